@@ -32,6 +32,7 @@ from shared.meta.auth import MetaAPIAuth
 from shared.meta.data_fetcher import MetaDataFetcher
 from shared.meta.db_uploader import MetaDBUploader
 from shared.system_config import get_config
+from shared.meta.pipeline import flatten_breakdown_data
 
 
 def generate_date_ranges(start_date: str, end_date: str, days_per_batch: int = 7):
@@ -53,82 +54,6 @@ def generate_date_ranges(start_date: str, end_date: str, days_per_batch: int = 7
     return ranges
 
 
-def flatten_breakdown_data(insights_raw, breakdown_type, account_name, usd_to_krw):
-    """Breakdown Raw 데이터를 DB 스키마에 맞게 변환 (outbound_clicks 수정 버전)"""
-    rows = []
-    USD_TO_KRW = usd_to_krw
-
-    for insight in insights_raw:
-        actions = {a['action_type']: int(a['value']) for a in insight.get('actions', [])}
-        action_values = {a['action_type']: float(a['value']) for a in insight.get('action_values', [])}
-
-        impressions = int(insight.get('impressions', 0))
-        clicks = int(insight.get('clicks', 0))
-        spend = float(insight.get('spend', 0))
-        purchase = actions.get('purchase', 0) or actions.get('omni_purchase', 0)
-        purchase_value = action_values.get('purchase', 0) or action_values.get('omni_purchase', 0)
-
-        # outbound_clicks 처리 (수정된 로직)
-        outbound_val = insight.get('outbound_clicks', 0)
-        outbound_clicks = int(outbound_val[0]['value']) if isinstance(outbound_val, list) and outbound_val else int(outbound_val or 0)
-        outbound_clicks = max(outbound_clicks, actions.get('outbound_click', 0))
-
-        # Calculated
-        aov = purchase_value / purchase if purchase > 0 else 0
-        cpa = spend / purchase if purchase > 0 else 0
-        roas = purchase_value / spend if spend > 0 else 0
-        cvr = purchase / clicks if clicks > 0 else 0
-
-        # KRW
-        spend_krw = spend * USD_TO_KRW
-        purchase_value_krw = purchase_value * USD_TO_KRW
-        aov_krw = aov * USD_TO_KRW
-        cpa_krw = cpa * USD_TO_KRW
-
-        row = {
-            'AccountName': account_name,
-            'Date': insight.get('date_start'),
-            'CampaignID': insight.get('campaign_id'),
-            'CampaignName': insight.get('campaign_name'),
-            'AdSetID': insight.get('adset_id'),
-            'AdSetName': insight.get('adset_name'),
-            'AdID': insight.get('ad_id'),
-            'AdName': insight.get('ad_name'),
-
-            'BreakdownType': breakdown_type,
-            'Age': insight.get('age'),
-            'Gender': insight.get('gender'),
-            'PublisherPlatform': insight.get('publisher_platform'),
-            'DevicePlatform': insight.get('device_platform'),
-            'ImpressionDevice': insight.get('impression_device'),
-
-            'Impressions': impressions,
-            'Reach': int(insight.get('reach', 0)),
-            'Frequency': float(insight.get('frequency', 0)),
-            'Clicks': clicks,
-            'CTR': float(insight.get('ctr', 0)),
-            'Spend': spend,
-            'CPM': float(insight.get('cpm', 0)),
-            'CPC': float(insight.get('cpc', 0)),
-
-            'LandingPageViews': actions.get('landing_page_view', 0),
-            'AddToCart': actions.get('add_to_cart', 0),
-            'InitiateCheckout': actions.get('initiate_checkout', 0),
-            'Purchase': purchase,
-            'CompleteRegistration': actions.get('complete_registration', 0),
-            'OutboundClicks': outbound_clicks,
-            'LinkClicks': actions.get('link_click', 0),
-
-            'PurchaseValue': purchase_value,
-            'AOV': aov, 'CPA': cpa, 'ROAS': roas, 'CVR': cvr,
-            'SpendKRW': spend_krw, 'PurchaseValueKRW': purchase_value_krw,
-            'AOVKRW': aov_krw, 'CPAKRW': cpa_krw
-        }
-        rows.append(row)
-
-    return pd.DataFrame(rows)
-
-
 def backfill_breakdown():
     """AdDataMetaBreakdown 백필 실행"""
     START_DATE = '2025-09-01'
@@ -24,7 +24,7 @@ if os.path.exists(settings_path):
 
 from shared.meta.auth import MetaAPIAuth
 from shared.meta.data_fetcher import MetaDataFetcher
-from shared.database import get_db_connection
+from shared.database import get_db_connection, bulk_insert
 from shared.system_config import get_config
 
 
@@ -117,9 +117,11 @@ def update_creative_urls(creatives_map: dict):
             print("[DB] 유효한 URL 데이터 없음")
             return 0
 
-        cursor.executemany(
-            "INSERT INTO #TempCreativeURLs VALUES (?, ?, ?, ?)",
-            data_to_insert
+        bulk_insert(
+            cursor, '#TempCreativeURLs',
+            ['AdID', 'ImageURL', 'LinkURL', 'PreviewURL'],
+            data_to_insert,
+            max_columns=['ImageURL', 'LinkURL', 'PreviewURL']
         )
 
         # MERGE: ImageURL, LinkURL, PreviewURL 업데이트 (기존 데이터 보존)
@@ -165,14 +165,17 @@ def backfill_naver(dates: list):
 
         total_count = 0
 
-        for date in dates:
+        # 여러 날짜의 리포트 작업을 묶어서 병렬 생성/수집
+        for date, raw_data in fetcher.iter_ad_reports(dates):
             print(f"\n>>> 날짜: {date} 처리 중...")
 
-            raw_data = fetcher.fetch_ad_report_data(date)
             if not raw_data:
                 print(f"   [WARNING] {date} 데이터 없음")
                 continue
 
+            # 매핑에 없는 ID가 있으면 해당 캠페인/광고그룹만 재조회
+            name_mapper.resolve_missing(raw_data)
+
             rows = []
             filtered_count = 0
 
@@ -175,23 +175,22 @@ def backfill_naver(start_date: str, end_date: str):
     start = datetime.strptime(start_date, '%Y-%m-%d')
     end = datetime.strptime(end_date, '%Y-%m-%d')
 
-    total_count = 0
-    current = start
-    day_num = 0
     total_days = (end - start).days + 1
+    dates = [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(total_days)]
 
-    while current <= end:
-        day_num += 1
-        date_str = current.strftime('%Y-%m-%d')
-        print(f"\n[{day_num}/{total_days}] {date_str}")
+    total_count = 0
 
-        raw_data = fetcher.fetch_ad_report_data(date_str)
+    # 7일치 리포트 작업을 묶어서 병렬 생성/수집
+    for day_num, (date_str, raw_data) in enumerate(fetcher.iter_ad_reports(dates), start=1):
+        print(f"\n[{day_num}/{total_days}] {date_str}")
 
         if not raw_data:
             print("   데이터 없음")
-            current += timedelta(days=1)
             continue
 
+        # 매핑에 없는 ID가 있으면 해당 캠페인/광고그룹만 재조회
+        name_mapper.resolve_missing(raw_data)
+
         rows = []
         for item in raw_data:
             campaign_name = name_mapper.get_name('campaign', item['CampaignID'])
@@ -223,10 +222,8 @@ def backfill_naver(start_date: str, end_date: str):
             total_count += len(df)
             print(f"   {len(df)}건 업로드")
 
-        current += timedelta(days=1)
-
-        # 7일마다 잠시 대기 (Rate Limit 방지)
-        if day_num % 7 == 0 and current <= end:
+        # 배치(7일)마다 잠시 대기 (Rate Limit 방지)
+        if day_num % 7 == 0 and day_num < total_days:
             print("   대기 중 (5초)...")
             time.sleep(5)
 
@@ -189,17 +189,20 @@ def backfill_naver(dates: list):
 
         total_count = 0
 
-        for date in dates:
+        # 여러 날짜의 리포트 작업을 묶어서 병렬 생성/수집
+        for date, raw_data in fetcher.iter_ad_reports(dates):
             print(f"\n{'='*80}")
             print(f"📅 날짜: {date} 처리 중...")
             print(f"{'='*80}")
 
             try:
-                raw_data = fetcher.fetch_ad_report_data(date)
                 if not raw_data:
                     print(f"   ⚠️  {date} 데이터 없음 (API에서 리포트 생성 실패 또는 데이터 없음)")
                     continue
 
+                # 매핑에 없는 ID가 있으면 해당 캠페인/광고그룹만 재조회
+                name_mapper.resolve_missing(raw_data)
+
                 rows = []
                 filtered_count = 0
 
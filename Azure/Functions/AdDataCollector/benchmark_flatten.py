@@ -0,0 +1,330 @@
+"""
+Meta 인사이트 정규화 벤치마크
+- 50,000행 백필 배치 규모의 합성 인사이트로 flatten + DB 튜플 변환 시간 측정
+- flatten은 기존 행 단위 구현(legacy_flatten_*), 업로드 튜플 변환은 기존 iterrows 방식과 비교
+- 기존 구현과 결과 값이 같은지도 확인
+
+실행: python benchmark_flatten.py [행 수]
+"""
+
+import sys
+import os
+import time
+import random
+
+import pandas as pd
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from shared.meta.pipeline import flatten_insights_data, flatten_breakdown_data
+from shared.meta.db_uploader import DAILY_COLUMNS, BREAKDOWN_COLUMNS
+from shared.database import to_records
+
+ACTION_TYPES = [
+    'link_click', 'outbound_click', 'landing_page_view', 'complete_registration',
+    'add_to_cart', 'initiate_checkout', 'purchase', 'omni_purchase',
+    'post_engagement', 'post_reaction', 'comment', 'video_view', 'post',
+    'page_engagement', 'post_click'
+]
+
+
+def make_insights(n_rows: int, n_ads: int = 2000, seed: int = 42) -> list:
+    """Graph API 응답 형태의 합성 인사이트 생성"""
+    rng = random.Random(seed)
+    insights = []
+
+    for i in range(n_rows):
+        ad_no = i % n_ads
+        action_types = rng.sample(ACTION_TYPES, rng.randint(0, len(ACTION_TYPES)))
+        insight = {
+            'date_start': f"2025-{(i // n_ads) % 12 + 1:02d}-01",
+            'campaign_id': str(1000 + ad_no // 100), 'campaign_name': f"campaign_{ad_no // 100}",
+            'adset_id': str(5000 + ad_no // 10), 'adset_name': f"adset_{ad_no // 10}",
+            'ad_id': str(90000 + ad_no), 'ad_name': f"ad_{ad_no}",
+            'impressions': str(rng.randint(0, 50000)), 'reach': str(rng.randint(0, 40000)),
+            'frequency': f"{rng.uniform(1, 3):.4f}", 'clicks': str(rng.randint(0, 2000)),
+            'unique_clicks': str(rng.randint(0, 1500)), 'spend': f"{rng.uniform(0, 500):.2f}",
+            'ctr': f"{rng.uniform(0, 5):.4f}", 'unique_ctr': f"{rng.uniform(0, 5):.4f}",
+            'cpm': f"{rng.uniform(0, 30):.4f}", 'cpc': f"{rng.uniform(0, 3):.4f}",
+            'inline_link_clicks': str(rng.randint(0, 1000)),
+            'inline_link_click_ctr': f"{rng.uniform(0, 3):.4f}",
+            'cost_per_inline_link_click': f"{rng.uniform(0, 3):.4f}",
+            'quality_ranking': 'AVERAGE', 'engagement_rate_ranking': 'ABOVE_AVERAGE',
+            'conversion_rate_ranking': 'BELOW_AVERAGE_35',
+            'age': rng.choice(['18-24', '25-34', '35-44']), 'gender': rng.choice(['male', 'female']),
+        }
+        if action_types:
+            insight['actions'] = [{'action_type': t, 'value': str(rng.randint(1, 300))} for t in action_types]
+            insight['action_values'] = [
+                {'action_type': t, 'value': f"{rng.uniform(1, 9000):.2f}"}
+                for t in action_types if t in ('purchase', 'omni_purchase')
+            ]
+        if rng.random() < 0.8:
+            insight['outbound_clicks'] = [{'action_type': 'outbound_click', 'value': str(rng.randint(0, 800))}]
+        insights.append(insight)
+
+    return insights
+
+
+def make_creatives(n_ads: int = 2000) -> dict:
+    return {
+        str(90000 + i): {
+            'creative_id': str(700000 + i), 'title': f"title {i}", 'body': 'body ' * 40,
+            'cta': 'SHOP_NOW', 'link_url': f"https://example.com/p/{i}",
+            'image_url': f"https://cdn.example.com/{i}.jpg", 'video_id': '',
+            'thumbnail_url': f"https://cdn.example.com/t/{i}.jpg", 'preview_url': ''
+        }
+        for i in range(n_ads)
+    }
+
+
+def timed(label: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"   {label:<32} {elapsed:8.3f}s")
+    return result
+
+
+def legacy_flatten_insights_data(insights_raw, ad_creatives_map, account_name, usd_to_krw):
+    """기존 행 단위 flatten_insights_data (비교용 기준선)"""
+    rows = []
+    USD_TO_KRW = usd_to_krw
+
+    for insight in insights_raw:
+        actions = {a['action_type']: int(a['value']) for a in insight.get('actions', [])}
+        action_values = {a['action_type']: float(a['value']) for a in insight.get('action_values', [])}
+
+        # 기본 지표
+        impressions = int(insight.get('impressions', 0))
+        clicks = int(insight.get('clicks', 0))
+        spend = float(insight.get('spend', 0))
+        purchase = actions.get('purchase', 0) or actions.get('omni_purchase', 0)
+        purchase_value = action_values.get('purchase', 0) or action_values.get('omni_purchase', 0)
+
+        # inline_link_clicks 처리
+        inline_val = insight.get('inline_link_clicks', 0)
+        inline_clicks = int(inline_val[0]['value']) if isinstance(inline_val, list) and inline_val else int(inline_val or 0)
+
+        # outbound_clicks 처리
+        outbound_val = insight.get('outbound_clicks', 0)
+        outbound_clicks = int(outbound_val[0]['value']) if isinstance(outbound_val, list) and outbound_val else int(outbound_val or 0)
+        outbound_clicks = max(outbound_clicks, actions.get('outbound_click', 0))
+
+        # Calculated Metrics
+        aov = purchase_value / purchase if purchase > 0 else 0
+        cpa = spend / purchase if purchase > 0 else 0
+        roas = purchase_value / spend if spend > 0 else 0
+        cvr = purchase / clicks if clicks > 0 else 0
+
+        # KRW Conversion
+        spend_krw = spend * USD_TO_KRW
+        purchase_value_krw = purchase_value * USD_TO_KRW
+        aov_krw = aov * USD_TO_KRW
+        cpa_krw = cpa * USD_TO_KRW
+
+        # Creative Info
+        ad_id = insight.get('ad_id')
+        creative = ad_creatives_map.get(ad_id, {})
+
+        row = {
+            'AccountName': account_name,
+            'Date': insight.get('date_start'),
+            'CampaignID': insight.get('campaign_id'),
+            'CampaignName': insight.get('campaign_name'),
+            'AdSetID': insight.get('adset_id'),
+            'AdSetName': insight.get('adset_name'),
+            'AdID': ad_id,
+            'AdName': insight.get('ad_name'),
+
+            'Impressions': impressions,
+            'Reach': int(insight.get('reach', 0)),
+            'Frequency': float(insight.get('frequency', 0)),
+            'Clicks': clicks,
+            'UniqueClicks': int(insight.get('unique_clicks', 0)),
+            'CTR': float(insight.get('ctr', 0)),
+            'UniqueCTR': float(insight.get('unique_ctr', 0)),
+            'Spend': spend,
+            'CPM': float(insight.get('cpm', 0)),
+            'CPC': float(insight.get('cpc', 0)),
+
+            'InlineLinkClicks': inline_clicks,
+            'InlineLinkClickCTR': float(insight.get('inline_link_click_ctr', 0)),
+            'CostPerInlineLinkClick': float(insight.get('cost_per_inline_link_click', 0)),
+            'QualityRanking': insight.get('quality_ranking'),
+            'EngagementRateRanking': insight.get('engagement_rate_ranking'),
+            'ConversionRateRanking': insight.get('conversion_rate_ranking'),
+
+            'LinkClicks': actions.get('link_click', 0),
+            'OutboundClicks': outbound_clicks,
+            'LandingPageViews': actions.get('landing_page_view', 0),
+            'CompleteRegistration': actions.get('complete_registration', 0),
+            'AddToCart': actions.get('add_to_cart', 0),
+            'InitiateCheckout': actions.get('initiate_checkout', 0),
+            'Purchase': purchase,
+            'WebsitePurchase': purchase,
+
+            'PostEngagement': actions.get('post_engagement', 0),
+            'PostReaction': actions.get('post_reaction', 0),
+            'Comment': actions.get('comment', 0),
+            'VideoView': actions.get('video_view', 0),
+            'PostSave': actions.get('post', 0),  # 'post' action is save
+            'PageEngagement': actions.get('page_engagement', 0),
+            'PostClick': actions.get('post_click', 0),
+
+            'PurchaseValue': purchase_value,
+            'WebsitePurchaseValue': purchase_value,
+
+            'AOV': aov, 'CPA': cpa, 'ROAS': roas, 'CVR': cvr,
+
+            'EngagementRate': actions.get('post_engagement', 0) / impressions if impressions > 0 else 0,
+            'ReactionRate': actions.get('post_reaction', 0) / impressions if impressions > 0 else 0,
+            'CommentRate': actions.get('comment', 0) / impressions if impressions > 0 else 0,
+            'VideoViewRate': actions.get('video_view', 0) / impressions if impressions > 0 else 0,
+            'SaveRate': actions.get('post', 0) / impressions if impressions > 0 else 0,
+
+            'SpendKRW': spend_krw,
+            'PurchaseValueKRW': purchase_value_krw,
+            'AOVKRW': aov_krw,
+            'CPAKRW': cpa_krw,
+
+            'CreativeID': creative.get('creative_id'),
+            'AdTitle': creative.get('title'),
+            'AdBody': creative.get('body'),
+            'CTAType': creative.get('cta'),
+            'LinkURL': creative.get('link_url'),
+            'ImageURL': creative.get('image_url'),
+            'VideoID': creative.get('video_id'),
+            'ThumbnailURL': creative.get('thumbnail_url'),
+            'PreviewURL': creative.get('preview_url')
+        }
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+
+def legacy_flatten_breakdown_data(insights_raw, breakdown_type, account_name, usd_to_krw):
+    """기존 행 단위 flatten_breakdown_data (비교용 기준선)"""
+    rows = []
+    USD_TO_KRW = usd_to_krw
+
+    for insight in insights_raw:
+        actions = {a['action_type']: int(a['value']) for a in insight.get('actions', [])}
+        action_values = {a['action_type']: float(a['value']) for a in insight.get('action_values', [])}
+
+        impressions = int(insight.get('impressions', 0))
+        clicks = int(insight.get('clicks', 0))
+        spend = float(insight.get('spend', 0))
+        purchase = actions.get('purchase', 0) or actions.get('omni_purchase', 0)
+        purchase_value = action_values.get('purchase', 0) or action_values.get('omni_purchase', 0)
+
+        # outbound_clicks 처리
+        outbound_val = insight.get('outbound_clicks', 0)
+        outbound_clicks = int(outbound_val[0]['value']) if isinstance(outbound_val, list) and outbound_val else int(outbound_val or 0)
+        outbound_clicks = max(outbound_clicks, actions.get('outbound_click', 0))
+
+        # Calculated
+        aov = purchase_value / purchase if purchase > 0 else 0
+        cpa = spend / purchase if purchase > 0 else 0
+        roas = purchase_value / spend if spend > 0 else 0
+        cvr = purchase / clicks if clicks > 0 else 0
+
+        # KRW
+        spend_krw = spend * USD_TO_KRW
+        purchase_value_krw = purchase_value * USD_TO_KRW
+        aov_krw = aov * USD_TO_KRW
+        cpa_krw = cpa * USD_TO_KRW
+
+        row = {
+            'AccountName': account_name,
+            'Date': insight.get('date_start'),
+            'CampaignID': insight.get('campaign_id'),
+            'CampaignName': insight.get('campaign_name'),
+            'AdSetID': insight.get('adset_id'),
+            'AdSetName': insight.get('adset_name'),
+            'AdID': insight.get('ad_id'),
+            'AdName': insight.get('ad_name'),
+
+            'BreakdownType': breakdown_type,
+            'Age': insight.get('age'),
+            'Gender': insight.get('gender'),
+            'PublisherPlatform': insight.get('publisher_platform'),
+            'DevicePlatform': insight.get('device_platform'),
+            'ImpressionDevice': insight.get('impression_device'),
+
+            'Impressions': impressions,
+            'Reach': int(insight.get('reach', 0)),
+            'Frequency': float(insight.get('frequency', 0)),
+            'Clicks': clicks,
+            'CTR': float(insight.get('ctr', 0)),
+            'Spend': spend,
+            'CPM': float(insight.get('cpm', 0)),
+            'CPC': float(insight.get('cpc', 0)),
+
+            'LandingPageViews': actions.get('landing_page_view', 0),
+            'AddToCart': actions.get('add_to_cart', 0),
+            'InitiateCheckout': actions.get('initiate_checkout', 0),
+            'Purchase': purchase,
+            'CompleteRegistration': actions.get('complete_registration', 0),
+            'OutboundClicks': outbound_clicks,
+            'LinkClicks': actions.get('link_click', 0),
+
+            'PurchaseValue': purchase_value,
+            'AOV': aov, 'CPA': cpa, 'ROAS': roas, 'CVR': cvr,
+            'SpendKRW': spend_krw, 'PurchaseValueKRW': purchase_value_krw,
+            'AOVKRW': aov_krw, 'CPAKRW': cpa_krw
+        }
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+
+def legacy_records(df, columns):
+    """기존 upload_*_data의 iterrows 기반 튜플 생성 (비교용)"""
+    return [tuple(row[c] for c in columns) for _, row in df.iterrows()]
+
+
+def check_same(label: str, new_df, legacy_df):
+    """컬럼 단위 결과와 기존 결과 값 비교 (dtype 차이, NaN/None 차이는 무시 - 업로드 시 모두 NULL)"""
+    new_df = new_df[legacy_df.columns].reset_index(drop=True)
+    try:
+        pd.testing.assert_frame_equal(
+            new_df.astype(object).where(new_df.notna(), None),
+            legacy_df.astype(object).where(legacy_df.notna(), None),
+            check_dtype=False, check_exact=False
+        )
+        print(f"   {label:<32} 기존 결과와 동일")
+    except AssertionError as e:
+        print(f"   {label:<32} [WARNING] 기존 결과와 다름: {e}")
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    print("=" * 60)
+    print(f"Meta 인사이트 정규화 벤치마크: {n_rows:,}행")
+    print("=" * 60)
+
+    insights = make_insights(n_rows)
+    creatives = make_creatives()
+
+    print("\n[Daily]")
+    daily_df = timed('flatten_insights_data', flatten_insights_data, insights, creatives, 'bench', 1400)
+    legacy_daily_df = timed('legacy flatten (row loop)', legacy_flatten_insights_data, insights, creatives, 'bench', 1400)
+    check_same('flatten_insights_data', daily_df, legacy_daily_df)
+    timed('to_records (column zip)', to_records, daily_df, DAILY_COLUMNS)
+    timed('legacy iterrows tuples', legacy_records, daily_df, DAILY_COLUMNS)
+
+    print("\n[Breakdown]")
+    breakdown_df = timed('flatten_breakdown_data', flatten_breakdown_data, insights, 'age_gender', 'bench', 1400)
+    legacy_breakdown_df = timed('legacy flatten (row loop)', legacy_flatten_breakdown_data, insights, 'age_gender', 'bench', 1400)
+    check_same('flatten_breakdown_data', breakdown_df, legacy_breakdown_df)
+    timed('to_records (column zip)', to_records, breakdown_df, BREAKDOWN_COLUMNS)
+    timed('legacy iterrows tuples', legacy_records, breakdown_df, BREAKDOWN_COLUMNS)
+
+    print(f"\n[OK] Daily {len(daily_df):,}행 / Breakdown {len(breakdown_df):,}행")
+
+
+if __name__ == '__main__':
+    main()
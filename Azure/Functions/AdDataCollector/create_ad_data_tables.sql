@@ -205,3 +205,67 @@ BEGIN
     );
 END
 GO
+
+-- 4. Meta Creative Cache (증분 크리에이티브 수집용)
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'AdCreativeCacheMeta')
+BEGIN
+    CREATE TABLE [dbo].[AdCreativeCacheMeta](
+        [AccountID] [nvarchar](50) NOT NULL,
+        [AdID] [nvarchar](50) NOT NULL,
+        [CreativeID] [nvarchar](50) NOT NULL,
+        [AdUpdatedTime] [datetime] NULL,
+
+        [AdTitle] [nvarchar](max) NULL,
+        [AdBody] [nvarchar](max) NULL,
+        [CTAType] [nvarchar](50) NULL,
+        [LinkURL] [nvarchar](max) NULL,
+        [ImageURL] [nvarchar](max) NULL,
+        [VideoID] [nvarchar](50) NULL,
+        [ThumbnailURL] [nvarchar](max) NULL,
+        [PreviewURL] [nvarchar](max) NULL,
+
+        [CollectedDate] [datetime] DEFAULT GETDATE(),
+        [UpdatedDate] [datetime] DEFAULT GETDATE(),
+
+        CONSTRAINT [PK_AdCreativeCacheMeta] PRIMARY KEY CLUSTERED ([AdID] ASC, [CreativeID] ASC)
+    );
+
+    CREATE NONCLUSTERED INDEX [IX_AdCreativeCacheMeta_Account_Updated] ON [dbo].[AdCreativeCacheMeta]
+    (
+        [AccountID] ASC,
+        [AdUpdatedTime] DESC
+    );
+END
+GO
+
+-- 4-1. Meta Creative Cache 동기화 워터마크 (변경분 조회가 오류 없이 끝난 시각, UTC)
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'AdCreativeCacheSyncMeta')
+BEGIN
+    CREATE TABLE [dbo].[AdCreativeCacheSyncMeta](
+        [AccountID] [nvarchar](50) NOT NULL,
+        [SyncedTime] [datetime] NOT NULL,
+        [UpdatedDate] [datetime] DEFAULT GETDATE(),
+
+        CONSTRAINT [PK_AdCreativeCacheSyncMeta] PRIMARY KEY CLUSTERED ([AccountID] ASC)
+    );
+END
+GO
+
+-- 5. Naver Entity Name Cache (ID -> 이름 매핑 캐시)
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'AdNaverEntityCache')
+BEGIN
+    CREATE TABLE [dbo].[AdNaverEntityCache](
+        [EntityType] [nvarchar](20) NOT NULL,   -- campaign / adgroup / keyword / ad
+        [EntityID] [nvarchar](50) NOT NULL,
+        [ParentID] [nvarchar](50) NULL,         -- adgroup: CampaignID, keyword/ad: AdGroupID
+        [Name] [nvarchar](500) NULL,
+        [Status] [nvarchar](20) NULL,           -- campaign: ACTIVE / INACTIVE
+        [EditTime] [nvarchar](50) NULL,         -- 마지막 하위 조회 시점의 editTm (변경 감지용)
+
+        [CollectedDate] [datetime] DEFAULT GETDATE(),
+        [UpdatedDate] [datetime] DEFAULT GETDATE(),
+
+        CONSTRAINT [PK_AdNaverEntityCache] PRIMARY KEY CLUSTERED ([EntityType] ASC, [EntityID] ASC)
+    );
+END
+GO
@@ -47,6 +47,9 @@ def daily_ad_data_collector(timer: func.TimerRequest) -> None:
         send_meta_notification, send_naver_notification,
         format_meta_result, format_naver_result
     )
+    from shared.http_client import reset_metrics, log_metrics
+
+    reset_metrics()
 
     logging.info('=' * 80)
     logging.info(f'광고 데이터 수집 시작: {datetime.utcnow().isoformat()}Z')
@@ -87,6 +90,9 @@ def daily_ad_data_collector(timer: func.TimerRequest) -> None:
     # Naver 결과 알림
     send_naver_notification(format_naver_result(naver_result))
 
+    # 호스트별 HTTP 요청 메트릭
+    log_metrics()
+
     logging.info('=' * 80)
     logging.info('광고 데이터 수집 종료')
     logging.info('=' * 80)
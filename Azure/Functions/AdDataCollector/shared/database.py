@@ -3,12 +3,21 @@
 - 환경 변수에서 DB 정보 읽기
 - pyodbc 연결 제공
 - Azure SQL Serverless 자동 재시도 지원
+- 임시 테이블 대량 적재 (fast_executemany)
 """
 
 import os
 import pyodbc
 import logging
 import time
+import pandas as pd
+from typing import Iterable, List, Sequence, Union
+
+# fast_executemany 1회 전송 행 수 (드라이버 파라미터 버퍼 메모리 제한)
+BULK_CHUNK_SIZE = 5000
+
+# nvarchar(max) 컬럼 바인딩 타입 (fast_executemany에서 max 컬럼 잘림/메모리 오류 방지)
+NVARCHAR_MAX = (pyodbc.SQL_WVARCHAR, 0, 0)
 
 # 데이터베이스 연결 정보
 DB_CONFIG = {
@@ -76,3 +85,72 @@ def get_db_connection(max_retries: int = 3, retry_delay: int = 10):
     # 모든 재시도 실패
     logging.error(f"[DB] 연결 최종 실패 - 모든 재시도 소진")
     raise last_error
+
+
+def to_records(df: pd.DataFrame, columns: List[str]) -> list:
+    """
+    DataFrame -> executemany용 튜플 리스트
+
+    - 컬럼 순서를 columns에 맞춤 (없는 컬럼은 None)
+    - NaN -> None, numpy 스칼라 -> Python 기본 타입 (pyodbc 호환)
+    - 컬럼 단위 tolist() 후 zip (iterrows/itertuples 대비 행 단위 Series 생성 없음)
+    """
+    frame = df.reindex(columns=columns)
+    arrays = []
+    for column in columns:
+        values = frame[column]
+        if values.dtype == object or values.hasnans:
+            values = values.astype(object).where(values.notna(), None)
+        arrays.append(values.tolist())
+    return list(zip(*arrays))
+
+
+def bulk_insert(
+    cursor,
+    table_name: str,
+    columns: List[str],
+    rows: Union[pd.DataFrame, Sequence[tuple]],
+    max_columns: Iterable[str] = (),
+    chunk_size: int = BULK_CHUNK_SIZE
+) -> int:
+    """
+    임시 테이블(#Temp...) 대량 적재
+
+    - fast_executemany로 청크당 1회 왕복 (기본 executemany는 행마다 왕복)
+    - nvarchar(max) 컬럼은 setinputsizes로 타입 지정
+    - DataFrame은 청크 단위로 튜플 변환하여 메모리 사용량 제한
+
+    Args:
+        cursor: pyodbc 커서
+        table_name: 적재 대상 테이블명 (예: #TempAdDataMeta)
+        columns: 컬럼 순서
+        rows: DataFrame 또는 columns 순서의 튜플 리스트
+        max_columns: nvarchar(max) 컬럼명 목록
+        chunk_size: executemany 1회당 행 수
+
+    Returns:
+        int: 적재한 행 수
+    """
+    total = len(rows)
+    if total == 0:
+        return 0
+
+    column_list = ', '.join(f'[{c}]' for c in columns)
+    placeholders = ', '.join(['?'] * len(columns))
+    insert_query = f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})"
+
+    max_columns = set(max_columns)
+    cursor.fast_executemany = True
+
+    for start in range(0, total, chunk_size):
+        if isinstance(rows, pd.DataFrame):
+            chunk = to_records(rows.iloc[start:start + chunk_size], columns)
+        else:
+            chunk = rows[start:start + chunk_size]
+
+        # executemany 호출마다 초기화되므로 청크마다 지정
+        if max_columns:
+            cursor.setinputsizes([NVARCHAR_MAX if c in max_columns else None for c in columns])
+        cursor.executemany(insert_query, chunk)
+
+    return total
@@ -3,10 +3,10 @@ Meta API 인증 모듈 (Azure Functions용)
 SystemConfig 테이블을 사용하여 토큰 관리
 """
 
-import requests
 import logging
 from datetime import datetime
 from ..system_config import get_config, update_config
+from .. import http_client
 
 class MetaAPIAuth:
     """Meta API 인증 관리 클래스"""
@@ -37,7 +37,7 @@ class MetaAPIAuth:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json().get('data', {})
 
@@ -77,7 +77,7 @@ class MetaAPIAuth:
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
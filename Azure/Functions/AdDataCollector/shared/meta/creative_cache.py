@@ -0,0 +1,263 @@
+"""
+Meta 광고 크리에이티브 캐시 모듈
+- AdCreativeCacheMeta 테이블에 (AdID, CreativeID) 기준으로 크리에이티브 정보 보관
+- 매 실행 시 updated_time 변경분 + 캐시에 없는 당일 인사이트 광고만 Meta API에서 조회
+- 계정별 동기화 워터마크(AdCreativeCacheSyncMeta)는 변경분 조회가 오류 없이 끝나고 캐시 저장까지 성공한 경우에만 전진
+"""
+
+import calendar
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+from ..database import get_db_connection, bulk_insert
+from .data_fetcher import MetaDataFetcher
+
+# SQL Server 파라미터 제한(2100) 대비 IN 절 청크 크기
+DB_IN_CHUNK = 1000
+
+# updated_time 경계값 누락 방지용 overlap
+WATERMARK_OVERLAP = timedelta(hours=1)
+
+# 캐시 컬럼 <-> 크리에이티브 dict 키 매핑
+CACHE_COLUMNS = [
+    ('CreativeID', 'creative_id'),
+    ('AdTitle', 'title'),
+    ('AdBody', 'body'),
+    ('CTAType', 'cta'),
+    ('LinkURL', 'link_url'),
+    ('ImageURL', 'image_url'),
+    ('VideoID', 'video_id'),
+    ('ThumbnailURL', 'thumbnail_url'),
+    ('PreviewURL', 'preview_url'),
+]
+
+# #TempAdCreativeCache 컬럼 순서
+TEMP_COLUMNS = ['AccountID', 'AdID', 'CreativeID', 'AdUpdatedTime'] + [col for col, _ in CACHE_COLUMNS[1:]]
+
+# nvarchar(max) 컬럼
+MAX_COLUMNS = ['AdTitle', 'AdBody', 'LinkURL', 'ImageURL', 'ThumbnailURL', 'PreviewURL']
+
+
+def parse_meta_time(value: str) -> Optional[datetime]:
+    """Meta updated_time ('2025-01-01T12:00:00+0000') -> UTC naive datetime"""
+    if not value:
+        return None
+    try:
+        dt = datetime.strptime(value, '%Y-%m-%dT%H:%M:%S%z')
+    except ValueError:
+        return None
+    return datetime.fromtimestamp(dt.timestamp(), timezone.utc).replace(tzinfo=None)
+
+
+class MetaCreativeCache:
+    """AdCreativeCacheMeta 테이블 기반 증분 크리에이티브 캐시"""
+
+    def __init__(self, fetcher: MetaDataFetcher):
+        self.fetcher = fetcher
+        self.stats = {'cache_hit': 0, 'fetched': 0}
+
+    def get_creatives(self, ad_account_id: str, ad_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        인사이트에 등장한 광고들의 크리에이티브 정보 반환
+
+        1. 동기화 워터마크(마지막 완료 조회 시각) 이후 변경된 광고만 조회 (updated_time 필터)
+        2. 캐시에 없는 인사이트 광고는 ID IN 필터로 조회
+        3. 새로 조회한 크리에이티브는 캐시에 MERGE
+
+        Args:
+            ad_account_id: 광고 계정 ID (act_xxx)
+            ad_ids: 당일 인사이트에 등장한 광고 ID 목록
+
+        Returns:
+            Dict[str, Dict]: ad_id -> 크리에이티브 정보 (fetch_ad_creatives 형식)
+        """
+        ad_ids = {ad_id for ad_id in ad_ids if ad_id}
+
+        try:
+            watermark = self._get_watermark(ad_account_id)
+        except Exception as e:
+            # 캐시 테이블 조회 불가 시 기존 방식(전체 조회)으로 동작
+            print(f"   [WARNING] 크리에이티브 캐시 조회 실패, 전체 조회로 대체: {e}")
+            fetched = self.fetcher.fetch_ad_creatives(ad_account_id)
+            self.stats['fetched'] += len(fetched)
+            return fetched
+
+        # 이번 동기화 기준 시각 (조회 시작 전 - 조회 중 변경된 광고는 다음 실행에서 다시 조회)
+        synced_time = datetime.now(timezone.utc).replace(tzinfo=None)
+        try:
+            if watermark is None:
+                # 최초 실행: 계정 전체 크리에이티브로 캐시 초기화
+                print(f"   [CreativeCache] {ad_account_id} 워터마크 없음 - 전체 조회")
+                fetched = self.fetcher.fetch_ad_creatives(ad_account_id, raise_on_error=True)
+            else:
+                since_ts = calendar.timegm((watermark - WATERMARK_OVERLAP).timetuple())
+                fetched = self.fetcher.fetch_ad_creatives_updated_since(ad_account_id, since_ts)
+            sync_complete = True
+        except Exception as e:
+            # 부분 결과로 워터마크를 옮기면 못 받은 변경분이 영구 누락 → 워터마크 유지, 인사이트 광고만 ID로 조회
+            print(f"   [WARNING] {ad_account_id} 크리에이티브 변경분 조회 실패, 워터마크 유지: {e}")
+            fetched = {}
+            sync_complete = False
+
+        creatives = {ad_id: fetched[ad_id] for ad_id in ad_ids if ad_id in fetched}
+
+        cached = self._load(ad_account_id, ad_ids - creatives.keys())
+        creatives.update(cached)
+
+        missing = ad_ids - creatives.keys()
+        if missing:
+            missing_fetched = self.fetcher.fetch_ad_creatives_by_ids(ad_account_id, sorted(missing))
+            fetched.update(missing_fetched)
+            creatives.update({ad_id: c for ad_id, c in missing_fetched.items() if ad_id in ad_ids})
+
+        saved = self._save(ad_account_id, fetched) if fetched else True
+        if sync_complete and saved:
+            self._set_watermark(ad_account_id, synced_time)
+
+        self.stats['cache_hit'] += len(cached)
+        self.stats['fetched'] += len(fetched)
+        print(f"   [CreativeCache] 캐시 {len(cached)}건, API 조회 {len(fetched)}건 (대상 광고 {len(ad_ids)}건)")
+
+        return creatives
+
+    def _get_watermark(self, ad_account_id: str) -> Optional[datetime]:
+        """계정별 마지막 완료 동기화 시각 (UTC) 조회"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT SyncedTime
+                FROM [dbo].[AdCreativeCacheSyncMeta]
+                WHERE AccountID = ?
+            """, ad_account_id)
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _set_watermark(self, ad_account_id: str, synced_time: datetime):
+        """계정별 동기화 워터마크 갱신 (실패해도 다음 실행에서 이전 워터마크부터 재조회)"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                MERGE INTO [dbo].[AdCreativeCacheSyncMeta] AS target
+                USING (SELECT ? AS AccountID, ? AS SyncedTime) AS source
+                ON target.AccountID = source.AccountID
+                WHEN MATCHED THEN
+                    UPDATE SET SyncedTime = source.SyncedTime, UpdatedDate = GETDATE()
+                WHEN NOT MATCHED THEN
+                    INSERT (AccountID, SyncedTime, UpdatedDate)
+                    VALUES (source.AccountID, source.SyncedTime, GETDATE());
+            """, ad_account_id, synced_time)
+            conn.commit()
+        except Exception as e:
+            print(f"   [WARNING] 크리에이티브 캐시 워터마크 저장 실패: {e}")
+            conn.rollback()
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _load(self, ad_account_id: str, ad_ids: Iterable[str]) -> Dict[str, Dict]:
+        """캐시에서 광고별 최신 크리에이티브 조회"""
+        ad_ids = list(ad_ids)
+        if not ad_ids:
+            return {}
+
+        columns = ', '.join(col for col, _ in CACHE_COLUMNS)
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            creatives = {}
+            for i in range(0, len(ad_ids), DB_IN_CHUNK):
+                chunk = ad_ids[i:i + DB_IN_CHUNK]
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor.execute(f"""
+                    SELECT AdID, {columns}
+                    FROM (
+                        SELECT *, ROW_NUMBER() OVER (PARTITION BY AdID ORDER BY AdUpdatedTime DESC) AS rn
+                        FROM [dbo].[AdCreativeCacheMeta]
+                        WHERE AccountID = ? AND AdID IN ({placeholders})
+                    ) c
+                    WHERE rn = 1
+                """, ad_account_id, *chunk)
+
+                for row in cursor.fetchall():
+                    creatives[row[0]] = {
+                        key: value or '' for (_, key), value in zip(CACHE_COLUMNS, row[1:])
+                    }
+            return creatives
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _save(self, ad_account_id: str, creatives_map: Dict[str, Dict]) -> bool:
+        """조회한 크리에이티브를 캐시에 MERGE (성공 여부 반환)"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                CREATE TABLE #TempAdCreativeCache (
+                    [AccountID] [nvarchar](50), [AdID] [nvarchar](50), [CreativeID] [nvarchar](50),
+                    [AdUpdatedTime] [datetime],
+                    [AdTitle] [nvarchar](max), [AdBody] [nvarchar](max), [CTAType] [nvarchar](50),
+                    [LinkURL] [nvarchar](max), [ImageURL] [nvarchar](max), [VideoID] [nvarchar](50),
+                    [ThumbnailURL] [nvarchar](max), [PreviewURL] [nvarchar](max)
+                )
+            """)
+
+            data_to_insert = [
+                (
+                    ad_account_id, ad_id, creative.get('creative_id') or '',
+                    parse_meta_time(creative.get('updated_time')),
+                    creative.get('title'), creative.get('body'), creative.get('cta'),
+                    creative.get('link_url'), creative.get('image_url'), creative.get('video_id'),
+                    creative.get('thumbnail_url'), creative.get('preview_url')
+                )
+                for ad_id, creative in creatives_map.items()
+            ]
+
+            bulk_insert(cursor, '#TempAdCreativeCache', TEMP_COLUMNS, data_to_insert, max_columns=MAX_COLUMNS)
+
+            cursor.execute("""
+                MERGE INTO [dbo].[AdCreativeCacheMeta] AS target
+                USING #TempAdCreativeCache AS source
+                ON target.AdID = source.AdID AND target.CreativeID = source.CreativeID
+
+                WHEN MATCHED THEN
+                    UPDATE SET
+                        AccountID = source.AccountID, AdUpdatedTime = source.AdUpdatedTime,
+                        AdTitle = source.AdTitle, AdBody = source.AdBody, CTAType = source.CTAType,
+                        LinkURL = source.LinkURL, ImageURL = source.ImageURL, VideoID = source.VideoID,
+                        ThumbnailURL = source.ThumbnailURL, PreviewURL = source.PreviewURL,
+                        UpdatedDate = GETDATE()
+
+                WHEN NOT MATCHED THEN
+                    INSERT (
+                        AccountID, AdID, CreativeID, AdUpdatedTime,
+                        AdTitle, AdBody, CTAType, LinkURL, ImageURL, VideoID, ThumbnailURL, PreviewURL,
+                        CollectedDate, UpdatedDate
+                    )
+                    VALUES (
+                        source.AccountID, source.AdID, source.CreativeID, source.AdUpdatedTime,
+                        source.AdTitle, source.AdBody, source.CTAType, source.LinkURL, source.ImageURL,
+                        source.VideoID, source.ThumbnailURL, source.PreviewURL,
+                        GETDATE(), GETDATE()
+                    );
+            """)
+            conn.commit()
+            print(f"   [DB] AdCreativeCacheMeta {len(data_to_insert)}건 저장 완료")
+            return True
+
+        except Exception as e:
+            # 캐시 저장 실패는 수집 자체를 막지 않음 (다음 실행에서 재조회)
+            print(f"   [WARNING] 크리에이티브 캐시 저장 실패: {e}")
+            conn.rollback()
+            return False
+        finally:
+            cursor.close()
+            conn.close()
@@ -2,9 +2,14 @@
 Meta API Raw 데이터 수집 모듈
 """
 
+import json
 import requests
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable
+from .. import http_client
+
+# Graph API filtering IN 연산자에 한 번에 넣을 광고 ID 수
+AD_ID_FILTER_CHUNK = 50
 
 class MetaDataFetcher:
     """Meta Ads Raw 데이터 수집기"""
@@ -57,9 +62,9 @@ class MetaDataFetcher:
             while retry_count < max_retries and not success:
                 try:
                     if next_url:
-                        response = requests.get(next_url, timeout=30)
+                        response = http_client.get(next_url, timeout=30)
                     else:
-                        response = requests.get(url, params=params, timeout=30)
+                        response = http_client.get(url, params=params, timeout=30)
 
                     response.raise_for_status()
                     json_data = response.json()
@@ -75,7 +80,8 @@ class MetaDataFetcher:
                     success = True
 
                 except requests.exceptions.HTTPError as e:
-                    if e.response.status_code in [403, 429]:
+                    # 429는 http_client에서 Retry-After/백오프로 이미 재시도 → 여기서는 Meta 403 제한만 재시도
+                    if e.response.status_code == 403:
                         retry_count += 1
                         if retry_count < max_retries:
                             print(f"[WARNING] Rate Limit 감지. {retry_delay}초 후 재시도...")
@@ -95,10 +101,21 @@ class MetaDataFetcher:
 
         return all_data
 
-    def fetch_ad_creatives(self, ad_account_id: str) -> Dict[str, Dict]:
-        """광고 크리에이티브 정보 가져오기"""
+    def fetch_ad_creatives(self, ad_account_id: str, filtering: Optional[List[Dict]] = None,
+                           raise_on_error: bool = False) -> Dict[str, Dict]:
+        """
+        광고 크리에이티브 정보 가져오기
+
+        Args:
+            ad_account_id: 광고 계정 ID (act_xxx)
+            filtering: ads 엣지 filtering 조건 (None이면 전체 광고 조회)
+            raise_on_error: True면 API/페이지 오류 시 부분 결과 대신 예외 발생 (증분 캐시 워터마크용)
+
+        Returns:
+            Dict[str, Dict]: ad_id -> 크리에이티브 정보 (updated_time 포함)
+        """
         fields = [
-            'id', 'name', 'preview_shareable_link',
+            'id', 'name', 'preview_shareable_link', 'updated_time',
             'creative{id,title,body,call_to_action_type,image_url,thumbnail_url,video_id,link_url,object_story_spec,asset_feed_spec}'
         ]
 
@@ -108,13 +125,15 @@ class MetaDataFetcher:
             'fields': ','.join(fields),
             'limit': 100
         }
+        if filtering:
+            params['filtering'] = json.dumps(filtering)
 
         ad_creatives_map = {}
         image_hashes_to_fetch = {}  # ad_id -> hash 매핑
 
         try:
             while url:
-                response = requests.get(url, params=params)
+                response = http_client.get(url, params=params)
                 response.raise_for_status()
                 data = response.json()
 
@@ -176,6 +195,7 @@ class MetaDataFetcher:
                         'video_id': creative.get('video_id', ''),
                         'thumbnail_url': thumbnail_url,
                         'preview_url': preview_url,  # 광고 미리보기 URL
+                        'updated_time': ad.get('updated_time', ''),
                         '_image_hash': first_image_hash  # 임시 저장
                     }
 
@@ -183,6 +203,8 @@ class MetaDataFetcher:
                 params = {}
 
         except Exception as e:
+            if raise_on_error:
+                raise
             print(f"[WARNING] 크리에이티브 조회 오류: {e}")
 
         # Fallback 및 정리 (에러 발생 여부와 관계없이 항상 실행)
@@ -207,10 +229,25 @@ class MetaDataFetcher:
 
         return ad_creatives_map
 
+    def fetch_ad_creatives_updated_since(self, ad_account_id: str, since_ts: int) -> Dict[str, Dict]:
+        """updated_time이 since_ts(Unix timestamp) 이후인 광고의 크리에이티브만 조회 (오류 시 예외 - 부분 결과 없음)"""
+        filtering = [{'field': 'updated_time', 'operator': 'GREATER_THAN', 'value': since_ts}]
+        return self.fetch_ad_creatives(ad_account_id, filtering=filtering, raise_on_error=True)
+
+    def fetch_ad_creatives_by_ids(self, ad_account_id: str, ad_ids: Iterable[str]) -> Dict[str, Dict]:
+        """지정한 광고 ID들의 크리에이티브만 조회 (IN 필터, 청크 단위)"""
+        ad_ids = [ad_id for ad_id in ad_ids if ad_id]
+        ad_creatives_map = {}
+
+        for i in range(0, len(ad_ids), AD_ID_FILTER_CHUNK):
+            chunk = ad_ids[i:i + AD_ID_FILTER_CHUNK]
+            filtering = [{'field': 'id', 'operator': 'IN', 'value': chunk}]
+            ad_creatives_map.update(self.fetch_ad_creatives(ad_account_id, filtering=filtering))
+
+        return ad_creatives_map
+
     def _fetch_image_urls_by_hash(self, ad_account_id: str, hashes: List[str]) -> Dict[str, str]:
         """이미지 해시로 실제 이미지 URL 조회"""
-        import json
-
         hash_to_url = {}
         if not hashes:
             return hash_to_url
@@ -223,7 +260,7 @@ class MetaDataFetcher:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = http_client.get(url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
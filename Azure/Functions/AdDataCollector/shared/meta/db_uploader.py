@@ -4,7 +4,50 @@ Meta Ads 데이터 DB 업로드 모듈 (Updated Schema)
 
 import pandas as pd
 import pyodbc
-from ..database import get_db_connection
+from ..database import get_db_connection, bulk_insert
+
+# #TempAdDataMeta 컬럼 순서 (63개)
+DAILY_COLUMNS = [
+    'AccountName', 'Date', 'CampaignID', 'CampaignName',
+    'AdSetID', 'AdSetName', 'AdID', 'AdName',
+    'Impressions', 'Reach', 'Frequency',
+    'Clicks', 'UniqueClicks', 'CTR', 'UniqueCTR',
+    'Spend', 'CPM', 'CPC',
+    'InlineLinkClicks', 'InlineLinkClickCTR', 'CostPerInlineLinkClick',
+    'QualityRanking', 'EngagementRateRanking', 'ConversionRateRanking',
+    'LinkClicks', 'OutboundClicks', 'LandingPageViews',
+    'CompleteRegistration', 'AddToCart', 'InitiateCheckout',
+    'Purchase', 'WebsitePurchase',
+    'PostEngagement', 'PostReaction', 'Comment',
+    'VideoView', 'PostSave', 'PageEngagement', 'PostClick',
+    'PurchaseValue', 'WebsitePurchaseValue',
+    'AOV', 'CPA', 'ROAS', 'CVR',
+    'EngagementRate', 'ReactionRate', 'CommentRate',
+    'VideoViewRate', 'SaveRate',
+    'SpendKRW', 'PurchaseValueKRW', 'AOVKRW', 'CPAKRW',
+    'CreativeID', 'AdTitle', 'AdBody',
+    'CTAType', 'LinkURL', 'ImageURL',
+    'VideoID', 'ThumbnailURL', 'PreviewURL'
+]
+
+# #TempAdDataMetaBreakdown 컬럼 순서 (38개)
+BREAKDOWN_COLUMNS = [
+    'AccountName', 'Date', 'CampaignID', 'CampaignName',
+    'AdSetID', 'AdSetName', 'AdID', 'AdName',
+    'BreakdownType', 'Age', 'Gender',
+    'PublisherPlatform', 'DevicePlatform', 'ImpressionDevice',
+    'Impressions', 'Reach', 'Frequency',
+    'Clicks', 'CTR', 'Spend', 'CPM', 'CPC',
+    'LandingPageViews', 'AddToCart', 'InitiateCheckout',
+    'Purchase', 'CompleteRegistration', 'OutboundClicks', 'LinkClicks',
+    'PurchaseValue',
+    'AOV', 'CPA', 'ROAS', 'CVR',
+    'SpendKRW', 'PurchaseValueKRW', 'AOVKRW', 'CPAKRW'
+]
+
+# nvarchar(max) 크리에이티브 컬럼
+CREATIVE_MAX_COLUMNS = ['AdTitle', 'AdBody', 'LinkURL', 'ImageURL', 'ThumbnailURL', 'PreviewURL']
+
 
 class MetaDBUploader:
     """Meta Ads 데이터를 Azure SQL DB에 업로드"""
@@ -46,36 +89,8 @@ class MetaDBUploader:
                 )
             """)
 
-            # 데이터 매핑 및 삽입
-            data_to_insert = []
-            for _, row in df.iterrows():
-                data_to_insert.append((
-                    row['AccountName'], row['Date'], row['CampaignID'], row['CampaignName'],
-                    row['AdSetID'], row['AdSetName'], row['AdID'], row['AdName'],
-                    row['Impressions'], row['Reach'], row['Frequency'],
-                    row['Clicks'], row['UniqueClicks'], row['CTR'], row['UniqueCTR'],
-                    row['Spend'], row['CPM'], row['CPC'],
-                    row['InlineLinkClicks'], row['InlineLinkClickCTR'], row['CostPerInlineLinkClick'],
-                    row['QualityRanking'], row['EngagementRateRanking'], row['ConversionRateRanking'],
-                    row['LinkClicks'], row['OutboundClicks'], row['LandingPageViews'],
-                    row['CompleteRegistration'], row['AddToCart'], row['InitiateCheckout'],
-                    row['Purchase'], row['WebsitePurchase'],
-                    row['PostEngagement'], row['PostReaction'], row['Comment'],
-                    row['VideoView'], row['PostSave'], row['PageEngagement'], row['PostClick'],
-                    row['PurchaseValue'], row['WebsitePurchaseValue'],
-                    row['AOV'], row['CPA'], row['ROAS'], row['CVR'],
-                    row['EngagementRate'], row['ReactionRate'], row['CommentRate'],
-                    row['VideoViewRate'], row['SaveRate'],
-                    row['SpendKRW'], row['PurchaseValueKRW'], row['AOVKRW'], row['CPAKRW'],
-                    row['CreativeID'], row['AdTitle'], row['AdBody'],
-                    row['CTAType'], row['LinkURL'], row['ImageURL'],
-                    row['VideoID'], row['ThumbnailURL'], row.get('PreviewURL')
-                ))
-
-            # 63개 컬럼
-            placeholders = ','.join(['?'] * 63)
-            insert_query = f"INSERT INTO #TempAdDataMeta VALUES ({placeholders})"
-            cursor.executemany(insert_query, data_to_insert)
+            # 데이터 삽입 (63개 컬럼, fast_executemany)
+            bulk_insert(cursor, '#TempAdDataMeta', DAILY_COLUMNS, df, max_columns=CREATIVE_MAX_COLUMNS)
 
             # MERGE 실행
             merge_query = """
@@ -175,26 +190,8 @@ class MetaDBUploader:
                 )
             """)
 
-            data_to_insert = []
-            for _, row in df.iterrows():
-                data_to_insert.append((
-                    row['AccountName'], row['Date'], row['CampaignID'], row['CampaignName'],
-                    row['AdSetID'], row['AdSetName'], row['AdID'], row['AdName'],
-                    row['BreakdownType'], row.get('Age'), row.get('Gender'),
-                    row.get('PublisherPlatform'), row.get('DevicePlatform'), row.get('ImpressionDevice'),
-                    row['Impressions'], row['Reach'], row['Frequency'],
-                    row['Clicks'], row['CTR'], row['Spend'], row['CPM'], row['CPC'],
-                    row['LandingPageViews'], row['AddToCart'], row['InitiateCheckout'],
-                    row['Purchase'], row['CompleteRegistration'], row['OutboundClicks'], row['LinkClicks'],
-                    row['PurchaseValue'],
-                    row['AOV'], row['CPA'], row['ROAS'], row['CVR'],
-                    row['SpendKRW'], row['PurchaseValueKRW'], row['AOVKRW'], row['CPAKRW']
-                ))
-
-            # 38개 컬럼
-            placeholders = ','.join(['?'] * 38)
-            insert_query = f"INSERT INTO #TempAdDataMetaBreakdown VALUES ({placeholders})"
-            cursor.executemany(insert_query, data_to_insert)
+            # 데이터 삽입 (38개 컬럼, fast_executemany)
+            bulk_insert(cursor, '#TempAdDataMetaBreakdown', BREAKDOWN_COLUMNS, df)
 
             merge_query = """
                 MERGE INTO [dbo].[AdDataMetaBreakdown] AS target
@@ -3,206 +3,276 @@ Meta Ads 데이터 수집 파이프라인 (Updated)
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from .auth import MetaAPIAuth
 from .data_fetcher import MetaDataFetcher
-from .db_uploader import MetaDBUploader
+from .db_uploader import MetaDBUploader, DAILY_COLUMNS, BREAKDOWN_COLUMNS
+from .creative_cache import MetaCreativeCache
 from ..system_config import get_config
 from ..slack_notifier import send_meta_notification
 
 
-def flatten_insights_data(insights_raw, ad_creatives_map, account_name, usd_to_krw):
-    """Daily Raw 데이터를 DB 스키마에 맞게 변환"""
-    rows = []
-    USD_TO_KRW = usd_to_krw
-
-    for insight in insights_raw:
-        actions = {a['action_type']: int(a['value']) for a in insight.get('actions', [])}
-        action_values = {a['action_type']: float(a['value']) for a in insight.get('action_values', [])}
-
-        # 기본 지표
-        impressions = int(insight.get('impressions', 0))
-        clicks = int(insight.get('clicks', 0))
-        spend = float(insight.get('spend', 0))
-        purchase = actions.get('purchase', 0) or actions.get('omni_purchase', 0)
-        purchase_value = action_values.get('purchase', 0) or action_values.get('omni_purchase', 0)
-
-        # inline_link_clicks 처리
-        inline_val = insight.get('inline_link_clicks', 0)
-        inline_clicks = int(inline_val[0]['value']) if isinstance(inline_val, list) and inline_val else int(inline_val or 0)
-
-        # outbound_clicks 처리
-        outbound_val = insight.get('outbound_clicks', 0)
-        outbound_clicks = int(outbound_val[0]['value']) if isinstance(outbound_val, list) and outbound_val else int(outbound_val or 0)
-        outbound_clicks = max(outbound_clicks, actions.get('outbound_click', 0))
-
-        # Calculated Metrics
-        aov = purchase_value / purchase if purchase > 0 else 0
-        cpa = spend / purchase if purchase > 0 else 0
-        roas = purchase_value / spend if spend > 0 else 0
-        cvr = purchase / clicks if clicks > 0 else 0
+# ----------------------------------------------------------------------------
+# 컬럼 단위 정규화 헬퍼 (배치 전체를 한 번에 처리)
+# ----------------------------------------------------------------------------
+
+def _zeros(index, dtype='int64') -> pd.Series:
+    return pd.Series(0, index=index, dtype=dtype)
+
+
+def _to_number(values: pd.Series) -> pd.Series:
+    """숫자 문자열 Series -> float Series (변환 불가 값은 NaN)"""
+    try:
+        # 정상 응답은 전부 숫자 문자열이므로 C 레벨 astype 우선 (to_numeric 대비 수 배 빠름)
+        return values.astype('float64')
+    except (ValueError, TypeError):
+        return pd.to_numeric(values, errors='coerce')
+
+
+def _num_col(base: pd.DataFrame, column: str, dtype='float64') -> pd.Series:
+    """숫자 문자열 컬럼 -> 숫자 Series (없거나 변환 불가 시 0)"""
+    if column not in base:
+        return _zeros(base.index, dtype)
+    return _to_number(base[column]).fillna(0).astype(dtype)
+
+
+def _str_col(base: pd.DataFrame, column: str) -> pd.Series:
+    """문자열 컬럼 (없으면 None)"""
+    if column not in base:
+        return pd.Series(None, index=base.index, dtype=object)
+    return base[column]
+
+
+def _first_value_col(base: pd.DataFrame, column: str) -> pd.Series:
+    """[{'action_type': ..., 'value': ...}] 또는 스칼라 형태 컬럼의 첫 번째 값 (int)"""
+    if column not in base:
+        return _zeros(base.index)
+    first = base[column].map(lambda v: v[0].get('value') if isinstance(v, list) and v else v)
+    return _to_number(first).fillna(0).astype('int64')
+
+
+def _pivot_actions(base: pd.DataFrame, column: str, dtype) -> pd.DataFrame:
+    """
+    actions / action_values 리스트 컬럼을 action_type별 컬럼으로 피벗
+
+    배치 전체를 explode -> 레코드 프레임 -> pivot 한 번으로 처리하며,
+    같은 action_type이 중복되면 마지막 값을 사용 (기존 dict 변환과 동일)
+    """
+    if column not in base:
+        return pd.DataFrame(index=base.index)
+
+    exploded = base[column].explode().dropna()
+    if exploded.empty:
+        return pd.DataFrame(index=base.index)
+
+    # json_normalize는 항목별 Python 재귀라 느림 -> 필요한 두 키만 레코드로 변환
+    items = pd.DataFrame.from_records(exploded.tolist(), columns=['action_type', 'value'])
+    items['row'] = exploded.index.values
+    items['value'] = _to_number(items['value']).fillna(0)
+
+    pivoted = items.groupby(['row', 'action_type'], sort=False)['value'].last().unstack()
+    return pivoted.reindex(base.index).fillna(0).astype(dtype)
 
+
+def _action(pivoted: pd.DataFrame, action_type: str, dtype='int64') -> pd.Series:
+    if action_type not in pivoted:
+        return _zeros(pivoted.index, dtype)
+    return pivoted[action_type]
+
+
+def _safe_div(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """분모가 0 이하인 행은 0"""
+    return (numerator / denominator.where(denominator > 0)).fillna(0)
+
+
+def _normalize_common(insights_raw, usd_to_krw):
+    """
+    Daily/Breakdown 공통 지표 계산
+
+    Returns:
+        (base, actions, metrics): 원본 컬럼 프레임, actions 피벗, 공통 지표 dict
+    """
+    base = pd.DataFrame.from_records(insights_raw)
+
+    actions = _pivot_actions(base, 'actions', 'int64')
+    action_values = _pivot_actions(base, 'action_values', 'float64')
+
+    impressions = _num_col(base, 'impressions', 'int64')
+    clicks = _num_col(base, 'clicks', 'int64')
+    spend = _num_col(base, 'spend')
+
+    purchase = _action(actions, 'purchase')
+    purchase = purchase.where(purchase != 0, _action(actions, 'omni_purchase'))
+    purchase_value = _action(action_values, 'purchase', 'float64')
+    purchase_value = purchase_value.where(purchase_value != 0, _action(action_values, 'omni_purchase', 'float64'))
+
+    # outbound_clicks: 필드 값과 actions의 outbound_click 중 큰 값
+    outbound_clicks = np.maximum(_first_value_col(base, 'outbound_clicks'), _action(actions, 'outbound_click'))
+
+    # Calculated Metrics
+    aov = _safe_div(purchase_value, purchase)
+    cpa = _safe_div(spend, purchase)
+    roas = _safe_div(purchase_value, spend)
+    cvr = _safe_div(purchase, clicks)
+
+    metrics = {
+        'impressions': impressions,
+        'clicks': clicks,
+        'spend': spend,
+        'purchase': purchase,
+        'purchase_value': purchase_value,
+        'outbound_clicks': outbound_clicks,
+        'aov': aov, 'cpa': cpa, 'roas': roas, 'cvr': cvr,
         # KRW Conversion
-        spend_krw = spend * USD_TO_KRW
-        purchase_value_krw = purchase_value * USD_TO_KRW
-        aov_krw = aov * USD_TO_KRW
-        cpa_krw = cpa * USD_TO_KRW
-
-        # Creative Info
-        ad_id = insight.get('ad_id')
-        creative = ad_creatives_map.get(ad_id, {})
-
-        row = {
-            'AccountName': account_name,
-            'Date': insight.get('date_start'),
-            'CampaignID': insight.get('campaign_id'),
-            'CampaignName': insight.get('campaign_name'),
-            'AdSetID': insight.get('adset_id'),
-            'AdSetName': insight.get('adset_name'),
-            'AdID': ad_id,
-            'AdName': insight.get('ad_name'),
-
-            'Impressions': impressions,
-            'Reach': int(insight.get('reach', 0)),
-            'Frequency': float(insight.get('frequency', 0)),
-            'Clicks': clicks,
-            'UniqueClicks': int(insight.get('unique_clicks', 0)),
-            'CTR': float(insight.get('ctr', 0)),
-            'UniqueCTR': float(insight.get('unique_ctr', 0)),
-            'Spend': spend,
-            'CPM': float(insight.get('cpm', 0)),
-            'CPC': float(insight.get('cpc', 0)),
-
-            'InlineLinkClicks': inline_clicks,
-            'InlineLinkClickCTR': float(insight.get('inline_link_click_ctr', 0)),
-            'CostPerInlineLinkClick': float(insight.get('cost_per_inline_link_click', 0)),
-            'QualityRanking': insight.get('quality_ranking'),
-            'EngagementRateRanking': insight.get('engagement_rate_ranking'),
-            'ConversionRateRanking': insight.get('conversion_rate_ranking'),
-
-            'LinkClicks': actions.get('link_click', 0),
-            'OutboundClicks': outbound_clicks,
-            'LandingPageViews': actions.get('landing_page_view', 0),
-            'CompleteRegistration': actions.get('complete_registration', 0),
-            'AddToCart': actions.get('add_to_cart', 0),
-            'InitiateCheckout': actions.get('initiate_checkout', 0),
-            'Purchase': purchase,
-            'WebsitePurchase': purchase,
-
-            'PostEngagement': actions.get('post_engagement', 0),
-            'PostReaction': actions.get('post_reaction', 0),
-            'Comment': actions.get('comment', 0),
-            'VideoView': actions.get('video_view', 0),
-            'PostSave': actions.get('post', 0),  # 'post' action is save
-            'PageEngagement': actions.get('page_engagement', 0),
-            'PostClick': actions.get('post_click', 0),
-
-            'PurchaseValue': purchase_value,
-            'WebsitePurchaseValue': purchase_value,
-
-            'AOV': aov, 'CPA': cpa, 'ROAS': roas, 'CVR': cvr,
-
-            'EngagementRate': actions.get('post_engagement', 0) / impressions if impressions > 0 else 0,
-            'ReactionRate': actions.get('post_reaction', 0) / impressions if impressions > 0 else 0,
-            'CommentRate': actions.get('comment', 0) / impressions if impressions > 0 else 0,
-            'VideoViewRate': actions.get('video_view', 0) / impressions if impressions > 0 else 0,
-            'SaveRate': actions.get('post', 0) / impressions if impressions > 0 else 0,
-
-            'SpendKRW': spend_krw,
-            'PurchaseValueKRW': purchase_value_krw,
-            'AOVKRW': aov_krw,
-            'CPAKRW': cpa_krw,
-
-            'CreativeID': creative.get('creative_id'),
-            'AdTitle': creative.get('title'),
-            'AdBody': creative.get('body'),
-            'CTAType': creative.get('cta'),
-            'LinkURL': creative.get('link_url'),
-            'ImageURL': creative.get('image_url'),
-            'VideoID': creative.get('video_id'),
-            'ThumbnailURL': creative.get('thumbnail_url'),
-            'PreviewURL': creative.get('preview_url')
-        }
-        rows.append(row)
-
-    return pd.DataFrame(rows)
+        'spend_krw': spend * usd_to_krw,
+        'purchase_value_krw': purchase_value * usd_to_krw,
+        'aov_krw': aov * usd_to_krw,
+        'cpa_krw': cpa * usd_to_krw,
+    }
+    return base, actions, metrics
+
+
+def flatten_insights_data(insights_raw, ad_creatives_map, account_name, usd_to_krw):
+    """Daily Raw 데이터를 DB 스키마에 맞게 변환 (컬럼 단위 일괄 처리)"""
+    if not insights_raw:
+        return pd.DataFrame(columns=DAILY_COLUMNS)
+
+    base, actions, m = _normalize_common(insights_raw, usd_to_krw)
+    impressions = m['impressions']
+
+    # Creative Info: ad_id 기준 조인
+    ad_ids = _str_col(base, 'ad_id')
+    creative_keys = ['creative_id', 'title', 'body', 'cta', 'link_url', 'image_url',
+                     'video_id', 'thumbnail_url', 'preview_url']
+    creatives = pd.DataFrame.from_dict(ad_creatives_map or {}, orient='index')
+    creatives = creatives.reindex(index=ad_ids.values, columns=creative_keys)
+    creatives.index = base.index
+
+    df = pd.DataFrame({
+        'AccountName': account_name,
+        'Date': _str_col(base, 'date_start'),
+        'CampaignID': _str_col(base, 'campaign_id'),
+        'CampaignName': _str_col(base, 'campaign_name'),
+        'AdSetID': _str_col(base, 'adset_id'),
+        'AdSetName': _str_col(base, 'adset_name'),
+        'AdID': ad_ids,
+        'AdName': _str_col(base, 'ad_name'),
+
+        'Impressions': impressions,
+        'Reach': _num_col(base, 'reach', 'int64'),
+        'Frequency': _num_col(base, 'frequency'),
+        'Clicks': m['clicks'],
+        'UniqueClicks': _num_col(base, 'unique_clicks', 'int64'),
+        'CTR': _num_col(base, 'ctr'),
+        'UniqueCTR': _num_col(base, 'unique_ctr'),
+        'Spend': m['spend'],
+        'CPM': _num_col(base, 'cpm'),
+        'CPC': _num_col(base, 'cpc'),
+
+        'InlineLinkClicks': _first_value_col(base, 'inline_link_clicks'),
+        'InlineLinkClickCTR': _num_col(base, 'inline_link_click_ctr'),
+        'CostPerInlineLinkClick': _num_col(base, 'cost_per_inline_link_click'),
+        'QualityRanking': _str_col(base, 'quality_ranking'),
+        'EngagementRateRanking': _str_col(base, 'engagement_rate_ranking'),
+        'ConversionRateRanking': _str_col(base, 'conversion_rate_ranking'),
+
+        'LinkClicks': _action(actions, 'link_click'),
+        'OutboundClicks': m['outbound_clicks'],
+        'LandingPageViews': _action(actions, 'landing_page_view'),
+        'CompleteRegistration': _action(actions, 'complete_registration'),
+        'AddToCart': _action(actions, 'add_to_cart'),
+        'InitiateCheckout': _action(actions, 'initiate_checkout'),
+        'Purchase': m['purchase'],
+        'WebsitePurchase': m['purchase'],
+
+        'PostEngagement': _action(actions, 'post_engagement'),
+        'PostReaction': _action(actions, 'post_reaction'),
+        'Comment': _action(actions, 'comment'),
+        'VideoView': _action(actions, 'video_view'),
+        'PostSave': _action(actions, 'post'),  # 'post' action is save
+        'PageEngagement': _action(actions, 'page_engagement'),
+        'PostClick': _action(actions, 'post_click'),
+
+        'PurchaseValue': m['purchase_value'],
+        'WebsitePurchaseValue': m['purchase_value'],
+
+        'AOV': m['aov'], 'CPA': m['cpa'], 'ROAS': m['roas'], 'CVR': m['cvr'],
+
+        'EngagementRate': _safe_div(_action(actions, 'post_engagement'), impressions),
+        'ReactionRate': _safe_div(_action(actions, 'post_reaction'), impressions),
+        'CommentRate': _safe_div(_action(actions, 'comment'), impressions),
+        'VideoViewRate': _safe_div(_action(actions, 'video_view'), impressions),
+        'SaveRate': _safe_div(_action(actions, 'post'), impressions),
+
+        'SpendKRW': m['spend_krw'],
+        'PurchaseValueKRW': m['purchase_value_krw'],
+        'AOVKRW': m['aov_krw'],
+        'CPAKRW': m['cpa_krw'],
+
+        'CreativeID': creatives['creative_id'],
+        'AdTitle': creatives['title'],
+        'AdBody': creatives['body'],
+        'CTAType': creatives['cta'],
+        'LinkURL': creatives['link_url'],
+        'ImageURL': creatives['image_url'],
+        'VideoID': creatives['video_id'],
+        'ThumbnailURL': creatives['thumbnail_url'],
+        'PreviewURL': creatives['preview_url']
+    }, index=base.index)
+
+    return df[DAILY_COLUMNS]
 
 
 def flatten_breakdown_data(insights_raw, breakdown_type, account_name, usd_to_krw):
-    """Breakdown Raw 데이터를 DB 스키마에 맞게 변환"""
-    rows = []
-    USD_TO_KRW = usd_to_krw
-
-    for insight in insights_raw:
-        actions = {a['action_type']: int(a['value']) for a in insight.get('actions', [])}
-        action_values = {a['action_type']: float(a['value']) for a in insight.get('action_values', [])}
-
-        impressions = int(insight.get('impressions', 0))
-        clicks = int(insight.get('clicks', 0))
-        spend = float(insight.get('spend', 0))
-        purchase = actions.get('purchase', 0) or actions.get('omni_purchase', 0)
-        purchase_value = action_values.get('purchase', 0) or action_values.get('omni_purchase', 0)
-
-        # outbound_clicks 처리
-        outbound_val = insight.get('outbound_clicks', 0)
-        outbound_clicks = int(outbound_val[0]['value']) if isinstance(outbound_val, list) and outbound_val else int(outbound_val or 0)
-        outbound_clicks = max(outbound_clicks, actions.get('outbound_click', 0))
-
-        # Calculated
-        aov = purchase_value / purchase if purchase > 0 else 0
-        cpa = spend / purchase if purchase > 0 else 0
-        roas = purchase_value / spend if spend > 0 else 0
-        cvr = purchase / clicks if clicks > 0 else 0
-
-        # KRW
-        spend_krw = spend * USD_TO_KRW
-        purchase_value_krw = purchase_value * USD_TO_KRW
-        aov_krw = aov * USD_TO_KRW
-        cpa_krw = cpa * USD_TO_KRW
-
-        row = {
-            'AccountName': account_name,
-            'Date': insight.get('date_start'),
-            'CampaignID': insight.get('campaign_id'),
-            'CampaignName': insight.get('campaign_name'),
-            'AdSetID': insight.get('adset_id'),
-            'AdSetName': insight.get('adset_name'),
-            'AdID': insight.get('ad_id'),
-            'AdName': insight.get('ad_name'),
-
-            'BreakdownType': breakdown_type,
-            'Age': insight.get('age'),
-            'Gender': insight.get('gender'),
-            'PublisherPlatform': insight.get('publisher_platform'),
-            'DevicePlatform': insight.get('device_platform'),
-            'ImpressionDevice': insight.get('impression_device'),
-
-            'Impressions': impressions,
-            'Reach': int(insight.get('reach', 0)),
-            'Frequency': float(insight.get('frequency', 0)),
-            'Clicks': clicks,
-            'CTR': float(insight.get('ctr', 0)),
-            'Spend': spend,
-            'CPM': float(insight.get('cpm', 0)),
-            'CPC': float(insight.get('cpc', 0)),
-
-            'LandingPageViews': actions.get('landing_page_view', 0),
-            'AddToCart': actions.get('add_to_cart', 0),
-            'InitiateCheckout': actions.get('initiate_checkout', 0),
-            'Purchase': purchase,
-            'CompleteRegistration': actions.get('complete_registration', 0),
-            'OutboundClicks': outbound_clicks,
-            'LinkClicks': actions.get('link_click', 0),
-
-            'PurchaseValue': purchase_value,
-            'AOV': aov, 'CPA': cpa, 'ROAS': roas, 'CVR': cvr,
-            'SpendKRW': spend_krw, 'PurchaseValueKRW': purchase_value_krw,
-            'AOVKRW': aov_krw, 'CPAKRW': cpa_krw
-        }
-        rows.append(row)
-
-    return pd.DataFrame(rows)
+    """Breakdown Raw 데이터를 DB 스키마에 맞게 변환 (컬럼 단위 일괄 처리)"""
+    if not insights_raw:
+        return pd.DataFrame(columns=BREAKDOWN_COLUMNS)
+
+    base, actions, m = _normalize_common(insights_raw, usd_to_krw)
+
+    df = pd.DataFrame({
+        'AccountName': account_name,
+        'Date': _str_col(base, 'date_start'),
+        'CampaignID': _str_col(base, 'campaign_id'),
+        'CampaignName': _str_col(base, 'campaign_name'),
+        'AdSetID': _str_col(base, 'adset_id'),
+        'AdSetName': _str_col(base, 'adset_name'),
+        'AdID': _str_col(base, 'ad_id'),
+        'AdName': _str_col(base, 'ad_name'),
+
+        'BreakdownType': breakdown_type,
+        'Age': _str_col(base, 'age'),
+        'Gender': _str_col(base, 'gender'),
+        'PublisherPlatform': _str_col(base, 'publisher_platform'),
+        'DevicePlatform': _str_col(base, 'device_platform'),
+        'ImpressionDevice': _str_col(base, 'impression_device'),
+
+        'Impressions': m['impressions'],
+        'Reach': _num_col(base, 'reach', 'int64'),
+        'Frequency': _num_col(base, 'frequency'),
+        'Clicks': m['clicks'],
+        'CTR': _num_col(base, 'ctr'),
+        'Spend': m['spend'],
+        'CPM': _num_col(base, 'cpm'),
+        'CPC': _num_col(base, 'cpc'),
+
+        'LandingPageViews': _action(actions, 'landing_page_view'),
+        'AddToCart': _action(actions, 'add_to_cart'),
+        'InitiateCheckout': _action(actions, 'initiate_checkout'),
+        'Purchase': m['purchase'],
+        'CompleteRegistration': _action(actions, 'complete_registration'),
+        'OutboundClicks': m['outbound_clicks'],
+        'LinkClicks': _action(actions, 'link_click'),
+
+        'PurchaseValue': m['purchase_value'],
+        'AOV': m['aov'], 'CPA': m['cpa'], 'ROAS': m['roas'], 'CVR': m['cvr'],
+        'SpendKRW': m['spend_krw'], 'PurchaseValueKRW': m['purchase_value_krw'],
+        'AOVKRW': m['aov_krw'], 'CPAKRW': m['cpa_krw']
+    }, index=base.index)
+
+    return df[BREAKDOWN_COLUMNS]
 
 
 def run_meta_pipeline():
@@ -251,6 +321,7 @@ def run_meta_pipeline():
 
         fetcher = MetaDataFetcher(auth.get_current_token())
         uploader = MetaDBUploader()
+        creative_cache = MetaCreativeCache(fetcher)
 
         # 3. 어제 날짜 계산
         yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
@@ -266,8 +337,6 @@ def run_meta_pipeline():
             for account in ad_accounts:
                 print(f"   [Main] 계정: {account['name']}")
 
-                creatives = fetcher.fetch_ad_creatives(account['id'])
-
                 fields = [
                     'date_start', 'campaign_id', 'campaign_name', 'adset_id', 'adset_name', 'ad_id', 'ad_name',
                     'impressions', 'reach', 'frequency', 'clicks', 'unique_clicks', 'spend', 'ctr', 'unique_ctr',
@@ -278,6 +347,10 @@ def run_meta_pipeline():
                 raw_data = fetcher.fetch_insights_raw(account['id'], fields, time_range=time_range)
 
                 if raw_data:
+                    # 크리에이티브: 캐시 + 변경분/신규 광고만 API 조회
+                    insight_ad_ids = {insight.get('ad_id') for insight in raw_data}
+                    creatives = creative_cache.get_creatives(account['id'], insight_ad_ids)
+
                     df = flatten_insights_data(raw_data, creatives, account['name'], usd_to_krw)
                     all_daily_df.append(df)
 
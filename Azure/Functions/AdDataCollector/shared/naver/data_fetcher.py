@@ -3,14 +3,31 @@
 AD + AD_CONVERSION 리포트 통합 수집
 """
 
-import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, Iterable, List
 from urllib.parse import urlparse
 from .auth import NaverAuth
+from .. import http_client
 
 BASE_URL = "https://api.naver.com"
 
+REPORT_TYPES = ('AD', 'AD_CONVERSION')
+
+# 리포트 빌드 대기 (지수 백오프)
+REPORT_MAX_WAIT = 120
+# REPORT_MAX_WAIT 안에 끝나지 않은 작업 재폴링 횟수 (라운드당 REPORT_MAX_WAIT)
+REPORT_REPOLL_ROUNDS = 1
+POLL_INITIAL_INTERVAL = 1
+POLL_MAX_INTERVAL = 15
+
+# 동시 다운로드 수
+DOWNLOAD_WORKERS = 4
+
+# 백필 시 한 번에 리포트 작업을 생성할 최대 일수 (일수 x 2개 작업)
+BATCH_DAYS = 7
+
 
 class NaverADReportFetcher:
     """AD + AD_CONVERSION 리포트 통합 수집"""
@@ -29,60 +46,97 @@ class NaverADReportFetcher:
         Returns:
             list: 파싱된 통합 데이터 리스트
         """
-        date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-        stat_dt = date_obj.strftime('%Y%m%d')
+        return self.fetch_ad_reports([target_date])[target_date]
 
-        print(f"\n[통합 리포트 수집] {target_date}")
-
-        # 1. AD 리포트 수집
-        ad_data = self._fetch_report('AD', stat_dt, target_date)
+    def fetch_ad_reports(self, target_dates: List[str]) -> Dict[str, list]:
+        """
+        여러 날짜의 AD + AD_CONVERSION 리포트를 한 번에 수집
 
-        # 2. AD_CONVERSION 리포트 수집
-        conversion_data = self._fetch_report('AD_CONVERSION', stat_dt, target_date)
+        1. 모든 (날짜, 리포트 타입) 조합의 리포트 작업을 먼저 생성
+        2. 미완료 작업을 지수 백오프 간격으로 함께 폴링
+        3. 완료된 리포트는 폴링과 병행하여 스트리밍 다운로드/파싱
 
-        # 3. 데이터 통합
-        merged_data = self._merge_reports(ad_data, conversion_data, target_date)
+        Args:
+            target_dates: 날짜 목록 (YYYY-MM-DD 형식)
 
-        print(f"   [통합 완료] {len(merged_data)}건")
+        Returns:
+            Dict[str, list]: 날짜 -> 파싱된 통합 데이터 리스트
+        """
+        print(f"\n[통합 리포트 수집] {', '.join(target_dates)}")
+
+        # 1. 리포트 생성 (날짜 x 타입)
+        jobs = {}
+        for target_date in target_dates:
+            stat_dt = datetime.strptime(target_date, '%Y-%m-%d').strftime('%Y%m%d')
+            for report_type in REPORT_TYPES:
+                print(f"\n   📊 [{report_type}] {target_date} 리포트 생성...")
+                report_job_id = self._create_report(report_type, stat_dt)
+                if report_job_id:
+                    jobs[report_job_id] = (target_date, report_type)
+                else:
+                    print(f"      ❌ 리포트 생성 단계 실패")
+
+        # 2. 폴링 + 3. 다운로드/파싱
+        parsed = {(target_date, report_type): [] for target_date in target_dates for report_type in REPORT_TYPES}
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {}
+            labels = {report_job_id: f"[{report_type}] {target_date}" for report_job_id, (target_date, report_type) in jobs.items()}
+            for report_job_id, report_info in self._wait_for_reports(list(jobs), max_wait=REPORT_MAX_WAIT, labels=labels):
+                target_date, report_type = jobs[report_job_id]
+                download_url = report_info.get('downloadUrl')
+                if not download_url:
+                    print(f"      ❌ 다운로드 URL 없음")
+                    print(f"         report_info: {report_info}")
+                    continue
+                futures[(target_date, report_type)] = executor.submit(
+                    self._download_and_parse, download_url, report_type, target_date
+                )
 
-        return merged_data
+            for key, future in futures.items():
+                parsed[key] = future.result()
 
-    def _fetch_report(self, report_type: str, stat_dt: str, target_date: str) -> list:
-        """특정 타입의 리포트 수집"""
-        print(f"\n   📊 [{report_type}] 리포트 수집 시작...")
+        # 4. 데이터 통합
+        results = {}
+        for target_date in target_dates:
+            merged_data = self._merge_reports(parsed[(target_date, 'AD')], parsed[(target_date, 'AD_CONVERSION')], target_date)
+            print(f"   [통합 완료] {target_date}: {len(merged_data)}건")
+            results[target_date] = merged_data
 
-        # 1. 리포트 생성
-        report_job_id = self._create_report(report_type, stat_dt)
-        if not report_job_id:
-            print(f"      ❌ 리포트 생성 단계 실패")
-            return []
+        return results
 
-        # 2. 리포트 완료 대기
-        report_info = self._wait_for_report(report_job_id, max_wait=120)
-        if not report_info or report_info.get('status') != 'BUILT':
-            print(f"      ❌ 리포트 빌드 단계 실패")
-            return []
+    def iter_ad_reports(self, target_dates: List[str], batch_days: int = BATCH_DAYS):
+        """
+        여러 날짜 리포트를 batch_days 단위로 병렬 생성/수집하며 날짜 순으로 반환
 
-        # 3. 다운로드
-        download_url = report_info.get('downloadUrl')
-        if not download_url:
-            print(f"      ❌ 다운로드 URL 없음")
-            print(f"         report_info: {report_info}")
+        Yields:
+            (target_date, list): 날짜, 파싱된 통합 데이터 리스트
+        """
+        for i in range(0, len(target_dates), batch_days):
+            batch = target_dates[i:i + batch_days]
+            results = self.fetch_ad_reports(batch)
+            for target_date in batch:
+                yield target_date, results[target_date]
+
+    def _download_and_parse(self, download_url: str, report_type: str, target_date: str) -> list:
+        """리포트 다운로드 + 파싱 (응답 스트림을 라인 단위로 바로 파싱)"""
+        response = self._download_report(download_url)
+        if response is None:
+            print(f"      ❌ [{report_type}] {target_date} 다운로드 단계 실패")
             return []
 
-        tsv_data = self._download_report(download_url)
-        if not tsv_data:
-            print(f"      ❌ 다운로드 단계 실패")
+        try:
+            with response:
+                lines = response.iter_lines(decode_unicode=True)
+                if report_type == 'AD':
+                    parsed_data = self._parse_ad_tsv(lines, target_date)
+                else:
+                    parsed_data = self._parse_conversion_tsv(lines, target_date)
+        except Exception as e:
+            print(f"      ❌ [{report_type}] {target_date} 다운로드/파싱 예외: {e}")
             return []
 
-        # 4. 파싱
-        if report_type == 'AD':
-            parsed_data = self._parse_ad_tsv(tsv_data, target_date)
-        else:
-            parsed_data = self._parse_conversion_tsv(tsv_data, target_date)
-
-        print(f"      ✓ 파싱 완료: {len(parsed_data)}건")
-
+        print(f"      ✓ [{report_type}] {target_date} 파싱 완료: {len(parsed_data)}건")
         return parsed_data
 
     def _create_report(self, report_type: str, stat_dt: str):
@@ -96,7 +150,7 @@ class NaverADReportFetcher:
         }
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.base_url}{uri}",
                 headers=headers,
                 json=report_data,
@@ -119,82 +173,129 @@ class NaverADReportFetcher:
             traceback.print_exc()
             return None
 
-    def _wait_for_report(self, report_job_id: str, max_wait: int = 120):
-        """리포트 생성 완료 대기"""
-        uri = f'/stat-reports/{report_job_id}'
-        wait_interval = 3
+    def _wait_for_reports(self, report_job_ids: List[str], max_wait: int = REPORT_MAX_WAIT,
+                          labels: Dict[str, str] = None):
+        """
+        여러 리포트 작업 완료 대기 (지수 백오프 폴링)
 
-        print(f"   ⏳ 리포트 빌드 대기 중 (최대 {max_wait}초)...")
+        - max_wait 안에 끝나지 않은 작업은 작업별로 로그를 남기고 REPORT_REPOLL_ROUNDS회까지 재폴링
+        - 재폴링 후에도 빌드 중인 작업은 마지막 상태와 함께 작업별로 포기 로그
 
-        for elapsed in range(0, max_wait, wait_interval):
-            time.sleep(wait_interval)
+        Args:
+            report_job_ids: 리포트 작업 ID 목록
+            max_wait: 폴링 라운드당 최대 대기 시간 (초)
+            labels: report_job_id -> 로그 표시 이름 (예: "[AD] 2025-01-01")
 
-            headers = self.auth.get_headers('GET', uri)
+        Yields:
+            (report_job_id, report_info): BUILT 상태가 된 작업 (완료 순)
+        """
+        labels = labels or {}
+        pending = list(report_job_ids)
+        if not pending:
+            return
+
+        print(f"   ⏳ 리포트 빌드 대기 중: {len(pending)}건 (최대 {max_wait}초)...")
+
+        start = time.monotonic()
+        deadline = start + max_wait
+        interval = POLL_INITIAL_INTERVAL
+        rounds = 0
+        last_status = {}
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if rounds >= REPORT_REPOLL_ROUNDS:
+                    break
+                # 대용량 계정은 빌드가 길어질 수 있음 → 남은 작업만 한 라운드 더 폴링
+                rounds += 1
+                for report_job_id in pending:
+                    print(f"   [WARNING] 리포트 빌드 지연 ({last_status.get(report_job_id)}), 재폴링 {rounds}/{REPORT_REPOLL_ROUNDS}: "
+                          f"{labels.get(report_job_id, '')} {report_job_id}")
+                deadline = time.monotonic() + max_wait
+                continue
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, POLL_MAX_INTERVAL)
+
+            still_pending = []
+            for report_job_id in pending:
+                report_info = self._get_report_status(report_job_id)
+                status = report_info.get('status') if report_info else None
+                last_status[report_job_id] = status
+
+                if status == 'BUILT':
+                    print(f"   ✓ 리포트 완료: {report_job_id} ({time.monotonic() - start:.0f}초)")
+                    yield report_job_id, report_info
+                elif status == 'FAIL':
+                    print(f"   ❌ 리포트 빌드 실패 (status=FAIL): {report_job_id}")
+                    print(f"      응답: {report_info}")
+                elif status == 'NONE':
+                    # 해당 일자 데이터 없음 - 기다려도 BUILT 되지 않음
+                    print(f"   [WARNING] 리포트 데이터 없음 (status=NONE): {report_job_id}")
+                else:
+                    # REGIST / RUNNING / 조회 실패 -> 다음 라운드에서 재확인
+                    still_pending.append(report_job_id)
+            pending = still_pending
 
-            try:
-                response = requests.get(
-                    f"{self.base_url}{uri}",
-                    headers=headers,
-                    timeout=10
-                )
+        for report_job_id in pending:
+            print(f"   ❌ 타임아웃 ({time.monotonic() - start:.0f}초, 마지막 상태 {last_status.get(report_job_id)}) - "
+                  f"리포트 수집 포기: {labels.get(report_job_id, '')} {report_job_id}")
 
-                if response.status_code == 200:
-                    report_info = response.json()
-                    status = report_info.get('status')
-
-                    if status == 'BUILT':
-                        print(f"   ✓ 리포트 완료 ({elapsed + wait_interval}초)")
-                        return report_info
-                    elif status == 'FAIL':
-                        print(f"   ❌ 리포트 빌드 실패 (status=FAIL)")
-                        print(f"      응답: {report_info}")
-                        return None
-                    elif status in ['REGIST', 'RUNNING']:
-                        # 진행 중
-                        if (elapsed + wait_interval) % 15 == 0:
-                            print(f"      진행 중... ({elapsed + wait_interval}초 경과, status={status})")
-                else:
-                    print(f"   ❌ 상태 조회 실패: {response.status_code}")
-                    print(f"      응답: {response.text}")
+    def _get_report_status(self, report_job_id: str):
+        """리포트 작업 상태 조회"""
+        uri = f'/stat-reports/{report_job_id}'
+        headers = self.auth.get_headers('GET', uri)
+
+        try:
+            response = http_client.get(
+                f"{self.base_url}{uri}",
+                headers=headers,
+                timeout=10
+            )
+
+            if response.status_code == 200:
+                return response.json()
+
+            print(f"   ❌ 상태 조회 실패: {response.status_code}")
+            print(f"      응답: {response.text}")
 
-            except Exception as e:
-                print(f"   ⚠️  상태 조회 예외: {e}")
-                pass
+        except Exception as e:
+            print(f"   ⚠️  상태 조회 예외: {e}")
 
-        print(f"   ❌ 타임아웃 ({max_wait}초) - 리포트 생성이 완료되지 않음")
         return None
 
     def _download_report(self, download_url: str):
-        """리포트 다운로드"""
+        """
+        리포트 다운로드 요청 (스트리밍)
+
+        Returns:
+            requests.Response: 본문을 아직 읽지 않은 스트리밍 응답 (실패 시 None)
+        """
         try:
             parsed = urlparse(download_url)
             download_uri = parsed.path
 
             headers = self.auth.get_headers('GET', download_uri)
 
-            response = requests.get(
-                download_url,
-                headers=headers,
-                timeout=30
-            )
+            response = http_client.get(download_url, headers=headers, timeout=30, stream=True)
 
-            if response.status_code == 200:
-                print(f"   ✓ 다운로드 완료 ({len(response.text)} bytes)")
-                return response.text
-            else:
+            if response.status_code != 200:
                 print(f"   ❌ 다운로드 실패: {response.status_code}")
                 print(f"      응답: {response.text}")
+                response.close()
                 return None
 
+            response.encoding = 'utf-8'
+            return response
+
         except Exception as e:
             print(f"   ❌ 다운로드 예외: {e}")
             import traceback
             traceback.print_exc()
             return None
 
-    def _parse_ad_tsv(self, tsv_data: str, target_date: str) -> list:
-        """AD 리포트 TSV 데이터 파싱"""
-        lines = tsv_data.strip().split('\n')
+    def _parse_ad_tsv(self, lines: Iterable[str], target_date: str) -> list:
+        """AD 리포트 TSV 데이터 파싱 (라인 단위)"""
         parsed_data = []
 
         for line in lines:
@@ -227,9 +328,8 @@ class NaverADReportFetcher:
 
         return parsed_data
 
-    def _parse_conversion_tsv(self, tsv_data: str, target_date: str) -> list:
-        """AD_CONVERSION 리포트 TSV 데이터 파싱"""
-        lines = tsv_data.strip().split('\n')
+    def _parse_conversion_tsv(self, lines: Iterable[str], target_date: str) -> list:
+        """AD_CONVERSION 리포트 TSV 데이터 파싱 (라인 단위)"""
         parsed_data = []
 
         for line in lines:
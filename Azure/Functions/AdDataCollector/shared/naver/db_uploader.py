@@ -3,7 +3,17 @@
 """
 
 import pandas as pd
-from ..database import get_db_connection
+from ..database import get_db_connection, bulk_insert
+
+# #TempAdDataNaver 컬럼 순서
+NAVER_COLUMNS = [
+    'Date', 'CampaignID', 'CampaignName',
+    'AdGroupID', 'AdGroupName',
+    'KeywordID', 'Keyword',
+    'AdID', 'AdName',
+    'Device', 'Impressions', 'Clicks',
+    'Conversions', 'ConversionValue'
+]
 
 
 class NaverDBUploader:
@@ -41,20 +51,8 @@ class NaverDBUploader:
                 )
             """)
 
-            # 데이터 삽입
-            data_to_insert = []
-            for _, row in df.iterrows():
-                data_to_insert.append((
-                    row['Date'], row['CampaignID'], row['CampaignName'],
-                    row['AdGroupID'], row['AdGroupName'],
-                    row['KeywordID'], row['Keyword'],
-                    row['AdID'], row['AdName'],
-                    row['Device'], row['Impressions'], row['Clicks'],
-                    row['Conversions'], row['ConversionValue']
-                ))
-
-            insert_query = "INSERT INTO #TempAdDataNaver VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)"
-            cursor.executemany(insert_query, data_to_insert)
+            # 데이터 삽입 (fast_executemany)
+            bulk_insert(cursor, '#TempAdDataNaver', NAVER_COLUMNS, df)
 
             # MERGE 실행
             merge_query = """
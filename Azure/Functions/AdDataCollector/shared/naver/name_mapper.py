@@ -1,20 +1,55 @@
 """
 네이버 검색광고 ID → 이름 매핑 모듈
 캠페인/광고그룹/키워드/소재 ID를 이름으로 변환
+
+- 매핑은 AdNaverEntityCache 테이블에 저장하여 실행 간 재사용
+- 캠페인/광고그룹의 editTm 변경 여부로 재조회 대상만 선별
+- 하위 엔티티 조회는 스레드 풀 + 공유 요청 간격 제한으로 병렬 처리
 """
 
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from .auth import NaverAuth
+from ..database import get_db_connection, bulk_insert
+from .. import http_client
 
 BASE_URL = "https://api.naver.com"
 
+# 동시 요청 수 / 초당 요청 수 (네이버 검색광고 API Rate Limit 이내)
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 8
+
+# #TempAdNaverEntityCache 컬럼 순서
+CACHE_COLUMNS = ['EntityType', 'EntityID', 'ParentID', 'Name', 'Status', 'EditTime']
+
+
+class _RateLimiter:
+    """스레드 간 공유되는 최소 요청 간격 제한"""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
 
 class NaverNameMapper:
     """ID를 이름으로 매핑하는 클래스"""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.auth = NaverAuth()
         self.base_url = BASE_URL
+        self.use_cache = use_cache
+        self.rate_limiter = _RateLimiter(REQUESTS_PER_SECOND)
 
         # 캐시
         self.campaign_cache = {}
@@ -23,46 +58,66 @@ class NaverNameMapper:
         self.keyword_cache = {}
         self.ad_cache = {}
 
-    def build_all_mappings(self):
-        """모든 매핑 테이블 구축"""
+        # 변경 감지용 (엔티티 ID -> editTm / 상위 ID)
+        self.campaign_edit_cache = {}
+        self.adgroup_edit_cache = {}
+        self.adgroup_parent_cache = {}  # adgroup_id -> campaign_id
+
+        # DB에 반영할 변경분 (CACHE_COLUMNS 순서 튜플)
+        self._changed_rows = []
+
+    def build_all_mappings(self, full_refresh: bool = False):
+        """
+        모든 매핑 테이블 구축
+
+        1. DB 캐시 로드
+        2. 캠페인 목록 조회 (항상)
+        3. 신규/변경 캠페인의 광고그룹 조회 (병렬)
+        4. 신규/변경 광고그룹의 키워드/소재 조회 (병렬)
+        5. 변경분 DB 저장
+
+        Args:
+            full_refresh: True면 캐시를 무시하고 전체 재조회
+        """
         print("\n[매핑 테이블 구축]")
 
+        if self.use_cache and not full_refresh:
+            self._load_cache()
+
         # 1. 캠페인 조회
-        campaigns = self._get_campaigns()
+        campaigns = self._get_campaigns() or []
         print(f"   캠페인: {len(campaigns)}개")
 
+        changed_campaigns = []
         for campaign in campaigns:
             campaign_id = campaign.get('nccCampaignId')
             campaign_name = campaign.get('name')
             campaign_status = campaign.get('status', 'UNKNOWN')  # ELIGIBLE, PAUSED 등
             user_lock = campaign.get('userLock', True)  # True=OFF, False=ON
+            edit_tm = campaign.get('editTm', '')
 
-            self.campaign_cache[campaign_id] = campaign_name
             # 활성 조건: status가 ELIGIBLE이고 userLock이 False(ON)
             is_active = (campaign_status == 'ELIGIBLE' and user_lock == False)
-            self.campaign_status_cache[campaign_id] = 'ACTIVE' if is_active else 'INACTIVE'
+            status = 'ACTIVE' if is_active else 'INACTIVE'
 
-            # 2. 광고그룹 조회
-            adgroups = self._get_adgroups(campaign_id)
+            if (self.campaign_cache.get(campaign_id) != campaign_name
+                    or self.campaign_status_cache.get(campaign_id) != status):
+                # editTm은 광고그룹 조회 성공 후 기록
+                self._changed_rows.append(
+                    ('campaign', campaign_id, None, campaign_name, status,
+                     self.campaign_edit_cache.get(campaign_id, ''))
+                )
 
-            for adgroup in adgroups:
-                adgroup_id = adgroup.get('nccAdgroupId')
-                adgroup_name = adgroup.get('name')
-                self.adgroup_cache[adgroup_id] = adgroup_name
+            self.campaign_cache[campaign_id] = campaign_name
+            self.campaign_status_cache[campaign_id] = status
 
-                # 3. 키워드 조회
-                keywords = self._get_keywords(adgroup_id)
-                for keyword in keywords:
-                    keyword_id = keyword.get('nccKeywordId')
-                    keyword_text = keyword.get('keyword', '')
-                    self.keyword_cache[keyword_id] = keyword_text
+            if full_refresh or self.campaign_edit_cache.get(campaign_id) != edit_tm:
+                changed_campaigns.append((campaign_id, edit_tm))
 
-                # 4. 소재 조회
-                ads = self._get_ads(adgroup_id)
-                for ad in ads:
-                    ad_id = ad.get('nccAdId')
-                    ad_name = ad.get('name', '')
-                    self.ad_cache[ad_id] = ad_name
+        # 2. 광고그룹 조회 (신규/변경 캠페인만)
+        self._crawl_campaigns(changed_campaigns, full_refresh)
+
+        self._save_cache()
 
         # 캠페인 상태별 카운트
         active_count = sum(1 for s in self.campaign_status_cache.values() if s == 'ACTIVE')
@@ -80,6 +135,41 @@ class NaverNameMapper:
             'ad': self.ad_cache
         }
 
+    def resolve_missing(self, report_rows: List[Dict]):
+        """
+        리포트에 등장했지만 매핑에 없는 ID가 있으면 해당 캠페인/광고그룹만 재조회
+
+        (캠페인/광고그룹 editTm에 반영되지 않는 하위 엔티티 추가 대비)
+        """
+        campaigns_to_crawl = set()
+        adgroups_to_crawl = {}
+
+        for item in report_rows:
+            campaign_id = item.get('CampaignID')
+            adgroup_id = item.get('AdGroupID')
+
+            if self._is_entity_id(adgroup_id) and adgroup_id not in self.adgroup_cache:
+                campaigns_to_crawl.add(campaign_id)
+            elif ((self._is_entity_id(item.get('KeywordID')) and item['KeywordID'] not in self.keyword_cache)
+                  or (self._is_entity_id(item.get('AdID')) and item['AdID'] not in self.ad_cache)):
+                adgroups_to_crawl[adgroup_id] = campaign_id
+
+        if not campaigns_to_crawl and not adgroups_to_crawl:
+            return
+
+        print(f"   [매핑 보완] 캠페인 {len(campaigns_to_crawl)}개, 광고그룹 {len(adgroups_to_crawl)}개 재조회")
+
+        self._crawl_campaigns(
+            [(campaign_id, self.campaign_edit_cache.get(campaign_id, '')) for campaign_id in campaigns_to_crawl],
+            full_refresh=True
+        )
+        self._crawl_adgroups([
+            (adgroup_id, self.adgroup_edit_cache.get(adgroup_id, ''), campaign_id)
+            for adgroup_id, campaign_id in adgroups_to_crawl.items()
+        ])
+
+        self._save_cache()
+
     def get_name(self, entity_type: str, entity_id: str) -> str:
         """ID로 이름 조회"""
         cache_map = {
@@ -100,69 +190,211 @@ class NaverNameMapper:
         """캠페인이 활성 상태인지 확인 (ON + 노출가능)"""
         return self.get_campaign_status(campaign_id) == 'ACTIVE'
 
-    def _get_campaigns(self) -> list:
-        """캠페인 목록 조회"""
-        uri = '/ncc/campaigns'
-        headers = self.auth.get_headers('GET', uri)
+    # ------------------------------------------------------------------
+    # 병렬 조회
+    # ------------------------------------------------------------------
 
-        try:
-            response = requests.get(f"{self.base_url}{uri}", headers=headers, timeout=10)
-            if response.status_code == 200:
-                return response.json()
-        except Exception:
-            pass
-        return []
+    def _crawl_campaigns(self, campaigns: List[tuple], full_refresh: bool = False):
+        """캠페인별 광고그룹 조회 후, 신규/변경 광고그룹의 키워드/소재 조회"""
+        if not campaigns:
+            return
 
-    def _get_adgroups(self, campaign_id: str) -> list:
-        """광고그룹 목록 조회"""
-        uri = '/ncc/adgroups'
-        headers = self.auth.get_headers('GET', uri)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(lambda c: self._get_adgroups(c[0]), campaigns))
 
-        try:
-            response = requests.get(
-                f"{self.base_url}{uri}",
-                headers=headers,
-                params={'nccCampaignId': campaign_id},
-                timeout=10
+        changed_adgroups = []
+        for (campaign_id, edit_tm), adgroups in zip(campaigns, results):
+            if adgroups is None:
+                # 조회 실패: editTm을 갱신하지 않아 다음 실행에서 재시도
+                continue
+
+            for adgroup in adgroups:
+                adgroup_id = adgroup.get('nccAdgroupId')
+                adgroup_name = adgroup.get('name')
+                adgroup_edit_tm = adgroup.get('editTm', '')
+
+                if full_refresh or self.adgroup_edit_cache.get(adgroup_id) != adgroup_edit_tm:
+                    changed_adgroups.append((adgroup_id, adgroup_edit_tm, campaign_id))
+
+                if self.adgroup_cache.get(adgroup_id) != adgroup_name:
+                    # editTm은 하위 엔티티 조회 성공 후 기록
+                    self._changed_rows.append(
+                        ('adgroup', adgroup_id, campaign_id, adgroup_name, None,
+                         self.adgroup_edit_cache.get(adgroup_id, ''))
+                    )
+                self.adgroup_cache[adgroup_id] = adgroup_name
+                self.adgroup_parent_cache[adgroup_id] = campaign_id
+
+            self.campaign_edit_cache[campaign_id] = edit_tm
+            self._changed_rows.append(
+                ('campaign', campaign_id, None, self.campaign_cache.get(campaign_id, campaign_id),
+                 self.campaign_status_cache.get(campaign_id, 'UNKNOWN'), edit_tm)
             )
-            if response.status_code == 200:
-                return response.json()
-        except Exception:
-            pass
-        return []
 
-    def _get_keywords(self, adgroup_id: str) -> list:
-        """키워드 목록 조회"""
-        uri = '/ncc/keywords'
-        headers = self.auth.get_headers('GET', uri)
+        self._crawl_adgroups(changed_adgroups)
+
+    def _crawl_adgroups(self, adgroups: List[tuple]):
+        """광고그룹별 키워드/소재 병렬 조회"""
+        if not adgroups:
+            return
+
+        print(f"   광고그룹 하위 조회: {len(adgroups)}개 (동시 {MAX_WORKERS})")
+
+        def crawl(adgroup):
+            adgroup_id = adgroup[0]
+            return self._get_keywords(adgroup_id), self._get_ads(adgroup_id)
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(crawl, adgroups))
+
+        for (adgroup_id, edit_tm, campaign_id), (keywords, ads) in zip(adgroups, results):
+            for keyword in keywords or []:
+                keyword_id = keyword.get('nccKeywordId')
+                keyword_text = keyword.get('keyword', '')
+                if self.keyword_cache.get(keyword_id) != keyword_text:
+                    self._changed_rows.append(('keyword', keyword_id, adgroup_id, keyword_text, None, ''))
+                self.keyword_cache[keyword_id] = keyword_text
 
+            for ad in ads or []:
+                ad_id = ad.get('nccAdId')
+                ad_name = ad.get('name', '')
+                if self.ad_cache.get(ad_id) != ad_name:
+                    self._changed_rows.append(('ad', ad_id, adgroup_id, ad_name, None, ''))
+                self.ad_cache[ad_id] = ad_name
+
+            # 키워드/소재 모두 조회 성공한 경우에만 editTm 기록 (실패 시 다음 실행에서 재조회)
+            if keywords is not None and ads is not None:
+                self.adgroup_edit_cache[adgroup_id] = edit_tm
+                self._changed_rows.append(
+                    ('adgroup', adgroup_id, campaign_id, self.adgroup_cache.get(adgroup_id, adgroup_id), None, edit_tm)
+                )
+
+    @staticmethod
+    def _is_entity_id(value: Optional[str]) -> bool:
+        return bool(value) and value != '-'
+
+    # ------------------------------------------------------------------
+    # DB 캐시
+    # ------------------------------------------------------------------
+
+    def _load_cache(self):
+        """AdNaverEntityCache 테이블에서 매핑 로드"""
         try:
-            response = requests.get(
-                f"{self.base_url}{uri}",
-                headers=headers,
-                params={'nccAdgroupId': adgroup_id},
-                timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()
-        except Exception:
-            pass
-        return []
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT EntityType, EntityID, ParentID, Name, Status, EditTime
+                    FROM [dbo].[AdNaverEntityCache]
+                """)
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+                conn.close()
+        except Exception as e:
+            print(f"   [WARNING] 매핑 캐시 로드 실패, 전체 조회로 진행: {e}")
+            return
 
-    def _get_ads(self, adgroup_id: str) -> list:
-        """소재 목록 조회"""
-        uri = '/ncc/ads'
+        for entity_type, entity_id, parent_id, name, status, edit_time in rows:
+            if entity_type == 'campaign':
+                self.campaign_cache[entity_id] = name
+                self.campaign_status_cache[entity_id] = status
+                self.campaign_edit_cache[entity_id] = edit_time
+            elif entity_type == 'adgroup':
+                self.adgroup_cache[entity_id] = name
+                self.adgroup_parent_cache[entity_id] = parent_id
+                if edit_time:
+                    self.adgroup_edit_cache[entity_id] = edit_time
+            elif entity_type == 'keyword':
+                self.keyword_cache[entity_id] = name
+            elif entity_type == 'ad':
+                self.ad_cache[entity_id] = name
+
+        print(f"   [캐시] {len(rows)}건 로드")
+
+    def _save_cache(self):
+        """변경분을 AdNaverEntityCache 테이블에 MERGE"""
+        if not self.use_cache or not self._changed_rows:
+            self._changed_rows = []
+            return
+
+        # 동일 엔티티는 마지막 값만 반영
+        rows = list({(row[0], row[1]): row for row in self._changed_rows}.values())
+        self._changed_rows = []
+
+        try:
+            conn = get_db_connection()
+        except Exception as e:
+            print(f"   [WARNING] 매핑 캐시 저장 실패: {e}")
+            return
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                CREATE TABLE #TempAdNaverEntityCache (
+                    [EntityType] [nvarchar](20), [EntityID] [nvarchar](50), [ParentID] [nvarchar](50),
+                    [Name] [nvarchar](500), [Status] [nvarchar](20), [EditTime] [nvarchar](50)
+                )
+            """)
+            bulk_insert(cursor, '#TempAdNaverEntityCache', CACHE_COLUMNS, rows)
+
+            cursor.execute("""
+                MERGE INTO [dbo].[AdNaverEntityCache] AS target
+                USING #TempAdNaverEntityCache AS source
+                ON target.EntityType = source.EntityType AND target.EntityID = source.EntityID
+
+                WHEN MATCHED THEN
+                    UPDATE SET
+                        ParentID = source.ParentID, Name = source.Name,
+                        Status = source.Status, EditTime = source.EditTime,
+                        UpdatedDate = GETDATE()
+
+                WHEN NOT MATCHED THEN
+                    INSERT (EntityType, EntityID, ParentID, Name, Status, EditTime, CollectedDate, UpdatedDate)
+                    VALUES (source.EntityType, source.EntityID, source.ParentID, source.Name,
+                            source.Status, source.EditTime, GETDATE(), GETDATE());
+            """)
+            conn.commit()
+            print(f"   [캐시] {len(rows)}건 저장")
+
+        except Exception as e:
+            # 캐시 저장 실패는 수집을 막지 않음 (다음 실행에서 재조회)
+            print(f"   [WARNING] 매핑 캐시 저장 실패: {e}")
+            conn.rollback()
+        finally:
+            cursor.close()
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # API 조회 (실패 시 None 반환 -> 캐시 editTm 미갱신)
+    # ------------------------------------------------------------------
+
+    def _request_list(self, uri: str, params: Optional[dict] = None) -> Optional[list]:
+        """서명된 GET 요청 (Rate Limit 대기, 429/5xx 재시도는 http_client에서 처리)"""
+        self.rate_limiter.wait()
         headers = self.auth.get_headers('GET', uri)
 
         try:
-            response = requests.get(
-                f"{self.base_url}{uri}",
-                headers=headers,
-                params={'nccAdgroupId': adgroup_id},
-                timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()
+            response = http_client.get(f"{self.base_url}{uri}", headers=headers, params=params, timeout=10)
         except Exception:
-            pass
-        return []
+            return None
+
+        if response.status_code == 200:
+            return response.json()
+        return None
+
+    def _get_campaigns(self) -> Optional[list]:
+        """캠페인 목록 조회"""
+        return self._request_list('/ncc/campaigns')
+
+    def _get_adgroups(self, campaign_id: str) -> Optional[list]:
+        """광고그룹 목록 조회"""
+        return self._request_list('/ncc/adgroups', {'nccCampaignId': campaign_id})
+
+    def _get_keywords(self, adgroup_id: str) -> Optional[list]:
+        """키워드 목록 조회"""
+        return self._request_list('/ncc/keywords', {'nccAdgroupId': adgroup_id})
+
+    def _get_ads(self, adgroup_id: str) -> Optional[list]:
+        """소재 목록 조회"""
+        return self._request_list('/ncc/ads', {'nccAdgroupId': adgroup_id})
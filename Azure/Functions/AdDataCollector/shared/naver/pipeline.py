@@ -42,7 +42,7 @@ def run_naver_pipeline():
 
         logging.info(f"[INFO] 수집 대상 날짜: {yesterday} (전날)")
 
-        # 4. 이름 매핑 테이블 구축 (한 번만)
+        # 4. 이름 매핑 테이블 구축 (DB 캐시 + 변경분만 재조회)
         name_mapper.build_all_mappings()
 
         # 5. 전날 데이터 수집
@@ -55,6 +55,9 @@ def run_naver_pipeline():
                 print(f"   [WARNING] {date} 데이터 없음")
                 continue
 
+            # 매핑에 없는 ID가 있으면 해당 캠페인/광고그룹만 재조회
+            name_mapper.resolve_missing(raw_data)
+
             # 데이터 변환 및 필터링
             rows = []
             filtered_count = 0
@@ -4,10 +4,10 @@ SystemConfig 테이블에서 Webhook URL 로드
 Meta / Naver 각각 별도 채널로 알림
 """
 
-import requests
 import logging
 from datetime import datetime
 from .system_config import get_config
+from . import http_client
 
 
 def _send_to_webhook(message, webhook_url):
@@ -17,7 +17,7 @@ def _send_to_webhook(message, webhook_url):
 
     try:
         payload = {"text": message}
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = http_client.post(webhook_url, json=payload, timeout=10)
 
         if response.status_code == 200:
             return True
@@ -35,6 +35,9 @@ def daily_sales_collector(timer: func.TimerRequest) -> None:
     logging.info(f'실행 시간: {datetime.utcnow().isoformat()}Z (UTC)')
     logging.info('=' * 80)
 
+    from common.http_client import reset_metrics, log_metrics
+    reset_metrics()
+
     results = {
         'cafe24': None,
         'sabangnet': None,
@@ -108,6 +111,9 @@ def daily_sales_collector(timer: func.TimerRequest) -> None:
     else:
         logging.info('모든 파이프라인 정상 완료!')
 
+    # 호스트별 HTTP 요청 메트릭
+    log_metrics()
+
     logging.info('=' * 80)
 
 
@@ -134,12 +140,18 @@ def daily_customer_collector(timer: func.TimerRequest) -> None:
     logging.info(f'실행 시간: {datetime.utcnow().isoformat()}Z (UTC)')
     logging.info('=' * 80)
 
+    from common.http_client import reset_metrics, log_metrics
+    reset_metrics()
+
     try:
         from cafe24.main_customers import main as run_customer_pipeline
 
         # 고객 수집 파이프라인 실행
         run_customer_pipeline()
 
+        # 호스트별 HTTP 요청 메트릭
+        log_metrics()
+
         logging.info('=' * 80)
         logging.info('Cafe24 고객 데이터 수집 완료!')
         logging.info('=' * 80)
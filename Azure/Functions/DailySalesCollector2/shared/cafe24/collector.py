@@ -3,7 +3,6 @@ Cafe24 주문 수집 모듈
 SystemConfig DB 기반 토큰 관리 (Blob Storage 대신)
 """
 
-import requests
 import json
 import time
 import os
@@ -15,6 +14,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from system_config import get_config, update_config
 from .config import get_cafe24_config, CAFE24_CONFIG, API_VERSION, BASE_URL
+from common import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +90,7 @@ class Cafe24OrderCollector:
         auth = (self.client_id, self.client_secret)
 
         try:
-            response = requests.post(url, data=data, auth=auth, timeout=30)
+            response = http_client.post(url, data=data, auth=auth, timeout=30)
 
             if response.status_code == 200:
                 token_data = response.json()
@@ -163,7 +163,7 @@ class Cafe24OrderCollector:
             }
 
             try:
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = http_client.get(url, headers=headers, params=params, timeout=30)
 
                 # 토큰 만료 시 재시도
                 if response.status_code == 401:
@@ -172,12 +172,7 @@ class Cafe24OrderCollector:
                     headers["Authorization"] = f"Bearer {access_token}"
                     continue
 
-                # Rate limit 처리
-                if response.status_code == 429:
-                    print("[대기] API 호출 제한, 2초 대기...")
-                    time.sleep(2)
-                    continue
-
+                # Rate limit(429)은 http_client에서 Retry-After 기준 재시도 → 여기까지 오면 재시도 소진 (아래에서 실패 처리)
                 if response.status_code != 200:
                     raise Exception(f"주문 조회 실패: {response.status_code}, {response.text}")
 
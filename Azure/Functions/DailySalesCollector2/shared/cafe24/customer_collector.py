@@ -2,11 +2,11 @@
 Cafe24 고객 데이터 수집 모듈
 Dynamic Cursor 방식으로 전체 고객 수집 (offset 8000 제한 우회)
 """
-import requests
 import time
 import logging
 from datetime import datetime, timedelta
 from .collector import Cafe24OrderCollector
+from common import http_client
 
 
 class Cafe24CustomerCollector(Cafe24OrderCollector):
@@ -63,7 +63,7 @@ class Cafe24CustomerCollector(Cafe24OrderCollector):
             }
 
             try:
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = http_client.get(url, headers=headers, params=params, timeout=30)
 
                 if response.status_code == 401:
                     logging.warning("토큰 만료, 자동 갱신 중...")
@@ -71,11 +71,7 @@ class Cafe24CustomerCollector(Cafe24OrderCollector):
                     headers["Authorization"] = f"Bearer {access_token}"
                     continue
 
-                if response.status_code == 429:
-                    logging.warning("API 호출 제한, 2초 대기...")
-                    time.sleep(2)
-                    continue
-
+                # 429는 http_client에서 재시도 후 반환 → 재시도 소진 시 아래에서 조회 실패 처리
                 if response.status_code == 422:
                     logging.warning(f"offset {offset} 한도 도달 (422). 이 범위의 데이터가 8000건을 초과했을 수 있음.")
                     break
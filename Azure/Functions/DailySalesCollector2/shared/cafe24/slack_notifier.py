@@ -3,8 +3,8 @@ Slack 알림 모듈
 Webhook을 통해 메시지 전송
 """
 
-import requests
 import os
+from common import http_client
 
 
 def send_slack_notification(message, webhook_url=None):
@@ -30,7 +30,7 @@ def send_slack_notification(message, webhook_url=None):
             "text": message
         }
 
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = http_client.post(webhook_url, json=payload, timeout=10)
 
         if response.status_code == 200:
             print("[슬랙 알림] 전송 성공")
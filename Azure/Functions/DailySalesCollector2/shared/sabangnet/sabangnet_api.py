@@ -9,6 +9,7 @@ import json
 import logging
 from typing import List, Dict, Optional
 from .config import SABANGNET_CONFIG, ORDER_CONFIG
+from common import http_client
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -136,7 +137,7 @@ class SabangnetAPI:
             logger.info(f"사방넷 API 호출: {full_url}")
             
             # API 호출
-            response = requests.get(full_url, timeout=30)
+            response = http_client.get(full_url, timeout=30)
             response.raise_for_status()
             
             # 응답 내용 로깅 (디버깅용)
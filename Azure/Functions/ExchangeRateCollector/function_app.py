@@ -48,6 +48,10 @@ def exchange_rate_collector(timer: func.TimerRequest) -> None:
         elif result["status"] == "skipped":
             logging.info(f'수집 생략: {result["reason"]}')
 
+        # 호스트별 HTTP 요청 메트릭
+        from http_client import log_metrics
+        log_metrics()
+
     except Exception as e:
         logging.error(f'환율 수집 실패: {str(e)}', exc_info=True)
         raise
@@ -6,8 +6,8 @@
 
 import logging
 from datetime import datetime, timedelta
-import requests
 from database import get_db_connection
+import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +48,7 @@ def fetch_exchange_rate(api_key: str, target_date: str) -> dict | None:
 
     logger.info(f"[API] 한국은행 환율 조회: {target_date}")
 
-    response = requests.get(url, timeout=30)
+    response = http_client.get(url, timeout=30)
     response.raise_for_status()
 
     data = response.json()
@@ -0,0 +1,140 @@
+# 자동 생성 파일 - Azure/Functions/shared_lib/http_client.py 에서 복사 (수정 시 원본 수정 후 python sync_shared_lib.py)
+"""
+공용 HTTP 클라이언트
+- 호스트별 requests.Session 재사용 (keep-alive → 페이지/요청마다 TCP+TLS 핸드셰이크 생략)
+- HTTPAdapter 연결 풀 크기 및 공통 재시도 정책 (연결 오류 / 429 / 5xx, Retry-After 준수)
+- 호스트별 요청 수 / 소요 시간 / 오류 수 메트릭
+
+- 원본은 Azure/Functions/shared_lib/http_client.py 1개 - 앱별 사본은 sync_shared_lib.py로 생성 (사본 직접 수정 금지)
+- 429/5xx/연결 오류 재시도는 여기서만 처리 (GET 계열) → 호출부에서 429 재시도 루프를 다시 두지 않음
+
+사용법 (앱별 배치 위치에 따라):
+    from shared import http_client   # AdDataCollector, ViralMonitor_v2/monitor
+    from common import http_client   # DailySalesCollector2, KeywordCollector
+    import http_client               # ExchangeRateCollector
+    response = http_client.get(url, params=params, timeout=10)
+"""
+import logging
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# 연결 풀 (호스트별 Session 1개 → 호스트당 동시 연결 수 = POOL_MAXSIZE)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# 공통 재시도 정책 (멱등 메서드만, POST는 호출부에서 처리)
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5  # 0.5, 1, 2초
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+RETRY_ALLOWED_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# timeout 미지정 요청의 기본값 (초)
+DEFAULT_TIMEOUT = 30
+
+_sessions: Dict[str, requests.Session] = {}
+_metrics: Dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+class _TimedSession(requests.Session):
+    """요청별 소요 시간을 호스트 메트릭에 기록하는 Session"""
+
+    def __init__(self, host: str):
+        super().__init__()
+        self.host = host
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        start = time.perf_counter()
+        error = False
+        try:
+            response = super().request(method, url, **kwargs)
+            error = response.status_code >= 400
+            return response
+        except Exception:
+            error = True
+            raise
+        finally:
+            _record(self.host, time.perf_counter() - start, error)
+
+
+def _create_session(host: str) -> requests.Session:
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 재시도 소진 시 마지막 응답 반환 (호출부 상태 코드 처리 유지)
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = _TimedSession(host)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """URL 호스트의 공용 Session (없으면 생성)"""
+    host = urlparse(url).netloc or url
+    session = _sessions.get(host)
+    if session is None:
+        with _lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _create_session(host)
+                _sessions[host] = session
+    return session
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """호스트별 공용 Session으로 요청 (requests.request와 같은 인자)"""
+    return get_session(url).request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def _record(host: str, elapsed: float, error: bool):
+    with _lock:
+        stats = _metrics.setdefault(host, {"requests": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0})
+        stats["requests"] += 1
+        stats["errors"] += int(error)
+        stats["total_time"] += elapsed
+        stats["max_time"] = max(stats["max_time"], elapsed)
+
+
+def get_metrics() -> Dict[str, dict]:
+    """호스트별 메트릭 복사본 {host: {requests, errors, total_time, max_time}}"""
+    with _lock:
+        return {host: dict(stats) for host, stats in _metrics.items()}
+
+
+def log_metrics():
+    """호스트별 요청 수 / 평균·최대 소요 시간 / 오류 수 로그 출력"""
+    for host, stats in sorted(get_metrics().items()):
+        avg_ms = stats["total_time"] / stats["requests"] * 1000
+        logger.info(
+            f"[HTTP] {host}: 요청 {stats['requests']}건, 평균 {avg_ms:.0f}ms, "
+            f"최대 {stats['max_time'] * 1000:.0f}ms, 오류 {stats['errors']}건"
+        )
+
+
+def reset_metrics():
+    """메트릭 초기화 (실행 시작 시 호출 - 웜 인스턴스에서 이전 실행 누적 방지)"""
+    with _lock:
+        _metrics.clear()
@@ -22,7 +22,9 @@ def daily_keyword_collector(timer: func.TimerRequest) -> None:
 
     try:
         from common.slack_notifier import send_keyword_notification
-        
+        from common.http_client import reset_metrics, log_metrics
+        reset_metrics()
+
         # 1. 네이버 수집
         from naver_keyword.naver_pipeline import run_naver_ads_pipeline
         naver_result = run_naver_ads_pipeline()
@@ -33,6 +35,9 @@ def daily_keyword_collector(timer: func.TimerRequest) -> None:
         # google_result = run_google_ads_pipeline()
         # send_keyword_notification("GoogleKeywordAPI", google_result)
 
+        # 호스트별 HTTP 요청 메트릭
+        log_metrics()
+
         logging.info('=' * 80)
         logging.info('키워드 검색량 수집 완료')
         logging.info('=' * 80)
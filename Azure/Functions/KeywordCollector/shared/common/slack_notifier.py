@@ -1,7 +1,7 @@
-import requests
 import logging
 from datetime import datetime
 from common.system_config import get_config
+from common import http_client
 
 def _send_to_webhook(message, webhook_url):
     """실제 Slack Webhook 전송"""
@@ -10,7 +10,7 @@ def _send_to_webhook(message, webhook_url):
 
     try:
         payload = {"text": message}
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = http_client.post(webhook_url, json=payload, timeout=10)
 
         if response.status_code == 200:
             return True
@@ -9,6 +9,7 @@ import base64
 import time
 import logging
 from .config import CUSTOMER_ID, ACCESS_LICENSE, SECRET_KEY, BASE_URL, KEYWORDSTOOL_PATH
+from common import http_client
 
 
 class NaverKeywordAPIClient:
@@ -74,7 +75,7 @@ class NaverKeywordAPIClient:
         }
 
         try:
-            response = requests.get(
+            response = http_client.get(
                 f"{self.base_url}{self.keywordstool_path}",
                 headers=headers,
                 params=params,
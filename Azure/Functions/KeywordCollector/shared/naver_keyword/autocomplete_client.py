@@ -4,6 +4,7 @@
 """
 import requests
 import logging
+from common import http_client
 
 
 class NaverAutocompleteClient:
@@ -39,7 +40,7 @@ class NaverAutocompleteClient:
         }
 
         try:
-            response = requests.get(
+            response = http_client.get(
                 self.base_url,
                 params=params,
                 timeout=10
@@ -11,35 +11,25 @@ from .autocomplete_client import NaverAutocompleteClient
 from .naver_uploader import NaverAdsUploader
 
 
-def call_api_with_retry(api_client, keyword, max_retries=3, retry_delay=5):
+def call_keyword_api(api_client, keyword):
     """
-    API 호출 재시도 로직
+    키워드 검색량 API 호출 (429/5xx/연결 오류 재시도는 http_client에서 처리 - 여기서 다시 재시도하지 않음)
 
     Args:
         api_client: NaverKeywordAPIClient 인스턴스
         keyword: 조회할 키워드
-        max_retries: 최대 재시도 횟수 (기본값: 3)
-        retry_delay: 재시도 간격 초 (기본값: 5)
 
     Returns:
         tuple: (result, error_message) - 성공 시 (result, None), 실패 시 (None, error_message)
     """
-    last_error = None
-    for attempt in range(max_retries):
-        try:
-            result = api_client.get_keyword_stats(keyword, include_related=False)
-            if result:
-                return result, None
-            else:
-                last_error = "Empty response"
-        except Exception as e:
-            last_error = str(e)
-            if attempt < max_retries - 1:
-                logging.warning(f"  API 재시도 {attempt + 1}/{max_retries} (키워드: {keyword}): {e}")
-                time.sleep(retry_delay)
-            continue
+    try:
+        result = api_client.get_keyword_stats(keyword, include_related=False)
+    except Exception as e:
+        return None, str(e)
 
-    return None, last_error
+    if result:
+        return result, None
+    return None, "Empty response"
 
 
 def run_naver_ads_pipeline():
@@ -137,8 +127,8 @@ def run_naver_ads_pipeline():
                 # 네이버 KeywordTool API는 공백 포함 키워드를 지원하지 않음
                 api_keyword = compound_keyword.replace(' ', '')
 
-                # KeywordTool API 호출 (재시도 로직 포함)
-                result, error = call_api_with_retry(api_client, api_keyword)
+                # KeywordTool API 호출 (재시도는 http_client)
+                result, error = call_keyword_api(api_client, api_keyword)
 
                 if result and 'keywordList' in result:
                     keyword_list = result['keywordList']
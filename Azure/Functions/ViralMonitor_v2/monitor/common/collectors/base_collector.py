@@ -0,0 +1,56 @@
+"""
+수집기 베이스 클래스
+모든 채널별 collector는 이 클래스를 상속받아 구현
+"""
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from ..models import Mention
+
+logger = logging.getLogger(__name__)
+
+
+class BaseCollector(ABC):
+    """추상 베이스 수집기"""
+
+    # 키워드별 워터마크 저장소 (AzureWatermarkStore, 워터마크를 쓰는 수집기만 설정)
+    watermark_store = None
+
+    def __init__(self, keywords: List[str]):
+        """
+        Args:
+            keywords: 모니터링할 키워드 리스트
+        """
+        self.keywords = keywords
+
+        # collect()에서 계산한 새 워터마크 (commit_watermarks 호출 전까지 저장하지 않음)
+        self.pending_watermarks: Dict[str, str] = {}
+
+    @abstractmethod
+    def collect(self) -> List[Mention]:
+        """
+        해당 채널에서 키워드 관련 게시글 수집
+
+        Returns:
+            Mention 객체 리스트
+        """
+        raise NotImplementedError("Subclass must implement collect()")
+
+    def commit_watermarks(self):
+        """
+        직전 collect()의 워터마크 저장
+
+        브랜드 처리와 Slack 전송이 모두 성공한 뒤 호출
+        (먼저 저장하면 처리 실패한 게시글이 다음 실행에서 워터마크에 막혀 누락됨)
+        """
+        if not self.watermark_store or not self.pending_watermarks:
+            return
+        try:
+            self.watermark_store.update(self.get_name(), self.pending_watermarks)
+            self.pending_watermarks = {}
+        except Exception as e:
+            logger.error(f"{self.get_name()} 워터마크 저장 오류: {e}")
+
+    def get_name(self) -> str:
+        """수집기 이름 반환"""
+        return self.__class__.__name__
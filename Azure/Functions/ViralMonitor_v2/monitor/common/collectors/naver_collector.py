@@ -0,0 +1,212 @@
+"""
+네이버 블로그 수집기
+네이버 검색 API를 사용하여 키워드 관련 게시글 수집
+- 키워드별 검색을 공유 Session으로 병렬 실행
+- start 파라미터로 페이지를 넘기며 수집 기간(since_days) 이전 글이 나올 때까지 수집
+- 키워드별 워터마크(직전 실행의 최신 게시글 링크)에 도달하면 조기 종료
+- 새 워터마크는 pending_watermarks에 보관 → 처리/알림 성공 후 commit_watermarks()로 저장
+"""
+import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import logging
+from .base_collector import BaseCollector
+from ..models import Mention
+from shared import http_client
+
+logger = logging.getLogger(__name__)
+
+# 네이버 검색 API 제한: display 최대 100, start 최대 1000
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+# 동시 키워드 검색 수 (검색 API 초당 호출 제한 고려)
+MAX_WORKERS = 4
+
+REQUEST_TIMEOUT = 10
+
+
+class NaverSearchCollector(BaseCollector):
+    """네이버 검색 API 공통 수집기 (키워드 병렬 + 페이지 수집 + 워터마크)"""
+
+    api_url = ""
+    label = "네이버 검색"
+    def __init__(
+        self,
+        keywords: List[str],
+        client_id: str,
+        client_secret: str,
+        since_days: int = 0,
+        max_pages: int = MAX_START // MAX_DISPLAY,
+        watermark_store=None,
+    ):
+        """
+        Args:
+            keywords: 모니터링할 키워드 리스트
+            client_id: 네이버 API Client ID
+            client_secret: 네이버 API Client Secret
+            since_days: 수집 기간 (0 = 당일 글까지)
+            max_pages: 키워드당 최대 페이지 수
+            watermark_store: 키워드별 워터마크 저장소 (AzureWatermarkStore, None이면 매번 전체 페이지 수집)
+        """
+        super().__init__(keywords)
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.since_days = since_days
+        self.max_pages = max_pages
+        self.watermark_store = watermark_store
+
+        self.headers = {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret,
+        }
+
+    def collect(self) -> List[Mention]:
+        """키워드별 병렬 검색 후 같은 URL의 게시글은 키워드 합치기"""
+        self.pending_watermarks = {}
+        watermarks = self._load_watermarks()
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(
+                lambda keyword: self._collect_keyword(keyword, watermarks.get(keyword)),
+                self.keywords
+            ))
+
+        url_to_mention = {}  # URL별로 Mention 저장 (중복 통합용)
+        url_to_keywords = {}  # URL별 매칭 키워드 (마지막에 1회 합치기)
+        new_watermarks = {}
+
+        for keyword, (mentions, newest_link) in zip(self.keywords, results):
+            if newest_link:
+                new_watermarks[keyword] = newest_link
+
+            for mention in mentions:
+                # 새 게시글이면 추가, 이미 존재하면 키워드만 추가
+                url_to_mention.setdefault(mention.url, mention)
+                url_to_keywords.setdefault(mention.url, []).append(keyword)
+
+        for url, mention in url_to_mention.items():
+            mention.keyword_matched = ", ".join(url_to_keywords[url])
+
+        self.pending_watermarks = new_watermarks
+
+        return list(url_to_mention.values())
+
+    def _collect_keyword(self, keyword: str, watermark: Optional[str]) -> Tuple[List[Mention], Optional[str]]:
+        """키워드 1개 수집 (오류 시 빈 결과, 기존 워터마크 유지)"""
+        try:
+            mentions, newest_link = self._search_keyword(keyword, watermark)
+            logger.info(f"{self.label}: '{keyword}' 검색 완료 - {len(mentions)}건 발견")
+            return mentions, newest_link or watermark
+        except Exception as e:
+            logger.error(f"{self.label} '{keyword}' 검색 오류: {e}")
+            return [], watermark
+
+    def _search_keyword(self, keyword: str, watermark: Optional[str] = None) -> Tuple[List[Mention], Optional[str]]:
+        """
+        특정 키워드로 최신순 페이지 수집
+
+        Returns:
+            (수집한 Mention 리스트, 이번 검색의 최신 게시글 링크)
+            - 워터마크/수집 기간/마지막 페이지까지 다 본 경우에만 최신 링크 반환
+            - 요청 오류나 최대 페이지로 중간에 멈추면 None (기존 워터마크 유지 → 다음 실행에서 빠진 글 재수집)
+        """
+        cutoff = (datetime.now() - timedelta(days=self.since_days)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        mentions = []
+        newest_link = None
+        completed = False
+
+        for page in range(self.max_pages):
+            start = page * MAX_DISPLAY + 1
+            if start > MAX_START:
+                break
+
+            params = {
+                "query": keyword,
+                "display": MAX_DISPLAY,
+                "start": start,
+                "sort": "date",  # 최신순
+            }
+
+            try:
+                response = http_client.get(self.api_url, headers=self.headers, params=params, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                items = response.json().get("items", [])
+            except requests.exceptions.RequestException as e:
+                logger.error(f"네이버 API 요청 오류: {e}")
+                break
+
+            if newest_link is None and items:
+                newest_link = items[0]["link"]
+
+            reached_end = False
+            for item in items:
+                # 직전 실행에서 본 최신 게시글 → 이후는 이미 수집한 글
+                if watermark and item["link"] == watermark:
+                    reached_end = True
+                    break
+
+                mention = self._parse_item(item, keyword)
+
+                # 수집 기간 이전 글 → 최신순이므로 이후 페이지도 모두 이전 글
+                if mention.posted_date < cutoff:
+                    reached_end = True
+                    break
+
+                mentions.append(mention)
+
+            if reached_end or len(items) < MAX_DISPLAY:
+                completed = True
+                break
+
+        return mentions, newest_link if completed else None
+
+    def _load_watermarks(self) -> Dict[str, str]:
+        if not self.watermark_store:
+            return {}
+        try:
+            return self.watermark_store.get(self.get_name())
+        except Exception as e:
+            logger.error(f"{self.label} 워터마크 로드 오류: {e}")
+            return {}
+
+    def _parse_item(self, item: dict, keyword: str) -> Mention:
+        """API 응답 파싱"""
+        raise NotImplementedError("Subclass must implement _parse_item()")
+
+    @staticmethod
+    def _remove_html_tags(text: str) -> str:
+        """HTML 태그 제거 (<b>, </b> 등)"""
+        return re.sub(r"<[^>]+>", "", text)
+
+
+class NaverBlogCollector(NaverSearchCollector):
+    """네이버 블로그 수집기"""
+
+    api_url = "https://openapi.naver.com/v1/search/blog.json"
+    label = "네이버 블로그"
+    source_name = "네이버 블로그"
+
+    def _parse_item(self, item: dict, keyword: str) -> Mention:
+        """API 응답 파싱"""
+        # HTML 태그 제거
+        title = self._remove_html_tags(item["title"])
+        description = self._remove_html_tags(item["description"])
+
+        # 날짜 파싱 (YYYYMMDD 형식 - 시간 정보는 네이버 API에서 제공 안함)
+        date_str = item["postdate"]
+        posted_date = datetime.strptime(date_str, "%Y%m%d")
+
+        return Mention(
+            source=self.source_name,
+            title=title,
+            url=item["link"],
+            author=item.get("bloggername", "알 수 없음"),
+            posted_date=posted_date,
+            content_preview=description,
+            keyword_matched=keyword,
+        )
+
@@ -0,0 +1,222 @@
+"""
+YouTube 비디오 수집기
+YouTube Data API v3를 사용하여 키워드 관련 비디오 수집
+- 키워드별 search.list를 공유 Session으로 병렬 실행
+- 키워드별 마지막 수집 시각을 워터마크로 저장하여 publishedAfter로 증분 검색
+- 모든 키워드의 비디오 ID를 합쳐 50개 단위 videos.list로 한 번씩만 상세 조회
+"""
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import logging
+from .base_collector import BaseCollector
+from ..models import Mention
+from shared import http_client
+
+logger = logging.getLogger(__name__)
+
+# videos.list 1회 최대 ID 수
+VIDEOS_BATCH_SIZE = 50
+
+# 동시 키워드 검색 수
+MAX_WORKERS = 4
+
+# 검색 색인 지연 대비 워터마크 overlap
+WATERMARK_OVERLAP = timedelta(hours=1)
+
+REQUEST_TIMEOUT = 10
+
+WATERMARK_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class YouTubeCollector(BaseCollector):
+    """YouTube 비디오 수집기"""
+
+    def __init__(self, keywords: List[str], api_key: str, max_results: int = 20, order: str = "date",
+                 watermark_store=None):
+        """
+        Args:
+            keywords: 모니터링할 키워드 리스트
+            api_key: YouTube Data API v3 API Key
+            max_results: 키워드당 수집할 비디오 수 (기본 20, 최대 50)
+            order: 정렬 방식 ('date': 최신순, 'viewCount': 조회수순, 'relevance': 관련도순)
+            watermark_store: 키워드별 마지막 수집 시각 저장소 (AzureWatermarkStore, None이면 매번 당일 전체 검색)
+        """
+        super().__init__(keywords)
+        self.api_key = api_key
+        self.max_results = min(max_results, 50)  # YouTube API 최대 50개
+        self.order = order
+        self.watermark_store = watermark_store
+        self.search_url = "https://www.googleapis.com/youtube/v3/search"
+        self.videos_url = "https://www.googleapis.com/youtube/v3/videos"
+
+    def collect(self) -> List[Mention]:
+        """YouTube에서 키워드 검색 (증분) 후 비디오 상세 일괄 조회"""
+        run_started = datetime.utcnow()
+        self.pending_watermarks = {}
+        watermarks = self._load_watermarks()
+
+        # 1단계: 키워드별 병렬 검색
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(
+                lambda keyword: self._search_keyword(keyword, watermarks.get(keyword)),
+                self.keywords
+            ))
+
+        # 비디오 ID별 매칭 키워드 (검색 순서 유지)
+        video_keywords: Dict[str, List[str]] = {}
+        new_watermarks = {}
+
+        for keyword, (video_ids, success) in zip(self.keywords, results):
+            if success:
+                new_watermarks[keyword] = run_started.strftime(WATERMARK_FORMAT)
+            for video_id in video_ids:
+                video_keywords.setdefault(video_id, []).append(keyword)
+
+        # 2단계: 모든 키워드의 비디오 ID를 합쳐 50개 단위로 상세 조회 (바이럴 지표 포함)
+        mentions, details_ok = self._get_video_details(list(video_keywords), video_keywords)
+
+        # 검색 성공한 키워드만 워터마크 갱신 (실패 키워드는 다음 실행에서 같은 구간 재검색)
+        # 상세 조회 실패 시 갱신하지 않음 (누락 비디오 재검색)
+        # 저장은 브랜드 처리/알림 성공 후 commit_watermarks()에서
+        if details_ok:
+            self.pending_watermarks = new_watermarks
+
+        logger.info(f"YouTube: 키워드 {len(self.keywords)}개 검색, 비디오 {len(video_keywords)}개 상세 조회")
+        return mentions
+
+    def _search_keyword(self, keyword: str, watermark: Optional[str]) -> Tuple[List[str], bool]:
+        """
+        특정 키워드로 YouTube 비디오 검색
+
+        Returns:
+            (비디오 ID 리스트, 검색 성공 여부)
+        """
+        try:
+            video_ids = self._search_videos(keyword, self._published_after(watermark))
+            logger.info(f"YouTube: '{keyword}' 검색 완료 - {len(video_ids)}건 발견")
+            return video_ids, True
+        except Exception as e:
+            logger.error(f"YouTube '{keyword}' 검색 오류: {e}")
+            return [], False
+
+    @staticmethod
+    def _published_after(watermark: Optional[str]) -> str:
+        """publishedAfter 값: max(오늘 자정, 마지막 수집 시각 - overlap)"""
+        # 오늘 자정 (KST -> UTC 변환)
+        published_after = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        if watermark:
+            try:
+                last_run = datetime.strptime(watermark, WATERMARK_FORMAT) - WATERMARK_OVERLAP
+                published_after = max(published_after, last_run)
+            except ValueError:
+                pass
+
+        return published_after.strftime(WATERMARK_FORMAT)
+
+    def _search_videos(self, keyword: str, published_after: str) -> List[str]:
+        """YouTube 검색 API로 비디오 ID 목록 가져오기"""
+        params = {
+            "part": "id",
+            "q": keyword,
+            "type": "video",
+            "maxResults": self.max_results,
+            "order": self.order,
+            "publishedAfter": published_after,
+            "key": self.api_key,
+        }
+
+        response = http_client.get(self.search_url, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+
+        return [item["id"]["videoId"] for item in data.get("items", [])]
+
+    def _get_video_details(self, video_ids: List[str], video_keywords: Dict[str, List[str]]) -> Tuple[List[Mention], bool]:
+        """
+        YouTube Videos API로 비디오 상세 정보 가져오기 (50개 단위)
+
+        Returns:
+            (Mention 리스트, 전체 배치 성공 여부)
+        """
+        mentions = []
+        success = True
+
+        for i in range(0, len(video_ids), VIDEOS_BATCH_SIZE):
+            params = {
+                "part": "snippet,statistics",
+                "id": ",".join(video_ids[i:i + VIDEOS_BATCH_SIZE]),
+                "key": self.api_key,
+            }
+
+            try:
+                response = http_client.get(self.videos_url, params=params, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                data = response.json()
+            except requests.exceptions.RequestException as e:
+                logger.error(f"YouTube Videos API 요청 오류: {e}")
+                success = False
+                continue
+
+            for item in data.get("items", []):
+                keyword = ", ".join(video_keywords.get(item.get("id"), []))
+                mention = self._parse_video(item, keyword)
+                if mention:
+                    mentions.append(mention)
+
+        return mentions, success
+
+    def _load_watermarks(self) -> Dict[str, str]:
+        if not self.watermark_store:
+            return {}
+        try:
+            return self.watermark_store.get(self.get_name())
+        except Exception as e:
+            logger.error(f"YouTube 워터마크 로드 오류: {e}")
+            return {}
+
+    def _parse_video(self, item: dict, keyword: str) -> Optional[Mention]:
+        """YouTube API 응답 파싱"""
+        try:
+            snippet = item.get("snippet", {})
+            statistics = item.get("statistics", {})
+            video_id = item.get("id")
+
+            # 날짜 파싱 (ISO 8601 형식)
+            published_at = snippet.get("publishedAt", "")
+            posted_date = datetime.strptime(published_at, "%Y-%m-%dT%H:%M:%SZ")
+
+            # 썸네일 URL (중간 크기)
+            thumbnails = snippet.get("thumbnails", {})
+            thumbnail_url = (
+                thumbnails.get("medium", {}).get("url")
+                or thumbnails.get("default", {}).get("url")
+            )
+
+            # 비디오 URL
+            video_url = f"https://www.youtube.com/watch?v={video_id}"
+
+            # 조회수, 좋아요, 댓글 (없을 수 있음)
+            view_count = int(statistics.get("viewCount", 0))
+            like_count = int(statistics.get("likeCount", 0))
+            comment_count = int(statistics.get("commentCount", 0))
+
+            return Mention(
+                source="YouTube",
+                title=snippet.get("title", "제목 없음"),
+                url=video_url,
+                author=snippet.get("channelTitle", "알 수 없음"),
+                posted_date=posted_date,
+                content_preview=snippet.get("description", "")[:300],  # 설명 300자
+                keyword_matched=keyword,
+                view_count=view_count,
+                like_count=like_count,
+                comment_count=comment_count,
+                thumbnail_url=thumbnail_url,
+            )
+
+        except Exception as e:
+            logger.error(f"YouTube 비디오 파싱 오류: {e}")
+            return None
@@ -0,0 +1,94 @@
+"""
+다중 키워드 매처 (Aho–Corasick)
+- 키워드 리스트로 실행당 1회 오토마톤 생성 → 본문 1회 순회로 모든 키워드 위치/집합 반환
+- 키워드 수와 무관하게 텍스트 길이에 비례 (제외/제품 키워드 수백 개 대응)
+- 겹치는 키워드도 모두 매칭 (예: "스크럽", "스크럽대디")
+- 대소문자 구분 (기존 `kw in text` 동작과 동일)
+"""
+from collections import deque
+from typing import Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """사전 컴파일된 다중 키워드 매처"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords: 매칭할 키워드 리스트 (빈 문자열/중복은 무시)
+        """
+        self.keywords = [kw for kw in dict.fromkeys(keywords) if kw]
+
+        # 노드별 전이 / 실패 링크 / 출력 키워드
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for keyword in self.keywords:
+            self._add(keyword)
+        self._build_fail_links()
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def _add(self, keyword: str):
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(keyword)
+
+    def _build_fail_links(self):
+        """BFS로 실패 링크 연결, 실패 노드의 출력을 합쳐 둠"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _scan(self, text: str):
+        """(끝 위치, 해당 위치에서 끝나는 키워드 리스트) 순회"""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                yield i, output[node]
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """
+        모든 매칭 위치
+
+        Returns:
+            [(시작 위치, 키워드)] (시작 위치 순)
+        """
+        matches = [(end - len(keyword) + 1, keyword) for end, keywords in self._scan(text) for keyword in keywords]
+        matches.sort()
+        return matches
+
+    def matched(self, text: str) -> Set[str]:
+        """본문에 포함된 키워드 집합"""
+        found = set()
+        for _, keywords in self._scan(text):
+            found.update(keywords)
+        return found
+
+    def search(self, text: str) -> bool:
+        """키워드가 하나라도 포함되어 있는지 (첫 매칭에서 종료)"""
+        for _ in self._scan(text):
+            return True
+        return False
@@ -0,0 +1,311 @@
+"""
+Slack 알림 전송
+- 멘션 여러 건을 Block Kit 메시지 1개로 묶어 전송 (Incoming Webhook 초당 1건 제한 대응)
+- 429 응답은 Retry-After 만큼 대기, 5xx/네트워크 오류는 지수 백오프로 재시도
+- Webhook 1개에는 메시지를 1초 이상 간격으로 순차 전송 (429 발생 전 선제 대응), 채널별 전송 소요 시간 기록
+"""
+import time
+import requests
+import logging
+from typing import Dict, List
+from ..models import Mention
+from shared import http_client
+
+logger = logging.getLogger(__name__)
+
+# Slack 메시지당 최대 블록 수 (Block Kit 제한)
+MAX_BLOCKS_PER_MESSAGE = 50
+
+# 메시지 1개에 묶을 최대 멘션 수
+MENTIONS_PER_MESSAGE = 5
+
+# 재시도 (429 / 5xx / 네트워크 오류)
+MAX_RETRIES = 3
+BACKOFF_BASE = 1  # 초 (1, 2, 4 ...)
+MAX_RETRY_WAIT = 30  # Retry-After 최대 대기 (초)
+
+# 같은 Webhook 메시지 최소 간격 (초, Incoming Webhook 초당 1건 제한)
+MIN_POST_INTERVAL = 1.0
+
+REQUEST_TIMEOUT = 10
+
+
+class SlackNotifier:
+    """Slack Webhook을 통한 알림 전송"""
+
+    def __init__(self, webhook_url: str):
+        """
+        Args:
+            webhook_url: Slack Incoming Webhook URL
+        """
+        self.webhook_url = webhook_url
+
+        # 채널별 전송 소요 시간 (초), send_mentions 실행 시 갱신
+        self.delivery_latency: Dict[str, float] = {}
+
+        # 마지막 Webhook 요청 시각 (time.monotonic, 전송 간격 유지용)
+        self._last_post_at = None
+
+    def _wait_interval(self):
+        """직전 요청 후 MIN_POST_INTERVAL이 지나지 않았으면 남은 시간만큼 대기"""
+        if self._last_post_at is not None:
+            remaining = self._last_post_at + MIN_POST_INTERVAL - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def _post(self, payload: dict) -> bool:
+        """
+        Webhook POST (Retry-After / 지수 백오프 재시도)
+
+        Returns:
+            성공 여부
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            wait = BACKOFF_BASE * (2 ** attempt)
+            self._wait_interval()
+            try:
+                response = http_client.post(self.webhook_url, json=payload, timeout=REQUEST_TIMEOUT)
+
+                if response.status_code == 200:
+                    return True
+
+                if response.status_code == 429:
+                    # Slack 속도 제한 → Retry-After(초) 만큼 대기
+                    retry_after = response.headers.get("Retry-After")
+                    if retry_after and retry_after.isdigit():
+                        wait = int(retry_after)
+                    logger.warning(f"Slack 속도 제한 (429), {wait}초 후 재시도 ({attempt + 1}/{MAX_RETRIES})")
+                elif response.status_code >= 500:
+                    logger.warning(f"Slack 서버 오류 ({response.status_code}), {wait}초 후 재시도 ({attempt + 1}/{MAX_RETRIES})")
+                else:
+                    # 4xx (잘못된 payload, 만료된 Webhook 등) → 재시도 무의미
+                    logger.error(f"Slack 알림 전송 실패: {response.status_code} - {response.text}")
+                    return False
+
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Slack 요청 오류: {e}, {wait}초 후 재시도 ({attempt + 1}/{MAX_RETRIES})")
+            finally:
+                self._last_post_at = time.monotonic()
+
+            if attempt < MAX_RETRIES:
+                time.sleep(min(wait, MAX_RETRY_WAIT))
+
+        logger.error(f"Slack 알림 전송 실패: 재시도 {MAX_RETRIES}회 초과")
+        return False
+
+    def send_mention(self, mention: Mention) -> bool:
+        """
+        단일 멘션 알림 전송
+
+        Args:
+            mention: Mention 객체
+
+        Returns:
+            성공 여부
+        """
+        if not self.webhook_url:
+            logger.warning("Slack Webhook URL이 설정되지 않았습니다.")
+            return False
+
+        try:
+            # Mention 객체를 Slack 포맷으로 변환
+            if self._post(mention.format_for_slack()):
+                logger.info(f"Slack 알림 전송 성공: {mention.title}")
+                return True
+            return False
+
+        except Exception as e:
+            logger.error(f"Slack 알림 전송 오류: {e}")
+            return False
+
+    def send_mentions(self, mentions: List[Mention]) -> dict:
+        """
+        여러 멘션 알림 전송 (채널별 묶음 메시지, 같은 Webhook이므로 순차 전송)
+
+        Args:
+            mentions: Mention 객체 리스트
+
+        Returns:
+            채널별 성공 건수 딕셔너리 (예: {"네이버 블로그": 5, "YouTube": 3})
+        """
+        self.delivery_latency = {}
+        if not mentions:
+            return {}
+
+        if not self.webhook_url:
+            logger.warning("Slack Webhook URL이 설정되지 않았습니다.")
+            return {mention.source: 0 for mention in mentions}
+
+        by_channel: Dict[str, List[Mention]] = {}
+        for mention in mentions:
+            by_channel.setdefault(mention.source, []).append(mention)
+
+        # 모든 채널이 같은 Webhook → 병렬 전송 시 초당 1건 제한 초과 (429 후 재시도 소진 시 유실)
+        results = [self._send_channel(channel_mentions) for channel_mentions in by_channel.values()]
+
+        success_by_channel = {}
+        for channel, (success, latency) in zip(by_channel, results):
+            success_by_channel[channel] = success
+            self.delivery_latency[channel] = latency
+
+        return success_by_channel
+
+    def _send_channel(self, mentions: List[Mention]):
+        """
+        채널 1개의 멘션을 묶음 메시지로 순차 전송
+
+        Returns:
+            (성공 건수, 전송 소요 시간(초))
+        """
+        start = time.monotonic()
+        success = 0
+
+        for batch in self._build_batches(mentions):
+            try:
+                if self._post(self._batch_payload(batch)):
+                    success += len(batch)
+                    logger.info(f"Slack 알림 전송 성공: {batch[0].source} {len(batch)}건")
+            except Exception as e:
+                logger.error(f"Slack 알림 전송 오류: {e}")
+
+        return success, time.monotonic() - start
+
+    @staticmethod
+    def _build_batches(mentions: List[Mention]) -> List[List[Mention]]:
+        """메시지당 멘션 수 / 블록 수 제한 내에서 멘션 묶기"""
+        batches = []
+        batch = []
+        block_count = 0
+
+        for mention in mentions:
+            # 멘션 블록 + 구분선
+            blocks = len(mention.format_for_slack()["blocks"]) + 1
+            if batch and (len(batch) >= MENTIONS_PER_MESSAGE or block_count + blocks > MAX_BLOCKS_PER_MESSAGE):
+                batches.append(batch)
+                batch = []
+                block_count = 0
+
+            batch.append(mention)
+            block_count += blocks
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    @staticmethod
+    def _batch_payload(mentions: List[Mention]) -> dict:
+        """멘션 여러 건 → Block Kit 메시지 1개 (멘션 사이 구분선)"""
+        blocks = []
+        for i, mention in enumerate(mentions):
+            if i:
+                blocks.append({"type": "divider"})
+            blocks.extend(mention.format_for_slack()["blocks"])
+
+        return {
+            # 알림 미리보기용 텍스트
+            "text": f"{mentions[0].source} - 새 언급 {len(mentions)}건",
+            "blocks": blocks,
+        }
+
+    def send_summary(self, total_mentions: int, success_by_channel: dict = None, collection_stats: dict = None, scan_time = None, brand_name: str = "스크럽대디", ai_cache_stats: dict = None, delivery_latency: dict = None):
+        """
+        수집 결과 요약 알림
+
+        Args:
+            total_mentions: 총 발견한 멘션 개수
+            success_by_channel: 채널별 성공 건수 딕셔너리 (예: {"네이버 블로그": 5, "YouTube": 3})
+            collection_stats: 수집기별 통계 (dict)
+            scan_time: 수집 시간
+            brand_name: 브랜드명 (기본값: "스크럽대디")
+            ai_cache_stats: AI 요약 캐시 통계 (예: {"hit": 3, "miss": 5})
+            delivery_latency: 채널별 전송 소요 시간(초) (예: {"네이버 블로그": 1.2})
+        """
+        if not self.webhook_url:
+            return
+
+        from datetime import datetime, timedelta
+
+        # 수집 시간 포맷팅 (한국 시간 KST = UTC+9)
+        if scan_time:
+            kst_time = scan_time + timedelta(hours=9)
+            time_str = kst_time.strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            kst_time = datetime.now() + timedelta(hours=9)
+            time_str = kst_time.strftime("%Y-%m-%d %H:%M:%S")
+
+        # 채널별 성공 건수 (+ 전송 소요 시간) 텍스트 생성
+        delivery_latency = delivery_latency or {}
+        total_success = 0
+        channel_text = ""
+        if success_by_channel:
+            for channel, count in success_by_channel.items():
+                total_success += count
+                latency = delivery_latency.get(channel)
+                latency_text = f" (전송 {latency:.1f}초)" if latency is not None else ""
+                channel_text += f"  • {channel}: {count}건{latency_text}\n"
+        else:
+            channel_text = "  • 없음\n"
+
+        summary_message = {
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"📊 *{brand_name} 모니터링 요약*\n\n"
+                                f"🕐 *수집 시간:* {time_str}\n\n"
+                                f"*새 게시글:* {total_mentions}건\n"
+                                f"*알림 전송:* {total_success}건\n"
+                                f"{channel_text}"
+                                f"{self._format_cache_stats(ai_cache_stats)}"
+                    }
+                }
+            ]
+        }
+
+        try:
+            self._post(summary_message)
+        except Exception as e:
+            logger.error(f"요약 알림 전송 오류: {e}")
+
+    @staticmethod
+    def _format_cache_stats(ai_cache_stats: dict = None) -> str:
+        """AI 요약 캐시 적중/미스 텍스트 (요약 요청이 없었으면 빈 문자열)"""
+        if not ai_cache_stats:
+            return ""
+
+        hit = ai_cache_stats.get("hit", 0)
+        miss = ai_cache_stats.get("miss", 0)
+        if hit + miss == 0:
+            return ""
+
+        return f"\n*AI 요약 캐시:* 적중 {hit}건 / 미스 {miss}건 (Gemini 호출 {hit}건 절감)\n"
+
+    def send_error(self, error_message: str):
+        """
+        에러 알림 전송
+
+        Args:
+            error_message: 에러 메시지
+        """
+        if not self.webhook_url:
+            return
+
+        error_payload = {
+            "blocks": [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"⚠️ *모니터링 오류 발생*\n\n```{error_message}```"
+                    }
+                }
+            ]
+        }
+
+        try:
+            if not self._post(error_payload):
+                logger.error("에러 알림 전송 실패")
+        except Exception as e:
+            logger.error(f"에러 알림 전송 실패: {e}")
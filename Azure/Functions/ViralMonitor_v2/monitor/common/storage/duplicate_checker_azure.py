@@ -0,0 +1,249 @@
+"""
+Azure Blob Storage 기반 중복 체크 관리
+- 게시글별 마커 Blob (seen/{unique_id 해시}) 을 조건부 생성(If-None-Match: *)하여 신규 여부 판정
+  → 실행당 I/O는 신규 후보 수에 비례, 여러 함수가 같은 Container를 써도 한 쪽만 신규로 판정
+- 날짜별 Append Blob 저널 (journal/{YYYY-MM-DD}.log) 에 그날 생성한 마커 해시를 추가
+- 보관 기간(35일) 지난 날짜 파티션은 저널에 기록된 마커와 함께 통째로 삭제
+"""
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from datetime import datetime, timedelta
+from ..models import Mention
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.storage.blob import BlobServiceClient
+import os
+
+logger = logging.getLogger(__name__)
+
+# 마커 생성/삭제 동시 요청 수
+MAX_WORKERS = 8
+
+# delete_blobs 1회 최대 건수 (Blob Batch API 제한)
+DELETE_BATCH_SIZE = 256
+
+
+class AzureDuplicateChecker:
+    """Azure Blob Storage 기반 중복 게시글 체크 (마커 Blob + 날짜별 저널)"""
+
+    def __init__(
+        self,
+        connection_string: str = None,
+        container_name: str = "viral-scrubdaddy",
+        blob_name: str = "seen_posts.json",
+        retention_days: int = 35,
+        marker_prefix: str = "seen/",
+        journal_prefix: str = "journal/"
+    ):
+        """
+        Args:
+            connection_string: Azure Storage 연결 문자열 (환경 변수에서 자동 로드)
+            container_name: Blob Container 이름
+            blob_name: 기존 seen_posts.json Blob 이름 (최초 1회 마이그레이션용)
+            retention_days: 보관 기간 (일), 기본 35일
+            marker_prefix: 게시글 마커 Blob prefix
+            journal_prefix: 날짜별 저널 Append Blob prefix
+        """
+        # 환경 변수에서 연결 문자열 가져오기
+        self.connection_string = connection_string or os.getenv("AZURE_STORAGE_CONNECTION_STRING")
+        if not self.connection_string:
+            raise ValueError("AZURE_STORAGE_CONNECTION_STRING 환경 변수가 설정되지 않았습니다")
+
+        self.container_name = container_name
+        self.blob_name = blob_name
+        self.retention_days = retention_days
+        self.marker_prefix = marker_prefix
+        self.journal_prefix = journal_prefix
+
+        # Blob Service Client 초기화
+        self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
+        self.container_client = self.blob_service_client.get_container_client(self.container_name)
+
+        # Container가 없으면 생성
+        try:
+            self.container_client.create_container()
+            logger.info(f"Container '{self.container_name}' 생성됨")
+        except Exception:
+            # 이미 존재하면 무시
+            pass
+
+        # 기존 seen_posts.json 마이그레이션 및 만료 파티션 정리
+        self._migrate_legacy_blob()
+        self._cleanup_old_entries()
+
+    @staticmethod
+    def _hash(unique_id: str) -> str:
+        """unique_id → 마커 Blob 이름용 해시"""
+        return hashlib.sha256(unique_id.encode('utf-8')).hexdigest()
+
+    def _marker_name(self, key: str) -> str:
+        return f"{self.marker_prefix}{key}"
+
+    def _journal_name(self, date_str: str) -> str:
+        return f"{self.journal_prefix}{date_str}.log"
+
+    def _create_marker(self, key: str, date_str: str) -> bool:
+        """
+        마커 조건부 생성 (If-None-Match: *)
+
+        Returns:
+            새로 생성했으면 True, 이미 있으면 False
+        """
+        blob_client = self.container_client.get_blob_client(self._marker_name(key))
+        try:
+            blob_client.upload_blob(
+                date_str.encode('utf-8'),
+                etag="*",
+                match_condition=MatchConditions.IfMissing
+            )
+            return True
+        except ResourceExistsError:
+            return False
+
+    def _append_journal(self, date_str: str, keys: List[str]):
+        """날짜별 저널에 생성한 마커 해시 추가"""
+        if not keys:
+            return
+
+        blob_client = self.container_client.get_blob_client(self._journal_name(date_str))
+        try:
+            blob_client.create_append_blob(etag="*", match_condition=MatchConditions.IfMissing)
+        except ResourceExistsError:
+            pass
+
+        blob_client.append_block(("\n".join(keys) + "\n").encode('utf-8'))
+
+    def _migrate_legacy_blob(self):
+        """기존 seen_posts.json 항목을 마커 + 저널로 옮기고 삭제 (최초 1회)"""
+        legacy_client = self.container_client.get_blob_client(self.blob_name)
+        try:
+            data = json.loads(legacy_client.download_blob().readall().decode('utf-8'))
+        except ResourceNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"seen_posts 마이그레이션 로드 오류: {e}")
+            return
+
+        # 구 형식(seen_ids): URL만 있음 -> 오늘 날짜로 처리
+        today = datetime.now().strftime("%Y-%m-%d")
+        if isinstance(data.get("seen_posts"), dict):
+            seen_posts = data["seen_posts"]
+        elif isinstance(data.get("seen_ids"), list):
+            seen_posts = {unique_id: today for unique_id in data["seen_ids"]}
+        else:
+            seen_posts = {}
+
+        cutoff_str = (datetime.now() - timedelta(days=self.retention_days)).strftime("%Y-%m-%d")
+        entries = [(self._hash(unique_id), date) for unique_id, date in seen_posts.items() if date >= cutoff_str]
+
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                created = list(executor.map(lambda entry: self._create_marker(*entry), entries))
+
+            by_date = {}
+            for (key, date), is_created in zip(entries, created):
+                if is_created:
+                    by_date.setdefault(date, []).append(key)
+            for date, keys in by_date.items():
+                self._append_journal(date, keys)
+
+            legacy_client.delete_blob()
+            logger.info(f"seen_posts.json 마이그레이션 완료: {len(entries)}개 게시글")
+        except Exception as e:
+            # 삭제 전 실패 시 다음 실행에서 재시도 (이미 만든 마커는 조건부 생성으로 건너뜀)
+            logger.error(f"seen_posts 마이그레이션 오류: {e}")
+
+    def _cleanup_old_entries(self):
+        """보관 기간 지난 날짜 파티션 삭제 (저널에 기록된 마커 + 저널)"""
+        cutoff_str = (datetime.now() - timedelta(days=self.retention_days)).strftime("%Y-%m-%d")
+
+        try:
+            expired = [
+                blob.name for blob in self.container_client.list_blobs(name_starts_with=self.journal_prefix)
+                if blob.name[len(self.journal_prefix):].split(".")[0] < cutoff_str
+            ]
+
+            removed_count = 0
+            for journal_name in expired:
+                content = self.container_client.download_blob(journal_name).readall().decode('utf-8')
+                markers = [self._marker_name(key) for key in content.split("\n") if key]
+
+                for i in range(0, len(markers), DELETE_BATCH_SIZE):
+                    # 이미 없는 마커는 무시
+                    self.container_client.delete_blobs(*markers[i:i + DELETE_BATCH_SIZE], raise_on_any_failure=False)
+
+                self.container_client.delete_blob(journal_name)
+                removed_count += len(markers)
+
+            if expired:
+                logger.info(f"오래된 파티션 정리: {len(expired)}일, {removed_count}개 삭제 (cutoff: {cutoff_str})")
+        except Exception as e:
+            logger.error(f"오래된 파티션 정리 오류: {e}")
+
+    def is_new(self, mention: Mention) -> bool:
+        """
+        새로운 게시글인지 확인 (마커 존재 여부)
+
+        Args:
+            mention: Mention 객체
+
+        Returns:
+            새 게시글이면 True, 이미 본 게시글이면 False
+        """
+        blob_client = self.container_client.get_blob_client(self._marker_name(self._hash(mention.unique_id)))
+        return not blob_client.exists()
+
+    def mark_as_seen(self, mention: Mention):
+        """
+        게시글을 '이미 봄' 상태로 표시 (마커 + 오늘 저널)
+
+        Args:
+            mention: Mention 객체
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        key = self._hash(mention.unique_id)
+        if self._create_marker(key, today):
+            self._append_journal(today, [key])
+
+    def filter_new_mentions(self, mentions: List[Mention]) -> List[Mention]:
+        """
+        새로운 게시글만 필터링하고, 본 것으로 표시
+
+        마커 조건부 생성 성공 = 신규 게시글 (확인과 표시가 한 번의 요청으로 원자적으로 처리됨)
+
+        Args:
+            mentions: Mention 객체 리스트
+
+        Returns:
+            새로운 Mention만 담긴 리스트
+        """
+        if not mentions:
+            logger.info("중복 체크 (Azure Blob): 전체 0건 중 0건이 새 게시글")
+            return []
+
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        # 같은 실행 내 중복(여러 키워드로 수집된 동일 게시글)은 첫 번째만 후보
+        candidates = {}
+        for mention in mentions:
+            candidates.setdefault(self._hash(mention.unique_id), mention)
+
+        keys = list(candidates)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            created = list(executor.map(lambda key: self._create_marker(key, today), keys))
+
+        new_keys = [key for key, is_created in zip(keys, created) if is_created]
+        new_mentions = [candidates[key] for key in new_keys]
+
+        # 오늘 파티션 저널에 추가 (만료 시 삭제 대상)
+        if new_keys:
+            try:
+                self._append_journal(today, new_keys)
+            except Exception as e:
+                logger.error(f"저널 기록 오류: {e}")
+
+        logger.info(f"중복 체크 (Azure Blob): 전체 {len(mentions)}건 중 {len(new_mentions)}건이 새 게시글")
+        return new_mentions
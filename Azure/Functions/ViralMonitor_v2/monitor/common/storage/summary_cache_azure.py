@@ -0,0 +1,138 @@
+"""
+Azure Blob Storage 기반 AI 요약 캐시
+- (브랜드, 정규화된 본문) 해시를 키로 Gemini 요약/감성 저장
+- 같은 영상/신디케이션 글이 여러 키워드로 재수집되어도 LLM 호출 생략
+- 항목당 Blob 1개 (summary_cache/{sha256}.json), TTL 지난 항목은 조회 시 삭제
+- 대부분의 본문은 다시 조회되지 않으므로 캐시 생성 시 prefix 전체를 훑어 last_modified가 TTL 지난 Blob 일괄 삭제
+  (배포 환경은 Storage 수명 주기 관리 규칙 없이 이 정리에 의존 - 규칙 추가 시에도 같은 prefix/기간으로 설정)
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from azure.storage.blob import BlobServiceClient
+import os
+
+logger = logging.getLogger(__name__)
+
+# 요약 프롬프트에 실제로 들어가는 본문 길이 (gemini_summarizer와 동일)
+MAX_TEXT_LENGTH = 2000
+
+# Blob Batch 삭제 1회 최대 개수 (Azure 제한 256)
+DELETE_BATCH_SIZE = 256
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 본문 정규화 (프롬프트 길이 제한 → 공백 정리 → 소문자)"""
+    return re.sub(r'\s+', ' ', text[:MAX_TEXT_LENGTH]).strip().lower()
+
+
+class AzureSummaryCache:
+    """Azure Blob Storage 기반 요약 캐시 (TTL)"""
+
+    def __init__(
+        self,
+        connection_string: str = None,
+        container_name: str = "viral-scrubdaddy",
+        prefix: str = "summary_cache/",
+        ttl_days: int = 30
+    ):
+        """
+        Args:
+            connection_string: Azure Storage 연결 문자열 (환경 변수에서 자동 로드)
+            container_name: Blob Container 이름
+            prefix: 캐시 Blob 이름 prefix
+            ttl_days: 캐시 보관 기간 (일), 기본 30일
+        """
+        self.connection_string = connection_string or os.getenv("AZURE_STORAGE_CONNECTION_STRING")
+        if not self.connection_string:
+            raise ValueError("AZURE_STORAGE_CONNECTION_STRING 환경 변수가 설정되지 않았습니다")
+
+        self.prefix = prefix
+        self.ttl = timedelta(days=ttl_days)
+        self.stats = {"hit": 0, "miss": 0}
+        self._lock = threading.Lock()
+
+        blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
+        self.container_client = blob_service_client.get_container_client(container_name)
+
+        # Container가 없으면 생성
+        try:
+            self.container_client.create_container()
+            logger.info(f"Container '{container_name}' 생성됨")
+        except Exception:
+            # 이미 존재하면 무시
+            pass
+
+        self._cleanup_expired()
+
+    def _cleanup_expired(self):
+        """TTL 지난 캐시 Blob 일괄 삭제 (조회되지 않는 항목도 정리 → Container 무한 증가 방지)"""
+        cutoff = datetime.now(timezone.utc) - self.ttl
+
+        try:
+            expired = [
+                blob.name for blob in self.container_client.list_blobs(name_starts_with=self.prefix)
+                if blob.last_modified < cutoff
+            ]
+
+            for i in range(0, len(expired), DELETE_BATCH_SIZE):
+                # 동시에 삭제된 Blob은 무시
+                self.container_client.delete_blobs(*expired[i:i + DELETE_BATCH_SIZE], raise_on_any_failure=False)
+
+            if expired:
+                logger.info(f"만료된 요약 캐시 정리: {len(expired)}개 삭제 (TTL {self.ttl.days}일)")
+        except Exception as e:
+            # 정리 실패해도 캐시 사용은 계속 (다음 실행에서 재시도)
+            logger.error(f"요약 캐시 정리 오류: {e}")
+
+    def make_key(self, brand_name: str, text: str) -> str:
+        """(브랜드, 정규화된 본문) SHA-256 해시"""
+        payload = f"{brand_name}\n{normalize_text(text)}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, brand_name: str, text: str) -> Optional[Tuple[str, str]]:
+        """
+        캐시된 (요약문, 감성) 조회
+
+        Returns:
+            (요약문, 감성) 튜플. 없거나 만료 시 None
+        """
+        blob_client = self.container_client.get_blob_client(f"{self.prefix}{self.make_key(brand_name, text)}.json")
+
+        try:
+            data = json.loads(blob_client.download_blob().readall().decode('utf-8'))
+            created = datetime.strptime(data["created"], "%Y-%m-%d %H:%M:%S")
+
+            if datetime.now() - created > self.ttl:
+                # 만료 항목 삭제 (다음 요약 결과로 재생성)
+                blob_client.delete_blob()
+                entry = None
+            else:
+                entry = (data["summary"], data["sentiment"])
+
+        except Exception:
+            # Blob이 없거나 형식 오류 시 캐시 미스
+            entry = None
+
+        with self._lock:
+            self.stats["hit" if entry else "miss"] += 1
+        return entry
+
+    def put(self, brand_name: str, text: str, summary: str, sentiment: str):
+        """요약 결과 저장 (실패해도 수집은 계속)"""
+        blob_client = self.container_client.get_blob_client(f"{self.prefix}{self.make_key(brand_name, text)}.json")
+
+        data = {
+            "summary": summary,
+            "sentiment": sentiment,
+            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+        try:
+            blob_client.upload_blob(json.dumps(data, ensure_ascii=False).encode('utf-8'), overwrite=True)
+        except Exception as e:
+            logger.error(f"요약 캐시 저장 오류: {e}")
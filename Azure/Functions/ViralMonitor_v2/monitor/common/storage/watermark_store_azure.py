@@ -0,0 +1,84 @@
+"""
+Azure Blob Storage 기반 수집 워터마크 저장소
+- 수집기별 {키워드: 최신 게시글 링크} 를 watermarks.json 1개 Blob에 저장
+- ETag 조건부 쓰기로 동시 실행 시 덮어쓰기 방지 (충돌 시 재로드 후 1회 재시도)
+"""
+import json
+import logging
+from typing import Dict
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceModifiedError, ResourceNotFoundError
+from azure.storage.blob import BlobServiceClient
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class AzureWatermarkStore:
+    """수집기별 키워드 워터마크 저장소"""
+
+    def __init__(
+        self,
+        connection_string: str = None,
+        container_name: str = "viral-scrubdaddy",
+        blob_name: str = "watermarks.json"
+    ):
+        """
+        Args:
+            connection_string: Azure Storage 연결 문자열 (환경 변수에서 자동 로드)
+            container_name: Blob Container 이름
+            blob_name: 워터마크 Blob 이름
+        """
+        self.connection_string = connection_string or os.getenv("AZURE_STORAGE_CONNECTION_STRING")
+        if not self.connection_string:
+            raise ValueError("AZURE_STORAGE_CONNECTION_STRING 환경 변수가 설정되지 않았습니다")
+
+        blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
+        container_client = blob_service_client.get_container_client(container_name)
+
+        # Container가 없으면 생성
+        try:
+            container_client.create_container()
+            logger.info(f"Container '{container_name}' 생성됨")
+        except Exception:
+            # 이미 존재하면 무시
+            pass
+
+        self.blob_client = container_client.get_blob_client(blob_name)
+
+    def _load(self):
+        """(전체 워터마크, ETag) 로드. Blob이 없으면 ({}, None)"""
+        try:
+            downloader = self.blob_client.download_blob()
+            data = json.loads(downloader.readall().decode('utf-8'))
+            return data, downloader.properties.etag
+        except ResourceNotFoundError:
+            return {}, None
+
+    def get(self, collector_name: str) -> Dict[str, str]:
+        """수집기의 {키워드: 최신 게시글 링크}"""
+        data, _ = self._load()
+        return data.get(collector_name, {})
+
+    def update(self, collector_name: str, watermarks: Dict[str, str]):
+        """수집기 워터마크 갱신 (다른 수집기 항목은 유지)"""
+        for attempt in range(2):
+            data, etag = self._load()
+            data.setdefault(collector_name, {}).update(watermarks)
+            content = json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+            try:
+                if etag:
+                    self.blob_client.upload_blob(
+                        content, overwrite=True, etag=etag, match_condition=MatchConditions.IfNotModified
+                    )
+                else:
+                    self.blob_client.upload_blob(
+                        content, etag="*", match_condition=MatchConditions.IfMissing
+                    )
+                return
+            except (ResourceModifiedError, ResourceExistsError):
+                # 다른 실행이 먼저 갱신함 → 재로드 후 재시도
+                logger.info(f"워터마크 동시 갱신 감지, 재시도 ({attempt + 1})")
+
+        logger.warning(f"워터마크 저장 실패 (동시 갱신 충돌): {collector_name}")
@@ -5,8 +5,8 @@
 """
 import re
 import logging
-import requests
 from bs4 import BeautifulSoup
+from shared import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ def crawl_blog_content(url: str, max_length: int = 2000) -> str:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
 
-        response = requests.get(mobile_url, headers=headers, timeout=10)
+        response = http_client.get(mobile_url, headers=headers, timeout=10)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.text, "html.parser")
@@ -0,0 +1,201 @@
+"""
+크롤링 + AI 요약 병렬 처리 (enrichment)
+- 본문 수집(블로그 크롤링/YouTube 자막)과 Gemini 요약을 별도 워커 풀에서 실행
+- 본문 수집이 끝난 게시글을 SUMMARY_BATCH_SIZE건씩 묶어 한 번에 요약 요청
+- 요약 캐시가 있으면 동일 본문은 Gemini 호출 생략
+- 단계별 제한 시간 초과 시 완료된 결과만 반영 (Slack 전송 지연 방지)
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, List, Optional, Tuple
+
+from ..models import Mention
+from ..storage.summary_cache_azure import AzureSummaryCache
+from .gemini_summarizer import summarize_batch
+
+logger = logging.getLogger(__name__)
+
+# 동시 크롤링 수 (네이버/YouTube 차단 방지를 위해 제한)
+CRAWL_WORKERS = 6
+
+# 동시 Gemini 요청 수 (API quota 고려)
+SUMMARY_WORKERS = 3
+
+# Gemini 1회 호출당 요약할 게시글 수
+SUMMARY_BATCH_SIZE = 8
+
+# 크롤링 단계 제한 시간 (초, 시작 기준) - 초과분은 content_preview로 요약
+CRAWL_TIMEOUT = 60
+
+# 전체 enrichment 제한 시간 (초, 시작 기준) - 초과분은 요약 없이 전송
+TOTAL_TIMEOUT = 150
+
+
+def enrich_mentions(
+    mentions: List[Mention],
+    brand_name: str,
+    api_key: str,
+    extract_text: Callable[[Mention], str],
+    crawl_workers: int = CRAWL_WORKERS,
+    summary_workers: int = SUMMARY_WORKERS,
+    crawl_timeout: float = CRAWL_TIMEOUT,
+    total_timeout: float = TOTAL_TIMEOUT,
+    cache: Optional[AzureSummaryCache] = None,
+    batch_size: int = SUMMARY_BATCH_SIZE,
+    model=None,
+) -> List[Mention]:
+    """
+    mention 목록에 AI 요약/감성 추가
+
+    Args:
+        mentions: 신규 게시글 목록
+        brand_name: 브랜드명
+        api_key: Gemini API 키
+        extract_text: mention -> 요약할 본문 텍스트 (크롤링/자막 추출)
+        crawl_workers: 동시 크롤링 수
+        summary_workers: 동시 Gemini 요청 수
+        crawl_timeout: 크롤링 단계 제한 시간 (초)
+        total_timeout: 전체 제한 시간 (초)
+        cache: 요약 캐시 (None이면 항상 Gemini 호출)
+        batch_size: Gemini 1회 호출당 요약할 게시글 수
+        model: generate_content를 제공하는 모델 객체 (None이면 Gemini, 오프라인 테스트 시 LocalModelClient)
+
+    Returns:
+        입력과 동일한 mention 목록 (완료된 항목만 ai_summary/sentiment 채워짐)
+    """
+    if not mentions:
+        return mentions
+
+    start = time.monotonic()
+    crawl_deadline = start + crawl_timeout
+    deadline = start + total_timeout
+
+    stats = {'summarized': 0, 'skipped': 0, 'failed': 0, 'crawl_timeout': 0, 'summary_timeout': 0}
+
+    crawl_pool = ThreadPoolExecutor(max_workers=crawl_workers, thread_name_prefix="crawl")
+    summary_pool = ThreadPoolExecutor(max_workers=summary_workers, thread_name_prefix="summary")
+
+    crawl_futures = {crawl_pool.submit(extract_text, mention): mention for mention in mentions}
+    summary_futures = {}
+    pending = set(crawl_futures)
+    batch = []  # 요약 대기 중인 (mention, text)
+
+    def submit_summary(mention: Mention, text: str):
+        # 텍스트가 없으면 기존 content_preview fallback
+        text = text or mention.content_preview or ""
+        if not text:
+            logger.info(f"요약 스킵 (텍스트 없음): {mention.title[:30]}...")
+            stats['skipped'] += 1
+            return
+        batch.append((mention, text))
+        if len(batch) >= batch_size:
+            flush_batch()
+
+    def flush_batch():
+        if not batch:
+            return
+        texts = [text for _, text in batch]
+        future = summary_pool.submit(_summarize, texts, brand_name, api_key, cache, model)
+        summary_futures[future] = [mention for mention, _ in batch]
+        pending.add(future)
+        batch.clear()
+
+    try:
+        while pending:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+
+            crawling = any(future in crawl_futures for future in pending)
+            stage_deadline = crawl_deadline if crawling else deadline
+            done, _ = wait(pending, timeout=max(0, min(stage_deadline, deadline) - now), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                pending.discard(future)
+
+                if future in crawl_futures:
+                    mention = crawl_futures[future]
+                    try:
+                        text = future.result()
+                    except Exception as e:
+                        logger.error(f"본문 수집 실패 ({mention.title[:30]}...): {e}")
+                        text = ""
+                    submit_summary(mention, text)
+                    continue
+
+                batch_mentions = summary_futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.error(f"AI 요약 실패 ({len(batch_mentions)}건): {e}")
+                    results = [("", "")] * len(batch_mentions)
+
+                for mention, (summary, sentiment) in zip(batch_mentions, results):
+                    if summary:
+                        mention.ai_summary = summary
+                        mention.sentiment = sentiment
+                        stats['summarized'] += 1
+                        logger.info(f"AI 요약 완료 [{sentiment}]: {mention.title[:30]}...")
+                    else:
+                        stats['failed'] += 1
+
+            # 크롤링 제한 시간 초과분은 content_preview로 요약 진행
+            if time.monotonic() >= crawl_deadline:
+                for future in [f for f in pending if f in crawl_futures]:
+                    pending.discard(future)
+                    future.cancel()
+                    mention = crawl_futures[future]
+                    stats['crawl_timeout'] += 1
+                    logger.warning(f"본문 수집 시간 초과, 미리보기로 요약: {mention.title[:30]}...")
+                    submit_summary(mention, "")
+
+            # 크롤링이 모두 끝났으면 남은 게시글 요약 요청
+            if not any(future in crawl_futures for future in pending):
+                flush_batch()
+
+        # 크롤링 대기로 아직 요약 요청하지 못한 게시글
+        for mention, _ in batch:
+            stats['summary_timeout'] += 1
+            logger.warning(f"AI 요약 시간 초과, 요약 없이 전송: {mention.title[:30]}...")
+
+        for future in pending:
+            future.cancel()
+            for mention in summary_futures.get(future) or [crawl_futures[future]]:
+                stats['summary_timeout'] += 1
+                logger.warning(f"AI 요약 시간 초과, 요약 없이 전송: {mention.title[:30]}...")
+
+    finally:
+        # 지연된 작업은 기다리지 않음 (부분 결과 반환)
+        crawl_pool.shutdown(wait=False, cancel_futures=True)
+        summary_pool.shutdown(wait=False, cancel_futures=True)
+
+    logger.info(
+        f"AI 요약 완료: {stats['summarized']}/{len(mentions)}건 "
+        f"(스킵 {stats['skipped']}, 실패 {stats['failed']}, "
+        f"크롤링 시간 초과 {stats['crawl_timeout']}, 요약 시간 초과 {stats['summary_timeout']}, "
+        f"{time.monotonic() - start:.1f}초)"
+    )
+    if cache is not None:
+        logger.info(f"AI 요약 캐시: 적중 {cache.stats['hit']}건 / 미스 {cache.stats['miss']}건")
+    return mentions
+
+
+def _summarize(
+    texts: List[str], brand_name: str, api_key: str, cache: Optional[AzureSummaryCache], model=None
+) -> List[Tuple[str, str]]:
+    """캐시 조회 → 미스만 배치 요약 후 캐시 저장"""
+    if cache is None:
+        return summarize_batch(texts, brand_name, api_key, model)
+
+    results = [cache.get(brand_name, text) for text in texts]
+    missing = [i for i, result in enumerate(results) if not result]
+
+    if missing:
+        summaries = summarize_batch([texts[i] for i in missing], brand_name, api_key, model)
+        for i, (summary, sentiment) in zip(missing, summaries):
+            results[i] = (summary, sentiment)
+            if summary:
+                cache.put(brand_name, texts[i], summary, sentiment)
+
+    return results
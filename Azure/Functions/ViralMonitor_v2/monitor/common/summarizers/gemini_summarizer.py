@@ -0,0 +1,217 @@
+"""
+Gemini AI 기반 콘텐츠 요약
+- 마케팅 관점 2~3문장 요약
+- 긍정/부정/중립 감성 분석
+- 여러 게시글을 한 번에 요약하는 배치 모드 (JSON 응답)
+"""
+import json
+import logging
+import re
+import threading
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "gemini-2.0-flash"
+
+# generate_content 요청 제한 시간 (초)
+REQUEST_TIMEOUT = 60
+
+# 게시글당 프롬프트에 넣는 최대 문자 수
+MAX_TEXT_LENGTH = 2000
+
+# 배치 프롬프트의 게시글 구분 헤더 ([게시글 1], [게시글 2], ...)
+BATCH_ITEM_HEADER = "[게시글 {}]"
+BATCH_ITEM_PATTERN = re.compile(r'^\[게시글 (\d+)\]$', re.MULTILINE)
+
+# API 키별 GenerativeModel (프로세스당 1회 configure)
+_models = {}
+_models_lock = threading.Lock()
+
+
+def _get_model(api_key: str):
+    """API 키별 Gemini 모델 객체 반환 (최초 호출 시에만 configure)"""
+    model = _models.get(api_key)
+    if model is not None:
+        return model
+
+    with _models_lock:
+        if api_key not in _models:
+            import google.generativeai as genai
+
+            genai.configure(api_key=api_key)
+            _models[api_key] = genai.GenerativeModel(MODEL_NAME)
+        return _models[api_key]
+
+
+def summarize_content(text: str, brand_name: str, api_key: str, model=None) -> Tuple[str, str]:
+    """
+    Gemini API로 콘텐츠 요약 + 감성 분석
+
+    Args:
+        text: 요약할 텍스트 (블로그 본문 또는 YouTube 자막)
+        brand_name: 브랜드명
+        api_key: Gemini API 키
+        model: generate_content를 제공하는 모델 객체 (None이면 Gemini)
+
+    Returns:
+        (요약문, 감성) 튜플. 예: ("스크럽대디 수세미가...", "긍정")
+        실패 시: ("", "")
+    """
+    if not text or not (api_key or model):
+        return ("", "")
+
+    try:
+        model = model or _get_model(api_key)
+
+        prompt = f"""다음은 '{brand_name}' 브랜드와 관련된 온라인 게시글 내용입니다.
+
+마케팅 담당자 관점에서 핵심 내용을 2~3문장으로 요약해주세요.
+마지막 줄에 감성을 [긍정], [부정], [중립] 중 하나로 판정해주세요.
+
+형식:
+요약: (2~3문장 요약)
+감성: [긍정/부정/중립]
+
+게시글 내용:
+{text[:MAX_TEXT_LENGTH]}"""
+
+        response = model.generate_content(prompt, request_options={"timeout": REQUEST_TIMEOUT})
+        result = response.text.strip()
+
+        # 응답 파싱
+        summary, sentiment = _parse_response(result)
+        logger.info(f"Gemini 요약 완료: {sentiment} / {summary[:50]}...")
+        return (summary, sentiment)
+
+    except Exception as e:
+        logger.error(f"Gemini 요약 오류: {e}")
+        return ("", "")
+
+
+def summarize_batch(texts: List[str], brand_name: str, api_key: str, model=None) -> List[Tuple[str, str]]:
+    """
+    여러 게시글을 한 번의 Gemini 호출로 요약 + 감성 분석 (JSON 응답)
+    - 응답 파싱에 실패한 게시글만 summarize_content로 개별 재요약
+
+    Args:
+        texts: 요약할 텍스트 목록
+        brand_name: 브랜드명
+        api_key: Gemini API 키
+        model: generate_content를 제공하는 모델 객체 (None이면 Gemini)
+
+    Returns:
+        texts와 같은 순서의 (요약문, 감성) 튜플 목록
+    """
+    if len(texts) <= 1 or not (api_key or model):
+        return [summarize_content(text, brand_name, api_key, model) for text in texts]
+
+    results = {}
+
+    try:
+        model = model or _get_model(api_key)
+
+        items = "\n\n".join(
+            f"{BATCH_ITEM_HEADER.format(i)}\n{text[:MAX_TEXT_LENGTH]}"
+            for i, text in enumerate(texts, start=1)
+        )
+        prompt = f"""다음은 '{brand_name}' 브랜드와 관련된 온라인 게시글 {len(texts)}건입니다.
+
+각 게시글마다 마케팅 담당자 관점에서 핵심 내용을 2~3문장으로 요약하고,
+감성을 "긍정", "부정", "중립" 중 하나로 판정해주세요.
+
+아래 형식의 JSON 배열로만 응답해주세요 (id는 게시글 번호):
+[{{"id": 1, "summary": "2~3문장 요약", "sentiment": "긍정"}}]
+
+{items}"""
+
+        response = model.generate_content(
+            prompt,
+            generation_config={"response_mime_type": "application/json"},
+            request_options={"timeout": REQUEST_TIMEOUT},
+        )
+        results = _parse_batch_response(response.text, len(texts))
+        logger.info(f"Gemini 배치 요약 완료: {len(results)}/{len(texts)}건")
+
+    except Exception as e:
+        logger.error(f"Gemini 배치 요약 오류: {e}")
+
+    # 파싱 실패 항목은 단건 요약으로 fallback
+    missing = [i for i in range(len(texts)) if i not in results]
+    if missing:
+        logger.warning(f"배치 응답 누락 {len(missing)}건, 개별 요약으로 재시도")
+        for i in missing:
+            results[i] = summarize_content(texts[i], brand_name, api_key, model)
+
+    return [results[i] for i in range(len(texts))]
+
+
+def _parse_batch_response(result: str, count: int) -> dict:
+    """배치 JSON 응답 → {0부터 시작하는 index: (요약문, 감성)}"""
+    data = json.loads(result)
+    if isinstance(data, dict):
+        # {"items": [...]} 형태로 감싸서 오는 경우
+        data = next((value for value in data.values() if isinstance(value, list)), [])
+
+    parsed = {}
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("id")) - 1
+        except (TypeError, ValueError):
+            continue
+
+        summary = str(item.get("summary") or "").strip()
+        if not (0 <= index < count) or not summary:
+            continue
+
+        sentiment_text = str(item.get("sentiment") or "")
+        if "긍정" in sentiment_text:
+            sentiment = "긍정"
+        elif "부정" in sentiment_text:
+            sentiment = "부정"
+        else:
+            sentiment = "중립"
+
+        parsed[index] = (summary, sentiment)
+
+    return parsed
+
+
+def _parse_response(result: str) -> Tuple[str, str]:
+    """Gemini 응답에서 요약문과 감성 분리"""
+    summary = ""
+    sentiment = "중립"
+
+    lines = result.strip().split("\n")
+
+    summary_lines = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if line.startswith("감성:") or line.startswith("감성 :"):
+            # 감성 추출
+            sentiment_text = line.split(":", 1)[1].strip()
+            if "긍정" in sentiment_text:
+                sentiment = "긍정"
+            elif "부정" in sentiment_text:
+                sentiment = "부정"
+            else:
+                sentiment = "중립"
+        elif line.startswith("요약:") or line.startswith("요약 :"):
+            summary_lines.append(line.split(":", 1)[1].strip())
+        else:
+            # 요약 부분이 여러 줄일 수 있음
+            if not any(keyword in line for keyword in ["감성", "[긍정]", "[부정]", "[중립]"]):
+                summary_lines.append(line)
+
+    summary = " ".join(summary_lines).strip()
+
+    # 요약이 비어있으면 전체 결과를 요약으로 사용
+    if not summary:
+        summary = result.replace("감성:", "").replace("[긍정]", "").replace("[부정]", "").replace("[중립]", "").strip()
+
+    return (summary, sentiment)
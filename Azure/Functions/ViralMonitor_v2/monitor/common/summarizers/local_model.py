@@ -0,0 +1,68 @@
+"""
+로컬 요약 모델 (Gemini 대체)
+- Gemini GenerativeModel과 같은 generate_content 인터페이스
+- API 키/네트워크 없이 요약 파이프라인(단건/배치) 동작 확인용
+- 요약: 본문 앞 2문장, 감성: 긍정/부정 단어 수 비교
+"""
+import json
+import re
+
+from .gemini_summarizer import BATCH_ITEM_PATTERN
+
+POSITIVE_WORDS = ["좋", "추천", "만족", "최고", "깨끗", "편리", "강추"]
+NEGATIVE_WORDS = ["별로", "불만", "실망", "아쉽", "최악", "불편", "비추"]
+
+
+class LocalResponse:
+    """generate_content 응답 (response.text)"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class LocalModelClient:
+    """Gemini 모델 대체 클라이언트 (오프라인 테스트용)"""
+
+    def __init__(self):
+        self.call_count = 0
+
+    def generate_content(self, prompt: str, generation_config: dict = None, request_options: dict = None) -> LocalResponse:
+        self.call_count += 1
+
+        # 배치 요청 (JSON 모드)
+        if generation_config and generation_config.get("response_mime_type") == "application/json":
+            items = []
+            for item_id, text in self._split_items(prompt):
+                summary, sentiment = self._summarize(text)
+                items.append({"id": item_id, "summary": summary, "sentiment": sentiment})
+            return LocalResponse(json.dumps(items, ensure_ascii=False))
+
+        # 단건 요청
+        text = prompt.split("게시글 내용:", 1)[-1]
+        summary, sentiment = self._summarize(text)
+        return LocalResponse(f"요약: {summary}\n감성: [{sentiment}]")
+
+    @staticmethod
+    def _split_items(prompt: str):
+        """배치 프롬프트 → [(id, 본문)]"""
+        parts = BATCH_ITEM_PATTERN.split(prompt)
+        # parts = [머리말, id1, 본문1, id2, 본문2, ...]
+        return [(int(parts[i]), parts[i + 1].strip()) for i in range(1, len(parts) - 1, 2)]
+
+    @staticmethod
+    def _summarize(text: str):
+        """본문 앞 2문장 + 단어 기반 감성"""
+        text = re.sub(r'\s+', ' ', text).strip()
+        sentences = re.split(r'(?<=[.!?])\s+', text)
+        summary = " ".join(sentences[:2])[:200]
+
+        positive = sum(text.count(word) for word in POSITIVE_WORDS)
+        negative = sum(text.count(word) for word in NEGATIVE_WORDS)
+        if positive > negative:
+            sentiment = "긍정"
+        elif negative > positive:
+            sentiment = "부정"
+        else:
+            sentiment = "중립"
+
+        return (summary, sentiment)
@@ -0,0 +1,101 @@
+"""
+멀티 브랜드 바이럴 모니터링 설정
+- SystemConfig / ViralKeywords는 한 번만 로드하여 모든 브랜드 설정 구성
+- 브랜드별: 검색/제품/제외 키워드, Blob Container, Slack Webhook
+"""
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# shared 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'shared'))
+
+from shared.system_config import get_config
+from shared.keyword_config import get_keywords
+
+# SystemConfig 로드
+_system_config = get_config()
+
+# ===== 네이버 API 설정 =====
+NAVER_CLIENT_ID = _system_config.get('API', 'NAVER_CLIENT_ID', os.getenv("NAVER_CLIENT_ID", ""))
+NAVER_CLIENT_SECRET = _system_config.get('API', 'NAVER_CLIENT_SECRET', os.getenv("NAVER_CLIENT_SECRET", ""))
+
+# ===== YouTube API 설정 =====
+YOUTUBE_API_KEY = _system_config.get('API', 'YOUTUBE_API_KEY', os.getenv("YOUTUBE_API_KEY", ""))
+YOUTUBE_MAX_RESULTS = 20  # 키워드당 수집할 비디오 수
+YOUTUBE_ORDER = "date"  # 정렬: 'date' (최신순) 또는 'viewCount' (조회수순)
+
+# ===== Gemini API 설정 (AI 요약용) =====
+GEMINI_API_KEY = _system_config.get('API', 'GEMINI_API_KEY', os.getenv("GEMINI_API_KEY", ""))
+
+# 로컬 요약 모델 사용 여부 (Gemini 대신 LocalModelClient, 오프라인 테스트용)
+GEMINI_LOCAL_MODEL = os.getenv("GEMINI_LOCAL_MODEL", "").lower() in ("1", "true", "yes")
+
+# ===== Azure Blob Storage 설정 =====
+BLOB_CONNECTION_STRING = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "")
+
+# 브랜드 공통 수집 상태 (키워드 워터마크)
+SHARED_CONTAINER_NAME = "viral-monitor"
+
+# AI 요약 캐시 보관 기간 (일)
+SUMMARY_CACHE_TTL_DAYS = 30
+
+# ===== 로그 설정 =====
+LOG_LEVEL = "INFO"
+
+
+@dataclass
+class BrandConfig:
+    """브랜드별 모니터링 설정"""
+
+    name: str                               # 브랜드명 (ViralKeywords.BrandName)
+    search_keywords: List[str]              # API 검색 키워드
+    product_keywords: List[str]             # 제품 키워드 (비어있으면 제품 키워드 필터 미적용)
+    exclude_keywords: List[str]             # 제외 키워드
+    container_name: str                     # 중복 체크/요약 캐시 Blob Container
+    slack_webhook_url: str                  # 브랜드 Slack 채널
+    youtube: bool = False                   # YouTube 수집 대상 여부
+    # 수집 source → 브랜드별 표시 source (기존 중복 체크 키 유지용)
+    source_labels: Dict[str, str] = field(default_factory=dict)
+
+
+def _load_brand(name: str, default_search: List[str], default_product: List[str] = None, **kwargs) -> BrandConfig:
+    """ViralKeywords 테이블 우선, 없으면 기본 키워드"""
+    search_keywords = get_keywords(name, 'search') or default_search
+    product_keywords = get_keywords(name, 'filter') or (default_product or [])
+    exclude_keywords = get_keywords(name, 'exclude')
+
+    return BrandConfig(
+        name=name,
+        search_keywords=search_keywords,
+        product_keywords=product_keywords,
+        exclude_keywords=exclude_keywords,
+        **kwargs
+    )
+
+
+BRANDS: List[BrandConfig] = [
+    _load_brand(
+        "스크럽대디",
+        default_search=[
+            "스크럽대디", "스크럽 대디", "스크랩대디",
+            "스크럽daddy", "Scrub Daddy", "ScrubDaddy", "scrubdaddy",
+        ],
+        container_name="viral-scrubdaddy",
+        slack_webhook_url=_system_config.get('Slack', 'WEBHOOK_URL', os.getenv("SLACK_WEBHOOK_URL", "")),
+        youtube=True,
+    ),
+    _load_brand(
+        "프로그",
+        default_search=["프로그", "FROG", "Frog", "frog"],
+        default_product=[
+            "고무장갑", "수세미", "설거지", "청소", "주방",
+            "세제", "칫솔", "행주", "니트릴장갑", "지퍼백",
+            "매직블럭", "핫딜", "특가", "쿠팡"
+        ],
+        container_name="viral-frog",
+        slack_webhook_url=os.getenv("SLACK_WEBHOOK_URL_FROG", ""),
+        source_labels={"네이버 블로그": "네이버 블로그 (프로그)"},
+    ),
+]
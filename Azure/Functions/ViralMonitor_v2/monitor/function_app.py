@@ -1,5 +1,5 @@
 """
-프로그 바이럴 모니터링 - Azure Functions
+멀티 브랜드 바이럴 모니터링 - Azure Functions
 """
 import azure.functions as func
 import logging
@@ -16,23 +16,23 @@ app = func.FunctionApp()
     arg_name="myTimer",
     run_on_startup=False
 )
-def frog_monitor(myTimer: func.TimerRequest) -> None:
-    """프로그 모니터링 타이머 함수"""
+def viral_monitor(myTimer: func.TimerRequest) -> None:
+    """전체 브랜드 모니터링 타이머 함수"""
     utc_timestamp = datetime.utcnow().replace(tzinfo=None).isoformat()
 
     if myTimer.past_due:
         logging.info('타이머가 예정 시간보다 늦게 실행되었습니다')
 
-    logging.info(f'프로그 모니터링 시작: {utc_timestamp}')
+    logging.info(f'멀티 브랜드 모니터링 시작: {utc_timestamp}')
 
     try:
-        from scheduler import FrogMonitoringScheduler
+        from scheduler import MultiBrandMonitoringScheduler
 
-        scheduler = FrogMonitoringScheduler()
+        scheduler = MultiBrandMonitoringScheduler()
         scheduler.run_once()
 
-        logging.info(f'프로그 모니터링 완료: {utc_timestamp}')
+        logging.info(f'멀티 브랜드 모니터링 완료: {utc_timestamp}')
 
     except Exception as e:
-        logging.error(f'프로그 모니터링 실행 중 오류 발생: {e}', exc_info=True)
+        logging.error(f'멀티 브랜드 모니터링 실행 중 오류 발생: {e}', exc_info=True)
         raise
@@ -0,0 +1,327 @@
+"""
+멀티 브랜드 바이럴 모니터링 스케줄러
+- 모든 브랜드 검색 키워드의 합집합으로 플랫폼별 1회 수집 (수집기 병렬 실행)
+- 매칭 키워드 기준으로 브랜드별 라우팅 후 브랜드 필터 (제외 키워드 → 제품 키워드 → 당일)
+- 브랜드별 중복 체크 / AI 요약 캐시 / Slack 채널은 기존 Container·Webhook 그대로 사용
+- 수집 워터마크는 모든 브랜드의 처리·Slack 전송이 성공한 뒤에만 저장 (실패 시 다음 실행에서 같은 구간 재수집)
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, List, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import config
+from config import BrandConfig
+from common.collectors.base_collector import BaseCollector
+from common.collectors.naver_collector import NaverBlogCollector
+from common.collectors.youtube_collector import YouTubeCollector
+from common.keyword_matcher import KeywordMatcher
+from common.notifiers.slack_notifier import SlackNotifier
+from common.storage.duplicate_checker_azure import AzureDuplicateChecker
+from common.storage.summary_cache_azure import AzureSummaryCache
+from common.storage.watermark_store_azure import AzureWatermarkStore
+from common.models import Mention
+from common.summarizers.blog_crawler import crawl_blog_content
+from common.summarizers.youtube_transcript import extract_transcript
+from common.summarizers.enricher import enrich_mentions
+from common.summarizers.local_model import LocalModelClient
+from shared import http_client
+
+logger = logging.getLogger(__name__)
+
+
+def _union(keyword_lists: List[List[str]]) -> List[str]:
+    """키워드 리스트 합집합 (순서 유지)"""
+    return list(dict.fromkeys(keyword for keywords in keyword_lists for keyword in keywords))
+
+
+class BrandMonitor:
+    """브랜드 1개의 필터 → 중복 체크 → AI 요약 → Slack 알림"""
+
+    def __init__(self, brand: BrandConfig):
+        self.brand = brand
+        self.notifier = SlackNotifier(webhook_url=brand.slack_webhook_url)
+
+        # 제외/제품 키워드 매처 (실행당 1회 컴파일)
+        self.exclude_keywords = set(brand.exclude_keywords)
+        self.product_keywords = set(brand.product_keywords)
+        self.keyword_matcher = KeywordMatcher(brand.exclude_keywords + brand.product_keywords)
+
+        # Azure Blob Storage 기반 중복 체크
+        self.duplicate_checker = AzureDuplicateChecker(
+            connection_string=config.BLOB_CONNECTION_STRING,
+            container_name=brand.container_name,
+        )
+
+        # AI 요약 캐시 (실패 시 캐시 없이 요약)
+        try:
+            self.summary_cache = AzureSummaryCache(
+                connection_string=config.BLOB_CONNECTION_STRING,
+                container_name=brand.container_name,
+                ttl_days=config.SUMMARY_CACHE_TTL_DAYS,
+            )
+        except Exception as e:
+            logger.warning(f"[{brand.name}] AI 요약 캐시 초기화 실패, 캐시 없이 진행: {e}")
+            self.summary_cache = None
+
+    def route(self, mentions: List[Mention]) -> List[Mention]:
+        """
+        공통 수집 결과 중 브랜드 검색 키워드로 찾은 게시글만 선택
+
+        - keyword_matched는 브랜드 키워드만 남김
+        - source는 브랜드별 표시 이름으로 변경 (unique_id 재계산 → 기존 중복 체크 키 유지)
+        """
+        brand_keywords = set(self.brand.search_keywords)
+        routed = []
+        for mention in mentions:
+            matched = [kw for kw in (mention.keyword_matched or "").split(", ") if kw in brand_keywords]
+            if not matched:
+                continue
+
+            routed.append(replace(
+                mention,
+                source=self.brand.source_labels.get(mention.source, mention.source),
+                keyword_matched=", ".join(matched),
+            ))
+
+        return routed
+
+    def process(self, mentions: List[Mention], collection_stats: Dict[str, int]) -> bool:
+        """
+        브랜드별 필터링 및 알림 (오류는 브랜드 채널로 전송)
+
+        Returns:
+            처리 및 새 게시글 Slack 전송이 모두 성공했는지 (워터마크 저장 여부 판단)
+        """
+        brand_name = self.brand.name
+        try:
+            # 1~2. 제외 키워드 → 제품 키워드 필터링 (제품 키워드가 설정된 브랜드만)
+            excluded_mentions, product_mentions = self._filter_by_keywords(mentions)
+            logger.info(f"[{brand_name}] 제외 키워드 필터링: {len(mentions)}개 → {len(excluded_mentions)}개")
+            if self.product_keywords:
+                logger.info(f"[{brand_name}] 제품 키워드 필터링: {len(excluded_mentions)}개 → {len(product_mentions)}개")
+
+            # 3. 날짜 필터링 (당일 글만)
+            filtered_mentions = self._filter_by_date_today_only(product_mentions)
+            logger.info(f"[{brand_name}] 날짜 필터링: {len(product_mentions)}개 → {len(filtered_mentions)}개")
+
+            # 4. 중복 제거
+            new_mentions = self.duplicate_checker.filter_new_mentions(filtered_mentions)
+
+            # 5. AI 요약 (크롤링 + Gemini)
+            new_mentions = self._enrich_with_ai_summary(new_mentions)
+
+            # 6. Slack 알림 전송
+            success_by_channel = {}
+            if new_mentions:
+                logger.info(f"[{brand_name}] 새 게시글 {len(new_mentions)}건 발견, Slack 알림 전송 중...")
+                success_by_channel = self.notifier.send_mentions(new_mentions)
+            else:
+                logger.info(f"[{brand_name}] 새로운 게시글 없음")
+
+            # 7. 요약 알림
+            self.notifier.send_summary(
+                total_mentions=len(new_mentions),
+                success_by_channel=success_by_channel,
+                collection_stats=collection_stats,
+                scan_time=datetime.now(),
+                brand_name=brand_name,
+                ai_cache_stats=self.summary_cache.stats if self.summary_cache else None,
+                delivery_latency=self.notifier.delivery_latency,
+            )
+
+            total_success = sum(success_by_channel.values())
+            logger.info(f"[{brand_name}] 알림 전송 완료: 총 {total_success}/{len(new_mentions)}건 성공")
+            return total_success == len(new_mentions)
+
+        except Exception as e:
+            error_msg = f"{brand_name} 모니터링 실행 중 오류 발생: {e}"
+            logger.error(error_msg, exc_info=True)
+            self.notifier.send_error(error_msg)
+            return False
+
+    def _enrich_with_ai_summary(self, mentions: List[Mention]) -> List[Mention]:
+        """각 mention에 AI 요약 추가 (크롤링 → Gemini 요약, 병렬 처리)"""
+        gemini_key = config.GEMINI_API_KEY
+        model = LocalModelClient() if config.GEMINI_LOCAL_MODEL else None
+        if not gemini_key and model is None:
+            logger.warning("GEMINI_API_KEY 미설정, AI 요약 건너뜀")
+            return mentions
+
+        return enrich_mentions(mentions, self.brand.name, gemini_key, self._extract_text, cache=self.summary_cache, model=model)
+
+    @staticmethod
+    def _extract_text(mention: Mention) -> str:
+        """소스별 요약 대상 텍스트 추출"""
+        if "블로그" in mention.source or "카페" in mention.source:
+            return crawl_blog_content(mention.url)
+        elif "YouTube" in mention.source:
+            return extract_transcript(mention.url, mention.content_preview or "")
+        return mention.content_preview or ""
+
+    def _filter_by_keywords(self, mentions: List[Mention]) -> Tuple[List[Mention], List[Mention]]:
+        """
+        제외 키워드 / 제품 키워드 필터링 (게시글당 본문 1회 순회)
+
+        Returns:
+            (제외 키워드 필터 통과, 제품 키워드 필터까지 통과)
+        """
+        if not self.keyword_matcher:
+            return mentions, mentions
+
+        excluded = []
+        filtered = []
+        for mention in mentions:
+            matched = self.keyword_matcher.matched(f"{mention.title} {mention.content_preview or ''}")
+
+            if matched & self.exclude_keywords:
+                logger.debug(f"제외 키워드로 필터링됨: {mention.title[:30]}...")
+                continue
+            excluded.append(mention)
+
+            # 제품 키워드가 최소 1개 있는 글만 통과 (제품 키워드 미설정 시 전체 통과)
+            if not self.product_keywords or matched & self.product_keywords:
+                filtered.append(mention)
+            else:
+                logger.debug(f"제품 키워드 없음으로 제외됨: {mention.title[:30]}...")
+
+        return excluded, filtered
+
+    def _filter_by_date_today_only(self, mentions: List[Mention]) -> List[Mention]:
+        """당일 글만 필터링"""
+        today = datetime.now().date()
+
+        filtered = []
+        for mention in mentions:
+            if mention.posted_date.date() == today:
+                filtered.append(mention)
+
+        return filtered
+
+
+class MultiBrandMonitoringScheduler:
+    """전체 브랜드 공통 수집 + 브랜드별 처리 스케줄러"""
+
+    def __init__(self, brands: List[BrandConfig] = None):
+        """
+        Args:
+            brands: 모니터링할 브랜드 설정 리스트 (기본값: config.BRANDS)
+        """
+        brands = brands if brands is not None else config.BRANDS
+
+        # 키워드별 수집 워터마크 (브랜드 공통, 실패 시 매번 수집 기간 전체 조회)
+        try:
+            watermark_store = AzureWatermarkStore(
+                connection_string=config.BLOB_CONNECTION_STRING,
+                container_name=config.SHARED_CONTAINER_NAME,
+            )
+        except Exception as e:
+            logger.warning(f"워터마크 저장소 초기화 실패, 워터마크 없이 진행: {e}")
+            watermark_store = None
+
+        # 플랫폼별 Collector 설정 (브랜드 검색 키워드 합집합으로 1회 수집)
+        self.collectors = [
+            # 네이버 블로그
+            NaverBlogCollector(
+                keywords=_union([brand.search_keywords for brand in brands]),
+                client_id=config.NAVER_CLIENT_ID,
+                client_secret=config.NAVER_CLIENT_SECRET,
+                watermark_store=watermark_store,
+            ),
+        ]
+
+        # YouTube Collector 추가 (YouTube 대상 브랜드가 있고 API Key가 있을 경우만)
+        youtube_keywords = _union([brand.search_keywords for brand in brands if brand.youtube])
+        if youtube_keywords and config.YOUTUBE_API_KEY:
+            self.collectors.append(
+                YouTubeCollector(
+                    keywords=youtube_keywords,
+                    api_key=config.YOUTUBE_API_KEY,
+                    max_results=config.YOUTUBE_MAX_RESULTS,
+                    order=config.YOUTUBE_ORDER,
+                    watermark_store=watermark_store,
+                )
+            )
+            logger.info("YouTube Collector 추가됨")
+        elif youtube_keywords:
+            logger.warning("YouTube API Key가 설정되지 않아 YouTube 수집을 건너뜁니다")
+
+        # 브랜드별 처리기 (초기화 실패한 브랜드는 제외하고 진행)
+        self.brand_monitors = []
+        for brand in brands:
+            try:
+                self.brand_monitors.append(BrandMonitor(brand))
+            except Exception as e:
+                error_msg = f"{brand.name} 모니터 초기화 실패: {e}"
+                logger.error(error_msg, exc_info=True)
+                SlackNotifier(webhook_url=brand.slack_webhook_url).send_error(error_msg)
+
+        logger.info(
+            f"멀티 브랜드 모니터링 스케줄러 초기화 완료: {len(self.brand_monitors)}개 브랜드, "
+            f"{len(self.collectors)}개 플랫폼"
+        )
+
+    def run_once(self):
+        """1회 모니터링 실행"""
+        logger.info("=" * 60)
+        logger.info(f"멀티 브랜드 모니터링 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("=" * 60)
+        http_client.reset_metrics()
+
+        # 1. 모든 플랫폼에서 데이터 수집 (수집기 병렬)
+        with ThreadPoolExecutor(max_workers=len(self.collectors)) as executor:
+            results = list(executor.map(self._collect, self.collectors))
+
+        total = sum(len(mentions) for mentions in results)
+        logger.info(f"총 {total}개 게시글 수집 완료 (전체 브랜드 공통)")
+
+        # 2. 브랜드별 라우팅 (수집기별 건수 = 브랜드 수집 통계)
+        routed = []
+        for monitor in self.brand_monitors:
+            brand_mentions = []
+            collection_stats = {}
+            for collector, mentions in zip(self.collectors, results):
+                if isinstance(collector, YouTubeCollector) and not monitor.brand.youtube:
+                    continue
+                collector_mentions = monitor.route(mentions)
+                brand_mentions.extend(collector_mentions)
+                collection_stats[collector.get_name()] = len(collector_mentions)
+
+            logger.info(f"[{monitor.brand.name}] 라우팅: {len(brand_mentions)}개 게시글")
+            routed.append((monitor, brand_mentions, collection_stats))
+
+        # 3. 브랜드별 필터 → 중복 체크 → AI 요약 → 알림 (브랜드 병렬)
+        processed = []
+        if routed:
+            with ThreadPoolExecutor(max_workers=len(routed)) as executor:
+                processed = list(executor.map(lambda item: item[0].process(item[1], item[2]), routed))
+
+        # 4. 워터마크 저장 (브랜드 처리/전송 실패 시 유지 → 다음 실행에서 같은 구간 재수집, 중복 체크로 재알림 방지)
+        if processed and all(processed):
+            for collector in self.collectors:
+                collector.commit_watermarks()
+        else:
+            logger.warning("브랜드 처리/알림 실패가 있어 수집 워터마크를 갱신하지 않음")
+
+        # 호스트별 HTTP 요청 메트릭
+        http_client.log_metrics()
+
+        logger.info("=" * 60)
+        logger.info("멀티 브랜드 모니터링 완료")
+        logger.info("=" * 60)
+
+    def _collect(self, collector: BaseCollector) -> List[Mention]:
+        """수집기 1개 실행 (오류 시 빈 결과, 전체 브랜드 채널에 알림)"""
+        try:
+            return collector.collect()
+        except Exception as e:
+            error_msg = f"{collector.get_name()} 수집 오류: {e}"
+            logger.error(error_msg)
+            for monitor in self.brand_monitors:
+                monitor.notifier.send_error(error_msg)
+            return []
@@ -0,0 +1,69 @@
+"""
+Function 앱 공용 모듈 동기화
+- Function 앱은 앱 폴더 단위로 배포되어 앱 밖의 모듈을 import할 수 없음
+  → 원본은 shared_lib/ 에 1개만 두고, 각 앱의 배치 위치로 사본 생성
+- 공용 모듈 수정 시 shared_lib/ 원본만 고친 뒤 이 스크립트 실행 (사본 직접 수정 금지)
+
+실행:
+    python sync_shared_lib.py          # 사본 갱신
+    python sync_shared_lib.py --check  # 원본과 다른 사본이 있으면 종료 코드 1 (배포 전 확인용)
+"""
+
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(BASE_DIR, "shared_lib")
+
+# 원본 파일 -> 앱별 사본 경로 (BASE_DIR 기준)
+TARGETS = {
+    "http_client.py": [
+        "AdDataCollector/shared/http_client.py",
+        "DailySalesCollector2/shared/common/http_client.py",
+        "ExchangeRateCollector/shared/http_client.py",
+        "KeywordCollector/shared/common/http_client.py",
+        "ViralMonitor_v2/monitor/shared/http_client.py",
+    ],
+}
+
+HEADER = "# 자동 생성 파일 - Azure/Functions/shared_lib/{name} 에서 복사 (수정 시 원본 수정 후 python sync_shared_lib.py)\n"
+
+
+def render(name: str) -> str:
+    """사본 내용 (자동 생성 헤더 + 원본)"""
+    with open(os.path.join(SOURCE_DIR, name), encoding="utf-8") as f:
+        return HEADER.format(name=name) + f.read()
+
+
+def main() -> int:
+    check_only = "--check" in sys.argv[1:]
+    stale = []
+
+    for name, targets in TARGETS.items():
+        content = render(name)
+        for target in targets:
+            path = os.path.join(BASE_DIR, target)
+            current = None
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    current = f.read()
+            if current == content:
+                continue
+
+            stale.append(target)
+            if not check_only:
+                with open(path, "w", encoding="utf-8", newline="\n") as f:
+                    f.write(content)
+                print(f"[SYNC] {target} 갱신")
+
+    if check_only and stale:
+        for target in stale:
+            print(f"[ERROR] 원본과 다른 사본: {target}")
+        return 1
+
+    print(f"[OK] 공용 모듈 사본 {sum(len(t) for t in TARGETS.values())}개 확인 (갱신 {0 if check_only else len(stale)}개)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,7 @@ from pathlib import Path
 
 # Routers
 from routers import product, brand, channel, sales, bom, pages, target, promotion, utility, withdrawal_plan
-from routers import auth, admin, system_config
+from routers import auth, admin, system_config, job
 
 app = FastAPI(
     title="Orio ERP System v2",
@@ -57,14 +57,32 @@ app.include_router(promotion.router)  # 비정기 관리
 app.include_router(withdrawal_plan.router)  # 불출 계획
 app.include_router(utility.router)  # 유틸리티
 app.include_router(system_config.router)
+app.include_router(job.router)  # 백그라운드 작업 상태
 
 
 
 
+@app.on_event("startup")
+async def startup():
+    """이전 프로세스에서 끝나지 않은 백그라운드 작업 정리"""
+    from core.jobs import job_manager
+
+    job_manager.recover_interrupted()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """큐에 남은 활동 로그 기록"""
+    from core.activity_log_writer import activity_log_writer
+
+    activity_log_writer.stop()
+
+
 @app.get("/api/health")
 async def health():
     """헬스 체크"""
     from core import test_connection
+    from core.activity_log_writer import activity_log_writer
 
     db_connected, db_info = test_connection()
 
@@ -74,7 +92,8 @@ async def health():
         "database": {
             "connected": db_connected,
             "info": db_info if db_connected else "연결 실패"
-        }
+        },
+        "activity_log": activity_log_writer.metrics()
     }
 
 
@@ -1,7 +1,15 @@
 """Core 모듈"""
 
 from .database import get_db_connection, get_db_cursor, get_db_transaction, test_connection
-from .query_builder import QueryBuilder, build_insert_query, build_update_query, build_delete_query
+from .query_builder import (
+    QueryBuilder, build_insert_query, build_update_query, build_delete_query,
+    build_search_condition, SEARCH_CONTAINS, SEARCH_PREFIX, SEARCH_FULLTEXT,
+    build_year_month_condition, year_month_range
+)
+from .cache import (
+    reference_cache, response_cache, CacheSnapshot, etag_response,
+    cache_response, invalidate_on_write
+)
 from .base_repository import BaseRepository
 from .decorators import (
     transactional, with_error_handling, retry_on_failure,
@@ -27,6 +35,19 @@ __all__ = [
     'build_insert_query',
     'build_update_query',
     'build_delete_query',
+    'build_search_condition',
+    'SEARCH_CONTAINS',
+    'SEARCH_PREFIX',
+    'SEARCH_FULLTEXT',
+    'build_year_month_condition',
+    'year_month_range',
+    # Cache
+    'reference_cache',
+    'response_cache',
+    'CacheSnapshot',
+    'etag_response',
+    'cache_response',
+    'invalidate_on_write',
     # Base Repository
     'BaseRepository',
     # Decorators
@@ -1,5 +1,6 @@
 """
 활동 로그 데코레이터 - CRUD 작업 자동 로깅
+- log_action은 큐에 넣고 즉시 반환 (core.activity_log_writer가 배치 INSERT) → 요청 응답 시간에 DB 기록 미포함
 """
 
 from functools import wraps
@@ -0,0 +1,214 @@
+"""
+활동 로그 비동기 기록기
+- 요청 처리 중에는 큐에 넣기만 하고 (DB 왕복 없음), 백그라운드 스레드가 모아서 다중 행 INSERT
+- 배치 기준: ACTIVITY_LOG_BATCH_SIZE건 또는 ACTIVITY_LOG_FLUSH_MS 경과
+- 큐가 가득 차면 유실 처리 (요청은 막지 않음) → metrics()의 dropped로 확인
+- DB 연결 오류는 지수 백오프 후 배치 재시도, 데이터 오류만 건별 재시도로 문제 행 제외
+- 서버 종료 시 stop()으로 남은 로그 기록
+"""
+
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyodbc
+
+# 큐 최대 크기 (초과 시 유실)
+ACTIVITY_LOG_QUEUE_SIZE = int(os.getenv("ACTIVITY_LOG_QUEUE_SIZE", "10000"))
+
+# 배치당 최대 건수 (ActivityLog 7컬럼 → SQL Server 파라미터 2100개 제한 이내)
+ACTIVITY_LOG_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "200"))
+
+# 배치 최대 대기 시간 (밀리초)
+ACTIVITY_LOG_FLUSH_MS = int(os.getenv("ACTIVITY_LOG_FLUSH_MS", "500"))
+
+# 연결 오류 시 배치 재시도 (1, 2, 4 ... 최대 MAX_RETRY_DELAY초 대기)
+MAX_WRITE_RETRIES = 5
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+# 특정 행 값 때문에 실패하는 오류 (건별 재시도 대상) - 그 외는 연결 오류로 보고 배치 재시도
+DATA_ERRORS = (pyodbc.DataError, pyodbc.IntegrityError)
+
+# 종료 시 남은 로그 기록 대기 시간 (초)
+SHUTDOWN_TIMEOUT = 10.0
+
+
+class ActivityLogWriter:
+    """활동 로그 큐 + 배치 기록 스레드"""
+
+    def __init__(
+        self,
+        queue_size: int = ACTIVITY_LOG_QUEUE_SIZE,
+        batch_size: int = ACTIVITY_LOG_BATCH_SIZE,
+        flush_ms: int = ACTIVITY_LOG_FLUSH_MS
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+        # 지표
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retries = 0
+        self.batches = 0
+        self.last_flush: Optional[datetime] = None
+        self._reported_dropped = 0
+
+    @property
+    def repo(self):
+        # 순환 import 방지 (repositories → core)
+        from repositories.activity_log_repository import activity_log_repo
+        return activity_log_repo
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+                self._thread.start()
+
+    def enqueue(self, record: Dict[str, Any]) -> bool:
+        """
+        로그 1건 등록 (즉시 반환)
+
+        Args:
+            record: ActivityLog 컬럼명 → 값 (UserID, ActionType, TargetTable, TargetID, Details, IPAddress, CreatedDate)
+
+        Returns:
+            bool: 등록 여부 (큐가 가득 차면 False - 유실)
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+        with self._lock:
+            self.enqueued += 1
+        return True
+
+    def _run(self) -> None:
+        """백그라운드 스레드 - 배치 크기 또는 대기 시간 기준으로 모아서 기록"""
+        while not (self._stop_event.is_set() and self._queue.empty()):
+            batch = self._collect_batch()
+            if batch:
+                self._write(batch)
+            self._report_dropped()
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """첫 건을 기다린 뒤 flush_interval 안에 들어온 로그를 batch_size까지 모음"""
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop_event.is_set():
+                # 종료 중이면 대기 없이 남은 로그만 수집
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """배치 기록 (연결 오류 → 백오프 후 배치 재시도, 데이터 오류 → 건별 재시도로 문제 행만 제외)"""
+        delay = RETRY_DELAY
+        for attempt in range(MAX_WRITE_RETRIES + 1):
+            try:
+                self.repo.insert_batch(batch)
+                written, failed = len(batch), 0
+                break
+            except DATA_ERRORS as e:
+                print(f"[WARNING] 활동 로그 배치 기록 실패 ({len(batch)}건), 건별 재시도: {e}")
+                written, failed = self._write_rows(batch)
+                break
+            except Exception as e:
+                # 연결 끊김 / DB 일시 중지 등 → 건별 재시도해도 모두 실패하므로 배치째 대기 후 재시도
+                if attempt == MAX_WRITE_RETRIES or self._stop_event.is_set():
+                    # 종료 중에는 백오프 없이 포기 (SHUTDOWN_TIMEOUT 안에 남은 큐 처리)
+                    reason = "종료 중" if self._stop_event.is_set() else f"재시도 {MAX_WRITE_RETRIES}회 초과"
+                    print(f"[WARNING] 활동 로그 배치 기록 실패 ({len(batch)}건), {reason}: {e}")
+                    written, failed = 0, len(batch)
+                    break
+                print(f"[WARNING] 활동 로그 배치 기록 실패 ({len(batch)}건), {delay:.0f}초 후 재시도 ({attempt + 1}/{MAX_WRITE_RETRIES}): {e}")
+                with self._lock:
+                    self.retries += 1
+                # stop() 호출 시 대기 중단 → 1회 더 시도 후 포기
+                self._stop_event.wait(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+
+        with self._lock:
+            self.written += written
+            self.failed += failed
+            self.batches += 1
+            self.last_flush = datetime.now()
+
+    def _write_rows(self, batch: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """건별 기록 (데이터 오류 행만 제외) → (기록 건수, 실패 건수)"""
+        written, failed = 0, 0
+        for record in batch:
+            try:
+                self.repo.insert_batch([record])
+                written += 1
+            except Exception as row_error:
+                failed += 1
+                print(f"[WARNING] 활동 로그 기록 실패 ({record.get('ActionType')} / {record.get('TargetTable')}): {row_error}")
+        return written, failed
+
+    def _report_dropped(self) -> None:
+        """큐 초과로 유실된 로그가 늘었으면 경고 출력"""
+        with self._lock:
+            new_drops = self.dropped - self._reported_dropped
+            self._reported_dropped = self.dropped
+        if new_drops:
+            print(f"[WARNING] 활동 로그 {new_drops}건 유실 (큐 가득 참, 누적 {self.dropped}건)")
+
+    def stop(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """종료 - 큐에 남은 로그를 기록한 뒤 스레드 종료 (서버 shutdown 이벤트에서 호출)"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout)
+        if thread.is_alive():
+            print(f"[WARNING] 활동 로그 기록 종료 대기 시간 초과 (미기록 {self._queue.qsize()}건)")
+        else:
+            print(f"[ACTIVITY] 활동 로그 기록 종료 (기록 {self.written}건, 유실 {self.dropped}건, 실패 {self.failed}건)")
+
+    def metrics(self) -> Dict[str, Any]:
+        """지표 (큐 대기 건수, 유실/실패 건수 등)"""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "retries": self.retries,
+                "batches": self.batches,
+                "last_flush": self.last_flush.strftime('%Y-%m-%d %H:%M:%S') if self.last_flush else None,
+            }
+
+
+activity_log_writer = ActivityLogWriter()
@@ -9,9 +9,13 @@ from abc import ABC, abstractmethod
 from typing import TypeVar, Generic, List, Dict, Any, Optional, Tuple
 from .database import get_db_cursor, get_db_transaction
 from .query_builder import QueryBuilder, build_insert_query, build_update_query, build_delete_query
+from .cache import reference_cache
 
 T = TypeVar('T')
 
+# 필터 기반 일괄 작업의 제외 ID 최대 개수 (SQL Server 파라미터 2100개 제한)
+MAX_EXCLUDE_IDS = 1000
+
 
 class BaseRepository(ABC, Generic[T]):
     """
@@ -20,8 +24,11 @@ class BaseRepository(ABC, Generic[T]):
     Attributes:
         table_name: 테이블 이름
         id_column: Primary Key 컬럼 이름
+        REFERENCE_TABLES: 변경 시 무효화할 참조 데이터 캐시 테이블 (core.cache)
     """
 
+    REFERENCE_TABLES: Tuple[str, ...] = ()
+
     def __init__(self, table_name: str, id_column: str = "ID"):
         self.table_name = table_name
         self.id_column = id_column
@@ -140,7 +147,8 @@ class BaseRepository(ABC, Generic[T]):
             cursor.execute("SELECT @@IDENTITY")
             new_id = int(cursor.fetchone()[0])
 
-            return new_id
+        self._invalidate_reference_cache()
+        return new_id
 
     def update(self, id_value: Any, data: Dict[str, Any]) -> bool:
         """
@@ -156,8 +164,11 @@ class BaseRepository(ABC, Generic[T]):
         with get_db_cursor() as cursor:
             query, params = build_update_query(self.table_name, self.id_column, id_value, data)
             cursor.execute(query, *params)
+            updated = cursor.rowcount > 0
 
-            return cursor.rowcount > 0
+        if updated:
+            self._invalidate_reference_cache()
+        return updated
 
     def delete(self, id_value: Any) -> bool:
         """
@@ -194,8 +205,119 @@ class BaseRepository(ABC, Generic[T]):
                 cursor.execute(query, *params)
                 total_deleted += cursor.rowcount
 
+        if total_deleted:
+            self._invalidate_reference_cache()
         return total_deleted
 
+    def delete_by_filters(self, filters: Dict[str, Any], exclude_ids: Optional[List[Any]] = None) -> int:
+        """
+        필터 기반 일괄 삭제 (단일 DELETE)
+        - 목록 조회와 같은 _apply_filters 조건으로 삭제 → ID 목록 왕복/IN 배치 불필요
+
+        Args:
+            filters: 필터 조건 딕셔너리 (목록 조회와 동일)
+            exclude_ids: 제외할 ID 리스트 (전체 선택 후 선택 해제한 행)
+
+        Returns:
+            int: 삭제된 레코드 수
+        """
+        builder = self._build_filter_target(filters, exclude_ids)
+
+        with get_db_cursor() as cursor:
+            query, params = builder.build_delete()
+            cursor.execute(query, *params)
+            deleted = cursor.rowcount
+
+        if deleted:
+            self._invalidate_reference_cache()
+        return deleted
+
+    def update_by_filters(
+        self,
+        filters: Dict[str, Any],
+        updates: Dict[str, Any],
+        exclude_ids: Optional[List[Any]] = None
+    ) -> int:
+        """
+        필터 기반 일괄 수정 (단일 UPDATE)
+
+        Args:
+            filters: 필터 조건 딕셔너리 (목록 조회와 동일)
+            updates: 수정할 필드와 값
+            exclude_ids: 제외할 ID 리스트 (전체 선택 후 선택 해제한 행)
+
+        Returns:
+            int: 수정된 레코드 수
+        """
+        if not updates:
+            return 0
+
+        invalid = [col for col in updates if not col.isidentifier()]
+        if invalid:
+            raise ValueError(f"잘못된 컬럼명: {', '.join(invalid)}")
+
+        builder = self._build_filter_target(filters, exclude_ids)
+
+        with get_db_cursor() as cursor:
+            query, params = builder.build_update(updates)
+            cursor.execute(query, *params)
+            updated = cursor.rowcount
+
+        if updated:
+            self._invalidate_reference_cache()
+        return updated
+
+    def _build_filter_target(
+        self,
+        filters: Dict[str, Any],
+        exclude_ids: Optional[List[Any]] = None
+    ) -> QueryBuilder:
+        """
+        필터 기반 일괄 작업 대상 QueryBuilder (내부 헬퍼)
+        - 적용된 필터 조건이 없으면 테이블 전체가 대상이 되므로 거부
+
+        Raises:
+            ValueError: 필터 조건 없음 / 제외 ID 개수 초과
+        """
+        if exclude_ids and len(exclude_ids) > MAX_EXCLUDE_IDS:
+            raise ValueError(f"제외 항목은 최대 {MAX_EXCLUDE_IDS}개까지 가능합니다")
+
+        builder = self._build_query_with_filters(self._normalize_filter_values(filters))
+        if not builder.where_conditions:
+            raise ValueError("필터 조건이 없습니다")
+
+        if exclude_ids:
+            builder.where_not_in(f"{builder.target_alias()}.{self.id_column}", exclude_ids)
+
+        return builder
+
+    @staticmethod
+    def _normalize_filter_values(filters: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """
+        클라이언트가 보낸 필터 값을 목록 조회(쿼리스트링)와 같은 문자열로 정규화
+        - 숫자는 문자열로 변환, 그 외 타입(bool/list/dict)은 거부
+
+        Raises:
+            ValueError: 잘못된 필터 값
+        """
+        normalized = {}
+        for key, value in filters.items():
+            if value is None or isinstance(value, str):
+                normalized[key] = value
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                normalized[key] = str(value)
+            else:
+                raise ValueError(f"잘못된 필터 값: {key}")
+        return normalized
+
+    def _invalidate_reference_cache(self) -> None:
+        """
+        참조 데이터 캐시 무효화 (커밋 후 호출)
+        REFERENCE_TABLES가 있는 Repository의 쓰기 메서드에서 사용 - 직접 SQL로 쓰는 메서드도 호출 필요
+        """
+        if self.REFERENCE_TABLES:
+            reference_cache.invalidate(*self.REFERENCE_TABLES)
+
     def exists(self, id_value: Any) -> bool:
         """
         레코드 존재 여부 확인
@@ -0,0 +1,243 @@
+"""
+프로세스 메모리 캐시
+1. 참조 데이터 캐시 (reference_cache) - Brand, Channel, ChannelDetail, Product, ProductBox 등
+   - 자주 바뀌지 않는 작은 테이블의 드롭다운/메타데이터/매핑 조회 결과를 보관
+   - 테이블별 버전: Repository의 생성/수정/삭제 후 invalidate(테이블) → 버전 증가 → 해당 테이블을 쓰는 스냅샷 재조회
+   - 다른 워커 프로세스의 변경은 알 수 없으므로 TTL(REFERENCE_CACHE_TTL)이 지나면 재조회
+2. 응답 캐시 (response_cache, @cache_response) - 년월/유형 목록 같은 읽기 전용 GET 엔드포인트
+   - 키: 경로 + 쿼리 파라미터 + 권한 범위(역할), 라우트별 TTL
+   - 같은 라우터의 쓰기 요청(invalidate_on_write) / 백그라운드 작업 완료 시 네임스페이스 단위 무효화
+   - 네임스페이스 버전: 조회 중 무효화되면 저장하지 않음 (무효화 전에 읽은 응답이 TTL 동안 남지 않도록)
+- 스냅샷마다 내용 해시로 약한 ETag 생성 → If-None-Match가 같으면 304 응답
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# 스냅샷 최대 보관 시간 (초) - 다른 프로세스에서 변경된 데이터 반영 주기
+REFERENCE_CACHE_TTL = int(os.getenv("REFERENCE_CACHE_TTL", "300"))
+
+# 응답 캐시 기본 TTL (초) - @cache_response(ttl=...)로 라우트별 지정
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "60"))
+
+# 응답 캐시를 무효화하지 않는 요청 메서드
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+@dataclass(frozen=True)
+class CacheSnapshot:
+    """조회 결과 1건 (value는 공유 객체 → 호출 측에서 수정 금지)"""
+    value: Any
+    etag: str
+    versions: Tuple[int, ...] = ()
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+def compute_etag(value: Any) -> str:
+    """내용 해시 기반 약한 ETag (워커 프로세스가 달라도 같은 데이터면 같은 값)"""
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return f'W/"{hashlib.md5(payload.encode("utf-8")).hexdigest()}"'
+
+
+class ReferenceCache:
+    """테이블 버전 기반 참조 데이터 캐시"""
+
+    def __init__(self, ttl: int = REFERENCE_CACHE_TTL):
+        self.ttl = ttl
+        self._versions: Dict[str, int] = {}
+        self._snapshots: Dict[str, CacheSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def _current_versions(self, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def get_snapshot(self, key: str, tables: Tuple[str, ...], loader: Callable[[], Any]) -> CacheSnapshot:
+        """
+        스냅샷 조회 (없거나, 테이블 버전이 바뀌었거나, TTL이 지났으면 loader로 재조회)
+
+        Args:
+            key: 캐시 키 (예: "brand.all")
+            tables: 조회에 사용하는 테이블명 (invalidate 대상)
+            loader: DB 조회 함수
+
+        Returns:
+            CacheSnapshot: 값 + ETag
+        """
+        with self._lock:
+            versions = self._current_versions(tables)
+            snapshot = self._snapshots.get(key)
+
+        if (
+            snapshot is not None
+            and snapshot.versions == versions
+            and time.monotonic() - snapshot.loaded_at < self.ttl
+        ):
+            return snapshot
+
+        # DB 조회는 잠금 밖에서 (느린 조회가 다른 키 조회를 막지 않도록)
+        value = loader()
+        snapshot = CacheSnapshot(value=value, etag=compute_etag(value), versions=versions)
+
+        with self._lock:
+            # 조회 중 invalidate 됐으면 저장하지 않음 (이전 데이터일 수 있음)
+            if self._current_versions(tables) == versions:
+                self._snapshots[key] = snapshot
+
+        return snapshot
+
+    def get(self, key: str, tables: Tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        """캐시된 값 조회 (get_snapshot().value)"""
+        return self.get_snapshot(key, tables, loader).value
+
+    def invalidate(self, *tables: str) -> None:
+        """테이블 버전 증가 → 해당 테이블을 쓰는 스냅샷은 다음 조회 시 재조회"""
+        if not tables:
+            return
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def clear(self) -> None:
+        """전체 스냅샷 삭제"""
+        with self._lock:
+            self._snapshots.clear()
+
+
+def etag_response(request: Request, snapshot: CacheSnapshot, content: Optional[Any] = None) -> Response:
+    """
+    ETag 응답 (If-None-Match가 같으면 304, 아니면 JSON 본문)
+
+    Args:
+        request: 요청 (If-None-Match 헤더 확인)
+        snapshot: 참조 데이터 스냅샷
+        content: 응답 본문 (None이면 snapshot.value) - 스냅샷 값을 감싸는 경우
+    """
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and snapshot.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(content=snapshot.value if content is None else content, headers=headers)
+
+
+class ResponseCache:
+    """네임스페이스(라우터) 단위 GET 응답 캐시"""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, CacheSnapshot]] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def version(self, namespace: str) -> int:
+        """네임스페이스 버전 (invalidate마다 증가) - 핸들러 실행 전에 조회해서 set()에 전달"""
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def get(self, namespace: str, key: str, ttl: int) -> Optional[CacheSnapshot]:
+        """TTL 안의 캐시된 응답 (없으면 None)"""
+        with self._lock:
+            snapshot = self._entries.get(namespace, {}).get(key)
+        if snapshot is not None and time.monotonic() - snapshot.loaded_at < ttl:
+            return snapshot
+        return None
+
+    def set(self, namespace: str, key: str, value: Any, version: int) -> CacheSnapshot:
+        """
+        응답 저장 (value는 JSON 변환 가능한 값)
+
+        Args:
+            version: 핸들러 실행 전 version(namespace) - 그 사이 무효화됐으면 저장하지 않음 (이전 데이터일 수 있음)
+        """
+        snapshot = CacheSnapshot(value=value, etag=compute_etag(value), versions=(version,))
+        with self._lock:
+            if self._versions.get(namespace, 0) == version:
+                self._entries.setdefault(namespace, {})[key] = snapshot
+        return snapshot
+
+    def invalidate(self, *namespaces: str) -> None:
+        """네임스페이스의 캐시된 응답 전체 삭제 + 버전 증가 (조회 중인 응답 저장 방지)"""
+        with self._lock:
+            for namespace in namespaces:
+                self._entries.pop(namespace, None)
+                self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+
+def _response_cache_key(request: Request, user: Any) -> str:
+    """경로 + 정렬된 쿼리 파라미터 + 권한 범위(역할) - 같은 역할이면 같은 응답"""
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    scope = getattr(user, "role", None) or "anonymous"
+    return f"{request.url.path}?{query}|{scope}"
+
+
+def cache_response(namespace: str, ttl: int = RESPONSE_CACHE_TTL):
+    """
+    GET 응답 캐시 데코레이터 (ETag/304 포함)
+
+    Args:
+        namespace: 무효화 단위 (같은 namespace의 invalidate_on_write 라우터 쓰기 시 삭제)
+        ttl: 캐시 유지 시간 (초)
+
+    사용 예시:
+        @router.get("/year-months")
+        @cache_response("promotion", ttl=60)
+        async def get_year_months(request: Request, user: CurrentUser = Depends(require_permission("Promotion", "READ"))):
+            return {"year_months": promotion_repo.get_year_months()}
+
+    주의사항:
+        - 함수에 request: Request 파라미터 필요 (없으면 캐시하지 않음)
+        - 권한 검사(Depends)는 캐시 여부와 관계없이 매 요청 실행
+        - Response 객체를 직접 반환하면 캐시하지 않음
+    """
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs.get("request")
+            if request is None:
+                return await func(*args, **kwargs)
+
+            user = kwargs.get("user") or kwargs.get("current_user") or kwargs.get("admin")
+            key = _response_cache_key(request, user)
+
+            snapshot = response_cache.get(namespace, key, ttl)
+            if snapshot is None:
+                version = response_cache.version(namespace)
+                result = await func(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                snapshot = response_cache.set(namespace, key, jsonable_encoder(result), version)
+
+            return etag_response(request, snapshot)
+        return wrapper
+    return decorator
+
+
+def invalidate_on_write(*namespaces: str):
+    """
+    라우터 의존성 - 쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 응답 캐시 무효화
+
+    사용 예시:
+        router = APIRouter(prefix="/api/promotions", dependencies=[Depends(invalidate_on_write("promotion"))])
+
+    백그라운드 작업으로 쓰는 경우 요청 시점에는 아직 데이터가 바뀌지 않으므로
+    job_manager.submit(..., invalidates=("promotion",))로 작업 완료 시 한 번 더 무효화
+    """
+    async def dependency(request: Request):
+        yield
+        if request.method not in SAFE_METHODS:
+            response_cache.invalidate(*namespaces)
+    return dependency
+
+
+reference_cache = ReferenceCache()
+response_cache = ResponseCache()
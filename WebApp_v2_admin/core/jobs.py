@@ -0,0 +1,269 @@
+"""
+백그라운드 작업 (Job) 실행기
+- 엑셀 업로드 / 동기화처럼 오래 걸리는 작업을 요청 처리와 분리해 실행 (요청은 job_id 즉시 반환)
+- 워커 스레드 풀로 동시 실행 수 제한
+- 진행률은 메모리에서 실시간 갱신, BackgroundJob 테이블에는 상태 변경 시 + 주기적으로 저장
+- 상태 조회: GET /api/jobs/{job_id} (폴링), GET /api/jobs/{job_id}/events (SSE)
+"""
+
+import os
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from .cache import response_cache
+
+# 동시 실행 작업 수 (초과 시 QUEUED 대기)
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "3"))
+
+# 진행률 DB 저장 최소 간격 (초)
+PERSIST_INTERVAL = 2.0
+
+# 완료된 작업의 메모리 보관 시간 (초) - 이후에는 DB에서 조회
+JOB_RETENTION_SECONDS = 3600
+
+STATUS_QUEUED = "QUEUED"
+STATUS_RUNNING = "RUNNING"
+STATUS_COMPLETED = "COMPLETED"
+STATUS_FAILED = "FAILED"
+FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_FAILED)
+
+
+class Job:
+    """실행 중인 작업 1건의 상태"""
+
+    def __init__(
+        self,
+        job_type: str,
+        title: Optional[str] = None,
+        user_id: Optional[int] = None,
+        invalidates: Tuple[str, ...] = ()
+    ):
+        self.job_id = uuid.uuid4().hex
+        self.job_type = job_type
+        self.title = title
+        self.user_id = user_id
+        self.invalidates = invalidates
+        self.status = STATUS_QUEUED
+        self.processed = 0
+        self.total = 0
+        self.message: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+        self._lock = threading.Lock()
+        self._last_persist = 0.0
+
+    def update_progress(self, processed: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+        """
+        진행률 갱신 (작업 함수의 배치 루프에서 호출)
+
+        Args:
+            processed: 처리 건수
+            total: 전체 건수 (None이면 유지)
+            message: 현재 단계 설명 (None이면 유지)
+        """
+        with self._lock:
+            self.processed = processed
+            if total is not None:
+                self.total = total
+            if message is not None:
+                self.message = message
+
+        if time.monotonic() - self._last_persist >= PERSIST_INTERVAL:
+            job_manager.persist(self)
+
+    def set_message(self, message: str) -> None:
+        """현재 단계 설명 갱신 (진행 건수는 유지)"""
+        self.update_progress(self.processed, message=message)
+
+    def progress_callback(self, message: Optional[str] = None) -> Callable[[int, int], None]:
+        """Repository bulk 메서드에 넘길 (처리 건수, 전체 건수) 콜백"""
+        def callback(processed: int, total: int) -> None:
+            self.update_progress(processed, total, message)
+        return callback
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 (JobRepository._row_to_dict와 같은 형식)"""
+        with self._lock:
+            return {
+                "JobID": self.job_id,
+                "JobType": self.job_type,
+                "Title": self.title,
+                "Status": self.status,
+                "Processed": self.processed,
+                "Total": self.total,
+                "Percent": round(self.processed / self.total * 100, 1) if self.total else None,
+                "Message": self.message,
+                "Result": self.result,
+                "Error": self.error,
+                "UserID": self.user_id,
+                "CreatedDate": self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+                "StartedDate": self.started_at.strftime('%Y-%m-%d %H:%M:%S') if self.started_at else None,
+                "FinishedDate": self.finished_at.strftime('%Y-%m-%d %H:%M:%S') if self.finished_at else None,
+            }
+
+
+class JobManager:
+    """작업 등록 / 실행 / 상태 조회"""
+
+    def __init__(self, max_workers: int = JOB_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def repo(self):
+        # 순환 import 방지 (repositories → core)
+        from repositories.job_repository import JobRepository
+        return JobRepository()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            return self._executor
+
+    def submit(
+        self,
+        job_type: str,
+        func: Callable[..., Dict[str, Any]],
+        *args: Any,
+        title: Optional[str] = None,
+        user_id: Optional[int] = None,
+        invalidates: Tuple[str, ...] = (),
+        **kwargs: Any
+    ) -> Job:
+        """
+        작업 등록 (즉시 반환, 워커 여유가 생기면 실행)
+
+        Args:
+            job_type: 작업 유형 (예: "ERPSALES_UPLOAD")
+            func: 작업 함수 - func(job, *args, **kwargs) → 결과 dict
+            title: 표시용 제목 (예: 파일명)
+            user_id: 요청 사용자 ID
+            invalidates: 작업 종료 시 무효화할 응답 캐시 네임스페이스 (core.cache.response_cache)
+
+        Returns:
+            Job: 등록된 작업
+        """
+        job = Job(job_type, title=title, user_id=user_id, invalidates=invalidates)
+
+        self._cleanup()
+        with self._lock:
+            self._jobs[job.job_id] = job
+
+        try:
+            self.repo.create_job({
+                "JobID": job.job_id,
+                "JobType": job.job_type,
+                "Title": job.title,
+                "Status": job.status,
+                "UserID": job.user_id,
+            })
+        except Exception as e:
+            print(f"[WARNING] 작업 상태 저장 실패 ({job.job_id}): {e}")
+
+        self._get_executor().submit(self._run, job, func, args, kwargs)
+        print(f"[JOB] 등록: {job.job_type} {job.job_id} ({job.title or '-'})")
+        return job
+
+    def _run(self, job: Job, func: Callable, args: tuple, kwargs: dict) -> None:
+        """워커 스레드에서 작업 실행"""
+        with job._lock:
+            job.status = STATUS_RUNNING
+            job.started_at = datetime.now()
+        self.persist(job)
+
+        try:
+            result = func(job, *args, **kwargs)
+            with job._lock:
+                job.result = result
+                job.status = STATUS_COMPLETED
+                if job.total:
+                    job.processed = job.total
+        except HTTPException as e:
+            # 작업 함수는 기존 엔드포인트 로직 그대로 → 검증 실패 등은 HTTPException.detail이 에러 메시지
+            with job._lock:
+                job.error = str(e.detail)
+                job.status = STATUS_FAILED
+        except Exception as e:
+            traceback.print_exc()
+            with job._lock:
+                job.error = str(e)
+                job.status = STATUS_FAILED
+        finally:
+            with job._lock:
+                job.finished_at = datetime.now()
+            if job.invalidates:
+                response_cache.invalidate(*job.invalidates)
+            self.persist(job)
+            duration = (job.finished_at - job.started_at).total_seconds()
+            print(f"[JOB] {job.status}: {job.job_type} {job.job_id} ({duration:.1f}초)")
+
+    def persist(self, job: Job) -> None:
+        """작업 상태 DB 저장 (실패해도 작업은 계속)"""
+        job._last_persist = time.monotonic()
+        data = job.to_dict()
+        try:
+            self.repo.update_job(job.job_id, {
+                "Status": data["Status"],
+                "Processed": data["Processed"],
+                "Total": data["Total"],
+                "Message": data["Message"],
+                "Result": data["Result"],
+                "ErrorMessage": data["Error"],
+                "StartedDate": job.started_at,
+                "FinishedDate": job.finished_at,
+            })
+        except Exception as e:
+            print(f"[WARNING] 작업 상태 저장 실패 ({job.job_id}): {e}")
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 조회 (메모리 우선, 없으면 DB)
+
+        Returns:
+            Dict | None: 작업 상태
+        """
+        job = self._jobs.get(job_id)
+        if job:
+            return job.to_dict()
+        return self.repo.get_by_id(job_id)
+
+    def list_recent(self, user_id: Optional[int] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (user_id가 None이면 전체)"""
+        return self.repo.get_recent_by_user(user_id, limit)
+
+    def recover_interrupted(self) -> None:
+        """서버 시작 시 이전 프로세스에서 끝나지 않은 작업을 실패 처리"""
+        try:
+            count = self.repo.mark_interrupted("서버 재시작으로 작업이 중단되었습니다")
+            if count:
+                print(f"[JOB] 중단된 작업 {count}건 실패 처리")
+        except Exception as e:
+            print(f"[WARNING] 중단 작업 정리 실패: {e}")
+
+    def _cleanup(self) -> None:
+        """보관 시간이 지난 완료 작업을 메모리에서 제거"""
+        now = datetime.now()
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at and (now - job.finished_at).total_seconds() > JOB_RETENTION_SECONDS
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+job_manager = JobManager()
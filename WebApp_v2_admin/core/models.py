@@ -4,7 +4,7 @@
 """
 
 from pydantic import BaseModel
-from typing import List, Any
+from typing import List, Any, Dict
 
 
 class BulkDeleteRequest(BaseModel):
@@ -15,3 +15,18 @@ class BulkDeleteRequest(BaseModel):
 class BulkDeleteAnyRequest(BaseModel):
     """일괄 삭제 요청 (문자열/혼합 ID)"""
     ids: List[Any]
+
+
+class FilterBulkRequest(BaseModel):
+    """
+    필터 기반 일괄 작업 요청 (전체 선택)
+    - filters: 목록 조회와 같은 필터 조건
+    - exclude_ids: 전체 선택 후 선택 해제한 ID
+    """
+    filters: Dict[str, Any]
+    exclude_ids: List[Any] = []
+
+
+class FilterBulkUpdateRequest(FilterBulkRequest):
+    """필터 기반 일괄 수정 요청"""
+    updates: Dict[str, Any]
@@ -4,8 +4,100 @@ SQL 쿼리 빌더
 - WHERE, JOIN, ORDER BY 절 자동 구성
 """
 
+import os
+from datetime import date, datetime, timedelta
 from typing import List, Tuple, Optional, Any, Dict
 
+# 텍스트 검색 모드
+# - contains: LIKE '%값%' (부분 일치, 인덱스 사용 불가 → 작은 마스터 테이블용)
+# - prefix: LIKE '값%' (앞부분 일치, 인덱스 Seek 가능 → 코드/대용량 테이블용)
+# - fulltext: CONTAINS(컬럼, '"값*"') (단어 단위 부분 일치, 전문 검색 인덱스 필요)
+SEARCH_CONTAINS = "contains"
+SEARCH_PREFIX = "prefix"
+SEARCH_FULLTEXT = "fulltext"
+
+# 전문 검색 인덱스 생성 여부 (미생성 시 fulltext 모드는 contains로 대체)
+FULLTEXT_SEARCH_ENABLED = os.getenv("FULLTEXT_SEARCH_ENABLED", "false").lower() == "true"
+
+
+def escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자(%, _, [) 이스케이프 - 입력값은 문자 그대로 검색"""
+    return value.replace("[", "[[]").replace("%", "[%]").replace("_", "[_]")
+
+
+def build_fulltext_term(value: str) -> str:
+    """
+    CONTAINS 검색어 생성 (공백 구분 단어마다 접두어 검색, AND 결합)
+
+    예: '오리오 치약' → '"오리오*" AND "치약*"'
+    """
+    words = [w.replace('"', '') for w in value.split()]
+    return " AND ".join(f'"{w}*"' for w in words if w)
+
+
+def build_search_condition(column: str, value: str, mode: str = SEARCH_CONTAINS) -> Tuple[str, Any]:
+    """
+    검색 모드에 맞는 WHERE 조건과 파라미터 생성
+
+    Args:
+        column: 검색 컬럼
+        value: 검색어
+        mode: SEARCH_CONTAINS / SEARCH_PREFIX / SEARCH_FULLTEXT
+
+    Returns:
+        (condition, param): WHERE 조건 문자열과 파라미터
+    """
+    value = value.strip()
+
+    if mode == SEARCH_FULLTEXT:
+        term = build_fulltext_term(value)
+        if FULLTEXT_SEARCH_ENABLED and term:
+            return f"CONTAINS({column}, ?)", term
+        mode = SEARCH_CONTAINS
+
+    if mode == SEARCH_PREFIX:
+        return f"{column} LIKE ?", f"{escape_like(value)}%"
+
+    return f"{column} LIKE ?", f"%{escape_like(value)}%"
+
+
+def year_month_range(year_month: str) -> Tuple[date, date]:
+    """
+    'YYYY-MM' → (해당 월 1일, 다음 달 1일)
+
+    Raises:
+        ValueError: 형식이 'YYYY-MM'이 아닌 경우
+    """
+    try:
+        start = datetime.strptime(year_month, '%Y-%m').date()
+    except (TypeError, ValueError):
+        raise ValueError(f"년월 형식이 올바르지 않습니다 (YYYY-MM): {year_month}")
+    end = date(start.year + 1, 1, 1) if start.month == 12 else date(start.year, start.month + 1, 1)
+    return start, end
+
+
+def parse_date(value: Any) -> date:
+    """'YYYY-MM-DD' 문자열 / date / datetime → date (날짜 컬럼에 문자열 파라미터 비교 방지)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다 (YYYY-MM-DD): {value}")
+
+
+def build_year_month_condition(column: str, year_month: str) -> Tuple[str, List[Any]]:
+    """
+    년월 조건 생성 - FORMAT(컬럼, 'yyyy-MM') = ? 대신 날짜 범위 (인덱스 Seek 가능)
+
+    Returns:
+        (condition, params): "컬럼 >= ? AND 컬럼 < ?"와 [월 시작일, 다음 달 1일]
+    """
+    start, end = year_month_range(year_month)
+    return f"{column} >= ? AND {column} < ?", [start, end]
+
 
 class QueryBuilder:
     """SQL 쿼리를 동적으로 생성하는 빌더 클래스"""
@@ -43,10 +135,26 @@ class QueryBuilder:
         return self
 
     def where_like(self, column: str, value: str) -> 'QueryBuilder':
-        """WHERE LIKE 조건 추가"""
-        if value:
-            self.where_conditions.append(f"{column} LIKE ?")
-            self.params.append(f"%{value}%")
+        """WHERE LIKE 조건 추가 (부분 일치)"""
+        return self.where_search(column, value, SEARCH_CONTAINS)
+
+    def where_prefix(self, column: str, value: str) -> 'QueryBuilder':
+        """WHERE LIKE 앞부분 일치 조건 추가 (인덱스 Seek 가능)"""
+        return self.where_search(column, value, SEARCH_PREFIX)
+
+    def where_search(self, column: str, value: str, mode: str = SEARCH_CONTAINS) -> 'QueryBuilder':
+        """
+        검색 모드별 텍스트 조건 추가
+
+        Args:
+            column: 검색 컬럼
+            value: 검색어 (공백만 있으면 무시)
+            mode: SEARCH_CONTAINS / SEARCH_PREFIX / SEARCH_FULLTEXT
+        """
+        if value and value.strip():
+            condition, param = build_search_condition(column, value, mode)
+            self.where_conditions.append(condition)
+            self.params.append(param)
         return self
 
     def where_in(self, column: str, values: List[Any]) -> 'QueryBuilder':
@@ -57,6 +165,14 @@ class QueryBuilder:
             self.params.extend(values)
         return self
 
+    def where_not_in(self, column: str, values: List[Any]) -> 'QueryBuilder':
+        """WHERE NOT IN 조건 추가"""
+        if values:
+            placeholders = ','.join(['?'] * len(values))
+            self.where_conditions.append(f"{column} NOT IN ({placeholders})")
+            self.params.extend(values)
+        return self
+
     def where_between(self, column: str, start: Any, end: Any) -> 'QueryBuilder':
         """WHERE BETWEEN 조건 추가"""
         if start and end:
@@ -70,6 +186,28 @@ class QueryBuilder:
             self.params.append(end)
         return self
 
+    def where_year_month(self, column: str, year_month: str) -> 'QueryBuilder':
+        """WHERE 년월 조건 추가 ('YYYY-MM' → 날짜 범위)"""
+        if year_month:
+            condition, params = build_year_month_condition(column, year_month)
+            self.where_conditions.append(condition)
+            self.params.extend(params)
+        return self
+
+    def where_date_range(self, column: str, start: Any = None, end: Any = None) -> 'QueryBuilder':
+        """
+        WHERE 날짜 범위 조건 추가 (종료일 포함)
+
+        시간이 있는 컬럼도 종료일 당일이 포함되도록 '< 종료일 + 1일'로 비교
+        """
+        if start:
+            self.where_conditions.append(f"{column} >= ?")
+            self.params.append(parse_date(start))
+        if end:
+            self.where_conditions.append(f"{column} < ?")
+            self.params.append(parse_date(end) + timedelta(days=1))
+        return self
+
     def order_by(self, column: str, direction: str = "ASC") -> 'QueryBuilder':
         """ORDER BY 절 추가"""
         self.order_clauses.append(f"{column} {direction}")
@@ -128,6 +266,47 @@ class QueryBuilder:
 
         return " ".join(query_parts), self.params
 
+    def target_alias(self) -> str:
+        """UPDATE/DELETE 대상 (별칭이 있으면 별칭, 없으면 테이블명)"""
+        return self.table.split()[-1]
+
+    def _build_from_where(self) -> str:
+        """FROM + JOIN + WHERE 절"""
+        query_parts = [f"FROM {self.table}"]
+
+        if self.joins:
+            query_parts.extend(self.joins)
+
+        if self.where_conditions:
+            query_parts.append(f"WHERE {' AND '.join(self.where_conditions)}")
+
+        return " ".join(query_parts)
+
+    def build_delete(self) -> Tuple[str, List[Any]]:
+        """
+        현재 WHERE 조건 기준 DELETE 쿼리 생성 (JOIN 포함 필터 그대로 사용)
+
+        Returns:
+            (query, params): DELETE 쿼리와 파라미터
+        """
+        query = f"DELETE {self.target_alias()} {self._build_from_where()}"
+        return query, list(self.params)
+
+    def build_update(self, data: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """
+        현재 WHERE 조건 기준 UPDATE 쿼리 생성 (JOIN 포함 필터 그대로 사용)
+
+        Args:
+            data: 업데이트할 데이터 딕셔너리
+
+        Returns:
+            (query, params): UPDATE 쿼리와 파라미터
+        """
+        # 컬럼명을 대괄호로 감싸서 SQL 예약어 문제 방지 (SET 컬럼은 UPDATE 대상 테이블 기준)
+        set_clauses = [f"[{col}] = ?" for col in data.keys()]
+        query = f"UPDATE {self.target_alias()} SET {', '.join(set_clauses)} {self._build_from_where()}"
+        return query, list(data.values()) + list(self.params)
+
     def build_paginated(self, page: int, limit: int) -> Tuple[str, List[Any]]:
         """
         페이지네이션이 적용된 쿼리 생성
@@ -13,6 +13,7 @@ from .target_promotion_repository import TargetPromotionRepository
 from .promotion_repository import PromotionRepository
 from .promotion_product_repository import PromotionProductRepository
 from .withdrawal_plan_repository import WithdrawalPlanRepository
+from .job_repository import JobRepository
 from .permission_repository import (
     PermissionRepository,
     RolePermissionRepository,
@@ -40,6 +41,7 @@ __all__ = [
     'PromotionRepository',
     'PromotionProductRepository',
     'WithdrawalPlanRepository',
+    'JobRepository',
     'PermissionRepository',
     'RolePermissionRepository',
     'UserPermissionRepository',
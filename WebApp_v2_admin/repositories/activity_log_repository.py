@@ -7,7 +7,10 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from core.base_repository import BaseRepository
 from core.database import get_db_cursor
-from core.query_builder import build_insert_query
+from core.activity_log_writer import activity_log_writer
+
+# SQL Server 파라미터 최대 개수 (다중 행 INSERT 배치 크기 계산용)
+MAX_SQL_PARAMS = 2100
 
 
 class ActivityLogRepository(BaseRepository):
@@ -23,6 +26,9 @@ class ActivityLogRepository(BaseRepository):
     ACTION_LOGIN_FAILED = "LOGIN_FAILED"
     ACTION_PASSWORD_CHANGE = "PASSWORD_CHANGE"
     ACTION_ROLE_CHANGE = "ROLE_CHANGE"
+
+    # 다중 행 INSERT 컬럼 (insert_batch)
+    INSERT_COLUMNS = ("UserID", "ActionType", "TargetTable", "TargetID", "Details", "IPAddress", "CreatedDate")
     
     def __init__(self):
         super().__init__(table_name="[dbo].[ActivityLog]", id_column="LogID")
@@ -69,9 +75,9 @@ class ActivityLogRepository(BaseRepository):
         target_id: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None
-    ) -> int:
+    ) -> None:
         """
-        활동 로그 기록
+        활동 로그 기록 (비동기 - 큐에 넣고 즉시 반환, activity_log_writer가 배치로 INSERT)
         
         Args:
             user_id: 사용자 ID
@@ -80,25 +86,40 @@ class ActivityLogRepository(BaseRepository):
             target_id: 대상 레코드 ID
             details: 상세 정보 (JSON으로 저장)
             ip_address: 클라이언트 IP
-            
+        """
+        activity_log_writer.enqueue({
+            "UserID": user_id,
+            "ActionType": action_type,
+            "TargetTable": target_table,
+            "TargetID": str(target_id) if target_id else None,
+            "Details": json.dumps(details, ensure_ascii=False, default=str) if details else None,
+            "IPAddress": ip_address,
+            "CreatedDate": datetime.now()  # 요청 시각 (배치 기록 시각 아님)
+        })
+
+    def insert_batch(self, records: List[Dict[str, Any]]) -> int:
+        """
+        활동 로그 다중 행 INSERT (activity_log_writer 전용)
+
+        Args:
+            records: log_action에서 만든 레코드 리스트 (INSERT_COLUMNS 키)
+
         Returns:
-            int: 생성된 로그 ID
+            int: 기록 건수
         """
+        columns = ", ".join(self.INSERT_COLUMNS)
+        row_placeholder = "(" + ", ".join(["?"] * len(self.INSERT_COLUMNS)) + ")"
+        batch_size = (MAX_SQL_PARAMS - 1) // len(self.INSERT_COLUMNS)
+
         with get_db_cursor() as cursor:
-            insert_data = {
-                "UserID": user_id,
-                "ActionType": action_type,
-                "TargetTable": target_table,
-                "TargetID": str(target_id) if target_id else None,
-                "Details": json.dumps(details, ensure_ascii=False) if details else None,
-                "IPAddress": ip_address
-            }
-            
-            query, params = build_insert_query("[dbo].[ActivityLog]", insert_data)
-            cursor.execute(query, *params)
-            
-            cursor.execute("SELECT @@IDENTITY")
-            return int(cursor.fetchone()[0])
+            for i in range(0, len(records), batch_size):
+                batch = records[i:i + batch_size]
+                params = [record.get(col) for record in batch for col in self.INSERT_COLUMNS]
+                cursor.execute(
+                    f"INSERT INTO [dbo].[ActivityLog] ({columns}) VALUES {', '.join([row_placeholder] * len(batch))}",
+                    *params
+                )
+        return len(records)
     
     def get_logs_with_user(
         self,
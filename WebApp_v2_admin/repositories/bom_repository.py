@@ -4,7 +4,7 @@ BOM (ProductBOM) Repository
 """
 
 from typing import Dict, Any, Optional, List
-from core import BaseRepository, QueryBuilder, get_db_cursor
+from core import BaseRepository, QueryBuilder, get_db_cursor, build_search_condition, SEARCH_CONTAINS, SEARCH_PREFIX
 
 
 class BOMRepository(BaseRepository):
@@ -97,13 +97,16 @@ class BOMRepository(BaseRepository):
             where_clauses = []
             params = []
 
+            # 품목코드는 앞부분 일치 (인덱스 사용), 제품명은 부분 일치
             if parent_erp:
-                where_clauses.append("pb.ERPCode LIKE ?")
-                params.append(f"%{parent_erp}%")
+                condition, param = build_search_condition("pb.ERPCode", parent_erp, SEARCH_PREFIX)
+                where_clauses.append(condition)
+                params.append(param)
 
             if parent_name:
-                where_clauses.append("p.Name LIKE ?")
-                params.append(f"%{parent_name}%")
+                condition, param = build_search_condition("p.Name", parent_name, SEARCH_CONTAINS)
+                where_clauses.append(condition)
+                params.append(param)
 
             # 자식 필터 (서브쿼리)
             if child_erp or child_name:
@@ -115,11 +118,13 @@ class BOMRepository(BaseRepository):
                         WHERE bom_sub.ParentProductBoxID = pb.BoxID
                 """
                 if child_erp:
-                    child_subquery += " AND pb_child.ERPCode LIKE ?"
-                    params.append(f"%{child_erp}%")
+                    condition, param = build_search_condition("pb_child.ERPCode", child_erp, SEARCH_PREFIX)
+                    child_subquery += f" AND {condition}"
+                    params.append(param)
                 if child_name:
-                    child_subquery += " AND p_child.Name LIKE ?"
-                    params.append(f"%{child_name}%")
+                    condition, param = build_search_condition("p_child.Name", child_name, SEARCH_CONTAINS)
+                    child_subquery += f" AND {condition}"
+                    params.append(param)
                 child_subquery += ")"
                 where_clauses.append(child_subquery)
 
@@ -4,12 +4,14 @@ Brand Repository
 """
 
 from typing import Dict, Any
-from core import BaseRepository, get_db_cursor
+from core import BaseRepository, CacheSnapshot, get_db_cursor, reference_cache
 
 
 class BrandRepository(BaseRepository):
     """Brand 테이블 Repository"""
 
+    REFERENCE_TABLES = ("Brand",)
+
     def __init__(self):
         super().__init__(table_name="[dbo].[Brand]", id_column="BrandID")
 
@@ -30,7 +32,15 @@ class BrandRepository(BaseRepository):
         }
 
     def get_all_brands(self) -> list:
-        """모든 브랜드 조회 (BrandID, Name, Title)"""
+        """모든 브랜드 조회 (BrandID, Name, Title) - 참조 데이터 캐시"""
+        return self.get_all_brands_snapshot().value
+
+    def get_all_brands_snapshot(self) -> CacheSnapshot:
+        """모든 브랜드 스냅샷 (ETag 응답용)"""
+        return reference_cache.get_snapshot("brand.all", ("Brand",), self._load_all_brands)
+
+    def _load_all_brands(self) -> list:
+        """모든 브랜드 DB 조회"""
         with get_db_cursor(commit=False) as cursor:
             cursor.execute("""
                 SELECT BrandID, Name, Title
@@ -4,12 +4,14 @@ Channel Repository
 """
 
 from typing import Dict, Any, Optional
-from core import BaseRepository, QueryBuilder, get_db_cursor
+from core import BaseRepository, QueryBuilder, CacheSnapshot, get_db_cursor, reference_cache
 
 
 class ChannelRepository(BaseRepository):
     """Channel 테이블 Repository"""
 
+    REFERENCE_TABLES = ("Channel",)
+
     def __init__(self):
         super().__init__(table_name="[dbo].[Channel]", id_column="ChannelID")
 
@@ -85,7 +87,15 @@ class ChannelRepository(BaseRepository):
         return builder
 
     def get_channel_list(self) -> list:
-        """채널 목록 조회 (드롭다운용) - ChannelID와 Name만 반환"""
+        """채널 목록 조회 (드롭다운용) - ChannelID와 Name만 반환, 참조 데이터 캐시"""
+        return self.get_channel_list_snapshot().value
+
+    def get_channel_list_snapshot(self) -> CacheSnapshot:
+        """채널 목록 스냅샷 (ETag 응답용)"""
+        return reference_cache.get_snapshot("channel.list", ("Channel",), self._load_channel_list)
+
+    def _load_channel_list(self) -> list:
+        """채널 목록 DB 조회"""
         with get_db_cursor(commit=False) as cursor:
             cursor.execute("""
                 SELECT ChannelID, Name
@@ -95,6 +105,15 @@ class ChannelRepository(BaseRepository):
             """)
             return [{"ChannelID": row[0], "Name": row[1]} for row in cursor.fetchall()]
 
+    def get_metadata_snapshot(self) -> CacheSnapshot:
+        """Channel 메타데이터 + ChannelDetail 거래처명 스냅샷 (필터용, ETag 응답용)"""
+        def load() -> Dict[str, list]:
+            metadata = self.get_metadata()
+            metadata['detail_names'] = ChannelDetailRepository().get_detail_names()
+            return metadata
+
+        return reference_cache.get_snapshot("channel.metadata", ("Channel", "ChannelDetail"), load)
+
     def get_metadata(self) -> Dict[str, list]:
         """Channel 메타데이터 조회 (필터용)"""
         with get_db_cursor(commit=False) as cursor:
@@ -169,6 +188,8 @@ class ChannelRepository(BaseRepository):
 class ChannelDetailRepository(BaseRepository):
     """ChannelDetail 테이블 Repository"""
 
+    REFERENCE_TABLES = ("ChannelDetail",)
+
     def __init__(self):
         super().__init__(table_name="[dbo].[ChannelDetail]", id_column="ChannelDetailID")
 
@@ -221,8 +242,10 @@ class ChannelDetailRepository(BaseRepository):
                 DELETE FROM [dbo].[ChannelDetail]
                 WHERE ChannelID = ?
             """, channel_id)
+            deleted = cursor.rowcount
 
-            return cursor.rowcount
+        self._invalidate_reference_cache()
+        return deleted
 
     def get_detail_names(self) -> list:
         """DetailName 목록 조회 (자동완성용)"""
@@ -286,9 +309,10 @@ class ChannelDetailRepository(BaseRepository):
 
             print(f"[DEBUG] ChannelDetail 생성 완료: {len(detail_ids)}개")
 
-            return {
-                "ChannelID": channel_id,
-                "ChannelDetailIDs": detail_ids,
-                "merged": existing_channel is not None,
-                **channel_data
-            }
+        reference_cache.invalidate("Channel", "ChannelDetail")
+        return {
+            "ChannelID": channel_id,
+            "ChannelDetailIDs": detail_ids,
+            "merged": existing_channel is not None,
+            **channel_data
+        }
@@ -0,0 +1,121 @@
+"""
+BackgroundJob Repository
+- 백그라운드 작업 상태 저장 (엑셀 업로드, 동기화 등)
+- 서버 재시작 / 다른 워커 프로세스에서도 작업 상태 조회 가능
+"""
+
+import json
+from typing import Dict, Any, Optional, List
+from core.base_repository import BaseRepository
+from core.database import get_db_cursor
+from core.query_builder import build_insert_query, build_update_query
+
+
+class JobRepository(BaseRepository):
+    """BackgroundJob 테이블 Repository"""
+
+    # SELECT 컬럼 상수 (순서 변경 금지 - _row_to_dict 인덱스와 일치해야 함)
+    SELECT_COLUMNS = (
+        "JobID", "JobType", "Title", "Status",
+        "Processed", "Total", "Message", "Result", "ErrorMessage",
+        "UserID", "CreatedDate", "StartedDate", "FinishedDate"
+    )
+
+    def __init__(self):
+        super().__init__(table_name="[dbo].[BackgroundJob]", id_column="JobID")
+
+    def get_select_query(self) -> str:
+        """BackgroundJob 조회 쿼리"""
+        columns = ", ".join(self.SELECT_COLUMNS)
+        return f"SELECT {columns} FROM [dbo].[BackgroundJob]"
+
+    def _row_to_dict(self, row) -> Dict[str, Any]:
+        """Row를 Dictionary로 변환 (JobManager 메모리 상태와 같은 형식)"""
+        processed = row[4] or 0
+        total = row[5] or 0
+        return {
+            "JobID": row[0],
+            "JobType": row[1],
+            "Title": row[2],
+            "Status": row[3],
+            "Processed": processed,
+            "Total": total,
+            "Percent": round(processed / total * 100, 1) if total else None,
+            "Message": row[6],
+            "Result": json.loads(row[7]) if row[7] else None,
+            "Error": row[8],
+            "UserID": row[9],
+            "CreatedDate": row[10].strftime('%Y-%m-%d %H:%M:%S') if row[10] else None,
+            "StartedDate": row[11].strftime('%Y-%m-%d %H:%M:%S') if row[11] else None,
+            "FinishedDate": row[12].strftime('%Y-%m-%d %H:%M:%S') if row[12] else None,
+        }
+
+    def create_job(self, data: Dict[str, Any]) -> None:
+        """
+        작업 레코드 생성 (JobID는 문자열 PK → 직접 INSERT)
+
+        Args:
+            data: 컬럼명 → 값 딕셔너리 (JobID 포함)
+        """
+        with get_db_cursor() as cursor:
+            query, params = build_insert_query(self.table_name, data)
+            cursor.execute(query, *params)
+
+    def update_job(self, job_id: str, data: Dict[str, Any]) -> bool:
+        """
+        작업 상태/진행률 수정
+
+        Args:
+            job_id: 작업 ID
+            data: 수정할 컬럼 (Result는 dict → JSON 변환)
+
+        Returns:
+            bool: 수정 성공 여부
+        """
+        if "Result" in data and data["Result"] is not None:
+            data = {**data, "Result": json.dumps(data["Result"], ensure_ascii=False, default=str)}
+
+        with get_db_cursor() as cursor:
+            query, params = build_update_query(self.table_name, self.id_column, job_id, data)
+            cursor.execute(query, *params)
+            return cursor.rowcount > 0
+
+    def get_recent_by_user(self, user_id: Optional[int] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        최근 작업 목록
+
+        Args:
+            user_id: 사용자 ID (None이면 전체)
+            limit: 최대 건수
+
+        Returns:
+            List[Dict]: 작업 목록 (최신순)
+        """
+        with get_db_cursor(commit=False) as cursor:
+            columns = ", ".join(self.SELECT_COLUMNS)
+            if user_id is not None:
+                cursor.execute(
+                    f"SELECT TOP (?) {columns} FROM [dbo].[BackgroundJob] WHERE UserID = ? ORDER BY CreatedDate DESC",
+                    limit, user_id
+                )
+            else:
+                cursor.execute(
+                    f"SELECT TOP (?) {columns} FROM [dbo].[BackgroundJob] ORDER BY CreatedDate DESC",
+                    limit
+                )
+            return [self._row_to_dict(row) for row in cursor.fetchall()]
+
+    def mark_interrupted(self, message: str) -> int:
+        """
+        완료되지 않은 작업을 실패 처리 (서버 시작 시 - 이전 프로세스에서 중단된 작업)
+
+        Returns:
+            int: 실패 처리된 작업 수
+        """
+        with get_db_cursor() as cursor:
+            cursor.execute("""
+                UPDATE [dbo].[BackgroundJob]
+                SET Status = 'FAILED', ErrorMessage = ?, FinishedDate = GETDATE()
+                WHERE Status IN ('QUEUED', 'RUNNING')
+            """, message)
+            return cursor.rowcount
@@ -5,12 +5,14 @@ ProductBox Repository
 """
 
 from typing import Dict, Any, Optional, List
-from core import BaseRepository, QueryBuilder, get_db_cursor
+from core import BaseRepository, QueryBuilder, get_db_cursor, reference_cache
 
 
 class ProductBoxRepository(BaseRepository):
     """ProductBox 테이블 Repository"""
 
+    REFERENCE_TABLES = ("ProductBox",)
+
     def __init__(self):
         super().__init__(table_name="[dbo].[ProductBox]", id_column="BoxID")
 
@@ -83,8 +85,25 @@ class ProductBoxRepository(BaseRepository):
                 DELETE FROM [dbo].[ProductBox]
                 WHERE ProductID = ?
             """, product_id)
-
-            return cursor.rowcount
+            deleted = cursor.rowcount
+
+        self._invalidate_reference_cache()
+        return deleted
+
+    def get_active_erp_codes(self) -> List[str]:
+        """판매 중(Product.Status = 'YES') 제품의 ERPCode 목록 (엑셀 양식 드롭다운용) - 참조 데이터 캐시"""
+        def load() -> List[str]:
+            with get_db_cursor(commit=False) as cursor:
+                cursor.execute("""
+                    SELECT DISTINCT pb.ERPCode
+                    FROM [dbo].[ProductBox] pb
+                    INNER JOIN [dbo].[Product] p ON pb.ProductID = p.ProductID
+                    WHERE p.Status = 'YES'
+                    ORDER BY pb.ERPCode
+                """)
+                return [row[0] for row in cursor.fetchall()]
+
+        return reference_cache.get("productbox.active_erp_codes", ("Product", "ProductBox"), load)
 
     def create_with_product(self, product_data: Dict[str, Any], box_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -143,10 +162,11 @@ class ProductBoxRepository(BaseRepository):
 
             print(f"[DEBUG] ProductBox 생성 완료: BoxID={box_id}, ERPCode={box_data.get('ERPCode')}")
 
-            return {
-                "ProductID": product_id,
-                "BoxID": box_id,
-                "merged": existing_product is not None,
-                **product_data,
-                **box_data
-            }
+        reference_cache.invalidate("Product", "ProductBox")
+        return {
+            "ProductID": product_id,
+            "BoxID": box_id,
+            "merged": existing_product is not None,
+            **product_data,
+            **box_data
+        }
@@ -5,12 +5,14 @@ Product Repository
 """
 
 from typing import Dict, Any, Optional
-from core import BaseRepository, QueryBuilder
+from core import BaseRepository, QueryBuilder, CacheSnapshot, reference_cache
 
 
 class ProductRepository(BaseRepository):
     """Product 테이블 Repository"""
 
+    REFERENCE_TABLES = ("Product",)
+
     def __init__(self):
         super().__init__(table_name="[dbo].[Product]", id_column="ProductID")
 
@@ -98,6 +100,14 @@ class ProductRepository(BaseRepository):
 
         return builder
 
+    def get_metadata_snapshot(self) -> CacheSnapshot:
+        """Product 메타데이터 스냅샷 (필터용, ETag 응답용) - BundleType / UniqueCode / 제품명 목록"""
+        return reference_cache.get_snapshot("product.metadata", ("Product",), lambda: {
+            "bundle_types": self.get_bundle_types(),
+            "unique_codes": self.get_unique_codes(),
+            "names": self.get_product_names()
+        })
+
     def get_bundle_types(self) -> list:
         """BundleType 목록 조회 (메타데이터)"""
         from core import get_db_cursor
@@ -3,7 +3,7 @@ PromotionProduct Repository
 - 행사 상품 테이블 CRUD 작업
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from core import BaseRepository, QueryBuilder, get_db_cursor
 
 
@@ -95,7 +95,7 @@ class PromotionProductRepository(BaseRepository):
             builder.where_equals("pp.PromotionID", filters['promotion_id'])
 
         if filters.get('year_month'):
-            builder.where("FORMAT(p.StartDate, 'yyyy-MM') = ?", filters['year_month'])
+            builder.where_year_month("p.StartDate", filters['year_month'])
 
         if filters.get('brand_id'):
             builder.where_equals("p.BrandID", filters['brand_id'])
@@ -123,12 +123,16 @@ class PromotionProductRepository(BaseRepository):
 
         return builder
 
-    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000) -> Dict[str, Any]:
+    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         일괄 INSERT/UPDATE
         - PromotionProductID가 있으면: ID 기반 UPDATE
         - PromotionProductID가 없으면: 복합키(PromotionID+UniqueCode) 중복 체크 후 INSERT
 
+        Args:
+            progress_callback: 배치마다 (처리 건수, 전체 건수) 콜백 (백그라운드 작업 진행률)
+
         Returns:
             Dict: {"inserted": N, "updated": M, "duplicates": [...]}
         """
@@ -169,6 +173,8 @@ class PromotionProductRepository(BaseRepository):
         with get_db_cursor() as cursor:
             for i in range(0, len(records), batch_size):
                 batch = records[i:i + batch_size]
+                if progress_callback:
+                    progress_callback(i, len(records))
 
                 for record in batch:
                     product_id = record.get('PromotionProductID')
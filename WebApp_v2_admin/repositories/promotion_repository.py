@@ -3,8 +3,90 @@ Promotion Repository
 - 행사 마스터 테이블 CRUD 작업
 """
 
-from typing import Dict, Any, Optional, List
-from core import BaseRepository, QueryBuilder, get_db_cursor
+from typing import Dict, Any, Optional, List, Callable
+from core import BaseRepository, QueryBuilder, get_db_cursor, build_year_month_condition
+
+
+# SQL Server 파라미터 최대 개수 (다중 행 INSERT 배치 크기 계산용)
+MAX_SQL_PARAMS = 2100
+
+# 통합 업로드 스테이징 테이블 컬럼 (컬럼명, 타입)
+PROMOTION_STAGE_COLUMNS = (
+    ("RowNum", "int"),
+    ("IsNew", "bit"),
+    ("PromotionID", "nvarchar(20) COLLATE DATABASE_DEFAULT"),
+    ("PromotionName", "nvarchar(200) COLLATE DATABASE_DEFAULT"),
+    ("PromotionType", "nvarchar(50) COLLATE DATABASE_DEFAULT"),
+    ("StartDate", "date"),
+    ("StartTime", "time"),
+    ("EndDate", "date"),
+    ("EndTime", "time"),
+    ("Status", "nvarchar(20) COLLATE DATABASE_DEFAULT"),
+    ("BrandID", "int"),
+    ("BrandName", "nvarchar(100) COLLATE DATABASE_DEFAULT"),
+    ("ChannelID", "int"),
+    ("ChannelName", "nvarchar(500) COLLATE DATABASE_DEFAULT"),
+    ("CommissionRate", "decimal(5,2)"),
+    ("DiscountOwner", "nvarchar(20) COLLATE DATABASE_DEFAULT"),
+    ("CompanyShare", "decimal(5,2)"),
+    ("ChannelShare", "decimal(5,2)"),
+    ("ExpectedSalesAmount", "decimal(18,2)"),
+    ("ExpectedQuantity", "int"),
+    ("Notes", "nvarchar(MAX) COLLATE DATABASE_DEFAULT"),
+)
+
+PRODUCT_STAGE_COLUMNS = (
+    ("RowNum", "int"),
+    ("PromotionProductID", "int"),
+    ("PromotionID", "nvarchar(20) COLLATE DATABASE_DEFAULT"),
+    ("ERPCode", "nvarchar(50) COLLATE DATABASE_DEFAULT"),
+    ("UniqueCode", "nvarchar(50) COLLATE DATABASE_DEFAULT"),
+    ("ProductName", "nvarchar(200) COLLATE DATABASE_DEFAULT"),
+    ("SellingPrice", "decimal(18,2)"),
+    ("PromotionPrice", "decimal(18,2)"),
+    ("SupplyPrice", "decimal(18,2)"),
+    ("CouponDiscountRate", "decimal(5,2)"),
+    ("UnitCost", "decimal(18,2)"),
+    ("LogisticsCost", "decimal(18,2)"),
+    ("ManagementCost", "decimal(18,2)"),
+    ("WarehouseCost", "decimal(18,2)"),
+    ("EDICost", "decimal(18,2)"),
+    ("MisCost", "decimal(18,2)"),
+    ("ExpectedSalesAmount", "decimal(18,2)"),
+    ("ExpectedQuantity", "int"),
+    ("Notes", "nvarchar(MAX) COLLATE DATABASE_DEFAULT"),
+)
+
+# 행사 상태 계산 (취소 외에는 현재 시각과 시작/종료 일시 비교)
+# StartAt / EndAt: Promotion의 PERSISTED 계산 컬럼 (StartDate + StartTime, EndDate + EndTime)
+# → 컬럼 가공 없이 인덱스(IX_Promotion_StartAt / IX_Promotion_EndAt) 범위 검색
+STATUS_CASE = """CASE
+            WHEN p.Status = 'CANCELLED' THEN 'CANCELLED'
+            WHEN p.StartAt > GETDATE() THEN 'SCHEDULED'
+            WHEN p.EndAt < GETDATE() THEN 'ENDED'
+            ELSE 'ACTIVE'
+        END"""
+
+
+def build_status_conditions(status: str) -> List[str]:
+    """
+    상태 필터 → WHERE 조건 목록 (STATUS_CASE와 같은 기준)
+
+    Args:
+        status: CANCELLED / SCHEDULED / ENDED / ACTIVE (그 외 값은 조건 없음)
+
+    Returns:
+        List[str]: AND로 연결할 조건 (파라미터 없음)
+    """
+    if status == 'CANCELLED':
+        return ["p.Status = 'CANCELLED'"]
+    if status == 'SCHEDULED':
+        return ["p.Status != 'CANCELLED'", "p.StartAt > GETDATE()"]
+    if status == 'ENDED':
+        return ["p.Status != 'CANCELLED'", "p.EndAt < GETDATE()"]
+    if status == 'ACTIVE':
+        return ["p.Status != 'CANCELLED'", "p.StartAt <= GETDATE()", "p.EndAt >= GETDATE()"]
+    return []
 
 
 class PromotionRepository(BaseRepository):
@@ -14,12 +96,7 @@ class PromotionRepository(BaseRepository):
     SELECT_COLUMNS = (
         "p.PromotionID", "p.PromotionName", "p.PromotionType",
         "p.StartDate", "p.StartTime", "p.EndDate", "p.EndTime",
-        """CASE
-            WHEN p.Status = 'CANCELLED' THEN 'CANCELLED'
-            WHEN CAST(p.StartDate AS DATETIME) + CAST(ISNULL(p.StartTime, '00:00:00') AS DATETIME) > GETDATE() THEN 'SCHEDULED'
-            WHEN CAST(p.EndDate AS DATETIME) + CAST(ISNULL(p.EndTime, '23:59:59') AS DATETIME) < GETDATE() THEN 'ENDED'
-            ELSE 'ACTIVE'
-        END AS Status""",
+        f"{STATUS_CASE} AS Status",
         "p.BrandID", "p.BrandName",
         "p.ChannelID", "p.ChannelName",
         "p.CommissionRate", "p.DiscountOwner",
@@ -75,7 +152,7 @@ class PromotionRepository(BaseRepository):
         - status: Status 정확히 매칭
         """
         if filters.get('year_month'):
-            builder.where("FORMAT(p.StartDate, 'yyyy-MM') = ?", filters['year_month'])
+            builder.where_year_month("p.StartDate", filters['year_month'])
 
         if filters.get('brand_id'):
             builder.where_equals("p.BrandID", filters['brand_id'])
@@ -87,19 +164,8 @@ class PromotionRepository(BaseRepository):
             builder.where_equals("p.PromotionType", filters['promotion_type'])
 
         if filters.get('status'):
-            status_val = filters['status']
-            if status_val == 'CANCELLED':
-                builder.where_equals("p.Status", 'CANCELLED')
-            elif status_val == 'SCHEDULED':
-                builder.where("p.Status != 'CANCELLED'")
-                builder.where("CAST(p.StartDate AS DATETIME) + CAST(ISNULL(p.StartTime, '00:00:00') AS DATETIME) > GETDATE()")
-            elif status_val == 'ENDED':
-                builder.where("p.Status != 'CANCELLED'")
-                builder.where("CAST(p.EndDate AS DATETIME) + CAST(ISNULL(p.EndTime, '23:59:59') AS DATETIME) < GETDATE()")
-            elif status_val == 'ACTIVE':
-                builder.where("p.Status != 'CANCELLED'")
-                builder.where("CAST(p.StartDate AS DATETIME) + CAST(ISNULL(p.StartTime, '00:00:00') AS DATETIME) <= GETDATE()")
-                builder.where("CAST(p.EndDate AS DATETIME) + CAST(ISNULL(p.EndTime, '23:59:59') AS DATETIME) >= GETDATE()")
+            for condition in build_status_conditions(filters['status']):
+                builder.where(condition)
 
     def _build_query_with_filters(self, filters: Optional[Dict[str, Any]] = None) -> QueryBuilder:
         """Promotion 전용 QueryBuilder 생성"""
@@ -131,13 +197,17 @@ class PromotionRepository(BaseRepository):
             cursor.execute(query, *params)
             return data.get('PromotionID')
 
-    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000) -> Dict[str, Any]:
+    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         일괄 INSERT/UPDATE
         - PromotionID가 있으면: ID 기반 UPDATE
         - PromotionID가 없으면: 복합키 중복 체크 후 INSERT (중복 시 에러)
           * 복합키: BrandID + ChannelID + PromotionType + StartDate + PromotionName
 
+        Args:
+            progress_callback: 배치마다 (처리 건수, 전체 건수) 콜백 (백그라운드 작업 진행률)
+
         Returns:
             Dict: {"inserted": N, "updated": M, "duplicates": [...]}
         """
@@ -185,6 +255,8 @@ class PromotionRepository(BaseRepository):
         with get_db_cursor() as cursor:
             for i in range(0, len(records), batch_size):
                 batch = records[i:i + batch_size]
+                if progress_callback:
+                    progress_callback(i, len(records))
 
                 for record in batch:
                     promotion_id = record.get('PromotionID')
@@ -262,6 +334,227 @@ class PromotionRepository(BaseRepository):
 
         return {"inserted": total_inserted, "updated": total_updated, "duplicates": []}
 
+    def import_with_products(
+        self,
+        promotions: List[Dict[str, Any]],
+        products: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        행사 + 행사 상품 통합 업로드 (단일 트랜잭션, 집합 기반)
+
+        1. 두 시트의 행을 임시 테이블(#PromotionStage, #PromotionProductStage)에 다중 행 INSERT
+        2. 복합키 중복을 JOIN 한 번으로 검사
+           - 신규 행사(IsNew=1): BrandID + ChannelID + PromotionType + StartDate + PromotionName
+           - 신규 상품(PromotionProductID 없음): PromotionID + UniqueCode (DB 기존 데이터 + 파일 내 중복)
+        3. 중복이 없으면 Promotion → PromotionProduct 순서로 MERGE
+        - 상품 단계에서 실패해도 행사까지 함께 롤백 (고아 행사 없음)
+
+        Args:
+            promotions: 행사 레코드 (PromotionID 할당 완료, _row_num / _is_new 포함)
+            products: 행사 상품 레코드 (_row_num 포함)
+            progress_callback: 스테이징 적재 중 (처리 건수, 전체 건수) 콜백
+
+        Returns:
+            Dict: {"promotion_inserted", "promotion_updated", "product_inserted", "product_updated",
+                   "duplicates": [...], "product_duplicates": [...]}
+                  중복이 있으면 아무것도 저장하지 않고 중복 목록만 반환
+        """
+        result = {
+            "promotion_inserted": 0, "promotion_updated": 0,
+            "product_inserted": 0, "product_updated": 0,
+            "duplicates": [], "product_duplicates": [],
+        }
+        total = len(promotions) + len(products)
+
+        with get_db_cursor() as cursor:
+            # 1. 스테이징
+            self._create_stage_table(cursor, "#PromotionStage", PROMOTION_STAGE_COLUMNS)
+            self._create_stage_table(cursor, "#PromotionProductStage", PRODUCT_STAGE_COLUMNS)
+
+            promotion_rows = [(
+                r.get('_row_num'), 1 if r.get('_is_new') else 0,
+                r.get('PromotionID'), r.get('PromotionName'), r.get('PromotionType'),
+                r.get('StartDate'), r.get('StartTime', '00:00:00'),
+                r.get('EndDate'), r.get('EndTime', '23:59:59'),
+                r.get('Status', 'SCHEDULED'),
+                r.get('BrandID'), r.get('BrandName'), r.get('ChannelID'), r.get('ChannelName'),
+                r.get('CommissionRate'), r.get('DiscountOwner'), r.get('CompanyShare'), r.get('ChannelShare'),
+                r.get('ExpectedSalesAmount'), r.get('ExpectedQuantity'), r.get('Notes'),
+            ) for r in promotions]
+
+            product_rows = [(
+                r.get('_row_num'), r.get('PromotionProductID'),
+                r.get('PromotionID'), r.get('ERPCode'), r.get('UniqueCode'), r.get('ProductName'),
+                r.get('SellingPrice'), r.get('PromotionPrice'), r.get('SupplyPrice'),
+                r.get('CouponDiscountRate'), r.get('UnitCost'), r.get('LogisticsCost'),
+                r.get('ManagementCost'), r.get('WarehouseCost'), r.get('EDICost'), r.get('MisCost'),
+                r.get('ExpectedSalesAmount'), r.get('ExpectedQuantity'), r.get('Notes'),
+            ) for r in products]
+
+            self._insert_stage_rows(cursor, "#PromotionStage", PROMOTION_STAGE_COLUMNS, promotion_rows,
+                                    progress_callback, 0, total)
+            self._insert_stage_rows(cursor, "#PromotionProductStage", PRODUCT_STAGE_COLUMNS, product_rows,
+                                    progress_callback, len(promotion_rows), total)
+
+            # 2. 중복 검사 (저장 전)
+            cursor.execute("""
+                SELECT s.RowNum, s.PromotionName, s.StartDate, s.BrandName, s.ChannelName,
+                       s.PromotionType, p.PromotionID
+                FROM #PromotionStage s
+                JOIN [dbo].[Promotion] p
+                  ON p.BrandID = s.BrandID AND p.ChannelID = s.ChannelID
+                 AND p.PromotionType = s.PromotionType AND p.StartDate = s.StartDate
+                 AND p.PromotionName = s.PromotionName
+                WHERE s.IsNew = 1
+                ORDER BY s.RowNum
+            """)
+            result["duplicates"] = [{
+                'row': row[0],
+                'promotion_name': row[1],
+                'start_date': row[2].strftime('%Y-%m-%d') if row[2] else None,
+                'brand_name': row[3],
+                'channel_name': row[4],
+                'promotion_type': row[5],
+                'existing_id': row[6],
+            } for row in cursor.fetchall()]
+
+            cursor.execute("""
+                SELECT s.RowNum, s.PromotionID, s.UniqueCode, pp.PromotionProductID
+                FROM #PromotionProductStage s
+                JOIN [dbo].[PromotionProduct] pp
+                  ON pp.PromotionID = s.PromotionID AND pp.UniqueCode = s.UniqueCode
+                WHERE s.PromotionProductID IS NULL
+                UNION ALL
+                SELECT s.RowNum, s.PromotionID, s.UniqueCode, NULL
+                FROM #PromotionProductStage s
+                JOIN (
+                    SELECT PromotionID, UniqueCode
+                    FROM #PromotionProductStage
+                    WHERE PromotionProductID IS NULL
+                    GROUP BY PromotionID, UniqueCode
+                    HAVING COUNT(*) > 1
+                ) d ON d.PromotionID = s.PromotionID AND d.UniqueCode = s.UniqueCode
+                WHERE s.PromotionProductID IS NULL
+                ORDER BY 1
+            """)
+            result["product_duplicates"] = [{
+                'row': row[0],
+                'promotion_id': row[1],
+                'unique_code': row[2],
+                'existing_id': row[3],
+            } for row in cursor.fetchall()]
+
+            if result["duplicates"] or result["product_duplicates"]:
+                return result
+
+            # 3. MERGE (행사 → 상품, 같은 트랜잭션)
+            cursor.execute("""
+                MERGE [dbo].[Promotion] AS t
+                USING #PromotionStage AS s
+                ON t.PromotionID = s.PromotionID
+                WHEN MATCHED THEN
+                    UPDATE SET
+                        PromotionName = s.PromotionName,
+                        EndDate = s.EndDate,
+                        EndTime = s.EndTime,
+                        StartTime = s.StartTime,
+                        CommissionRate = s.CommissionRate,
+                        DiscountOwner = s.DiscountOwner,
+                        CompanyShare = s.CompanyShare,
+                        ChannelShare = s.ChannelShare,
+                        ExpectedSalesAmount = s.ExpectedSalesAmount,
+                        ExpectedQuantity = s.ExpectedQuantity,
+                        Notes = s.Notes,
+                        UpdatedDate = GETDATE()
+                WHEN NOT MATCHED BY TARGET THEN
+                    INSERT (PromotionID, PromotionName, PromotionType,
+                            StartDate, StartTime, EndDate, EndTime,
+                            Status, BrandID, BrandName, ChannelID, ChannelName,
+                            CommissionRate, DiscountOwner, CompanyShare, ChannelShare,
+                            ExpectedSalesAmount, ExpectedQuantity, Notes)
+                    VALUES (s.PromotionID, s.PromotionName, s.PromotionType,
+                            s.StartDate, s.StartTime, s.EndDate, s.EndTime,
+                            s.Status, s.BrandID, s.BrandName, s.ChannelID, s.ChannelName,
+                            s.CommissionRate, s.DiscountOwner, s.CompanyShare, s.ChannelShare,
+                            s.ExpectedSalesAmount, s.ExpectedQuantity, s.Notes)
+                OUTPUT $action;
+            """)
+            actions = [row[0] for row in cursor.fetchall()]
+            result["promotion_inserted"] = actions.count('INSERT')
+            result["promotion_updated"] = actions.count('UPDATE')
+
+            if product_rows:
+                # PromotionProductID가 있으면 ID 기반 UPDATE, 없으면 INSERT (없는 ID는 무시)
+                cursor.execute("""
+                    MERGE [dbo].[PromotionProduct] AS t
+                    USING #PromotionProductStage AS s
+                    ON t.PromotionProductID = s.PromotionProductID
+                    WHEN MATCHED THEN
+                        UPDATE SET
+                            ERPCode = s.ERPCode,
+                            ProductName = s.ProductName,
+                            SellingPrice = s.SellingPrice,
+                            PromotionPrice = s.PromotionPrice,
+                            SupplyPrice = s.SupplyPrice,
+                            CouponDiscountRate = s.CouponDiscountRate,
+                            UnitCost = s.UnitCost,
+                            LogisticsCost = s.LogisticsCost,
+                            ManagementCost = s.ManagementCost,
+                            WarehouseCost = s.WarehouseCost,
+                            EDICost = s.EDICost,
+                            MisCost = s.MisCost,
+                            ExpectedSalesAmount = s.ExpectedSalesAmount,
+                            ExpectedQuantity = s.ExpectedQuantity,
+                            Notes = s.Notes,
+                            UpdatedDate = GETDATE()
+                    WHEN NOT MATCHED BY TARGET AND s.PromotionProductID IS NULL THEN
+                        INSERT (PromotionID, ERPCode, UniqueCode, ProductName,
+                                SellingPrice, PromotionPrice, SupplyPrice,
+                                CouponDiscountRate, UnitCost, LogisticsCost,
+                                ManagementCost, WarehouseCost, EDICost, MisCost,
+                                ExpectedSalesAmount, ExpectedQuantity, Notes)
+                        VALUES (s.PromotionID, s.ERPCode, s.UniqueCode, s.ProductName,
+                                s.SellingPrice, s.PromotionPrice, s.SupplyPrice,
+                                s.CouponDiscountRate, s.UnitCost, s.LogisticsCost,
+                                s.ManagementCost, s.WarehouseCost, s.EDICost, s.MisCost,
+                                s.ExpectedSalesAmount, s.ExpectedQuantity, s.Notes)
+                    OUTPUT $action;
+                """)
+                actions = [row[0] for row in cursor.fetchall()]
+                result["product_inserted"] = actions.count('INSERT')
+                result["product_updated"] = actions.count('UPDATE')
+
+            cursor.execute("DROP TABLE #PromotionProductStage; DROP TABLE #PromotionStage;")
+
+        return result
+
+    @staticmethod
+    def _create_stage_table(cursor, table: str, columns: tuple) -> None:
+        """임시 스테이징 테이블 생성"""
+        column_defs = ", ".join(f"[{name}] {sql_type} NULL" for name, sql_type in columns)
+        cursor.execute(f"CREATE TABLE {table} ({column_defs})")
+
+    @staticmethod
+    def _insert_stage_rows(cursor, table: str, columns: tuple, rows: List[tuple],
+                           progress_callback: Optional[Callable[[int, int], None]],
+                           offset: int, total: int) -> None:
+        """다중 행 INSERT ... VALUES (파라미터 2100개 제한 내에서 최대한 묶어서 전송)"""
+        if not rows:
+            return
+
+        column_names = ", ".join(f"[{name}]" for name, _ in columns)
+        row_placeholder = "(" + ", ".join(["?"] * len(columns)) + ")"
+        rows_per_statement = (MAX_SQL_PARAMS - 1) // len(columns)
+
+        for i in range(0, len(rows), rows_per_statement):
+            chunk = rows[i:i + rows_per_statement]
+            values_sql = ", ".join([row_placeholder] * len(chunk))
+            params = [value for row in chunk for value in row]
+            cursor.execute(f"INSERT INTO {table} ({column_names}) VALUES {values_sql}", *params)
+            if progress_callback:
+                progress_callback(offset + i + len(chunk), total)
+
     def get_by_ids(self, ids: List[str]) -> List[Dict[str, Any]]:
         """PromotionID 리스트로 데이터 조회"""
         if not ids:
@@ -352,16 +645,41 @@ class PromotionRepository(BaseRepository):
 
         return total_deleted
 
+    def delete_by_filters(self, filters: Dict[str, Any], exclude_ids: Optional[List[Any]] = None) -> int:
+        """필터 기반 일괄 삭제 (PromotionProduct도 함께 삭제)"""
+        builder = self._build_filter_target(filters, exclude_ids)
+
+        with get_db_cursor() as cursor:
+            # PromotionProduct 먼저 삭제 (FK 제약) - 같은 필터의 PromotionID 서브쿼리
+            builder.select("p.PromotionID")
+            id_query, id_params = builder.build()
+            cursor.execute(
+                f"DELETE FROM [dbo].[PromotionProduct] WHERE PromotionID IN ({id_query})",
+                *id_params
+            )
+
+            # Promotion 삭제
+            query, params = builder.build_delete()
+            cursor.execute(query, *params)
+            return cursor.rowcount
+
     def get_master_summary(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """마스터 패널용 - 비정기 목록 + 상품 수 + 상품 예상매출/수량 합계"""
+        """
+        마스터 패널용 - 비정기 목록 + 상품 수 + 상품 예상매출/수량 합계
+
+        - 상태 필터: StartAt / EndAt 계산 컬럼 범위 조건 (인덱스 사용)
+        - 상품 합계: vw_PromotionProductSummary 인덱싱된 뷰 (PromotionProduct 변경 시 자동 갱신)
+          → 필터에 걸린 행사만 PromotionID로 조인, 전체 PromotionProduct 집계 없음
+        """
         with get_db_cursor(commit=False) as cursor:
             where_clauses = []
             params = []
 
             if filters:
                 if filters.get('year_month'):
-                    where_clauses.append("FORMAT(p.StartDate, 'yyyy-MM') = ?")
-                    params.append(filters['year_month'])
+                    condition, month_params = build_year_month_condition("p.StartDate", filters['year_month'])
+                    where_clauses.append(condition)
+                    params.extend(month_params)
                 if filters.get('brand_id'):
                     where_clauses.append("p.BrandID = ?")
                     params.append(filters['brand_id'])
@@ -372,47 +690,22 @@ class PromotionRepository(BaseRepository):
                     where_clauses.append("p.PromotionType = ?")
                     params.append(filters['promotion_type'])
                 if filters.get('status'):
-                    status_val = filters['status']
-                    if status_val == 'CANCELLED':
-                        where_clauses.append("p.Status = 'CANCELLED'")
-                    elif status_val == 'SCHEDULED':
-                        where_clauses.append("p.Status != 'CANCELLED'")
-                        where_clauses.append("CAST(p.StartDate AS DATETIME) + CAST(ISNULL(p.StartTime, '00:00:00') AS DATETIME) > GETDATE()")
-                    elif status_val == 'ENDED':
-                        where_clauses.append("p.Status != 'CANCELLED'")
-                        where_clauses.append("CAST(p.EndDate AS DATETIME) + CAST(ISNULL(p.EndTime, '23:59:59') AS DATETIME) < GETDATE()")
-                    elif status_val == 'ACTIVE':
-                        where_clauses.append("p.Status != 'CANCELLED'")
-                        where_clauses.append("CAST(p.StartDate AS DATETIME) + CAST(ISNULL(p.StartTime, '00:00:00') AS DATETIME) <= GETDATE()")
-                        where_clauses.append("CAST(p.EndDate AS DATETIME) + CAST(ISNULL(p.EndTime, '23:59:59') AS DATETIME) >= GETDATE()")
+                    where_clauses.extend(build_status_conditions(filters['status']))
 
             where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
 
-            status_case = """CASE
-                WHEN p.Status = 'CANCELLED' THEN 'CANCELLED'
-                WHEN CAST(p.StartDate AS DATETIME) + CAST(ISNULL(p.StartTime, '00:00:00') AS DATETIME) > GETDATE() THEN 'SCHEDULED'
-                WHEN CAST(p.EndDate AS DATETIME) + CAST(ISNULL(p.EndTime, '23:59:59') AS DATETIME) < GETDATE() THEN 'ENDED'
-                ELSE 'ACTIVE'
-            END"""
-
             query = f"""
                 SELECT p.PromotionID, p.PromotionName, p.PromotionType,
                        p.StartDate, p.EndDate,
                        p.BrandID, p.BrandName, p.ChannelID, p.ChannelName,
-                       {status_case} AS ComputedStatus,
+                       {STATUS_CASE} AS ComputedStatus,
                        p.CommissionRate, p.DiscountOwner,
                        ISNULL(cnt.ProductCount, 0) AS ProductCount,
                        ISNULL(cnt.TotalSalesAmount, 0) AS TotalSalesAmount,
                        ISNULL(cnt.TotalQuantity, 0) AS TotalQuantity
                 FROM [dbo].[Promotion] p
-                LEFT JOIN (
-                    SELECT PromotionID,
-                           COUNT(*) AS ProductCount,
-                           SUM(ISNULL(ExpectedSalesAmount, 0)) AS TotalSalesAmount,
-                           SUM(ISNULL(ExpectedQuantity, 0)) AS TotalQuantity
-                    FROM [dbo].[PromotionProduct]
-                    GROUP BY PromotionID
-                ) cnt ON p.PromotionID = cnt.PromotionID
+                LEFT JOIN [dbo].[vw_PromotionProductSummary] cnt WITH (NOEXPAND)
+                  ON p.PromotionID = cnt.PromotionID
                 WHERE {where_sql}
                 ORDER BY p.StartDate DESC, p.PromotionName ASC
             """
@@ -449,21 +742,22 @@ class PromotionRepository(BaseRepository):
             return {}
 
         result = {prefix: 0 for prefix in prefixes}
+        unique_prefixes = list(set(prefixes))
 
+        # 접두사 목록을 VALUES로 넘겨 한 번의 쿼리로 접두사별 최대 순번 조회
         with get_db_cursor(commit=False) as cursor:
-            unique_prefixes = list(set(prefixes))
-
-            for prefix in unique_prefixes:
-                query = """
-                    SELECT MAX(CAST(RIGHT(PromotionID, 2) AS INT))
-                    FROM [dbo].[Promotion]
-                    WHERE PromotionID LIKE ? + '%'
-                      AND LEN(PromotionID) > 2
-                """
-                cursor.execute(query, prefix)
-                row = cursor.fetchone()
-
-                if row and row[0] is not None:
-                    result[prefix] = row[0]
+            values_sql = ", ".join(["(?)"] * len(unique_prefixes))
+            query = f"""
+                SELECT v.Prefix, MAX(CAST(RIGHT(p.PromotionID, 2) AS INT))
+                FROM (VALUES {values_sql}) AS v(Prefix)
+                JOIN [dbo].[Promotion] p
+                  ON p.PromotionID LIKE v.Prefix + '%'
+                 AND LEN(p.PromotionID) > 2
+                GROUP BY v.Prefix
+            """
+            cursor.execute(query, *unique_prefixes)
+            for prefix, max_seq in cursor.fetchall():
+                if max_seq is not None:
+                    result[prefix] = max_seq
 
         return result
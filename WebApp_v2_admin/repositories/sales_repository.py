@@ -3,13 +3,33 @@ Sales (ERPSales) Repository
 - ERPSales 테이블 CRUD 작업
 """
 
-from typing import Dict, Any, Optional
-from core import BaseRepository, QueryBuilder
+from typing import Dict, Any, Optional, List, Sequence
+from core import (
+    BaseRepository, QueryBuilder, get_db_cursor, year_month_range,
+    SEARCH_CONTAINS, SEARCH_PREFIX, SEARCH_FULLTEXT
+)
 
 
 class SalesRepository(BaseRepository):
     """ERPSales 테이블 Repository"""
 
+    # 텍스트 필터 → (컬럼, 검색 모드)
+    # ERPSales는 대용량이라 앞 와일드카드('%값%')는 전체 스캔 → 코드/채널명은 앞부분 일치로 인덱스 사용
+    # 브랜드는 작은 Brand 테이블에서 부분 일치 후 IX_ERPSales_BrandID로 조인
+    SEARCH_COLUMNS = {
+        'brand': ("b.Title", SEARCH_CONTAINS),
+        'product_name': ("e.PRODUCT_NAME", SEARCH_FULLTEXT),
+        'erp_code': ("e.ERPCode", SEARCH_PREFIX),
+        'channel_name': ("e.ChannelName", SEARCH_PREFIX),
+    }
+
+    # 월별 집계 그룹 기준 → (집계 뷰 컬럼, 이름 컬럼, 이름 조인, 응답 ID 키, 응답 이름 키)
+    MONTHLY_DIMENSIONS = {
+        'brand': ("m.BrandID", "b.Title", "LEFT JOIN [dbo].[Brand] b ON m.BrandID = b.BrandID", "BrandID", "BrandTitle"),
+        'channel': ("m.ChannelID", "c.Name", "LEFT JOIN [dbo].[Channel] c ON m.ChannelID = c.ChannelID", "ChannelID", "ChannelName"),
+        'product': ("m.ProductID", "p.Name", "LEFT JOIN [dbo].[Product] p ON m.ProductID = p.ProductID", "ProductID", "ProductName"),
+    }
+
     def __init__(self):
         super().__init__(table_name="[dbo].[ERPSales]", id_column="IDX")
 
@@ -51,30 +71,19 @@ class SalesRepository(BaseRepository):
         Sales 전용 필터 로직
 
         지원하는 필터:
-        - brand: Brand.Title LIKE 검색
-        - product_name: PRODUCT_NAME LIKE 검색
-        - erp_code: ERPCode LIKE 검색
-        - channel_name: ChannelName LIKE 검색
+        - brand: Brand.Title 부분 일치
+        - product_name: PRODUCT_NAME 전문 검색 (인덱스 미생성 시 부분 일치)
+        - erp_code: ERPCode 앞부분 일치
+        - channel_name: ChannelName 앞부분 일치
         - start_date: DATE >= 검색
         - end_date: DATE <= 검색
         """
-        if filters.get('brand'):
-            builder.where_like("b.Title", filters['brand'])
-
-        if filters.get('product_name'):
-            builder.where_like("e.PRODUCT_NAME", filters['product_name'])
-
-        if filters.get('erp_code'):
-            builder.where_like("e.ERPCode", filters['erp_code'])
-
-        if filters.get('channel_name'):
-            builder.where_like("e.ChannelName", filters['channel_name'])
+        for key, (column, mode) in self.SEARCH_COLUMNS.items():
+            if filters.get(key):
+                builder.where_search(column, filters[key], mode)
 
-        if filters.get('start_date'):
-            builder.where("e.[DATE] >= ?", filters['start_date'])
-
-        if filters.get('end_date'):
-            builder.where("e.[DATE] <= ?", filters['end_date'])
+        # 문자열 대신 date 파라미터로 비교 → IX_ERPSales_Date Seek
+        builder.where_date_range("e.[DATE]", filters.get('start_date'), filters.get('end_date'))
 
     def _build_query_with_filters(self, filters: Optional[Dict[str, Any]] = None) -> QueryBuilder:
         """Sales 전용 QueryBuilder 생성 (Brand 조인 포함)"""
@@ -140,3 +149,76 @@ class SalesRepository(BaseRepository):
                 total_updated += cursor.rowcount
 
         return total_updated
+
+    def get_monthly_summary(
+        self,
+        start_month: str,
+        end_month: Optional[str] = None,
+        brand_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        group_by: Sequence[str] = ('brand', 'channel')
+    ) -> List[Dict[str, Any]]:
+        """
+        월별 판매 집계 조회 (vw_ERPSalesMonthly 인덱싱된 뷰 - 원본 ERPSales 스캔 없음)
+
+        집계 뷰는 (YearMonth, BrandID, ChannelID, ProductID) 단위로 SQL Server가
+        ERPSales INSERT/UPDATE/DELETE 시 자동 갱신하므로 업로드/동기화/삭제 경로에서 별도 갱신 불필요
+
+        Args:
+            start_month: 시작 년월 (YYYY-MM)
+            end_month: 종료 년월 (YYYY-MM, 포함, None이면 start_month와 동일)
+            brand_id: 브랜드 필터
+            channel_id: 채널 필터
+            group_by: 그룹 기준 ('brand', 'channel', 'product' 조합, 년월은 항상 포함)
+
+        Returns:
+            List[Dict]: YearMonth, 그룹별 ID/이름, Quantity, TaxableAmount, RowCount
+        """
+        dimensions = [self.MONTHLY_DIMENSIONS[key] for key in self.MONTHLY_DIMENSIONS if key in group_by]
+        start, _ = year_month_range(start_month)
+        _, end = year_month_range(end_month or start_month)
+
+        select_cols = ["m.YearMonth"]
+        group_cols = ["m.YearMonth"]
+        joins = []
+        for id_col, name_col, join, _, _ in dimensions:
+            select_cols.extend([id_col, name_col])
+            group_cols.extend([id_col, name_col])
+            joins.append(join)
+
+        where_clauses = ["m.YearMonth >= ?", "m.YearMonth < ?"]
+        params: List[Any] = [start, end]
+        if brand_id is not None:
+            where_clauses.append("m.BrandID = ?")
+            params.append(brand_id)
+        if channel_id is not None:
+            where_clauses.append("m.ChannelID = ?")
+            params.append(channel_id)
+
+        query = f"""
+            SELECT {", ".join(select_cols)},
+                   SUM(m.Quantity), SUM(m.TaxableAmount), SUM(m.RowCnt)
+            FROM [dbo].[vw_ERPSalesMonthly] m WITH (NOEXPAND)
+            {" ".join(joins)}
+            WHERE {" AND ".join(where_clauses)}
+            GROUP BY {", ".join(group_cols)}
+            ORDER BY {", ".join(group_cols)}
+        """
+
+        with get_db_cursor(commit=False) as cursor:
+            cursor.execute(query, *params)
+            rows = cursor.fetchall()
+
+        result = []
+        for row in rows:
+            item = {"YearMonth": row[0].strftime('%Y-%m') if row[0] else None}
+            idx = 1
+            for _, _, _, id_key, name_key in dimensions:
+                item[id_key] = row[idx]
+                item[name_key] = row[idx + 1]
+                idx += 2
+            item["Quantity"] = float(row[idx]) if row[idx] else 0
+            item["TaxableAmount"] = float(row[idx + 1]) if row[idx + 1] else 0
+            item["RowCount"] = int(row[idx + 2]) if row[idx + 2] else 0
+            result.append(item)
+        return result
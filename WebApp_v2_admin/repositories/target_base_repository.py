@@ -3,8 +3,8 @@ TargetBaseProduct Repository
 - 정기 목표 Regular 테이블 CRUD 작업
 """
 
-from typing import Dict, Any, Optional, List
-from core import BaseRepository, QueryBuilder, get_db_cursor
+from typing import Dict, Any, Optional, List, Callable
+from core import BaseRepository, QueryBuilder, get_db_cursor, build_year_month_condition
 from utils.helpers import calculate_amount_ex_vat
 
 
@@ -59,8 +59,7 @@ class TargetBaseRepository(BaseRepository):
         - channel_id: ChannelID 정확히 매칭
         """
         if filters.get('year_month'):
-            year_month = filters['year_month']
-            builder.where("FORMAT(t.[Date], 'yyyy-MM') = ?", year_month)
+            builder.where_year_month("t.[Date]", filters['year_month'])
 
         if 'brand_id' in filters:
             builder.where_equals("t.BrandID", filters['brand_id'])
@@ -78,7 +77,8 @@ class TargetBaseRepository(BaseRepository):
 
         return builder
 
-    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000) -> Dict[str, Any]:
+    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         일괄 INSERT/UPDATE
         - ID가 있으면: ID 기반 UPDATE
@@ -87,6 +87,7 @@ class TargetBaseRepository(BaseRepository):
         Args:
             records: 삽입/수정할 레코드 리스트
             batch_size: 배치 크기
+            progress_callback: 배치마다 (처리 건수, 전체 건수) 콜백 (백그라운드 작업 진행률)
 
         Returns:
             Dict: {"inserted": N, "updated": M, "duplicates": [...]}
@@ -131,6 +132,8 @@ class TargetBaseRepository(BaseRepository):
         with get_db_cursor() as cursor:
             for i in range(0, len(records), batch_size):
                 batch = records[i:i + batch_size]
+                if progress_callback:
+                    progress_callback(i, len(records))
 
                 for record in batch:
                     target_id = record.get('TargetBaseID')
@@ -242,8 +245,8 @@ class TargetBaseRepository(BaseRepository):
     def get_channels_summary(self, year_month: str, brand_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """채널별 목표 요약 조회 (마스터 패널용)"""
         with get_db_cursor(commit=False) as cursor:
-            where_clauses = ["FORMAT(t.[Date], 'yyyy-MM') = ?"]
-            params = [year_month]
+            condition, params = build_year_month_condition("t.[Date]", year_month)
+            where_clauses = [condition]
 
             if brand_id is not None:
                 where_clauses.append("t.BrandID = ?")
@@ -274,8 +277,9 @@ class TargetBaseRepository(BaseRepository):
         """특정 채널의 목표 상품 목록 조회 (디테일 패널용)"""
         with get_db_cursor(commit=False) as cursor:
             columns = ", ".join(self.SELECT_COLUMNS)
-            where_clauses = ["t.ChannelID = ?", "FORMAT(t.[Date], 'yyyy-MM') = ?"]
-            params = [channel_id, year_month]
+            condition, month_params = build_year_month_condition("t.[Date]", year_month)
+            where_clauses = ["t.ChannelID = ?", condition]
+            params = [channel_id, *month_params]
 
             if brand_id is not None:
                 where_clauses.append("t.BrandID = ?")
@@ -327,32 +331,24 @@ class TargetBaseRepository(BaseRepository):
         return {"updated": total_updated}
 
     def delete_by_filter(self, year_month: str, brand_id: Optional[int] = None,
-                         channel_id: Optional[int] = None) -> int:
+                         channel_id: Optional[int] = None,
+                         exclude_ids: Optional[List[int]] = None) -> int:
         """
-        필터 조건으로 일괄 삭제
+        필터 조건으로 일괄 삭제 (목록 조회와 같은 _apply_filters 조건)
 
         Args:
             year_month: 년월 (YYYY-MM)
             brand_id: 브랜드 ID (선택)
             channel_id: 채널 ID (선택)
+            exclude_ids: 제외할 TargetBaseID 리스트 (선택)
 
         Returns:
             int: 삭제된 레코드 수
         """
-        with get_db_cursor() as cursor:
-            conditions = ["FORMAT([Date], 'yyyy-MM') = ?"]
-            params = [year_month]
-
-            if brand_id:
-                conditions.append("BrandID = ?")
-                params.append(brand_id)
+        filters = {'year_month': year_month}
+        if brand_id:
+            filters['brand_id'] = brand_id
+        if channel_id:
+            filters['channel_id'] = channel_id
 
-            if channel_id:
-                conditions.append("ChannelID = ?")
-                params.append(channel_id)
-
-            where_clause = " AND ".join(conditions)
-            query = f"DELETE FROM [dbo].[TargetBaseProduct] WHERE {where_clause}"
-
-            cursor.execute(query, *params)
-            return cursor.rowcount
+        return self.delete_by_filters(filters, exclude_ids)
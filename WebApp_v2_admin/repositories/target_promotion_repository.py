@@ -3,8 +3,8 @@ TargetPromotionProduct Repository
 - 비정기 목표 Irregular 테이블 CRUD 작업
 """
 
-from typing import Dict, Any, Optional, List
-from core import BaseRepository, QueryBuilder, get_db_cursor
+from typing import Dict, Any, Optional, List, Callable
+from core import BaseRepository, QueryBuilder, get_db_cursor, build_year_month_condition
 from utils.helpers import calculate_amount_ex_vat
 
 
@@ -69,8 +69,7 @@ class TargetPromotionRepository(BaseRepository):
         - promotion_type: PromotionType 정확히 매칭
         """
         if filters.get('year_month'):
-            year_month = filters['year_month']
-            builder.where("FORMAT(t.StartDate, 'yyyy-MM') = ?", year_month)
+            builder.where_year_month("t.StartDate", filters['year_month'])
 
         if 'brand_id' in filters:
             builder.where_equals("t.BrandID", filters['brand_id'])
@@ -91,7 +90,8 @@ class TargetPromotionRepository(BaseRepository):
 
         return builder
 
-    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000) -> Dict[str, Any]:
+    def bulk_upsert(self, records: List[Dict[str, Any]], batch_size: int = 1000,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """
         일괄 INSERT/UPDATE
         - ID가 있으면: ID 기반 UPDATE
@@ -101,6 +101,7 @@ class TargetPromotionRepository(BaseRepository):
         Args:
             records: 삽입/수정할 레코드 리스트
             batch_size: 배치 크기
+            progress_callback: 배치마다 (처리 건수, 전체 건수) 콜백 (백그라운드 작업 진행률)
 
         Returns:
             Dict: {"inserted": N, "updated": M, "duplicates": [...]}
@@ -149,6 +150,8 @@ class TargetPromotionRepository(BaseRepository):
         with get_db_cursor() as cursor:
             for i in range(0, len(records), batch_size):
                 batch = records[i:i + batch_size]
+                if progress_callback:
+                    progress_callback(i, len(records))
 
                 for record in batch:
                     target_id = record.get('TargetPromotionID')
@@ -260,8 +263,8 @@ class TargetPromotionRepository(BaseRepository):
                            promotion_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """그룹별 요약 조회 (채널+행사명+행사유형 기준, 마스터 패널용)"""
         with get_db_cursor(commit=False) as cursor:
-            where_clauses = ["FORMAT(t.StartDate, 'yyyy-MM') = ?"]
-            params = [year_month]
+            condition, params = build_year_month_condition("t.StartDate", year_month)
+            where_clauses = [condition]
 
             if brand_id is not None:
                 where_clauses.append("t.BrandID = ?")
@@ -315,13 +318,14 @@ class TargetPromotionRepository(BaseRepository):
         """특정 그룹의 상품 목록 조회 (디테일 패널용)"""
         with get_db_cursor(commit=False) as cursor:
             columns = ", ".join(self.SELECT_COLUMNS)
+            month_condition, month_params = build_year_month_condition("t.StartDate", year_month)
             where_clauses = [
                 "t.ChannelID = ?",
                 "t.PromotionName = ?",
                 "t.PromotionType = ?",
-                "FORMAT(t.StartDate, 'yyyy-MM') = ?"
+                month_condition
             ]
-            params = [channel_id, promotion_name, promotion_type, year_month]
+            params = [channel_id, promotion_name, promotion_type, *month_params]
 
             if brand_id is not None:
                 where_clauses.append("t.BrandID = ?")
@@ -386,40 +390,30 @@ class TargetPromotionRepository(BaseRepository):
 
     def delete_by_filter(self, year_month: str, brand_id: Optional[int] = None,
                          channel_id: Optional[int] = None,
-                         promotion_type: Optional[str] = None) -> int:
+                         promotion_type: Optional[str] = None,
+                         exclude_ids: Optional[List[int]] = None) -> int:
         """
-        필터 조건으로 일괄 삭제
+        필터 조건으로 일괄 삭제 (목록 조회와 같은 _apply_filters 조건)
 
         Args:
             year_month: 년월 (YYYY-MM, StartDate 기준)
             brand_id: 브랜드 ID (선택)
             channel_id: 채널 ID (선택)
             promotion_type: 행사 유형 (선택)
+            exclude_ids: 제외할 TargetPromotionID 리스트 (선택)
 
         Returns:
             int: 삭제된 레코드 수
         """
-        with get_db_cursor() as cursor:
-            conditions = ["FORMAT(StartDate, 'yyyy-MM') = ?"]
-            params = [year_month]
-
-            if brand_id:
-                conditions.append("BrandID = ?")
-                params.append(brand_id)
-
-            if channel_id:
-                conditions.append("ChannelID = ?")
-                params.append(channel_id)
-
-            if promotion_type:
-                conditions.append("PromotionType = ?")
-                params.append(promotion_type)
-
-            where_clause = " AND ".join(conditions)
-            query = f"DELETE FROM [dbo].[TargetPromotionProduct] WHERE {where_clause}"
-
-            cursor.execute(query, *params)
-            return cursor.rowcount
+        filters = {'year_month': year_month}
+        if brand_id:
+            filters['brand_id'] = brand_id
+        if channel_id:
+            filters['channel_id'] = channel_id
+        if promotion_type:
+            filters['promotion_type'] = promotion_type
+
+        return self.delete_by_filters(filters, exclude_ids)
 
     def get_max_sequences_by_prefixes(self, prefixes: List[str]) -> Dict[str, int]:
         """
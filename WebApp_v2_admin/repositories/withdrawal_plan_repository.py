@@ -5,7 +5,7 @@ WithdrawalPlan Repository
 """
 
 from typing import Dict, Any, Optional, List
-from core import BaseRepository, QueryBuilder, get_db_cursor
+from core import BaseRepository, QueryBuilder, get_db_cursor, build_year_month_condition
 
 
 class WithdrawalPlanRepository(BaseRepository):
@@ -47,7 +47,7 @@ class WithdrawalPlanRepository(BaseRepository):
     def _apply_filters(self, builder: QueryBuilder, filters: Dict[str, Any]) -> None:
         """필터 적용"""
         if filters.get('year_month'):
-            builder.where("FORMAT(p.[Date], 'yyyy-MM') = ?", filters['year_month'])
+            builder.where_year_month("p.[Date]", filters['year_month'])
         if filters.get('type'):
             builder.where_equals("p.Type", filters['type'])
         if filters.get('title'):
@@ -79,8 +79,9 @@ class WithdrawalPlanRepository(BaseRepository):
 
             if filters:
                 if filters.get('year_month'):
-                    where_clauses.append("FORMAT(p.[Date], 'yyyy-MM') = ?")
-                    params.append(filters['year_month'])
+                    condition, month_params = build_year_month_condition("p.[Date]", filters['year_month'])
+                    where_clauses.append(condition)
+                    params.extend(month_params)
                 if filters.get('type'):
                     where_clauses.append("p.Type = ?")
                     params.append(filters['type'])
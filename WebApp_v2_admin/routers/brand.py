@@ -8,7 +8,7 @@ from pydantic import BaseModel
 from typing import Optional
 from repositories import BrandRepository
 from core.dependencies import get_client_ip, CurrentUser
-from core import log_activity, log_delete, require_permission
+from core import log_activity, log_delete, require_permission, etag_response
 
 router = APIRouter(prefix="/api/brands", tags=["Brand"])
 
@@ -46,11 +46,11 @@ async def get_brands(
 
 
 @router.get("/all")
-async def get_all_brands(user: CurrentUser = Depends(require_permission("Brand", "READ"))):
-    """모든 브랜드 Title 조회 (중복 제거)"""
+async def get_all_brands(request: Request, user: CurrentUser = Depends(require_permission("Brand", "READ"))):
+    """모든 브랜드 Title 조회 (중복 제거) - 참조 데이터 캐시, ETag/304"""
     try:
-        brands = brand_repo.get_all_brands()
-        return {"data": brands}
+        snapshot = brand_repo.get_all_brands_snapshot()
+        return etag_response(request, snapshot, {"data": snapshot.value})
     except Exception as e:
         raise HTTPException(500, f"브랜드 조회 실패: {str(e)}")
 
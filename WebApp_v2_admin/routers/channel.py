@@ -10,7 +10,7 @@ from pydantic import BaseModel
 from typing import Optional, List
 from repositories import ChannelRepository, ChannelDetailRepository
 from core.dependencies import get_client_ip, CurrentUser
-from core import log_activity, log_delete, log_bulk_delete, require_permission
+from core import log_activity, log_delete, log_bulk_delete, require_permission, etag_response
 from core.models import BulkDeleteRequest
 
 router = APIRouter(prefix="/api/channels", tags=["Channel"])
@@ -111,21 +111,19 @@ async def get_channels(
 
 
 @router.get("/metadata")
-async def get_channel_metadata(user: CurrentUser = Depends(require_permission("Channel", "READ"))):
-    """Channel 메타데이터 조회 (필터용)"""
+async def get_channel_metadata(request: Request, user: CurrentUser = Depends(require_permission("Channel", "READ"))):
+    """Channel 메타데이터 조회 (필터용) - 참조 데이터 캐시, ETag/304"""
     try:
-        metadata = channel_repo.get_metadata()
-        metadata['detail_names'] = detail_repo.get_detail_names()
-        return metadata
+        return etag_response(request, channel_repo.get_metadata_snapshot())
     except Exception as e:
         raise HTTPException(500, f"메타데이터 조회 실패: {str(e)}")
 
 
 @router.get("/list")
-async def get_channel_list(user: CurrentUser = Depends(require_permission("Channel", "READ"))):
-    """채널 목록 조회 (드롭다운용) - ChannelID와 Name만 반환"""
+async def get_channel_list(request: Request, user: CurrentUser = Depends(require_permission("Channel", "READ"))):
+    """채널 목록 조회 (드롭다운용) - ChannelID와 Name만 반환, 참조 데이터 캐시, ETag/304"""
     try:
-        return channel_repo.get_channel_list()
+        return etag_response(request, channel_repo.get_channel_list_snapshot())
     except Exception as e:
         raise HTTPException(500, f"채널 목록 조회 실패: {str(e)}")
 
@@ -0,0 +1,76 @@
+"""
+Job Router
+- 백그라운드 작업 상태 조회 API (엑셀 업로드, 동기화 등)
+- 폴링: GET /api/jobs/{job_id}
+- 실시간: GET /api/jobs/{job_id}/events (Server-Sent Events)
+"""
+
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from core.dependencies import get_current_user, CurrentUser
+from core.jobs import job_manager, FINISHED_STATUSES
+
+router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
+
+# SSE 상태 확인 간격 (초)
+SSE_INTERVAL = 1.0
+
+
+def _get_job_or_404(job_id: str, user: CurrentUser) -> dict:
+    """작업 조회 (본인 작업 또는 관리자만)"""
+    job = job_manager.get(job_id)
+    if not job or (job["UserID"] != user.user_id and not user.is_admin):
+        raise HTTPException(404, "작업을 찾을 수 없습니다")
+    return job
+
+
+@router.get("")
+async def get_jobs(limit: int = 20, user: CurrentUser = Depends(get_current_user)):
+    """최근 작업 목록 (관리자는 전체)"""
+    try:
+        user_id = None if user.is_admin else user.user_id
+        return {"data": job_manager.list_recent(user_id, limit)}
+    except Exception as e:
+        raise HTTPException(500, f"작업 목록 조회 실패: {str(e)}")
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, user: CurrentUser = Depends(get_current_user)):
+    """작업 상태 조회 (폴링용)"""
+    try:
+        return _get_job_or_404(job_id, user)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(500, f"작업 조회 실패: {str(e)}")
+
+
+@router.get("/{job_id}/events")
+async def get_job_events(job_id: str, user: CurrentUser = Depends(get_current_user)):
+    """작업 상태 스트림 (SSE) - 상태가 바뀔 때마다 전송, 완료/실패 시 종료"""
+    _get_job_or_404(job_id, user)
+
+    async def event_stream():
+        last_payload = None
+        while True:
+            job = job_manager.get(job_id)
+            if not job:
+                break
+
+            payload = json.dumps(job, ensure_ascii=False, default=str)
+            if payload != last_payload:
+                yield f"data: {payload}\n\n"
+                last_payload = payload
+
+            if job["Status"] in FINISHED_STATUSES:
+                break
+
+            await asyncio.sleep(SSE_INTERVAL)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
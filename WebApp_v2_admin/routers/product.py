@@ -15,7 +15,7 @@ from datetime import datetime
 from urllib.parse import quote
 from repositories import ProductRepository, ProductBoxRepository
 from core.dependencies import get_client_ip, CurrentUser
-from core import log_activity, log_delete, log_bulk_delete, require_permission, get_db_cursor
+from core import log_activity, log_delete, log_bulk_delete, require_permission, get_db_cursor, etag_response
 from core.models import BulkDeleteRequest
 from utils.excel import ProductExcelHandler
 
@@ -131,9 +131,9 @@ async def get_products(
 
 
 @router.get("/metadata")
-async def get_product_metadata(user: CurrentUser = Depends(require_permission("Product", "READ"))):
+async def get_product_metadata(request: Request, user: CurrentUser = Depends(require_permission("Product", "READ"))):
     """
-    Product 메타데이터 조회 (필터용)
+    Product 메타데이터 조회 (필터용) - 참조 데이터 캐시, ETag/304
 
     Returns:
     - bundle_types: BundleType 목록
@@ -141,11 +141,7 @@ async def get_product_metadata(user: CurrentUser = Depends(require_permission("P
     - names: 제품명 목록
     """
     try:
-        return {
-            "bundle_types": product_repo.get_bundle_types(),
-            "unique_codes": product_repo.get_unique_codes(),
-            "names": product_repo.get_product_names()
-        }
+        return etag_response(request, product_repo.get_metadata_snapshot())
     except Exception as e:
         raise HTTPException(500, f"메타데이터 조회 실패: {str(e)}")
 
@@ -16,8 +16,9 @@ from repositories.promotion_product_repository import PromotionProductRepository
 from repositories import BrandRepository, ChannelRepository, ProductRepository, ActivityLogRepository
 from core import get_db_cursor
 from core.dependencies import get_client_ip, CurrentUser
-from core import log_activity, log_delete, log_bulk_delete, require_permission
-from core.models import BulkDeleteAnyRequest as BulkDeleteRequest
+from core import log_activity, log_delete, log_bulk_delete, require_permission, cache_response, invalidate_on_write
+from core.jobs import job_manager, Job
+from core.models import BulkDeleteAnyRequest as BulkDeleteRequest, FilterBulkRequest
 from utils.helpers import format_time_value
 
 
@@ -120,7 +121,10 @@ class PromotionProductBulkUpdateRequest(BaseModel):
 # ==========================================================
 #  Promotion Router (행사 목록 CRUD + 통합 엑셀)
 # ==========================================================
-router = APIRouter(prefix="/api/promotions", tags=["Promotion"])
+router = APIRouter(
+    prefix="/api/promotions", tags=["Promotion"],
+    dependencies=[Depends(invalidate_on_write("promotion"))]
+)
 
 
 # ========== 행사 목록 조회 ==========
@@ -182,7 +186,8 @@ async def get_promotion_list(
 
 
 @router.get("/year-months")
-async def get_promotion_year_months(user: CurrentUser = Depends(require_permission("Promotion", "READ"))):
+@cache_response("promotion", ttl=60)
+async def get_promotion_year_months(request: Request, user: CurrentUser = Depends(require_permission("Promotion", "READ"))):
     """행사 년월 목록 조회"""
     try:
         year_months = promotion_repo.get_year_months()
@@ -192,7 +197,8 @@ async def get_promotion_year_months(user: CurrentUser = Depends(require_permissi
 
 
 @router.get("/promotion-types")
-async def get_promotion_types(user: CurrentUser = Depends(require_permission("Promotion", "READ"))):
+@cache_response("promotion", ttl=300)
+async def get_promotion_types(request: Request, user: CurrentUser = Depends(require_permission("Promotion", "READ"))):
     """행사유형 목록 조회 (PromotionType 테이블에서 DisplayName)"""
     try:
         promotion_types = promotion_repo.get_promotion_type_display_names()
@@ -202,7 +208,8 @@ async def get_promotion_types(user: CurrentUser = Depends(require_permission("Pr
 
 
 @router.get("/statuses")
-async def get_promotion_statuses(user: CurrentUser = Depends(require_permission("Promotion", "READ"))):
+@cache_response("promotion", ttl=300)
+async def get_promotion_statuses(request: Request, user: CurrentUser = Depends(require_permission("Promotion", "READ"))):
     """행사 상태 목록 조회 (고정값)"""
     try:
         statuses = promotion_repo.get_statuses()
@@ -622,17 +629,29 @@ async def upload_promotions(
     request: Request = None,
     user: CurrentUser = Depends(require_permission("Promotion", "UPLOAD"))
 ):
-    """행사 + 행사 상품 통합 엑셀 업로드"""
+    """행사 + 행사 상품 통합 엑셀 업로드 (백그라운드 작업 등록 후 job_id 즉시 반환)"""
+    # 1. 파일 확장자 검증
+    if not file.filename.endswith(('.xlsx', '.xls')):
+        raise HTTPException(400, "엑셀 파일(.xlsx, .xls)만 업로드 가능합니다")
+
+    content = await file.read()
+
+    job = job_manager.submit(
+        "PROMOTION_UPLOAD", _process_promotion_upload,
+        file.filename, content, user, get_client_ip(request) if request else None,
+        title=file.filename, user_id=user.user_id, invalidates=("promotion",)
+    )
+    return {"job_id": job.job_id, "status": job.status}
+
+
+def _process_promotion_upload(job: Job, filename: str, content: bytes, user: CurrentUser, ip_address: Optional[str]):
+    """행사 + 행사 상품 통합 엑셀 업로드 처리 (백그라운드 작업)"""
     try:
         upload_start_time = datetime.now()
 
-        # 1. 파일 확장자 검증
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(400, "엑셀 파일(.xlsx, .xls)만 업로드 가능합니다")
-
-        print(f"\n[행사 관리 통합 업로드 시작] {file.filename}")
+        print(f"\n[행사 관리 통합 업로드 시작] {filename}")
 
-        content = await file.read()
+        job.set_message("엑셀 파일 읽는 중")
         excel_file = io.BytesIO(content)
         df = pd.read_excel(excel_file)
         print(f"   총 {len(df):,}행 로드됨")
@@ -821,276 +840,48 @@ async def upload_promotions(
                 error_messages.append(f"존재하지 않는 행사유형: {display_name} (행 {', '.join(map(str, rows[:5]))}{'...' if len(rows) > 5 else ''})")
             raise HTTPException(400, "\n".join(error_messages))
 
-        # 6. 행사 단위 그룹핑
-        def get_group_key(row, has_promotion_id):
-            if has_promotion_id:
-                return row['PromotionID']
-            else:
-                brand = str(row['BrandName']).strip() if pd.notna(row['BrandName']) else ''
-                channel = str(row['ChannelName']).strip() if pd.notna(row['ChannelName']) else ''
-                ptype = str(row['PromotionType']).strip() if pd.notna(row['PromotionType']) else ''
-                sdate = row['StartDate'].strftime('%Y-%m-%d') if hasattr(row['StartDate'], 'strftime') else str(row['StartDate'])[:10]
-                pname = str(row['PromotionName']).strip() if pd.notna(row['PromotionName']) else ''
-                return f"{brand}_{channel}_{ptype}_{sdate}_{pname}"
-
-        groups = {}  # {group_key: [row_indices]}
-        for idx, row in df.iterrows():
-            has_promo_id = (
-                'PromotionID' in row
-                and pd.notna(row.get('PromotionID'))
-                and str(row.get('PromotionID')).strip() not in ['', 'nan']
-            )
-            key = get_group_key(row, has_promo_id)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(idx)
-
-        # 7. 신규 행사 복합키 중복 체크
-        duplicate_promotions = []
-        for key, indices in groups.items():
-            first_row = df.iloc[indices[0]]
-            has_promo_id = (
-                'PromotionID' in first_row
-                and pd.notna(first_row.get('PromotionID'))
-                and str(first_row.get('PromotionID')).strip() not in ['', 'nan']
-            )
-
-            if not has_promo_id:
-                # 신규 행사 → 복합키 중복 체크
-                brand_name = str(first_row['BrandName']).strip() if pd.notna(first_row['BrandName']) else None
-                channel_name = str(first_row['ChannelName']).strip() if pd.notna(first_row['ChannelName']) else None
-                promo_type = str(first_row['PromotionType']).strip() if pd.notna(first_row['PromotionType']) else None
-                promo_name = str(first_row['PromotionName']).strip() if pd.notna(first_row['PromotionName']) else None
-                start_date_val = first_row['StartDate'].strftime('%Y-%m-%d') if hasattr(first_row['StartDate'], 'strftime') else str(first_row['StartDate'])[:10]
-
-                brand_info = brand_map.get(brand_name, {})
-                channel_info = channel_map.get(channel_name, {})
-
-                b_id = brand_info.get('BrandID')
-                c_id = channel_info.get('ChannelID')
-
-                if b_id and c_id and promo_type and promo_name:
-                    with get_db_cursor(commit=False) as cursor:
-                        cursor.execute("""
-                            SELECT PromotionID FROM [dbo].[Promotion]
-                            WHERE BrandID = ? AND ChannelID = ? AND PromotionType = ?
-                              AND StartDate = ? AND PromotionName = ?
-                        """, b_id, c_id, promo_type, start_date_val, promo_name)
-                        existing = cursor.fetchone()
-                        if existing:
-                            row_num = int(indices[0]) + 2
-                            duplicate_promotions.append(
-                                f"행 {row_num}: 이미 등록된 행사 (행사명: {promo_name}, 시작일: {start_date_val}, 브랜드: {brand_name}, 채널: {channel_name}, 유형: {promo_type})"
-                            )
-
-        if duplicate_promotions:
-            raise HTTPException(400, "중복된 행사가 있습니다. 동일 복합키(브랜드+채널+행사유형+시작일+행사명)의 행사가 이미 존재합니다.\n" + "\n".join(duplicate_promotions[:10]))
-
-        # 8. 신규 행사만 PromotionID 자동 생성
-        prefix_sequences = {}  # {prefix: current_sequence}
-
-        # DB에서 각 접두사의 최대 순번 조회
-        all_prefixes = set()
-        for key, indices in groups.items():
-            first_row = df.iloc[indices[0]]
-            has_promo_id = (
-                'PromotionID' in first_row
-                and pd.notna(first_row.get('PromotionID'))
-                and str(first_row.get('PromotionID')).strip() not in ['', 'nan']
-            )
-
-            if not has_promo_id:
-                brand_name = str(first_row['BrandName']).strip() if pd.notna(first_row['BrandName']) else None
-                promo_type = str(first_row['PromotionType']).strip() if pd.notna(first_row['PromotionType']) else None
-
-                if brand_name and promo_type and pd.notna(first_row['StartDate']):
-                    b_info = brand_map.get(brand_name, {})
-                    t_info = promotion_type_map.get(promo_type, {})
-                    b_code = b_info.get('BrandCode', '')[:2] if b_info.get('BrandCode') else ''
-                    t_code = t_info.get('TypeCode', '')
-
-                    if b_code and t_code:
-                        start_dt = first_row['StartDate']
-                        if hasattr(start_dt, 'strftime'):
-                            yymm = start_dt.strftime('%y%m')
-                        else:
-                            yymm = pd.to_datetime(start_dt).strftime('%y%m')
-                        prefix = f"{b_code}{t_code}{yymm}"
-                        all_prefixes.add(prefix)
-
-        if all_prefixes:
-            max_sequences = promotion_repo.get_max_sequences_by_prefixes(list(all_prefixes))
-            for prefix, max_seq in max_sequences.items():
-                prefix_sequences[prefix] = max_seq
-
-        # 각 그룹에 대해 PromotionID 할당
-        group_promotion_ids = {}  # {group_key: PromotionID}
-        for key, indices in groups.items():
-            first_row = df.iloc[indices[0]]
-            has_promo_id = (
-                'PromotionID' in first_row
-                and pd.notna(first_row.get('PromotionID'))
-                and str(first_row.get('PromotionID')).strip() not in ['', 'nan']
-            )
+        # 6~9. 행사 단위 그룹핑 → 신규 PromotionID 할당 → 행사/상품 레코드 생성 (컬럼 단위 처리)
+        promotion_records, product_records = _build_promotion_upload_records(
+            df, brand_map, channel_map, promotion_type_map, product_map
+        )
+        print(f"   행사 {len(promotion_records):,}건, 상품 {len(product_records):,}건 준비")
 
-            if has_promo_id:
-                group_promotion_ids[key] = str(first_row['PromotionID']).strip()
-            else:
-                # 신규 PromotionID 생성
-                brand_name = str(first_row['BrandName']).strip() if pd.notna(first_row['BrandName']) else None
-                promo_type = str(first_row['PromotionType']).strip() if pd.notna(first_row['PromotionType']) else None
-
-                b_info = brand_map.get(brand_name, {})
-                t_info = promotion_type_map.get(promo_type, {})
-                b_code = b_info.get('BrandCode', '')[:2] if b_info.get('BrandCode') else ''
-                t_code = t_info.get('TypeCode', '')
-
-                if b_code and t_code and pd.notna(first_row['StartDate']):
-                    start_dt = first_row['StartDate']
-                    if hasattr(start_dt, 'strftime'):
-                        yymm = start_dt.strftime('%y%m')
-                    else:
-                        yymm = pd.to_datetime(start_dt).strftime('%y%m')
-                    prefix = f"{b_code}{t_code}{yymm}"
-
-                    current_seq = prefix_sequences.get(prefix, 0) + 1
-                    prefix_sequences[prefix] = current_seq
-                    promotion_id = f"{prefix}{current_seq:02d}"
-                    group_promotion_ids[key] = promotion_id
-                    print(f"   [PromotionID 자동 생성] {promotion_id}")
-                else:
-                    row_num = int(indices[0]) + 2
-                    raise HTTPException(400, f"행사ID를 생성할 수 없습니다. BrandCode, 행사유형, 시작일을 확인해주세요. (행 {row_num})")
-
-        # 9. Promotion 레코드 준비 + bulk_upsert
-        promotion_records = []
-        for key, indices in groups.items():
-            first_row = df.iloc[indices[0]]
-            promo_id = group_promotion_ids[key]
-
-            brand_name = str(first_row['BrandName']).strip() if pd.notna(first_row['BrandName']) and str(first_row['BrandName']).strip() != 'nan' else None
-            channel_name = str(first_row['ChannelName']).strip() if pd.notna(first_row['ChannelName']) and str(first_row['ChannelName']).strip() != 'nan' else None
-            promo_type = str(first_row['PromotionType']).strip() if pd.notna(first_row['PromotionType']) and str(first_row['PromotionType']).strip() != 'nan' else None
-
-            brand_info = brand_map.get(brand_name, {})
-            channel_info = channel_map.get(channel_name, {})
-            type_info = promotion_type_map.get(promo_type, {})
-
-            start_time_val = format_time_value(first_row.get('StartTime', '00:00:00'))
-            end_time_val = format_time_value(first_row.get('EndTime', '23:59:59'))
-
-            # 상품 레벨 예상매출/예상수량 합산 → 행사 레벨 자동 계산
-            sum_sales = 0.0
-            sum_qty = 0
-            for idx in indices:
-                row = df.iloc[idx]
-                if pd.notna(row.get('ProdExpectedSalesAmount')):
-                    sum_sales += float(row['ProdExpectedSalesAmount'])
-                if pd.notna(row.get('ProdExpectedQuantity')):
-                    sum_qty += int(row['ProdExpectedQuantity'])
-
-            promotion_records.append({
-                'PromotionID': promo_id,
-                'PromotionName': str(first_row['PromotionName']).strip() if pd.notna(first_row.get('PromotionName')) else None,
-                'PromotionType': type_info.get('DisplayName') or promo_type,
-                'StartDate': first_row['StartDate'].strftime('%Y-%m-%d') if pd.notna(first_row['StartDate']) else None,
-                'StartTime': start_time_val,
-                'EndDate': first_row['EndDate'].strftime('%Y-%m-%d') if pd.notna(first_row['EndDate']) else None,
-                'EndTime': end_time_val,
-                'BrandID': brand_info.get('BrandID'),
-                'BrandName': brand_info.get('BrandName'),
-                'ChannelID': channel_info.get('ChannelID'),
-                'ChannelName': channel_info.get('ChannelName'),
-                'CommissionRate': float(first_row['CommissionRate']) if pd.notna(first_row.get('CommissionRate')) else None,
-                'DiscountOwner': str(first_row.get('DiscountOwner')).strip() if pd.notna(first_row.get('DiscountOwner')) and str(first_row.get('DiscountOwner')).strip() != 'nan' else None,
-                'CompanyShare': float(first_row['CompanyShare']) if pd.notna(first_row.get('CompanyShare')) else None,
-                'ChannelShare': float(first_row['ChannelShare']) if pd.notna(first_row.get('ChannelShare')) else None,
-                'ExpectedSalesAmount': sum_sales if sum_sales > 0 else None,
-                'ExpectedQuantity': sum_qty if sum_qty > 0 else None,
-                'Notes': str(first_row['PromoNotes']) if pd.notna(first_row.get('PromoNotes')) and str(first_row.get('PromoNotes')).strip() != 'nan' else None,
-            })
+        # 10. 스테이징 → 복합키 중복 검사 → MERGE (행사 + 상품 단일 트랜잭션)
+        import_result = promotion_repo.import_with_products(
+            promotion_records, product_records,
+            progress_callback=job.progress_callback("저장 중")
+        )
 
-        promo_result = promotion_repo.bulk_upsert(promotion_records)
+        if import_result['duplicates']:
+            duplicate_promotions = [
+                f"행 {dup['row']}: 이미 등록된 행사 (행사명: {dup['promotion_name']}, 시작일: {dup['start_date']}, 브랜드: {dup['brand_name']}, 채널: {dup['channel_name']}, 유형: {dup['promotion_type']})"
+                for dup in import_result['duplicates'][:10]
+            ]
+            raise HTTPException(400, "중복된 행사가 있습니다. 동일 복합키(브랜드+채널+행사유형+시작일+행사명)의 행사가 이미 존재합니다.\n" + "\n".join(duplicate_promotions))
 
-        # 중복 체크 (Repository 방어)
-        promo_duplicates = promo_result.get('duplicates', [])
-        if promo_duplicates:
+        if import_result['product_duplicates']:
             error_messages = []
-            for dup in promo_duplicates[:10]:
+            for dup in import_result['product_duplicates'][:10]:
                 error_messages.append(
-                    f"행사 중복: {dup.get('promotion_name', '')} (시작일: {dup.get('start_date', '')}, 브랜드: {dup.get('brand_name', '')})"
+                    f"행 {dup.get('row', '')}: 중복 상품 (행사ID: {dup.get('promotion_id', '')}, 상품코드: {dup.get('unique_code', '')})"
                 )
-            raise HTTPException(400, "중복된 행사가 있습니다.\n" + "\n".join(error_messages))
-
-        # 10. PromotionProduct 레코드 준비 + bulk_upsert
-        product_records = []
-        for key, indices in groups.items():
-            promo_id = group_promotion_ids[key]
-
-            for idx in indices:
-                row = df.iloc[idx]
-
-                erp_code = str(row['ERPCode']).strip() if pd.notna(row.get('ERPCode')) and str(row.get('ERPCode')).strip() not in ['', 'nan'] else None
-
-                if not erp_code:
-                    continue  # 품목코드 없으면 스킵
-
-                product_info = product_map.get(erp_code, {})
-
-                product_id = None
-                if 'PromotionProductID' in row and pd.notna(row.get('PromotionProductID')):
-                    try:
-                        product_id = int(row['PromotionProductID'])
-                    except (ValueError, TypeError):
-                        product_id = None
-
-                product_records.append({
-                    'PromotionProductID': product_id,
-                    'PromotionID': promo_id,
-                    'ERPCode': erp_code,
-                    'UniqueCode': product_info.get('UniqueCode'),
-                    'ProductName': product_info.get('ProductName') or (str(row['ProductName']).strip() if pd.notna(row.get('ProductName')) and str(row.get('ProductName')).strip() != 'nan' else None),
-                    'SellingPrice': float(row['SellingPrice']) if pd.notna(row.get('SellingPrice')) else None,
-                    'PromotionPrice': float(row['PromotionPrice']) if pd.notna(row.get('PromotionPrice')) else None,
-                    'SupplyPrice': float(row['SupplyPrice']) if pd.notna(row.get('SupplyPrice')) else None,
-                    'CouponDiscountRate': float(row['CouponDiscountRate']) if pd.notna(row.get('CouponDiscountRate')) else None,
-                    'UnitCost': float(row['UnitCost']) if pd.notna(row.get('UnitCost')) else None,
-                    'LogisticsCost': float(row['LogisticsCost']) if pd.notna(row.get('LogisticsCost')) else None,
-                    'ManagementCost': float(row['ManagementCost']) if pd.notna(row.get('ManagementCost')) else None,
-                    'WarehouseCost': float(row['WarehouseCost']) if pd.notna(row.get('WarehouseCost')) else None,
-                    'EDICost': float(row['EDICost']) if pd.notna(row.get('EDICost')) else None,
-                    'MisCost': float(row['MisCost']) if pd.notna(row.get('MisCost')) else None,
-                    'ExpectedSalesAmount': float(row['ProdExpectedSalesAmount']) if pd.notna(row.get('ProdExpectedSalesAmount')) else None,
-                    'ExpectedQuantity': int(row['ProdExpectedQuantity']) if pd.notna(row.get('ProdExpectedQuantity')) else None,
-                    'Notes': str(row['ProdNotes']) if pd.notna(row.get('ProdNotes')) and str(row.get('ProdNotes')).strip() != 'nan' else None,
-                    '_row_num': int(idx) + 2,
-                })
+            raise HTTPException(400, "중복된 행사 상품이 있습니다.\n" + "\n".join(error_messages))
 
-        prod_result = {"inserted": 0, "updated": 0, "duplicates": []}
-        if product_records:
-            prod_result = promotion_product_repo.bulk_upsert(product_records)
-
-            prod_duplicates = prod_result.get('duplicates', [])
-            if prod_duplicates:
-                error_messages = []
-                for dup in prod_duplicates[:10]:
-                    error_messages.append(
-                        f"행 {dup.get('row', '')}: 중복 상품 (행사ID: {dup.get('promotion_id', '')}, 상품코드: {dup.get('unique_code', '')})"
-                    )
-                raise HTTPException(400, "중복된 행사 상품이 있습니다.\n" + "\n".join(error_messages))
+        promo_result = {"inserted": import_result['promotion_inserted'], "updated": import_result['promotion_updated']}
+        prod_result = {"inserted": import_result['product_inserted'], "updated": import_result['product_updated']}
 
         upload_end_time = datetime.now()
         duration = (upload_end_time - upload_start_time).total_seconds()
 
         # 11. 활동 로그
-        if user and request:
+        if user:
             activity_log_repo.log_action(
                 user_id=user.user_id,
                 action_type="CREATE",
                 target_table="Promotion",
                 details={
                     "action": "EXCEL_UPLOAD",
-                    "filename": file.filename,
+                    "filename": filename,
                     "total_rows": len(df),
                     "promotion_inserted": promo_result['inserted'],
                     "promotion_updated": promo_result['updated'],
@@ -1098,7 +889,7 @@ async def upload_promotions(
                     "product_updated": prod_result['updated'],
                     "duration_seconds": duration
                 },
-                ip_address=get_client_ip(request)
+                ip_address=ip_address
             )
 
         print(f"   업로드 완료: 행사 {promo_result['inserted']}건 삽입/{promo_result['updated']}건 수정, 상품 {prod_result['inserted']}건 삽입/{prod_result['updated']}건 수정")
@@ -1120,6 +911,158 @@ async def upload_promotions(
         raise HTTPException(500, f"업로드 실패: {str(e)}")
 
 
+def _text_column(df: pd.DataFrame, col: str, strip: bool = True) -> pd.Series:
+    """문자열 컬럼 정규화 (공백 제거, 빈 값/'nan' → None), 컬럼이 없으면 전부 None"""
+    if col not in df.columns:
+        return pd.Series(None, index=df.index, dtype=object)
+    raw = df[col].astype(str)
+    stripped = raw.str.strip()
+    valid = df[col].notna() & ~stripped.isin(['', 'nan'])
+    return (stripped if strip else raw).astype(object).where(valid, None)
+
+
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    """원본 컬럼 (컬럼이 없으면 전부 None)"""
+    if col not in df.columns:
+        return pd.Series(None, index=df.index, dtype=object)
+    return df[col]
+
+
+def _map_column(series: pd.Series, mapping: dict) -> pd.Series:
+    """dict 조회 결과를 object 컬럼으로 (int가 float로 바뀌지 않도록)"""
+    return pd.Series([mapping.get(v) for v in series], index=series.index, dtype=object)
+
+
+def _to_records(frame: pd.DataFrame) -> List[dict]:
+    """DataFrame → dict 리스트 (NaN/NaT → None)"""
+    frame = frame.astype(object)
+    return frame.where(frame.notna(), None).to_dict('records')
+
+
+def _build_promotion_upload_records(df: pd.DataFrame, brand_map: dict, channel_map: dict,
+                                    promotion_type_map: dict, product_map: dict):
+    """
+    통합 업로드 DataFrame → (행사 레코드, 행사 상품 레코드)
+
+    - 행사 단위 그룹: 행사ID가 있으면 행사ID, 없으면 브랜드+채널+행사유형+시작일+행사명
+    - 그룹 번호는 groupby().ngroup() (파일 등장 순서), 행사 속성은 그룹의 첫 행 기준
+    - 신규 행사 PromotionID = {BrandCode 2자리}{TypeCode}{YYMM}{순번 2자리}, 접두사별 DB 최대 순번 다음부터
+    - 행사 예상매출/예상수량 = 상품 행 합계
+    """
+    brand = _text_column(df, 'BrandName')
+    channel = _text_column(df, 'ChannelName')
+    promo_type = _text_column(df, 'PromotionType')
+    promo_name = _text_column(df, 'PromotionName')
+    promo_id = _text_column(df, 'PromotionID')
+    start_date = df['StartDate'].dt.strftime('%Y-%m-%d')
+
+    # 1. 그룹 키 → 그룹 번호
+    composite_key = (
+        brand.fillna('') + '_' + channel.fillna('') + '_' + promo_type.fillna('') + '_'
+        + start_date + '_' + promo_name.fillna('')
+    )
+    group_key = promo_id.where(promo_id.notna(), composite_key)
+    group_no = group_key.groupby(group_key, sort=False).ngroup()
+
+    # 2. 그룹 첫 행 (groupby().first()는 컬럼별 첫 non-null 값이라 행이 섞이므로 첫 행을 그대로 사용)
+    first = ~group_no.duplicated()
+    groups = pd.DataFrame({
+        'RowNum': df.index[first.values] + 2,
+        'PromotionID': promo_id[first],
+        'IsNew': promo_id[first].isna(),
+        'BrandName': brand[first],
+        'ChannelName': channel[first],
+        'PromotionType': promo_type[first],
+        'PromotionName': promo_name[first],
+        'StartDate': df.loc[first, 'StartDate'],
+        'EndDate': df.loc[first, 'EndDate'],
+    }, index=df.index[first.values])
+    groups.index = group_no[first].values
+
+    # 3. 신규 행사 PromotionID 할당 (접두사별 순번)
+    brand_codes = {name: (info.get('BrandCode') or '')[:2] for name, info in brand_map.items()}
+    type_codes = {name: info.get('TypeCode') or '' for name, info in promotion_type_map.items()}
+    b_code = _map_column(groups['BrandName'], brand_codes).fillna('')
+    t_code = _map_column(groups['PromotionType'], type_codes).fillna('')
+    prefix = b_code + t_code + groups['StartDate'].dt.strftime('%y%m')
+
+    invalid = groups['IsNew'] & ((b_code == '') | (t_code == ''))
+    if invalid.any():
+        row_num = int(groups.loc[invalid, 'RowNum'].iloc[0])
+        raise HTTPException(400, f"행사ID를 생성할 수 없습니다. BrandCode, 행사유형, 시작일을 확인해주세요. (행 {row_num})")
+
+    new_prefix = prefix[groups['IsNew']]
+    if len(new_prefix):
+        max_sequences = promotion_repo.get_max_sequences_by_prefixes(new_prefix.unique().tolist())
+        sequence = new_prefix.groupby(new_prefix).cumcount() + 1 + _map_column(new_prefix, max_sequences).fillna(0).astype(int)
+        new_ids = new_prefix + sequence.map('{:02d}'.format)
+        groups.loc[new_ids.index, 'PromotionID'] = new_ids
+        for promotion_id in new_ids:
+            print(f"   [PromotionID 자동 생성] {promotion_id}")
+
+    # 4. 행사 레코드
+    group_sales = _column(df, 'ProdExpectedSalesAmount').groupby(group_no).sum(min_count=1)
+    group_qty = _column(df, 'ProdExpectedQuantity').groupby(group_no).sum(min_count=1)
+    type_names = {name: info.get('DisplayName') for name, info in promotion_type_map.items()}
+
+    promotion_frame = pd.DataFrame({
+        'PromotionID': groups['PromotionID'],
+        'PromotionName': groups['PromotionName'],
+        'PromotionType': _map_column(groups['PromotionType'], type_names).where(lambda x: x.notna(), groups['PromotionType']),
+        'StartDate': groups['StartDate'].dt.strftime('%Y-%m-%d'),
+        'StartTime': _column(df, 'StartTime')[first].map(format_time_value).values,
+        'EndDate': groups['EndDate'].dt.strftime('%Y-%m-%d'),
+        'EndTime': _column(df, 'EndTime')[first].map(lambda v: format_time_value(v, '23:59:59')).values,
+        'BrandID': _map_column(groups['BrandName'], {n: i['BrandID'] for n, i in brand_map.items()}),
+        'BrandName': _map_column(groups['BrandName'], {n: i['BrandName'] for n, i in brand_map.items()}),
+        'ChannelID': _map_column(groups['ChannelName'], {n: i['ChannelID'] for n, i in channel_map.items()}),
+        'ChannelName': _map_column(groups['ChannelName'], {n: i['ChannelName'] for n, i in channel_map.items()}),
+        'CommissionRate': _column(df, 'CommissionRate')[first].values,
+        'DiscountOwner': _text_column(df, 'DiscountOwner')[first].values,
+        'CompanyShare': _column(df, 'CompanyShare')[first].values,
+        'ChannelShare': _column(df, 'ChannelShare')[first].values,
+        'ExpectedSalesAmount': group_sales.where(group_sales > 0),
+        'ExpectedQuantity': _map_column(group_qty.index.to_series(), {k: int(v) for k, v in group_qty.items() if v > 0}),
+        'Notes': _text_column(df, 'PromoNotes', strip=False)[first].values,
+        '_row_num': groups['RowNum'],
+        '_is_new': groups['IsNew'],
+    }, index=groups.index)
+    promotion_records = _to_records(promotion_frame)
+
+    # 5. 행사 상품 레코드 (품목코드 없는 행은 제외)
+    erp_code = _text_column(df, 'ERPCode')
+    has_product = erp_code.notna()
+    product_codes = erp_code[has_product]
+    product_ids = pd.to_numeric(_column(df, 'PromotionProductID')[has_product], errors='coerce')
+    file_names = _text_column(df, 'ProductName')[has_product]
+    master_names = _map_column(product_codes, {c: i['ProductName'] for c, i in product_map.items()})
+
+    product_frame = pd.DataFrame({
+        'PromotionProductID': pd.Series([int(v) if pd.notna(v) else None for v in product_ids], index=product_codes.index, dtype=object),
+        'PromotionID': group_no[has_product].map(groups['PromotionID']),
+        'ERPCode': product_codes,
+        'UniqueCode': _map_column(product_codes, {c: i['UniqueCode'] for c, i in product_map.items()}),
+        'ProductName': master_names.where(master_names.notna(), file_names),
+        'SellingPrice': _column(df, 'SellingPrice')[has_product],
+        'PromotionPrice': _column(df, 'PromotionPrice')[has_product],
+        'SupplyPrice': _column(df, 'SupplyPrice')[has_product],
+        'CouponDiscountRate': _column(df, 'CouponDiscountRate')[has_product],
+        'UnitCost': _column(df, 'UnitCost')[has_product],
+        'LogisticsCost': _column(df, 'LogisticsCost')[has_product],
+        'ManagementCost': _column(df, 'ManagementCost')[has_product],
+        'WarehouseCost': _column(df, 'WarehouseCost')[has_product],
+        'EDICost': _column(df, 'EDICost')[has_product],
+        'MisCost': _column(df, 'MisCost')[has_product],
+        'ExpectedSalesAmount': _column(df, 'ProdExpectedSalesAmount')[has_product],
+        'ExpectedQuantity': _column(df, 'ProdExpectedQuantity')[has_product],
+        'Notes': _text_column(df, 'ProdNotes', strip=False)[has_product],
+        '_row_num': product_codes.index + 2,
+    }, index=product_codes.index)
+    product_records = _to_records(product_frame)
+
+    return promotion_records, product_records
+
+
 # ========== 행사 단일 CRUD ==========
 
 @router.get("/{promotion_id}")
@@ -1266,6 +1209,29 @@ async def bulk_delete_promotions(
         raise HTTPException(500, f"일괄 삭제 실패: {str(e)}")
 
 
+@router.post("/filter-delete")
+@log_activity("BULK_DELETE", "Promotion")
+async def filter_delete_promotions(
+    request_body: FilterBulkRequest,
+    request: Request,
+    user: CurrentUser = Depends(require_permission("Promotion", "DELETE"))
+):
+    """필터 조건으로 행사 일괄 삭제 (PromotionProduct도 함께 삭제)"""
+    try:
+        deleted_count = promotion_repo.delete_by_filters(request_body.filters, request_body.exclude_ids)
+
+        return {
+            "message": "삭제되었습니다",
+            "deleted_count": deleted_count,
+            "filter": request_body.filters,
+            "exclude_ids": request_body.exclude_ids
+        }
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except Exception as e:
+        raise HTTPException(500, f"일괄 삭제 실패: {str(e)}")
+
+
 # ==========================================================
 #  PromotionProduct Router (행사 상품 CRUD)
 # ==========================================================
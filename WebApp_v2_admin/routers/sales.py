@@ -16,7 +16,8 @@ from repositories import SalesRepository, ActivityLogRepository
 from core import get_db_cursor
 from core.dependencies import get_client_ip, CurrentUser
 from core import log_activity, log_delete, log_bulk_delete, require_permission
-from core.models import BulkDeleteRequest
+from core.jobs import job_manager, Job
+from core.models import BulkDeleteRequest, FilterBulkRequest, FilterBulkUpdateRequest
 from utils import send_sync_notification, send_erpsales_upload_notification
 from utils.excel import SalesExcelHandler
 
@@ -129,10 +130,42 @@ async def get_sales(
         )
 
         return result
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     except Exception as e:
         raise HTTPException(500, f"판매 데이터 조회 실패: {str(e)}")
 
 
+@router.get("/monthly-summary")
+async def get_sales_monthly_summary(
+    start_month: str,
+    end_month: Optional[str] = None,
+    brand_id: Optional[int] = None,
+    channel_id: Optional[int] = None,
+    group_by: str = "brand,channel",
+    user: CurrentUser = Depends(require_permission("Sales", "READ"))
+):
+    """
+    월별 판매 집계 (월별 대시보드 / 목표 대비 실적용)
+
+    - group_by: brand, channel, product 중 쉼표 구분 (년월은 항상 포함)
+    """
+    try:
+        dimensions = [d.strip() for d in group_by.split(",") if d.strip()]
+        invalid = [d for d in dimensions if d not in SalesRepository.MONTHLY_DIMENSIONS]
+        if invalid:
+            raise HTTPException(400, f"지원하지 않는 group_by: {', '.join(invalid)}")
+
+        data = sales_repo.get_monthly_summary(start_month, end_month, brand_id, channel_id, dimensions)
+        return {"data": data, "total": len(data)}
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except Exception as e:
+        raise HTTPException(500, f"월별 판매 집계 조회 실패: {str(e)}")
+
+
 @router.get("/{idx}")
 async def get_sales_item(idx: int, user: CurrentUser = Depends(require_permission("Sales", "READ"))):
     """ERPSales 단일 조회"""
@@ -263,6 +296,63 @@ async def bulk_update_sales(
         raise HTTPException(500, f"일괄 수정 실패: {str(e)}")
 
 
+@router.post("/filter-delete")
+@log_activity("BULK_DELETE", "ERPSales")
+async def filter_delete_sales(
+    request_body: FilterBulkRequest,
+    request: Request,
+    user: CurrentUser = Depends(require_permission("Sales", "DELETE"))
+):
+    """필터 조건으로 ERPSales 일괄 삭제 (전체 선택 - 제외 ID)"""
+    try:
+        deleted_count = sales_repo.delete_by_filters(request_body.filters, request_body.exclude_ids)
+
+        return {
+            "message": "삭제되었습니다",
+            "deleted_count": deleted_count,
+            "filter": request_body.filters,
+            "exclude_ids": request_body.exclude_ids
+        }
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except Exception as e:
+        raise HTTPException(500, f"일괄 삭제 실패: {str(e)}")
+
+
+@router.post("/filter-update")
+@log_activity("BULK_UPDATE", "ERPSales")
+async def filter_update_sales(
+    request_body: FilterBulkUpdateRequest,
+    request: Request,
+    user: CurrentUser = Depends(require_permission("Sales", "UPDATE"))
+):
+    """필터 조건으로 ERPSales 일괄 수정 (전체 선택 - 제외 ID)"""
+    try:
+        if not request_body.updates:
+            raise HTTPException(400, "수정할 데이터가 없습니다")
+
+        invalid = set(request_body.updates) - set(SalesUpdate.__fields__)
+        if invalid:
+            raise HTTPException(400, f"수정할 수 없는 필드: {', '.join(sorted(invalid))}")
+
+        updated_count = sales_repo.update_by_filters(
+            request_body.filters, request_body.updates, request_body.exclude_ids
+        )
+
+        return {
+            "updated_count": updated_count,
+            "filter": request_body.filters,
+            "exclude_ids": request_body.exclude_ids,
+            "updates": request_body.updates
+        }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except Exception as e:
+        raise HTTPException(500, f"일괄 수정 실패: {str(e)}")
+
+
 # ========== 엑셀 업로드/다운로드 ==========
 
 @router.get("/download/template")
@@ -306,20 +396,35 @@ async def upload_excel(
     user: CurrentUser = Depends(require_permission("Sales", "UPLOAD"))
 ):
     """
-    엑셀 파일 업로드 및 ERPSales에 삽입 (대용량 지원 - 배치 처리)
+    엑셀 파일 업로드 (백그라운드 작업 등록 후 job_id 즉시 반환)
+    - 진행률/결과: GET /api/jobs/{job_id} 또는 /api/jobs/{job_id}/events
+    """
+    SalesExcelHandler().validate_file(file)
+    content = await file.read()
+
+    job = job_manager.submit(
+        "ERPSALES_UPLOAD", _process_sales_upload,
+        file.filename, content, user, get_client_ip(request) if request else None,
+        title=file.filename, user_id=user.user_id
+    )
+    return {"job_id": job.job_id, "status": job.status}
+
+
+def _process_sales_upload(job: Job, filename: str, content: bytes, user: CurrentUser, ip_address: Optional[str]):
+    """
+    엑셀 파일을 ERPSales에 삽입 (대용량 지원 - 배치 처리, 백그라운드 작업)
     """
     try:
         start_time = datetime.now()
 
         # 핸들러 초기화
         handler = SalesExcelHandler()
-        handler.validate_file(file)
 
-        print(f"\n[엑셀 업로드 시작] {file.filename}")
+        print(f"\n[엑셀 업로드 시작] {filename}")
 
         # 파일 읽기
-        excel_file = await handler.read_file(file)
-        df = pd.read_excel(excel_file)
+        job.set_message("엑셀 파일 읽는 중")
+        df = pd.read_excel(io.BytesIO(content))
         print(f"   총 {len(df):,}행 로드됨")
 
         # 전처리 (칼럼 매핑, 날짜 변환, NULL 처리)
@@ -344,6 +449,7 @@ async def upload_excel(
         print(f"   데이터 전처리 완료: {len(df):,}행")
 
         # 매핑 테이블 로드
+        job.set_message("매핑 테이블 로드 중")
         mapping_counts = handler.load_sales_mappings()
         print(f"   매핑 테이블 로드 완료 (Brand:{mapping_counts['brand']}, Product:{mapping_counts['product']}, Channel:{mapping_counts['channel']}, Detail:{mapping_counts['channel_detail']}, Warehouse:{mapping_counts['warehouse']})")
 
@@ -355,6 +461,8 @@ async def upload_excel(
         total_batches = (len(df) + BATCH_SIZE - 1) // BATCH_SIZE
 
         print(f"   배치 처리 시작 (배치 크기: {BATCH_SIZE}, 총 배치: {total_batches})")
+        job.update_progress(0, len(df), "저장 중")
+        processed_rows = 0
 
         merge_sql = """
             MERGE INTO [dbo].[ERPSales] AS target
@@ -446,6 +554,10 @@ async def upload_excel(
                             }
                         })
 
+                    # 행 단위 진행률 (DB 저장은 Job에서 주기적으로)
+                    processed_rows += 1
+                    job.update_progress(processed_rows)
+
                 if (batch_num + 1) % 5 == 0 or (batch_num + 1) == total_batches:
                     progress_pct = (batch_num + 1) / total_batches * 100
                     print(f"   진행: {batch_num + 1}/{total_batches} 배치 (삽입:{inserted_count:,}, 수정:{updated_count:,}, 실패:{len(failed_rows)}, {progress_pct:.1f}%)")
@@ -457,14 +569,14 @@ async def upload_excel(
         warnings = handler.get_unmapped_summary()
 
         # 활동 로그 기록 (엑셀 업로드)
-        if user and request:
+        if user:
             activity_log_repo.log_action(
                 user_id=user.user_id,
                 action_type="CREATE",
                 target_table="ERPSales",
                 details={
                     "action": "EXCEL_UPLOAD",
-                    "filename": file.filename,
+                    "filename": filename,
                     "total_rows": len(df),
                     "inserted": inserted_count,
                     "updated": updated_count,
@@ -472,7 +584,7 @@ async def upload_excel(
                     "date_range": date_range,
                     "duration_seconds": duration
                 },
-                ip_address=get_client_ip(request)
+                ip_address=ip_address
             )
 
         # 리포트
@@ -524,7 +636,6 @@ async def upload_excel(
 
 
 @router.post("/sync-to-orders")
-@log_activity("SYNC", "OrdersRealtime")
 async def sync_erpsales_to_orders(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
@@ -532,7 +643,26 @@ async def sync_erpsales_to_orders(
     user: CurrentUser = Depends(require_permission("Sales", "UPDATE"))
 ):
     """
-    ERPSales 데이터를 OrdersRealtime으로 동기화 (MERGE 방식)
+    ERPSales → OrdersRealtime 동기화 (백그라운드 작업 등록 후 job_id 즉시 반환)
+    - 진행 상태/결과: GET /api/jobs/{job_id} 또는 /api/jobs/{job_id}/events
+    """
+    job = job_manager.submit(
+        "ERPSALES_SYNC", _process_sync_to_orders,
+        start_date, end_date, user, get_client_ip(request) if request else None,
+        title=f"{start_date or '전체'} ~ {end_date or '전체'}", user_id=user.user_id
+    )
+    return {"job_id": job.job_id, "status": job.status}
+
+
+def _process_sync_to_orders(
+    job: Job,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    user: CurrentUser,
+    ip_address: Optional[str]
+):
+    """
+    ERPSales 데이터를 OrdersRealtime으로 동기화 (MERGE 방식, 백그라운드 작업)
 
     - Channel.LiveSource = 'ERP'인 모든 채널 동기화
     - SourceOrderID (ERPIDX) 기준으로 중복 체크
@@ -546,6 +676,7 @@ async def sync_erpsales_to_orders(
             print(f"   종료 날짜: {end_date}")
 
         start_time = datetime.now()
+        job.set_message("OrdersRealtime 동기화 중")
 
         with get_db_cursor(commit=True) as cursor:
             sql = """
@@ -589,7 +720,7 @@ async def sync_erpsales_to_orders(
         except Exception as slack_error:
             print(f"[경고] Slack 알림 전송 실패: {str(slack_error)}")
 
-        return {
+        result = {
             "action": "SYNC_FROM_ERPSALES",
             "status": status,
             "insert_count": insert_count,
@@ -600,6 +731,21 @@ async def sync_erpsales_to_orders(
             "end_date": end_date
         }
 
+        # 활동 로그 기록 (요청 스레드 밖에서 실행되므로 데코레이터 대신 직접 기록)
+        if user:
+            try:
+                activity_log_repo.log_action(
+                    user_id=user.user_id,
+                    action_type="SYNC",
+                    target_table="OrdersRealtime",
+                    details=result,
+                    ip_address=ip_address
+                )
+            except Exception as log_error:
+                print(f"[WARNING] 동기화 활동 로그 기록 실패: {log_error}")
+
+        return result
+
     except Exception as e:
         print(f"\n[ERROR] 동기화 실패: {str(e)}")
         import traceback
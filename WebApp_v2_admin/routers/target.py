@@ -13,22 +13,28 @@ import io
 from datetime import datetime
 from repositories.target_base_repository import TargetBaseRepository
 from repositories.target_promotion_repository import TargetPromotionRepository
-from repositories import BrandRepository, ChannelRepository, ProductRepository, ActivityLogRepository
+from repositories import BrandRepository, ChannelRepository, ProductRepository, ProductBoxRepository, ActivityLogRepository, SalesRepository
 from core import get_db_cursor
 from core.dependencies import get_client_ip, CurrentUser
-from core import log_activity, log_delete, log_bulk_delete, require_permission
+from core import log_activity, log_delete, log_bulk_delete, require_permission, cache_response, invalidate_on_write
+from core.jobs import job_manager, Job
 from core.models import BulkDeleteRequest
 from utils.helpers import format_time_value
 
 
 # ========== 정기 목표 Router ==========
-router = APIRouter(prefix="/api/targets/base", tags=["TargetBase"])
+router = APIRouter(
+    prefix="/api/targets/base", tags=["TargetBase"],
+    dependencies=[Depends(invalidate_on_write("target_base"))]
+)
 
 # Repository 인스턴스
 target_base_repo = TargetBaseRepository()
 brand_repo = BrandRepository()
 channel_repo = ChannelRepository()
 product_repo = ProductRepository()
+box_repo = ProductBoxRepository()
+sales_repo = SalesRepository()
 activity_log_repo = ActivityLogRepository()
 
 
@@ -63,6 +69,7 @@ class FilterDeleteRequest(BaseModel):
     year_month: str
     brand_id: Optional[int] = None
     channel_id: Optional[int] = None
+    exclude_ids: List[int] = []
 
 
 class TargetBaseBulkUpdateItem(BaseModel):
@@ -124,7 +131,8 @@ async def get_target_base_list(
 
 
 @router.get("/year-months")
-async def get_target_base_year_months(user: CurrentUser = Depends(require_permission("Target", "READ"))):
+@cache_response("target_base", ttl=60)
+async def get_target_base_year_months(request: Request, user: CurrentUser = Depends(require_permission("Target", "READ"))):
     """정기 목표 년월 목록 조회"""
     try:
         year_months = target_base_repo.get_year_months()
@@ -139,14 +147,32 @@ async def get_target_base_channels(
     brand_id: Optional[int] = None,
     user: CurrentUser = Depends(require_permission("Target", "READ"))
 ):
-    """채널별 정기 목표 요약 조회 (마스터 패널용)"""
+    """채널별 정기 목표 요약 조회 (마스터 패널용, 월별 집계 기준 실적 포함)"""
     try:
         if not year_month:
             raise HTTPException(400, "년월은 필수입니다")
         channels = target_base_repo.get_channels_summary(year_month, brand_id)
+
+        # 목표 대비 실적 - 월별 집계 뷰에서 채널별 합계만 조회 (집계 뷰 없으면 실적 없이 반환)
+        try:
+            actuals = {
+                row["ChannelID"]: row
+                for row in sales_repo.get_monthly_summary(year_month, brand_id=brand_id, group_by=('channel',))
+            }
+        except Exception as e:
+            print(f"[WARNING] 월별 실적 조회 실패: {e}")
+            actuals = {}
+
+        for channel in channels:
+            actual = actuals.get(channel["ChannelID"])
+            channel["ActualAmount"] = actual["TaxableAmount"] if actual else 0
+            channel["ActualQuantity"] = actual["Quantity"] if actual else 0
+
         return {"data": channels, "total": len(channels)}
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     except Exception as e:
         raise HTTPException(500, f"채널 요약 조회 실패: {str(e)}")
 
@@ -300,16 +326,8 @@ async def download_target_base(
         channel_names = [ch['Name'] for ch in channels]
         brand_names = [br['Name'] for br in brands]
 
-        # 품목코드 드롭다운용 목록 조회 (Status = 'YES'인 제품만)
-        with get_db_cursor(commit=False) as cursor:
-            cursor.execute("""
-                SELECT DISTINCT pb.ERPCode
-                FROM ProductBox pb
-                INNER JOIN Product p ON pb.ProductID = p.ProductID
-                WHERE p.Status = 'YES'
-                ORDER BY pb.ERPCode
-            """)
-            erp_codes = [row[0] for row in cursor.fetchall()]
+        # 품목코드 드롭다운용 목록 조회 (Status = 'YES'인 제품만, 참조 데이터 캐시)
+        erp_codes = box_repo.get_active_erp_codes()
 
         output = io.BytesIO()
         with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
@@ -567,13 +585,16 @@ async def filter_delete_target_base(
         deleted_count = target_base_repo.delete_by_filter(
             year_month=request_body.year_month,
             brand_id=request_body.brand_id,
-            channel_id=request_body.channel_id
+            channel_id=request_body.channel_id,
+            exclude_ids=request_body.exclude_ids
         )
 
         return {
             "deleted_count": deleted_count,
             "filter": request_body.dict()
         }
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     except Exception as e:
         raise HTTPException(500, f"일괄 삭제 실패: {str(e)}")
 
@@ -586,18 +607,30 @@ async def upload_target_base(
     request: Request = None,
     user: CurrentUser = Depends(require_permission("Target", "UPLOAD"))
 ):
-    """정기 목표 엑셀 업로드"""
+    """정기 목표 엑셀 업로드 (백그라운드 작업 등록 후 job_id 즉시 반환)"""
+    # 파일 확장자 검증
+    if not file.filename.endswith(('.xlsx', '.xls')):
+        raise HTTPException(400, "엑셀 파일(.xlsx, .xls)만 업로드 가능합니다")
+
+    content = await file.read()
+
+    job = job_manager.submit(
+        "TARGET_BASE_UPLOAD", _process_target_base_upload,
+        file.filename, content, user, get_client_ip(request) if request else None,
+        title=file.filename, user_id=user.user_id, invalidates=("target_base",)
+    )
+    return {"job_id": job.job_id, "status": job.status}
+
+
+def _process_target_base_upload(job: Job, filename: str, content: bytes, user: CurrentUser, ip_address: Optional[str]):
+    """정기 목표 엑셀 업로드 처리 (백그라운드 작업)"""
     try:
         upload_start_time = datetime.now()
 
-        # 파일 확장자 검증
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(400, "엑셀 파일(.xlsx, .xls)만 업로드 가능합니다")
-
-        print(f"\n[정기 목표 업로드 시작] {file.filename}")
+        print(f"\n[정기 목표 업로드 시작] {filename}")
 
         # 파일 읽기
-        content = await file.read()
+        job.set_message("엑셀 파일 읽는 중")
         excel_file = io.BytesIO(content)
         df = pd.read_excel(excel_file)
         print(f"   총 {len(df):,}행 로드됨")
@@ -734,7 +767,7 @@ async def upload_target_base(
             })
 
         # UPSERT 실행
-        result = target_base_repo.bulk_upsert(records)
+        result = target_base_repo.bulk_upsert(records, progress_callback=job.progress_callback("저장 중"))
 
         upload_end_time = datetime.now()
         duration = (upload_end_time - upload_start_time).total_seconds()
@@ -752,20 +785,20 @@ async def upload_target_base(
             raise HTTPException(400, "중복 데이터가 있습니다. ID 없이 신규 입력 시 기존 데이터와 중복될 수 없습니다.\n" + "\n".join(error_messages))
 
         # 활동 로그
-        if user and request:
+        if user:
             activity_log_repo.log_action(
                 user_id=user.user_id,
                 action_type="CREATE",
                 target_table="TargetBaseProduct",
                 details={
                     "action": "EXCEL_UPLOAD",
-                    "filename": file.filename,
+                    "filename": filename,
                     "total_rows": len(df),
                     "inserted": result['inserted'],
                     "updated": result['updated'],
                     "duration_seconds": duration
                 },
-                ip_address=get_client_ip(request)
+                ip_address=ip_address
             )
 
         print(f"   업로드 완료: {result['inserted']}건 삽입, {result['updated']}건 수정")
@@ -785,7 +818,10 @@ async def upload_target_base(
 
 
 # ========== 비정기 목표 Router ==========
-promotion_router = APIRouter(prefix="/api/targets/promotion", tags=["TargetPromotion"])
+promotion_router = APIRouter(
+    prefix="/api/targets/promotion", tags=["TargetPromotion"],
+    dependencies=[Depends(invalidate_on_write("target_promotion"))]
+)
 
 # Repository 인스턴스
 target_promotion_repo = TargetPromotionRepository()
@@ -833,6 +869,7 @@ class PromotionFilterDeleteRequest(BaseModel):
     brand_id: Optional[int] = None
     channel_id: Optional[int] = None
     promotion_type: Optional[str] = None
+    exclude_ids: List[int] = []
 
 
 class TargetPromoBulkUpdateItem(BaseModel):
@@ -899,7 +936,8 @@ async def get_target_promotion_list(
 
 
 @promotion_router.get("/year-months")
-async def get_target_promotion_year_months(user: CurrentUser = Depends(require_permission("Target", "READ"))):
+@cache_response("target_promotion", ttl=60)
+async def get_target_promotion_year_months(request: Request, user: CurrentUser = Depends(require_permission("Target", "READ"))):
     """비정기 목표 년월 목록 조회"""
     try:
         year_months = target_promotion_repo.get_year_months()
@@ -909,7 +947,8 @@ async def get_target_promotion_year_months(user: CurrentUser = Depends(require_p
 
 
 @promotion_router.get("/promotion-types")
-async def get_promotion_types(user: CurrentUser = Depends(require_permission("Target", "READ"))):
+@cache_response("target_promotion", ttl=300)
+async def get_promotion_types(request: Request, user: CurrentUser = Depends(require_permission("Target", "READ"))):
     """행사유형 목록 조회 (드롭다운용)"""
     try:
         promotion_types = target_promotion_repo.get_promotion_types()
@@ -1111,16 +1150,8 @@ async def download_target_promotion(
         brand_names = [br['Name'] for br in brands]
         promotion_types = ['에누리', '쿠폰', '판매가+쿠폰', '판매가할인', '정산후보정', '기획상품', '원매가할인', '공동구매']
 
-        # 품목코드 드롭다운용 목록 조회 (Status = 'YES'인 제품만)
-        with get_db_cursor(commit=False) as cursor:
-            cursor.execute("""
-                SELECT DISTINCT pb.ERPCode
-                FROM ProductBox pb
-                INNER JOIN Product p ON pb.ProductID = p.ProductID
-                WHERE p.Status = 'YES'
-                ORDER BY pb.ERPCode
-            """)
-            erp_codes = [row[0] for row in cursor.fetchall()]
+        # 품목코드 드롭다운용 목록 조회 (Status = 'YES'인 제품만, 참조 데이터 캐시)
+        erp_codes = box_repo.get_active_erp_codes()
 
         output = io.BytesIO()
         with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
@@ -1391,13 +1422,16 @@ async def filter_delete_target_promotion(
             year_month=request_body.year_month,
             brand_id=request_body.brand_id,
             channel_id=request_body.channel_id,
-            promotion_type=request_body.promotion_type
+            promotion_type=request_body.promotion_type,
+            exclude_ids=request_body.exclude_ids
         )
 
         return {
             "deleted_count": deleted_count,
             "filter": request_body.dict()
         }
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     except Exception as e:
         raise HTTPException(500, f"일괄 삭제 실패: {str(e)}")
 
@@ -1410,16 +1444,28 @@ async def upload_target_promotion(
     request: Request = None,
     user: CurrentUser = Depends(require_permission("Target", "UPLOAD"))
 ):
-    """비정기 목표 엑셀 업로드"""
+    """비정기 목표 엑셀 업로드 (백그라운드 작업 등록 후 job_id 즉시 반환)"""
+    if not file.filename.endswith(('.xlsx', '.xls')):
+        raise HTTPException(400, "엑셀 파일(.xlsx, .xls)만 업로드 가능합니다")
+
+    content = await file.read()
+
+    job = job_manager.submit(
+        "TARGET_PROMOTION_UPLOAD", _process_target_promotion_upload,
+        file.filename, content, user, get_client_ip(request) if request else None,
+        title=file.filename, user_id=user.user_id, invalidates=("target_promotion",)
+    )
+    return {"job_id": job.job_id, "status": job.status}
+
+
+def _process_target_promotion_upload(job: Job, filename: str, content: bytes, user: CurrentUser, ip_address: Optional[str]):
+    """비정기 목표 엑셀 업로드 처리 (백그라운드 작업)"""
     try:
         upload_start_time = datetime.now()
 
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(400, "엑셀 파일(.xlsx, .xls)만 업로드 가능합니다")
-
-        print(f"\n[비정기 목표 업로드 시작] {file.filename}")
+        print(f"\n[비정기 목표 업로드 시작] {filename}")
 
-        content = await file.read()
+        job.set_message("엑셀 파일 읽는 중")
         excel_file = io.BytesIO(content)
         df = pd.read_excel(excel_file)
         print(f"   총 {len(df):,}행 로드됨")
@@ -1749,7 +1795,7 @@ async def upload_target_promotion(
                 'Notes': str(row['Notes']) if pd.notna(row.get('Notes')) else None,
             })
 
-        result = target_promotion_repo.bulk_upsert(records)
+        result = target_promotion_repo.bulk_upsert(records, progress_callback=job.progress_callback("저장 중"))
 
         upload_end_time = datetime.now()
         duration = (upload_end_time - upload_start_time).total_seconds()
@@ -1766,20 +1812,20 @@ async def upload_target_promotion(
                 error_messages.append(f"... 외 {len(duplicates) - 10}건 더 있음")
             raise HTTPException(400, "중복 데이터가 있습니다.\n" + "\n".join(error_messages))
 
-        if user and request:
+        if user:
             activity_log_repo.log_action(
                 user_id=user.user_id,
                 action_type="CREATE",
                 target_table="TargetPromotionProduct",
                 details={
                     "action": "EXCEL_UPLOAD",
-                    "filename": file.filename,
+                    "filename": filename,
                     "total_rows": len(df),
                     "inserted": result['inserted'],
                     "updated": result['updated'],
                     "duration_seconds": duration
                 },
-                ip_address=get_client_ip(request)
+                ip_address=ip_address
             )
 
         print(f"   업로드 완료: {result['inserted']}건 삽입, {result['updated']}건 수정")
@@ -15,8 +15,8 @@ from repositories.withdrawal_plan_repository import WithdrawalPlanRepository
 from repositories import ProductRepository, ActivityLogRepository
 from core import get_db_cursor
 from core.dependencies import get_client_ip, CurrentUser
-from core import log_activity, log_delete, log_bulk_delete, require_permission
-from core.models import BulkDeleteAnyRequest as BulkDeleteRequest
+from core import log_activity, log_delete, log_bulk_delete, require_permission, cache_response, invalidate_on_write
+from core.models import BulkDeleteAnyRequest as BulkDeleteRequest, FilterBulkRequest
 
 
 # ========== Repository 인스턴스 ==========
@@ -62,7 +62,10 @@ class WithdrawalPlanBulkUpdateRequest(BaseModel):
 # ==========================================================
 #  WithdrawalPlan Router
 # ==========================================================
-router = APIRouter(prefix="/api/withdrawal-plans", tags=["WithdrawalPlan"])
+router = APIRouter(
+    prefix="/api/withdrawal-plans", tags=["WithdrawalPlan"],
+    dependencies=[Depends(invalidate_on_write("withdrawal_plan"))]
+)
 
 
 # ========== 캠페인 그룹 목록 (마스터) ==========
@@ -154,7 +157,8 @@ async def get_withdrawal_plans(
 # ========== 메타데이터 ==========
 
 @router.get("/types")
-async def get_withdrawal_types(user: CurrentUser = Depends(require_permission("WithdrawalPlan", "READ"))):
+@cache_response("withdrawal_plan", ttl=300)
+async def get_withdrawal_types(request: Request, user: CurrentUser = Depends(require_permission("WithdrawalPlan", "READ"))):
     """사용유형 목록"""
     try:
         return {"types": plan_repo.get_types()}
@@ -163,7 +167,8 @@ async def get_withdrawal_types(user: CurrentUser = Depends(require_permission("W
 
 
 @router.get("/year-months")
-async def get_year_months(user: CurrentUser = Depends(require_permission("WithdrawalPlan", "READ"))):
+@cache_response("withdrawal_plan", ttl=60)
+async def get_year_months(request: Request, user: CurrentUser = Depends(require_permission("WithdrawalPlan", "READ"))):
     """년월 목록"""
     try:
         return {"year_months": plan_repo.get_year_months()}
@@ -688,6 +693,28 @@ async def bulk_delete_withdrawal_plans(
         raise HTTPException(500, f"일괄 삭제 실패: {str(e)}")
 
 
+@router.post("/filter-delete")
+@log_activity("BULK_DELETE", "WithdrawalPlan")
+async def filter_delete_withdrawal_plans(
+    data: FilterBulkRequest,
+    request: Request,
+    user: CurrentUser = Depends(require_permission("WithdrawalPlan", "DELETE"))
+):
+    """필터 조건으로 일괄 삭제"""
+    try:
+        deleted = plan_repo.delete_by_filters(data.filters, data.exclude_ids)
+        return {
+            "message": f"{deleted}건 삭제 완료",
+            "deleted_count": deleted,
+            "filter": data.filters,
+            "exclude_ids": data.exclude_ids
+        }
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except Exception as e:
+        raise HTTPException(500, f"일괄 삭제 실패: {str(e)}")
+
+
 @router.post("/groups/delete")
 @log_activity("DELETE", "WithdrawalPlan", id_key="group_id")
 async def delete_withdrawal_group(
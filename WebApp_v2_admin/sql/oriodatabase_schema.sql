@@ -202,6 +202,36 @@ CREATE TABLE oriodatabase.dbo.AdDataNaver_Frog (
 	 ON [PRIMARY ] ;
 
 
+-- oriodatabase.dbo.BackgroundJob definition
+
+-- Drop table
+
+-- DROP TABLE oriodatabase.dbo.BackgroundJob;
+
+CREATE TABLE oriodatabase.dbo.BackgroundJob (
+	JobID nvarchar(32) COLLATE SQL_Latin1_General_CP1_CI_AS NOT NULL,
+	JobType nvarchar(50) COLLATE SQL_Latin1_General_CP1_CI_AS NOT NULL,
+	Title nvarchar(255) COLLATE SQL_Latin1_General_CP1_CI_AS NULL,
+	Status nvarchar(20) COLLATE SQL_Latin1_General_CP1_CI_AS NOT NULL,
+	Processed int DEFAULT 0 NOT NULL,
+	Total int DEFAULT 0 NOT NULL,
+	Message nvarchar(500) COLLATE SQL_Latin1_General_CP1_CI_AS NULL,
+	[Result] nvarchar(MAX) COLLATE SQL_Latin1_General_CP1_CI_AS NULL,
+	ErrorMessage nvarchar(MAX) COLLATE SQL_Latin1_General_CP1_CI_AS NULL,
+	UserID int NULL,
+	CreatedDate datetime DEFAULT getdate() NULL,
+	StartedDate datetime NULL,
+	FinishedDate datetime NULL,
+	CONSTRAINT PK_BackgroundJob PRIMARY KEY (JobID)
+);
+ CREATE NONCLUSTERED INDEX IX_BackgroundJob_Status ON oriodatabase.dbo.BackgroundJob (  Status ASC  )  
+	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
+	 ON [PRIMARY ] ;
+ CREATE NONCLUSTERED INDEX IX_BackgroundJob_UserID_CreatedDate ON oriodatabase.dbo.BackgroundJob (  UserID ASC  , CreatedDate DESC  )  
+	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
+	 ON [PRIMARY ] ;
+
+
 -- oriodatabase.dbo.Brand definition
 
 -- Drop table
@@ -975,9 +1005,22 @@ CREATE TABLE oriodatabase.dbo.Promotion (
 	Notes nvarchar(MAX) COLLATE SQL_Latin1_General_CP1_CI_AS NULL,
 	CreatedDate datetime DEFAULT getdate() NULL,
 	UpdatedDate datetime DEFAULT getdate() NULL,
+	StartAt AS (CAST(StartDate AS datetime) + CAST(StartTime AS datetime)) PERSISTED,
+	EndAt AS (CAST(EndDate AS datetime) + CAST(EndTime AS datetime)) PERSISTED,
 	CONSTRAINT PK__Promotio__52C42F2FB81831C0 PRIMARY KEY (PromotionID),
 	CONSTRAINT FK_Promotion_Brand FOREIGN KEY (BrandID) REFERENCES oriodatabase.dbo.Brand(BrandID)
 );
+ CREATE NONCLUSTERED INDEX IX_Promotion_StartDate ON oriodatabase.dbo.Promotion (  StartDate DESC  )  
+	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
+	 ON [PRIMARY ] ;
+ CREATE NONCLUSTERED INDEX IX_Promotion_StartAt ON oriodatabase.dbo.Promotion (  StartAt ASC  )  
+	 INCLUDE ( EndAt , Status )  
+	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
+	 ON [PRIMARY ] ;
+ CREATE NONCLUSTERED INDEX IX_Promotion_EndAt ON oriodatabase.dbo.Promotion (  EndAt ASC  )  
+	 INCLUDE ( StartAt , Status )  
+	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
+	 ON [PRIMARY ] ;
 
 
 -- oriodatabase.dbo.PromotionProduct definition
@@ -1244,6 +1287,17 @@ CREATE TABLE oriodatabase.dbo.ERPSales (
  CREATE NONCLUSTERED INDEX IX_ERPSales_ProductID ON oriodatabase.dbo.ERPSales (  ProductID ASC  )  
 	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
 	 ON [PRIMARY ] ;
+ CREATE NONCLUSTERED INDEX IX_ERPSales_ChannelName ON oriodatabase.dbo.ERPSales (  ChannelName ASC  )  
+	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
+	 ON [PRIMARY ] ;
+ CREATE NONCLUSTERED INDEX IX_ERPSales_ERPCode ON oriodatabase.dbo.ERPSales (  ERPCode ASC  )  
+	 WITH (  PAD_INDEX = OFF ,FILLFACTOR = 100  ,SORT_IN_TEMPDB = OFF , IGNORE_DUP_KEY = OFF , STATISTICS_NORECOMPUTE = OFF , ONLINE = OFF , ALLOW_ROW_LOCKS = ON , ALLOW_PAGE_LOCKS = ON  )
+	 ON [PRIMARY ] ;
+
+-- 상품명 부분 검색용 전문 검색 인덱스 (선택 - 생성 후 FULLTEXT_SEARCH_ENABLED=true)
+-- CREATE FULLTEXT CATALOG FTC_oriodatabase;
+-- CREATE FULLTEXT INDEX ON oriodatabase.dbo.ERPSales ( PRODUCT_NAME LANGUAGE 1042 )
+-- 	KEY INDEX PK_ERPSales ON FTC_oriodatabase WITH CHANGE_TRACKING AUTO;
 
 
 -- oriodatabase.dbo.OrdersRealtime definition
@@ -1370,4 +1424,37 @@ FROM dbo.AdDataNaver ad
 LEFT JOIN dbo.AdContractNaver c 
     ON ad.Date BETWEEN c.StartDate AND c.EndDate
     AND c.IsActive = 1
-    AND c.BrandID = 3;
\ No newline at end of file
+    AND c.BrandID = 3;
+
+-- dbo.vw_ERPSalesMonthly source
+
+-- 월별 판매 집계 (인덱싱된 뷰 - ERPSales 변경 시 SQL Server가 자동 갱신)
+-- 조회 시 WITH (NOEXPAND) 힌트 사용 (Standard 에디션에서도 집계 인덱스 사용)
+CREATE VIEW dbo.vw_ERPSalesMonthly WITH SCHEMABINDING AS
+SELECT
+    DATEFROMPARTS(YEAR([DATE]), MONTH([DATE]), 1) AS YearMonth,
+    BrandID,
+    ChannelID,
+    ProductID,
+    SUM(ISNULL(Quantity, 0)) AS Quantity,
+    SUM(ISNULL(TaxableAmount, 0)) AS TaxableAmount,
+    COUNT_BIG(*) AS RowCnt
+FROM dbo.ERPSales
+GROUP BY DATEFROMPARTS(YEAR([DATE]), MONTH([DATE]), 1), BrandID, ChannelID, ProductID;
+
+CREATE UNIQUE CLUSTERED INDEX IX_vw_ERPSalesMonthly ON dbo.vw_ERPSalesMonthly (  YearMonth ASC  , BrandID ASC  , ChannelID ASC  , ProductID ASC  );
+
+-- dbo.vw_PromotionProductSummary source
+
+-- 행사별 상품 수 / 예상매출 / 예상수량 합계 (인덱싱된 뷰 - PromotionProduct 변경 시 SQL Server가 자동 갱신)
+-- 행사 마스터 패널(PromotionRepository.get_master_summary)에서 WITH (NOEXPAND)로 조인
+CREATE VIEW dbo.vw_PromotionProductSummary WITH SCHEMABINDING AS
+SELECT
+    PromotionID,
+    COUNT_BIG(*) AS ProductCount,
+    SUM(ISNULL(ExpectedSalesAmount, 0)) AS TotalSalesAmount,
+    SUM(ISNULL(ExpectedQuantity, 0)) AS TotalQuantity
+FROM dbo.PromotionProduct
+GROUP BY PromotionID;
+
+CREATE UNIQUE CLUSTERED INDEX IX_vw_PromotionProductSummary ON dbo.vw_PromotionProductSummary (  PromotionID ASC  );
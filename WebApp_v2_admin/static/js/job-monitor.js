@@ -0,0 +1,88 @@
+/**
+ * Job Monitor Module
+ * - 백그라운드 작업(엑셀 업로드, 동기화 등) 진행 상태 추적
+ * - SSE(/api/jobs/{id}/events) 우선, 실패 시 폴링(/api/jobs/{id})으로 전환
+ */
+
+const JOB_POLL_INTERVAL = 1000;
+const JOB_FINISHED_STATUSES = ['COMPLETED', 'FAILED'];
+
+/**
+ * 작업 완료까지 대기
+ * @param {string} jobId - 작업 ID
+ * @param {function} onProgress - 상태 변경 콜백 (job 객체: Status, Processed, Total, Percent, Message)
+ * @returns {Promise<object>} 완료 시 Result, 실패 시 Error 메시지로 reject
+ */
+function waitForJob(jobId, onProgress = null) {
+    return new Promise((resolve, reject) => {
+        const finish = (job) => {
+            if (job.Status === 'COMPLETED') {
+                resolve(job.Result || {});
+            } else {
+                reject(new Error(job.Error || '작업 실패'));
+            }
+        };
+
+        const handle = (job) => {
+            if (onProgress) onProgress(job);
+            if (JOB_FINISHED_STATUSES.includes(job.Status)) {
+                finish(job);
+                return true;
+            }
+            return false;
+        };
+
+        const poll = async () => {
+            try {
+                const job = await api.get(`/api/jobs/${jobId}`);
+                if (!handle(job)) setTimeout(poll, JOB_POLL_INTERVAL);
+            } catch (e) {
+                reject(e);
+            }
+        };
+
+        if (!window.EventSource) {
+            poll();
+            return;
+        }
+
+        const source = new EventSource(`/api/jobs/${jobId}/events`);
+        let done = false;
+
+        source.onmessage = (event) => {
+            if (handle(JSON.parse(event.data))) {
+                done = true;
+                source.close();
+            }
+        };
+
+        source.onerror = () => {
+            // 연결 끊김 (프록시 타임아웃 등) → 폴링으로 이어서 확인
+            source.close();
+            if (!done) poll();
+        };
+    });
+}
+
+/**
+ * 진행률 바 갱신 헬퍼
+ * @param {object} job - 작업 상태
+ * @param {string} barId - 진행률 바 요소 ID
+ * @param {string} textId - 진행률 텍스트 요소 ID
+ */
+function renderJobProgress(job, barId, textId) {
+    const bar = document.getElementById(barId);
+    const text = document.getElementById(textId);
+    const percent = job.Percent ?? 0;
+
+    if (bar) bar.style.width = percent + '%';
+    if (!text) return;
+
+    if (job.Status === 'QUEUED') {
+        text.textContent = '대기 중...';
+    } else if (job.Total) {
+        text.textContent = `${job.Message || '처리 중'} ${job.Processed.toLocaleString()} / ${job.Total.toLocaleString()} (${percent}%)`;
+    } else {
+        text.textContent = `${job.Message || '처리 중'}...`;
+    }
+}
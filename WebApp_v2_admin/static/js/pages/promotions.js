@@ -808,15 +808,8 @@ async function uploadFile() {
     try {
         document.getElementById('uploadProgress').style.display = 'block';
         document.getElementById('uploadButton').disabled = true;
-
-        let progress = 0;
-        const progressInterval = setInterval(() => {
-            progress += 5;
-            if (progress <= 90) {
-                document.getElementById('progressBar').style.width = progress + '%';
-                document.getElementById('progressText').textContent = progress + '%';
-            }
-        }, 100);
+        document.getElementById('progressBar').style.width = '0%';
+        document.getElementById('progressText').textContent = '파일 전송 중...';
 
         const formData = new FormData();
         formData.append('file', file);
@@ -830,14 +823,9 @@ async function uploadFile() {
             body: formData
         });
 
-        clearInterval(progressInterval);
-        document.getElementById('progressBar').style.width = '100%';
-        document.getElementById('progressText').textContent = '100%';
-
-        uploadModal.hide();
-
         if (!response.ok) {
             const error = await response.json();
+            uploadModal.hide();
             document.getElementById('uploadSuccessSection').style.display = 'none';
             document.getElementById('uploadErrorSection').style.display = 'block';
             document.getElementById('uploadResultTitle').textContent = '업로드 실패';
@@ -846,7 +834,11 @@ async function uploadFile() {
             return;
         }
 
-        const result = await response.json();
+        // 서버는 작업 등록 후 job_id 즉시 반환 → 실제 진행률로 표시
+        const { job_id } = await response.json();
+        const result = await waitForJob(job_id, (job) => renderJobProgress(job, 'progressBar', 'progressText'));
+
+        uploadModal.hide();
 
         document.getElementById('uploadSuccessSection').style.display = 'block';
         document.getElementById('uploadErrorSection').style.display = 'none';
@@ -4,6 +4,11 @@ let currentFilters = {};
 let currentSortBy = null;
 let currentSortDir = null;
 
+// 전체 선택 모드: 현재 필터 조건 전체 - 선택 해제한 행 (서버에서 필터 기준 일괄 처리)
+let selectAllMode = false;
+let excludedIds = new Set();
+let currentTotal = 0;
+
 // 컬럼 정의
 const columns = [
     { key: 'DATE', header: '날짜', sortKey: 'DATE', render: (row) => row.DATE || '-' },
@@ -38,6 +43,7 @@ document.addEventListener('DOMContentLoaded', function () {
         selectable: true,
         idKey: 'IDX',
         onSelectionChange: (selectedIds) => {
+            if (selectAllMode) syncExcludedIds();
             updateActionButtons(selectedIds);
         },
         onSort: (sortKey, sortDir) => {
@@ -73,6 +79,8 @@ async function loadSales(page = 1, limit = 20) {
 
         // 데이터 렌더링
         tableManager.render(data.data, columns);
+        currentTotal = data.total;
+        if (selectAllMode) checkVisibleRows();
 
         // 페이지네이션 렌더링
         paginationManager.render({
@@ -114,8 +122,12 @@ async function loadChannelNames() {
     }
 }
 
+function getSelectionCount() {
+    return selectAllMode ? currentTotal - excludedIds.size : tableManager.getSelectedRows().length;
+}
+
 function updateActionButtons(selectedIds) {
-    const hasSelection = selectedIds.length > 0;
+    const hasSelection = selectAllMode ? getSelectionCount() > 0 : selectedIds.length > 0;
     const editBtn = document.getElementById('editButton');
     const deleteBtn = document.getElementById('deleteButton');
 
@@ -130,13 +142,22 @@ function updateActionButtons(selectedIds) {
 
 async function bulkDelete() {
     const selectedIds = tableManager.getSelectedRows();
-    if (selectedIds.length === 0) return;
+    const count = getSelectionCount();
+    if (count === 0) return;
 
-    showConfirm(`선택한 ${selectedIds.length}개 항목을 삭제하시겠습니까?`, async () => {
+    showConfirm(`선택한 ${count.toLocaleString()}개 항목을 삭제하시겠습니까?`, async () => {
         try {
-            await api.post('/api/erpsales/bulk-delete', { ids: selectedIds.map(id => parseInt(id)) });
+            if (selectAllMode) {
+                await api.post('/api/erpsales/filter-delete', {
+                    filters: currentFilters,
+                    exclude_ids: Array.from(excludedIds).map(id => parseInt(id))
+                });
+            } else {
+                await api.post('/api/erpsales/bulk-delete', { ids: selectedIds.map(id => parseInt(id)) });
+            }
 
             showAlert('삭제되었습니다.', 'success');
+            exitSelectAllMode();
             tableManager.clearSelection();
             loadSales(paginationManager.getCurrentPage(), paginationManager.getLimit());
         } catch (e) {
@@ -155,7 +176,7 @@ async function bulkEdit() {
         const sale = await api.get(`/api/erpsales/${firstId}`);
 
         // 모달에 선택 개수와 현재 값 표시
-        document.getElementById('bulkEditCount').textContent = selectedIds.length;
+        document.getElementById('bulkEditCount').textContent = getSelectionCount().toLocaleString();
         document.getElementById('currentQuantity').textContent = sale.Quantity || '(없음)';
         document.getElementById('currentUnitPrice').textContent = sale.UnitPrice || '(없음)';
 
@@ -184,10 +205,18 @@ async function saveBulkEdit() {
     if (unitPrice) updates.UnitPrice = parseFloat(unitPrice);
 
     try {
-        await api.post('/api/erpsales/bulk-update', {
-            ids: selectedIds.map(id => parseInt(id)),
-            updates
-        });
+        if (selectAllMode) {
+            await api.post('/api/erpsales/filter-update', {
+                filters: currentFilters,
+                exclude_ids: Array.from(excludedIds).map(id => parseInt(id)),
+                updates
+            });
+        } else {
+            await api.post('/api/erpsales/bulk-update', {
+                ids: selectedIds.map(id => parseInt(id)),
+                updates
+            });
+        }
 
         showAlert('수정되었습니다.', 'success');
         bulkEditModal.hide();
@@ -209,6 +238,9 @@ function applyFilters() {
     if (brand) currentFilters.brand = brand;
     if (channel) currentFilters.channel_name = channel;
 
+    // 필터가 바뀌면 전체 선택 대상도 바뀌므로 선택 초기화
+    exitSelectAllMode();
+    tableManager.clearSelection();
     loadSales(1, paginationManager.getLimit());
 }
 
@@ -219,6 +251,8 @@ function resetFilters() {
     document.getElementById('searchChannel').value = '';
     currentFilters = {};
 
+    exitSelectAllMode();
+    tableManager.clearSelection();
     loadSales(1, paginationManager.getLimit());
 }
 
@@ -236,45 +270,53 @@ function changeLimit() {
     loadSales(1, limit);
 }
 
-async function selectAllData() {
-    showConfirm('현재 필터 조건의 모든 데이터를 선택하시겠습니까?', async () => {
-        try {
-            const params = { limit: 10000, ...currentFilters };
-            const queryString = api.buildQueryString(params);
-            const data = await api.get(`/api/erpsales${queryString}`);
-
-            // TableManager는 현재 페이지의 행만 선택 관리하는 것이 기본임.
-            // 전체 데이터 선택은 TableManager의 범위를 벗어날 수 있음 (클라이언트 사이드 페이지네이션이 아니므로).
-            // 하지만 여기서는 "현재 페이지에 보이는 것"이 아니라 "DB상의 전체 데이터"를 선택하려는 의도.
-            // 기존 로직: selectedIds에 모든 ID를 넣음.
-
-            // TableManager의 selectedRows는 Set임. 여기에 다 넣으면 됨.
-            // 하지만 TableManager는 렌더링된 행의 체크박스만 제어함.
-            // 보이지 않는 행의 선택 상태를 TableManager가 관리할 수 있을까?
-            // TableManager 코드를 보면 selectedRows는 Set이고, _handleRowSelection 등에서 업데이트함.
-            // getSelectedRows()는 selectedRows를 배열로 반환함.
-            // 따라서 selectedRows에 ID를 직접 추가하면 됨.
-
-            data.data.forEach(s => tableManager.selectedRows.add(s.IDX.toString()));
-
-            // 현재 화면에 보이는 행들의 체크박스 켜기
-            const checkboxes = document.querySelectorAll('.row-checkbox');
-            checkboxes.forEach(cb => {
-                if (tableManager.selectedRows.has(cb.dataset.id)) {
-                    cb.checked = true;
-                }
-            });
+function selectAllData() {
+    // 필터 없는 전체 선택은 테이블 전체 삭제/수정이 되므로 서버에서도 거부함
+    if (Object.keys(currentFilters).length === 0) {
+        showAlert('검색 조건을 먼저 적용해주세요.', 'warning');
+        return;
+    }
 
-            // 전체 선택 체크박스 켜기
-            const selectAllCb = document.getElementById('select-all');
-            if (selectAllCb) selectAllCb.checked = true;
+    showConfirm('현재 필터 조건의 모든 데이터를 선택하시겠습니까?', () => {
+        // ID 목록을 받아오지 않고 필터 조건 자체를 선택 상태로 유지
+        // 삭제/수정 시 filters + exclude_ids 를 서버로 전송 → 서버에서 단일 DELETE/UPDATE
+        selectAllMode = true;
+        excludedIds.clear();
+        checkVisibleRows();
 
-            updateActionButtons(Array.from(tableManager.selectedRows));
-            showAlert(`${tableManager.selectedRows.size}개 항목이 선택되었습니다.`, 'success');
-        } catch (e) {
-            showAlert('전체 선택 실패: ' + e.message, 'error');
+        updateActionButtons(tableManager.getSelectedRows());
+        showAlert(`${getSelectionCount().toLocaleString()}개 항목이 선택되었습니다.`, 'success');
+    });
+}
+
+function checkVisibleRows() {
+    // 현재 화면의 행 중 선택 해제하지 않은 행 체크
+    document.querySelectorAll('#sales-table .row-checkbox').forEach(cb => {
+        if (!excludedIds.has(cb.dataset.id)) {
+            cb.checked = true;
+            tableManager.selectedRows.add(cb.dataset.id);
         }
     });
+
+    if (tableManager._selectAllCheckbox) {
+        tableManager._selectAllCheckbox.checked = excludedIds.size === 0;
+    }
+}
+
+function syncExcludedIds() {
+    // 전체 선택 모드에서 화면의 체크 해제 → 제외 목록
+    document.querySelectorAll('#sales-table .row-checkbox').forEach(cb => {
+        if (cb.checked) {
+            excludedIds.delete(cb.dataset.id);
+        } else {
+            excludedIds.add(cb.dataset.id);
+        }
+    });
+}
+
+function exitSelectAllMode() {
+    selectAllMode = false;
+    excludedIds.clear();
 }
 
 function downloadTemplate() {
@@ -311,28 +353,16 @@ async function uploadFile() {
     document.getElementById('progressText').textContent = '업로드 중...';
 
     try {
-        let progress = 0;
-        const progressInterval = setInterval(() => {
-            progress += 5;
-            if (progress <= 90) {
-                document.getElementById('progressBar').style.width = progress + '%';
-                document.getElementById('progressText').textContent = progress + '%';
-            }
-        }, 100);
-
-        // 파일 업로드는 fetch 사용 (api-client가 FormData 지원하는지 확인 필요. 보통 JSON 전송용임)
-        // api-client.js의 _request는 body를 JSON.stringify함. FormData는 직접 fetch 써야 함.
+        // 파일 업로드는 fetch 사용 (api-client.js의 _request는 body를 JSON.stringify함)
         const res = await fetch('/api/erpsales/upload', {
             method: 'POST',
             body: formData
         });
 
-        clearInterval(progressInterval);
-        document.getElementById('progressBar').style.width = '100%';
-        document.getElementById('progressText').textContent = '100%';
-
         if (res.ok) {
-            const result = await res.json();
+            // 서버는 작업 등록 후 job_id 즉시 반환 → 실제 진행률로 표시
+            const { job_id } = await res.json();
+            const result = await waitForJob(job_id, (job) => renderJobProgress(job, 'progressBar', 'progressText'));
             // ... 결과 처리 로직 (기존과 동일) ...
             // (너무 길어서 생략, 기존 코드 복사해서 넣음)
             // 여기서는 간략하게 처리하고 기존 코드의 상세 로직을 그대로 가져와야 함.
@@ -409,14 +439,6 @@ async function executeSyncToOrders() {
     document.getElementById('syncProgressText').textContent = '동기화 중...';
 
     try {
-        let progress = 0;
-        const progressInterval = setInterval(() => {
-            progress += 10;
-            if (progress <= 90) {
-                document.getElementById('syncProgressBar').style.width = progress + '%';
-            }
-        }, 200);
-
         const params = {};
         if (startDate) params.start_date = startDate;
         if (endDate) params.end_date = endDate;
@@ -427,11 +449,14 @@ async function executeSyncToOrders() {
             method: 'POST'
         });
 
-        clearInterval(progressInterval);
-        document.getElementById('syncProgressBar').style.width = '100%';
-
         if (res.ok) {
-            const result = await res.json();
+            // 저장 프로시저는 단계별 진행률이 없으므로 완료 시점만 표시
+            const { job_id } = await res.json();
+            const result = await waitForJob(job_id, (job) => {
+                document.getElementById('syncProgressText').textContent =
+                    job.Status === 'QUEUED' ? '대기 중...' : '동기화 중...';
+            });
+            document.getElementById('syncProgressBar').style.width = '100%';
             document.getElementById('syncProgressText').textContent =
                 `완료! (INSERT: ${result.insert_count?.toLocaleString() || 0}, UPDATE: ${result.update_count?.toLocaleString() || 0})`;
 
@@ -6,9 +6,44 @@ Sales (ERPSales) 전용 엑셀 처리 핸들러
 
 from typing import Dict, List, Optional, Any, Set
 import pandas as pd
-from core import get_db_cursor
+from core import get_db_cursor, reference_cache
 from .base_handler import ExcelBaseHandler
 
+# Sales 매핑에 사용하는 테이블 (참조 데이터 캐시 무효화 대상)
+SALES_MAPPING_TABLES = ("Brand", "ProductBox", "Channel", "ChannelDetail", "Warehouse")
+
+
+def _load_sales_mappings() -> Dict[str, Dict[str, int]]:
+    """Sales 매핑 테이블 DB 조회"""
+    with get_db_cursor(commit=False) as cursor:
+        # Brand
+        cursor.execute("SELECT Name, BrandID FROM [dbo].[Brand]")
+        brand_map = {row[0]: row[1] for row in cursor.fetchall()}
+
+        # Product (ERPCode 기준)
+        cursor.execute("SELECT ERPCode, ProductID FROM [dbo].[ProductBox] WHERE ERPCode IS NOT NULL")
+        product_erp_map = {row[0]: row[1] for row in cursor.fetchall()}
+
+        # Channel
+        cursor.execute("SELECT Name, ChannelID FROM [dbo].[Channel]")
+        channel_map = {row[0]: row[1] for row in cursor.fetchall()}
+
+        # ChannelDetail
+        cursor.execute("SELECT DetailName, ChannelDetailID FROM [dbo].[ChannelDetail]")
+        channel_detail_map = {row[0]: row[1] for row in cursor.fetchall()}
+
+        # Warehouse
+        cursor.execute("SELECT WarehouseName, WarehouseID FROM [dbo].[Warehouse]")
+        warehouse_map = {row[0]: row[1] for row in cursor.fetchall()}
+
+    return {
+        'brand': brand_map,
+        'product': product_erp_map,
+        'channel': channel_map,
+        'channel_detail': channel_detail_map,
+        'warehouse': warehouse_map,
+    }
+
 
 class SalesExcelHandler(ExcelBaseHandler):
     """Sales 전용 엑셀 처리 핸들러"""
@@ -50,35 +85,19 @@ class SalesExcelHandler(ExcelBaseHandler):
         self.unmapped_warehouses = set()
 
     def load_sales_mappings(self):
-        """Sales 전용 매핑 테이블 로드 (Brand, Product, Channel, ChannelDetail, Warehouse)"""
-        with get_db_cursor(commit=False) as cursor:
-            # Brand
-            cursor.execute("SELECT Name, BrandID FROM [dbo].[Brand]")
-            self._brand_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # Product (ERPCode 기준)
-            cursor.execute("SELECT ERPCode, ProductID FROM [dbo].[ProductBox] WHERE ERPCode IS NOT NULL")
-            self._product_erp_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # Channel
-            cursor.execute("SELECT Name, ChannelID FROM [dbo].[Channel]")
-            self._channel_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # ChannelDetail
-            cursor.execute("SELECT DetailName, ChannelDetailID FROM [dbo].[ChannelDetail]")
-            self._channel_detail_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-            # Warehouse
-            cursor.execute("SELECT WarehouseName, WarehouseID FROM [dbo].[Warehouse]")
-            self._warehouse_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-        return {
-            'brand': len(self._brand_map),
-            'product': len(self._product_erp_map),
-            'channel': len(self._channel_map),
-            'channel_detail': len(self._channel_detail_map),
-            'warehouse': len(self._warehouse_map),
-        }
+        """
+        Sales 전용 매핑 테이블 로드 (Brand, Product, Channel, ChannelDetail, Warehouse)
+        - 참조 데이터 캐시 사용 (업로드마다 재조회하지 않음, 매핑 dict는 공유 객체 → 수정 금지)
+        - Warehouse는 쓰기 Repository가 없으므로 TTL(REFERENCE_CACHE_TTL) 경과 시 갱신
+        """
+        mappings = reference_cache.get("sales.mappings", SALES_MAPPING_TABLES, _load_sales_mappings)
+        self._brand_map = mappings['brand']
+        self._product_erp_map = mappings['product']
+        self._channel_map = mappings['channel']
+        self._channel_detail_map = mappings['channel_detail']
+        self._warehouse_map = mappings['warehouse']
+
+        return {name: len(mapping) for name, mapping in mappings.items()}
 
     def get_product_id_by_erp(self, erp_code: Optional[str]) -> Optional[int]:
         """ERPCode -> ProductID 매핑"""